@@ -0,0 +1,20 @@
+-- Migration: 001_ohlc_candles
+-- Date: 2026-10-16
+-- Description: OHLC candle table with the (pair, timeframe, open_time) key
+--              used by CandleRepository upserts and range reads.
+
+-- UP
+CREATE TABLE IF NOT EXISTS ohlc_candles (
+    pair        TEXT             NOT NULL,
+    timeframe   TEXT             NOT NULL,
+    open_time   TIMESTAMPTZ      NOT NULL,
+    open        DOUBLE PRECISION NOT NULL,
+    high        DOUBLE PRECISION NOT NULL,
+    low         DOUBLE PRECISION NOT NULL,
+    close       DOUBLE PRECISION NOT NULL,
+    volume      DOUBLE PRECISION,
+    CONSTRAINT ohlc_candles_pair_timeframe_time_key UNIQUE (pair, timeframe, open_time)
+);
+
+-- DOWN
+DROP TABLE IF EXISTS ohlc_candles;
@@ -0,0 +1,64 @@
+"""Shared FastAPI dependencies.
+
+Route modules depend on these rather than building their own resources, so
+tests can swap them through ``app.dependency_overrides``.
+"""
+
+from functools import cache
+from pathlib import Path
+from typing import Annotated
+
+from fastapi import Depends
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+from src.domain.market_data.store import CandleStore
+from src.domain.structure.swing_cache import FileCacheBackend, SwingCache
+
+
+class ApiSettings(BaseSettings):
+    """Environment settings for the API layer.
+
+    Attributes:
+        candle_store_dir: Root of the local CandleStore the candle and swing
+            endpoints read from (env ``FRACTAL_CANDLE_STORE_DIR``).
+        stream_chunk_rows: Rows serialised per streamed response chunk
+            (env ``FRACTAL_STREAM_CHUNK_ROWS``).
+        swing_cache_size: Swing sets kept in memory per worker
+            (env ``FRACTAL_SWING_CACHE_SIZE``).
+        swing_cache_ttl_s: Seconds a cached swing set stays valid
+            (env ``FRACTAL_SWING_CACHE_TTL_S``).
+        swing_cache_dir: Optional directory shared by all workers on the
+            host, so one worker's detections are reused by the others
+            (env ``FRACTAL_SWING_CACHE_DIR``). None = per-worker cache only.
+    """
+
+    model_config = SettingsConfigDict(env_prefix="FRACTAL_")
+
+    candle_store_dir: Path = Path("data/candles")
+    stream_chunk_rows: int = 10_000
+    swing_cache_size: int = 256
+    swing_cache_ttl_s: float = 900.0
+    swing_cache_dir: Path | None = None
+
+
+@cache
+def get_api_settings() -> ApiSettings:
+    """Return the process-wide API settings, read on first use."""
+    return ApiSettings()
+
+
+def get_candle_store(
+    settings: Annotated[ApiSettings, Depends(get_api_settings)],
+) -> CandleStore:
+    """CandleStore rooted at the configured directory."""
+    return CandleStore(settings.candle_store_dir)
+
+
+@cache
+def get_swing_cache() -> SwingCache:
+    """Return the process-wide swing cache, created on first use."""
+    settings = get_api_settings()
+    backend = (
+        None if settings.swing_cache_dir is None else FileCacheBackend(settings.swing_cache_dir)
+    )
+    return SwingCache(settings.swing_cache_size, settings.swing_cache_ttl_s, backend)
@@ -0,0 +1,119 @@
+"""Columnar wire encoders for streamed API responses.
+
+Endpoints hand these encoders a dict of equal-length NumPy columns and
+stream the chunks they yield, so a large range is never materialised as
+one JSON document or as a list of pydantic models. Each chunk converts a
+slice of every column to Python scalars in one vectorised ``tolist`` and
+serialises its rows with orjson.
+
+- NDJSON (``application/x-ndjson``): one JSON object per line. Datetimes
+  are ISO-8601 strings without offset (UTC), like ``Candle.model_dump_json``.
+- Arrow IPC stream (``application/vnd.apache.arrow.stream``): one record
+  batch per chunk. Needs the optional ``pyarrow`` package
+  (``pip install -e ".[arrow]"``); check ``arrow_available`` first.
+"""
+
+import importlib.util
+import io
+from collections.abc import Iterator
+from typing import Any
+
+import numpy as np
+import orjson
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+ARROW_MEDIA_TYPE = "application/vnd.apache.arrow.stream"
+
+Columns = dict[str, np.ndarray]
+
+
+def _num_rows(columns: Columns) -> int:
+    lengths = {len(values) for values in columns.values()}
+    if len(lengths) > 1:
+        raise ValueError(f"Columns must have equal lengths, got {sorted(lengths)}")
+    return lengths.pop() if lengths else 0
+
+
+def _json_values(values: np.ndarray) -> list[Any]:
+    if values.dtype.kind == "M":
+        return np.datetime_as_string(values.astype("datetime64[s]")).tolist()
+    return values.tolist()
+
+
+def iter_ndjson(columns: Columns, chunk_rows: int = 10_000) -> Iterator[bytes]:
+    """Encode columns as newline-delimited JSON, ``chunk_rows`` lines at a time.
+
+    Args:
+        columns: Field name -> column. Field order is preserved in every row.
+        chunk_rows: Rows per yielded chunk.
+
+    Yields:
+        Byte chunks, each ending in a newline. Nothing for zero rows.
+
+    Raises:
+        ValueError: If the columns differ in length or chunk_rows < 1.
+    """
+    if chunk_rows < 1:
+        raise ValueError("chunk_rows must be >= 1")
+    n = _num_rows(columns)
+    names = list(columns)
+    for lo in range(0, n, chunk_rows):
+        values = [_json_values(column[lo : lo + chunk_rows]) for column in columns.values()]
+        yield b"".join(
+            orjson.dumps(dict(zip(names, row, strict=True)), option=orjson.OPT_APPEND_NEWLINE)
+            for row in zip(*values, strict=True)
+        )
+
+
+def arrow_available() -> bool:
+    """Whether the optional pyarrow dependency is installed."""
+    return importlib.util.find_spec("pyarrow") is not None
+
+
+def iter_arrow_ipc(columns: Columns, chunk_rows: int = 10_000) -> Iterator[bytes]:
+    """Encode columns as an Arrow IPC stream, one record batch per chunk.
+
+    Numeric and datetime columns are handed to Arrow without per-value
+    conversion; fixed-width unicode columns become Arrow strings.
+
+    Args:
+        columns: Field name -> column.
+        chunk_rows: Rows per record batch.
+
+    Yields:
+        Byte chunks which concatenate to a complete IPC stream (schema,
+        batches, end-of-stream marker). A zero-row range still yields the
+        schema.
+
+    Raises:
+        ValueError: If the columns differ in length or chunk_rows < 1.
+        ModuleNotFoundError: If pyarrow is not installed.
+    """
+    import pyarrow as pa
+
+    if chunk_rows < 1:
+        raise ValueError("chunk_rows must be >= 1")
+    n = _num_rows(columns)
+
+    def to_arrow(values: np.ndarray) -> Any:
+        if values.dtype.kind == "U":
+            return pa.array(values.tolist(), type=pa.string())
+        return pa.array(np.ascontiguousarray(values))
+
+    schema = pa.schema(
+        [pa.field(name, to_arrow(column[:0]).type) for name, column in columns.items()]
+    )
+    sink = io.BytesIO()
+
+    def take() -> bytes:
+        data = sink.getvalue()
+        sink.seek(0)
+        sink.truncate()
+        return data
+
+    with pa.ipc.new_stream(sink, schema) as writer:
+        for lo in range(0, n, chunk_rows):
+            arrays = [to_arrow(column[lo : lo + chunk_rows]) for column in columns.values()]
+            writer.write_batch(pa.record_batch(arrays, schema=schema))
+            yield take()
+    yield take()
@@ -5,12 +5,24 @@ Start with:
 """
 
 from fastapi import FastAPI
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import PlainTextResponse
+
+from src.api.middleware import MetricsMiddleware
+from src.api.routes import market
+from src.domain.observability.metrics import CONTENT_TYPE, get_metrics_registry
 
 app = FastAPI(
     title="Fractal AI",
     description="Systematic forex trading platform — API layer",
     version="0.1.0",
 )
+# Compresses responses (streamed ones included) for clients sending
+# Accept-Encoding: gzip; small bodies are not worth the CPU.
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+# Outermost, so request latency includes compression.
+app.add_middleware(MetricsMiddleware)
+app.include_router(market.router)
 
 
 @app.get("/health")
@@ -21,3 +33,12 @@ async def health() -> dict:
         Status dict confirming the API is running.
     """
     return {"status": "ok", "version": "0.1.0"}
+
+
+@app.get("/metrics", response_class=PlainTextResponse)
+async def metrics() -> PlainTextResponse:
+    """Pipeline and API metrics in the Prometheus text format.
+
+    Empty while ``FRACTAL_METRICS_ENABLED`` is false.
+    """
+    return PlainTextResponse(get_metrics_registry().render(), media_type=CONTENT_TYPE)
@@ -0,0 +1,51 @@
+"""Request latency middleware.
+
+A plain ASGI middleware rather than ``BaseHTTPMiddleware``: it does not wrap
+the response in a second stream, so streamed candle and swing bodies pass
+through untouched. Latency is recorded once the last body chunk is sent, so a
+long backfill counts for its full duration. Requests are labelled by route
+template (``/candles/{pair}/{timeframe}``), never by raw path, to keep the
+label set bounded.
+"""
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.domain.observability.metrics import get_metrics_registry
+
+UNMATCHED_ROUTE = "<unmatched>"
+
+
+class MetricsMiddleware:
+    """Records every HTTP request in ``fractal_http_request_duration_seconds``."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        metrics = get_metrics_registry()
+        if scope["type"] != "http" or not metrics.enabled:
+            await self.app(scope, receive, send)
+            return
+
+        start = metrics.clock()
+        status = 500
+        done = False
+
+        def record() -> None:
+            route = getattr(scope.get("route"), "path", UNMATCHED_ROUTE)
+            metrics.observe_http(scope["method"], route, status, metrics.clock() - start)
+
+        async def send_and_record(message: Message) -> None:
+            nonlocal status, done
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+            if message["type"] == "http.response.body" and not message.get("more_body"):
+                done = True
+                record()
+
+        try:
+            await self.app(scope, receive, send_and_record)
+        finally:
+            if not done:
+                record()
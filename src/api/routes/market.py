@@ -0,0 +1,224 @@
+"""Candle and swing query endpoints.
+
+n8n's Strategy Engine and Alert Processor poll these every 5 minutes per
+pair, and backfills ask for months at a time, so responses are streamed in
+a columnar wire format (NDJSON by default, Arrow IPC on request) straight
+from the memory-mapped CandleStore.
+
+Swing sets come from the process-wide ``SwingCache``, so the overlapping
+windows different callers ask for are detected once per series and then
+only extended as candles arrive.
+
+Nothing CPU-bound runs on the event loop: store reads and swing detection
+go through ``asyncio.to_thread``, and the response body is a synchronous
+iterator, which Starlette drains on its thread pool. A long backfill
+therefore cannot stall ``/health`` or other callers. Compression is
+negotiated by the app's GZip middleware from ``Accept-Encoding``.
+
+Pair and timeframe are checked against the configured pairs and the
+supported timeframes before anything touches the filesystem, so a path
+segment can never name a file outside the store.
+"""
+
+import asyncio
+from datetime import datetime
+from enum import StrEnum
+from typing import Annotated
+
+import numpy as np
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
+
+from src.api.dependencies import (
+    ApiSettings,
+    get_api_settings,
+    get_candle_store,
+    get_swing_cache,
+)
+from src.api.encoding import (
+    ARROW_MEDIA_TYPE,
+    NDJSON_MEDIA_TYPE,
+    Columns,
+    arrow_available,
+    iter_arrow_ipc,
+    iter_ndjson,
+)
+from src.domain.market_data.resampler import timeframe_duration
+from src.domain.market_data.store import CandleStore
+from src.domain.structure.models import CandleSeries, utc_naive
+from src.domain.structure.swing_cache import SwingCache
+from src.infrastructure.config import get_config_registry
+
+router = APIRouter(tags=["market data"])
+
+StoreDep = Annotated[CandleStore, Depends(get_candle_store)]
+SettingsDep = Annotated[ApiSettings, Depends(get_api_settings)]
+SwingCacheDep = Annotated[SwingCache, Depends(get_swing_cache)]
+StartQuery = Annotated[
+    datetime | None, Query(description="Inclusive lower bound on open_time (UTC).")
+]
+EndQuery = Annotated[
+    datetime | None, Query(description="Exclusive upper bound on open_time (UTC).")
+]
+AcceptHeader = Annotated[str | None, Header()]
+
+
+class WireFormat(StrEnum):
+    """Response body encodings."""
+
+    NDJSON = "ndjson"
+    ARROW = "arrow"
+
+
+def _negotiate(requested: WireFormat | None, accept: str | None) -> WireFormat:
+    """An explicit ``format`` wins; otherwise Arrow only if the client accepts it."""
+    if requested is not None:
+        fmt = requested
+    elif accept is not None and ARROW_MEDIA_TYPE in accept:
+        fmt = WireFormat.ARROW
+    else:
+        fmt = WireFormat.NDJSON
+    if fmt is WireFormat.ARROW and not arrow_available():
+        raise HTTPException(
+            status.HTTP_406_NOT_ACCEPTABLE,
+            "Arrow IPC needs the optional pyarrow dependency; use format=ndjson",
+        )
+    return fmt
+
+
+def _stream(columns: Columns, fmt: WireFormat, chunk_rows: int) -> StreamingResponse:
+    headers = {"X-Row-Count": str(len(next(iter(columns.values()))))}
+    if fmt is WireFormat.ARROW:
+        return StreamingResponse(
+            iter_arrow_ipc(columns, chunk_rows), media_type=ARROW_MEDIA_TYPE, headers=headers
+        )
+    return StreamingResponse(
+        iter_ndjson(columns, chunk_rows), media_type=NDJSON_MEDIA_TYPE, headers=headers
+    )
+
+
+def _series_key(pair: str, timeframe: str) -> tuple[str, str]:
+    """Normalised (pair, timeframe) of a known series, or 404.
+
+    Pairs must be configured (pairs.json or the tolerances.json pip table)
+    and timeframes supported by the resampler ("<n>M", "<n>H", "D", "W").
+    """
+    pair, timeframe = pair.upper(), timeframe.upper()
+    if pair not in get_config_registry().pip_values:
+        raise HTTPException(status.HTTP_404_NOT_FOUND, f"Unknown pair {pair!r}")
+    try:
+        timeframe_duration(timeframe)
+    except ValueError as exc:
+        raise HTTPException(status.HTTP_404_NOT_FOUND, str(exc)) from exc
+    return pair, timeframe
+
+
+def _utc(value: datetime | None) -> np.datetime64 | None:
+    """Query bound as naive-UTC ``datetime64[us]`` (offsets are converted)."""
+    if value is None:
+        return None
+    return np.datetime64(utc_naive(value), "us")
+
+
+async def _read(store: CandleStore, pair: str, timeframe: str) -> CandleSeries:
+    try:
+        series = await asyncio.to_thread(store.read, pair, timeframe)
+    except FileNotFoundError as exc:
+        raise HTTPException(
+            status.HTTP_404_NOT_FOUND, f"No candles for {pair} {timeframe}"
+        ) from exc
+    return series
+
+
+def _window(
+    open_time: np.ndarray, start: np.datetime64 | None, end: np.datetime64 | None
+) -> tuple[int, int]:
+    lo = 0 if start is None else int(np.searchsorted(open_time, start, "left"))
+    hi = len(open_time) if end is None else int(np.searchsorted(open_time, end, "left"))
+    return lo, max(lo, hi)
+
+
+def _swings_in_range(
+    cache: SwingCache,
+    series: CandleSeries,
+    start: np.datetime64 | None,
+    end: np.datetime64 | None,
+    min_swing_pips: float | None,
+) -> np.ndarray:
+    """Swings whose C2 lies in [start, end).
+
+    Detection covers the whole stored series (through the cache), so swings
+    on the first and last candle of the range are confirmed by their
+    neighbours outside it.
+    """
+    swings = cache.detect(series, min_swing_pips)
+    lo, hi = _window(swings["open_time"], start, end)
+    return swings[lo:hi]
+
+
+@router.get("/candles/{pair}/{timeframe}", response_class=StreamingResponse)
+async def get_candles(
+    pair: str,
+    timeframe: str,
+    store: StoreDep,
+    settings: SettingsDep,
+    start: StartQuery = None,
+    end: EndQuery = None,
+    format: WireFormat | None = None,
+    accept: AcceptHeader = None,
+) -> StreamingResponse:
+    """Stream candles for a pair/timeframe over [start, end).
+
+    Rows carry ``open_time``, ``open``, ``high``, ``low`` and ``close``; the
+    row count is sent up front in ``X-Row-Count``.
+    """
+    pair, timeframe = _series_key(pair, timeframe)
+    fmt = _negotiate(format, accept)
+    series = await _read(store, pair, timeframe)
+    lo, hi = _window(series.open_time, _utc(start), _utc(end))
+    window = series[lo:hi]
+    columns = {
+        "open_time": window.open_time,
+        "open": window.open,
+        "high": window.high,
+        "low": window.low,
+        "close": window.close,
+    }
+    return _stream(columns, fmt, settings.stream_chunk_rows)
+
+
+@router.get("/swings/{pair}/{timeframe}", response_class=StreamingResponse)
+async def get_swings(
+    pair: str,
+    timeframe: str,
+    store: StoreDep,
+    settings: SettingsDep,
+    cache: SwingCacheDep,
+    start: StartQuery = None,
+    end: EndQuery = None,
+    min_swing_pips: Annotated[
+        float | None,
+        Query(ge=0, description="C2 range filter in pips. Defaults to the timeframe's config."),
+    ] = None,
+    format: WireFormat | None = None,
+    accept: AcceptHeader = None,
+) -> StreamingResponse:
+    """Detect and stream swings whose C2 candle opens in [start, end).
+
+    Rows carry ``open_time``, ``type`` and ``price``. Without
+    ``min_swing_pips`` the timeframe's configured minimum applies (none if
+    the timeframe has no entry); pass 0 to disable the filter.
+    """
+    pair, timeframe = _series_key(pair, timeframe)
+    fmt = _negotiate(format, accept)
+    if min_swing_pips is None:
+        min_swing_pips = get_config_registry().min_swing_pips(timeframe)
+    series = await _read(store, pair, timeframe)
+    try:
+        swings = await asyncio.to_thread(
+            _swings_in_range, cache, series, _utc(start), _utc(end), min_swing_pips
+        )
+    except ValueError as exc:
+        raise HTTPException(422, str(exc)) from exc
+    columns = {"open_time": swings["open_time"], "type": swings["type"], "price": swings["price"]}
+    return _stream(columns, fmt, settings.stream_chunk_rows)
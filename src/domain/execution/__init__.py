@@ -0,0 +1,11 @@
+"""Execution bounded context — trade lifecycle, monitoring, outcomes."""
+
+from src.domain.execution.models import OpenTrade, TradeDirection, TradeOutcome
+from src.domain.execution.trade_monitor import TradeMonitor
+
+__all__ = [
+    "OpenTrade",
+    "TradeDirection",
+    "TradeMonitor",
+    "TradeOutcome",
+]
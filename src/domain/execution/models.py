@@ -0,0 +1,71 @@
+"""Domain models for the execution bounded context.
+
+Trade vocabulary follows docs/GLOSSARY.md: a trade is LONG or SHORT, and a
+closed trade's outcome is WIN, LOSS, EXPIRED or CANCELLED, with its result
+expressed in R (multiples of the entry-to-stop distance). ``OpenTrade`` is
+a trade that has been entered and not yet closed.
+"""
+
+from datetime import datetime
+from enum import StrEnum
+
+from pydantic import BaseModel, model_validator
+
+
+class TradeDirection(StrEnum):
+    """Side of a trade."""
+
+    LONG = "LONG"
+    SHORT = "SHORT"
+
+
+class TradeOutcome(StrEnum):
+    """How a trade ended.
+
+    WIN: take profit reached. LOSS: stop loss reached. EXPIRED: neither was
+    reached before the strategy's expiry. CANCELLED: never entered.
+    """
+
+    WIN = "WIN"
+    LOSS = "LOSS"
+    EXPIRED = "EXPIRED"
+    CANCELLED = "CANCELLED"
+
+
+class OpenTrade(BaseModel, frozen=True):
+    """A trade that has been entered and is waiting for its stop, target or expiry.
+
+    Attributes:
+        trade_id: Unique id.
+        pair: Currency pair.
+        direction: LONG or SHORT.
+        entry_time: UTC entry time. Only candles opening at or after it can
+            close the trade.
+        entry_price: Entry price.
+        stop_loss: Stop price, below the entry for LONG and above for SHORT.
+        take_profit: Target price, on the other side of the entry.
+        expires_at: UTC time after which the trade expires. None uses the
+            monitor's default (``strategy_defaults.expiry_hours``).
+    """
+
+    trade_id: str
+    pair: str
+    direction: TradeDirection
+    entry_time: datetime
+    entry_price: float
+    stop_loss: float
+    take_profit: float
+    expires_at: datetime | None = None
+
+    @model_validator(mode="after")
+    def _check_levels(self) -> "OpenTrade":
+        if self.direction is TradeDirection.LONG:
+            valid = self.stop_loss < self.entry_price < self.take_profit
+        else:
+            valid = self.take_profit < self.entry_price < self.stop_loss
+        if not valid:
+            raise ValueError(
+                f"Trade {self.trade_id}: stop_loss and take_profit must lie on opposite "
+                f"sides of entry_price for a {self.direction} trade"
+            )
+        return self
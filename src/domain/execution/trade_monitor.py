@@ -0,0 +1,346 @@
+"""Batched stop, target and expiry checks for open trades.
+
+``TradeMonitor`` replaces the Trade Monitor workflow's per-trade polling.
+Open trades are grouped by pair. Each pair's book keeps one sorted array of
+stops and one of targets per direction, plus one of expiry times. A closed
+candle then resolves every trade of its pair with a handful of binary
+searches:
+
+- LONG stops at or above the low, and LONG targets at or below the high.
+- SHORT stops at or below the high, and SHORT targets at or above the low.
+- Expiries at or before the candle's close.
+
+Each lookup is a contiguous range of a sorted array. The cost per candle is
+O(log n) plus the number of trades that actually close, not O(n).
+
+Resolution follows the backtester (``src.domain.research.backtest``):
+
+- A trade is live on candles opening at or after its ``entry_time`` and
+  before its expiry.
+- A candle that reaches both levels is resolved stop-first.
+- A trade that survives its last live candle expires at that candle's close.
+- If candles were missing so that the expiry passed unseen, the trade
+  expires at the last close the monitor saw for the pair.
+
+Closed trades are marked dead rather than removed from the sorted arrays.
+They are compacted away once they outnumber the live ones, and adding
+trades rebuilds the arrays on the next candle.
+
+Feed it base-timeframe (5M) candles: finer candles resolve intrabar order
+better. Not thread-safe; drive it from one task.
+"""
+
+from collections.abc import Iterable
+from datetime import datetime, timedelta
+
+import numpy as np
+
+from src.domain.execution.models import OpenTrade, TradeDirection
+from src.domain.market_data.resampler import timeframe_duration
+from src.domain.structure.models import Candle
+
+# Module reference rather than ``from ... import`` (and quoted annotations):
+# src.events.models imports this package's models, so its names may not exist
+# yet while this module loads.
+from src.events import models as events
+from src.infrastructure.config import get_config_registry
+
+_EPOCH = datetime(1970, 1, 1)
+
+# Dead slots tolerated before a book is compacted.
+_MIN_COMPACT = 64
+
+
+def _to_us(t: datetime) -> int:
+    delta = t.replace(tzinfo=None) - _EPOCH
+    return (delta.days * 86_400 + delta.seconds) * 1_000_000 + delta.microseconds
+
+
+def _from_us(us: int) -> datetime:
+    return _EPOCH + timedelta(microseconds=int(us))
+
+
+class _SortedIndex:
+    """Slots of one trade subset ordered by a price or time key."""
+
+    __slots__ = ("keys", "slots")
+
+    def __init__(self, keys: np.ndarray, slots: np.ndarray) -> None:
+        order = np.argsort(keys[slots], kind="stable")
+        self.slots = slots[order]
+        self.keys = keys[self.slots]
+
+    def at_or_above(self, value: float) -> np.ndarray:
+        return self.slots[np.searchsorted(self.keys, value, side="left") :]
+
+    def at_or_below(self, value: float) -> np.ndarray:
+        return self.slots[: np.searchsorted(self.keys, value, side="right")]
+
+
+class _PairBook:
+    """Open trades of one pair in column arrays plus sorted indexes."""
+
+    def __init__(self) -> None:
+        self.trades: list[OpenTrade] = []
+        self.is_long = np.empty(0, dtype=bool)
+        self.entry_us = np.empty(0, dtype=np.int64)
+        self.expires_us = np.empty(0, dtype=np.int64)
+        self.entry = np.empty(0, dtype=np.float64)
+        self.stop = np.empty(0, dtype=np.float64)
+        self.target = np.empty(0, dtype=np.float64)
+        self.alive = np.empty(0, dtype=bool)
+        self.pending: list[tuple[OpenTrade, int]] = []
+        self.dead = 0
+        self.last_close: float | None = None
+        self.last_close_us: int | None = None
+        self._indexes: tuple[_SortedIndex, ...] | None = None
+
+    def __len__(self) -> int:
+        return len(self.trades) + len(self.pending) - self.dead
+
+    def add(self, trade: OpenTrade, expires_us: int) -> None:
+        self.pending.append((trade, expires_us))
+        self._indexes = None
+
+    def kill(self, slots: np.ndarray) -> None:
+        self.alive[slots] = False
+        self.dead += len(slots)
+        if self.dead > max(_MIN_COMPACT, len(self.trades) - self.dead):
+            self._indexes = None
+
+    def remove_pending(self, trade_id: str) -> bool:
+        for i, (trade, _) in enumerate(self.pending):
+            if trade.trade_id == trade_id:
+                del self.pending[i]
+                return True
+        return False
+
+    def indexes(self) -> tuple[_SortedIndex, ...]:
+        """(long stop, long target, short stop, short target, expiry) indexes."""
+        if self._indexes is None:
+            self._rebuild()
+        return self._indexes  # type: ignore[return-value]
+
+    def _rebuild(self) -> None:
+        keep = np.flatnonzero(self.alive)
+        trades = [self.trades[i] for i in keep] + [t for t, _ in self.pending]
+        new = self.pending
+        is_long = [t.direction is TradeDirection.LONG for t, _ in new]
+        self.is_long = np.concatenate([self.is_long[keep], np.array(is_long, dtype=bool)])
+        self.entry_us = np.concatenate(
+            [self.entry_us[keep], np.array([_to_us(t.entry_time) for t, _ in new], np.int64)]
+        )
+        self.expires_us = np.concatenate(
+            [self.expires_us[keep], np.array([e for _, e in new], np.int64)]
+        )
+        for name, field in (
+            ("entry", "entry_price"),
+            ("stop", "stop_loss"),
+            ("target", "take_profit"),
+        ):
+            old = getattr(self, name)[keep]
+            added = np.array([getattr(t, field) for t, _ in new], dtype=np.float64)
+            setattr(self, name, np.concatenate([old, added]))
+        self.trades = trades
+        self.alive = np.ones(len(trades), dtype=bool)
+        self.pending = []
+        self.dead = 0
+
+        slots = np.arange(len(trades))
+        longs, shorts = slots[self.is_long], slots[~self.is_long]
+        self._indexes = (
+            _SortedIndex(self.stop, longs),
+            _SortedIndex(self.target, longs),
+            _SortedIndex(self.stop, shorts),
+            _SortedIndex(self.target, shorts),
+            _SortedIndex(self.expires_us, slots),
+        )
+
+
+class TradeMonitor:
+    """Index of open trades, resolved in bulk on every closed candle.
+
+    Example:
+        monitor = TradeMonitor()
+        monitor.open(trade)
+        for event in monitor.on_candle(candle):
+            await bus.publish(event)
+    """
+
+    def __init__(self, expiry_hours: float | None = None) -> None:
+        """Create an empty monitor.
+
+        Args:
+            expiry_hours: Lifetime of trades opened without ``expires_at``.
+                Defaults to ``strategy_defaults.expiry_hours``.
+        """
+        if expiry_hours is None:
+            expiry_hours = get_config_registry().tolerances.strategy_defaults.expiry_hours
+        self.expiry = timedelta(hours=expiry_hours)
+        self._books: dict[str, _PairBook] = {}
+        self._pairs: dict[str, str] = {}
+
+    def __len__(self) -> int:
+        return len(self._pairs)
+
+    def __contains__(self, trade_id: object) -> bool:
+        return trade_id in self._pairs
+
+    def open(self, trade: OpenTrade) -> None:
+        """Start monitoring a trade.
+
+        Raises:
+            ValueError: If a trade with the same id is already open.
+        """
+        if trade.trade_id in self._pairs:
+            raise ValueError(f"Trade {trade.trade_id} is already open")
+        expires_at = trade.expires_at or trade.entry_time + self.expiry
+        self._books.setdefault(trade.pair, _PairBook()).add(trade, _to_us(expires_at))
+        self._pairs[trade.trade_id] = trade.pair
+
+    def open_many(self, trades: Iterable[OpenTrade]) -> None:
+        """Start monitoring several trades."""
+        for trade in trades:
+            self.open(trade)
+
+    def cancel(self, trade_id: str) -> bool:
+        """Stop monitoring a trade without emitting an event.
+
+        Returns:
+            True if the trade was open.
+        """
+        pair = self._pairs.pop(trade_id, None)
+        if pair is None:
+            return False
+        book = self._books[pair]
+        if not book.remove_pending(trade_id):
+            slot = next(i for i, t in enumerate(book.trades) if t.trade_id == trade_id)
+            book.kill(np.array([slot]))
+        return True
+
+    def open_trades(self, pair: str | None = None) -> list[OpenTrade]:
+        """Trades still open, optionally for one pair only."""
+        books = [self._books[pair]] if pair in self._books else []
+        if pair is None:
+            books = list(self._books.values())
+        trades: list[OpenTrade] = []
+        for book in books:
+            trades.extend(t for t, alive in zip(book.trades, book.alive, strict=True) if alive)
+            trades.extend(t for t, _ in book.pending)
+        return trades
+
+    def on_candle(self, candle: Candle) -> "list[events.TradeExit]":
+        """Resolve the candle's pair against a closed candle.
+
+        Returns:
+            ``StopHit``, ``TargetHit`` and ``TradeExpired`` events, in that
+            order, each group in the order the trades were opened.
+        """
+        close_time = candle.open_time + timeframe_duration(candle.timeframe)
+        return self.check(
+            candle.pair, candle.open_time, close_time, candle.high, candle.low, candle.close
+        )
+
+    def check(
+        self,
+        pair: str,
+        open_time: datetime,
+        close_time: datetime,
+        high: float,
+        low: float,
+        close: float,
+    ) -> "list[events.TradeExit]":
+        """Resolve a pair's trades against one closed candle given as values.
+
+        Args:
+            pair: Currency pair.
+            open_time: Candle open time (UTC).
+            close_time: Candle close time (UTC).
+            high: Candle high.
+            low: Candle low.
+            close: Candle close.
+
+        Returns:
+            As for ``on_candle``.
+        """
+        book = self._books.get(pair)
+        if book is None:
+            return []
+        long_stop, long_target, short_stop, short_target, expiry = book.indexes()
+        open_us, close_us = _to_us(open_time), _to_us(close_time)
+
+        stops = np.concatenate([long_stop.at_or_above(low), short_stop.at_or_below(high)])
+        targets = np.concatenate([long_target.at_or_below(high), short_target.at_or_above(low)])
+        stops = stops[self._live(book, stops, open_us)]
+        targets = targets[self._live(book, targets, open_us)]
+        targets = np.setdiff1d(targets, stops, assume_unique=True)  # stop-first
+        due = expiry.at_or_below(close_us)
+        due = due[book.alive[due]]
+        due = np.setdiff1d(due, np.concatenate([stops, targets]), assume_unique=True)
+        stale = due[book.expires_us[due] <= open_us]
+        expired = due[book.expires_us[due] > open_us]
+
+        exit_time = _from_us(close_us)
+        result = [
+            *self._exits(book, np.sort(stops), events.StopHit, book.stop, exit_time),
+            *self._exits(book, np.sort(targets), events.TargetHit, book.target, exit_time),
+        ]
+        if len(stale):
+            # The expiry passed between candles: mark at the last close seen.
+            last_close = book.last_close
+            price = book.entry[stale] if last_close is None else np.full(len(stale), last_close)
+            when = exit_time if book.last_close_us is None else _from_us(book.last_close_us)
+            prices = np.empty(len(book.trades))
+            prices[stale] = price
+            result += self._exits(book, np.sort(stale), events.TradeExpired, prices, when)
+        if len(expired):
+            result += self._exits(
+                book, expired, events.TradeExpired, np.full(len(book.trades), close), exit_time
+            )
+
+        book.last_close, book.last_close_us = close, close_us
+        return result
+
+    @staticmethod
+    def _live(book: _PairBook, slots: np.ndarray, open_us: int) -> np.ndarray:
+        return (
+            book.alive[slots]
+            & (book.entry_us[slots] <= open_us)
+            & (book.expires_us[slots] > open_us)
+        )
+
+    def _exits(
+        self,
+        book: _PairBook,
+        slots: np.ndarray,
+        event_type: "type[events.TradeExit]",
+        prices: np.ndarray,
+        exit_time: datetime,
+    ) -> "list[events.TradeExit]":
+        if len(slots) == 0:
+            return []
+        slots = np.sort(slots)
+        exit_price = prices[slots]
+        entry = book.entry[slots]
+        sign = np.where(book.is_long[slots], 1.0, -1.0)
+        result_r = sign * (exit_price - entry) / np.abs(entry - book.stop[slots])
+        if event_type is events.StopHit:
+            result_r = np.full(len(slots), -1.0)
+        book.kill(slots)
+        exits = []
+        for slot, price, r in zip(
+            slots.tolist(), exit_price.tolist(), result_r.tolist(), strict=True
+        ):
+            trade = book.trades[slot]
+            del self._pairs[trade.trade_id]
+            exits.append(
+                event_type(
+                    trade_id=trade.trade_id,
+                    pair=trade.pair,
+                    direction=trade.direction,
+                    exit_time=exit_time,
+                    exit_price=price,
+                    result_r=r,
+                )
+            )
+        return exits
@@ -0,0 +1,38 @@
+"""Market data bounded context — candle ingestion, storage and validation."""
+
+from src.domain.market_data.ingestion import TIMEFRAME_INTERVALS, TwelveDataAdapter, to_series
+from src.domain.market_data.resampler import (
+    Resampler,
+    resample,
+    resample_all,
+    timeframe_duration,
+)
+from src.domain.market_data.store import RECORD_DTYPE, CandleStore
+from src.domain.market_data.validation import (
+    GAP_DTYPE,
+    UNUSABLE,
+    QualityFlag,
+    QualityReport,
+    SessionCalendar,
+    validate_candles,
+    validate_series,
+)
+
+__all__ = [
+    "GAP_DTYPE",
+    "RECORD_DTYPE",
+    "TIMEFRAME_INTERVALS",
+    "UNUSABLE",
+    "CandleStore",
+    "QualityFlag",
+    "QualityReport",
+    "Resampler",
+    "SessionCalendar",
+    "TwelveDataAdapter",
+    "resample",
+    "resample_all",
+    "timeframe_duration",
+    "to_series",
+    "validate_candles",
+    "validate_series",
+]
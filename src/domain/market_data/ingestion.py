@@ -0,0 +1,206 @@
+"""TwelveData adapter — the market-data anti-corruption layer.
+
+Translates TwelveData time-series payloads into ``CandleSeries`` (BLUEPRINT
+§10.3). Pairs map to provider symbols through ``twelvedata_symbol`` in
+config/pairs.json, and our timeframes to provider intervals through
+``TIMEFRAME_INTERVALS``. If the provider changes, only this module and the
+client change.
+
+``fetch`` replaces fetching one pair and timeframe at a time. It sends every
+pair of a timeframe in batched requests, and all timeframes concurrently,
+through one pooled, rate-limited ``TwelveDataClient``. Payloads go straight
+into NumPy columns: no per-bar ``Candle`` model is built. Each batch passes
+the data-quality checks of ``validation`` on the way in, and each series
+advances its freshness watermark in the metrics registry.
+"""
+
+import asyncio
+from collections.abc import Iterable
+from datetime import datetime
+from typing import Any
+
+import numpy as np
+import structlog
+
+from src.domain.market_data.resampler import timeframe_duration
+from src.domain.market_data.validation import SessionCalendar, validate_candles
+from src.domain.observability.metrics import get_metrics_registry
+from src.domain.structure.models import CandleSeries
+from src.infrastructure.config import PairsConfig, get_config_registry
+from src.infrastructure.twelve_data import TwelveDataClient, TwelveDataError
+
+logger = structlog.get_logger(__name__)
+
+# Our timeframe -> TwelveData interval.
+TIMEFRAME_INTERVALS = {
+    "1M": "1min",
+    "5M": "5min",
+    "15M": "15min",
+    "30M": "30min",
+    "1H": "1h",
+    "2H": "2h",
+    "4H": "4h",
+    "D": "1day",
+    "W": "1week",
+}
+
+_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+class TwelveDataAdapter:
+    """Fetches candles from TwelveData as ``CandleSeries``."""
+
+    def __init__(
+        self,
+        client: TwelveDataClient,
+        pairs: PairsConfig | None = None,
+        calendar: SessionCalendar | None = None,
+    ) -> None:
+        """Create an adapter.
+
+        Args:
+            client: Shared TwelveData client.
+            pairs: Parsed pairs.json. Defaults to the config registry's copy.
+            calendar: Session calendar for data-quality checks. Defaults to
+                ``SessionCalendar.from_config()``.
+        """
+        self.client = client
+        self._pairs = pairs
+        self.calendar = calendar or SessionCalendar.from_config()
+
+    @property
+    def pairs(self) -> PairsConfig:
+        """Pair parameters used for symbol mapping."""
+        return self._pairs or get_config_registry().pairs
+
+    def symbol(self, pair: str) -> str:
+        """TwelveData symbol for a pair (e.g. "EURUSD" -> "EUR/USD").
+
+        Raises:
+            KeyError: If the pair is not in pairs.json.
+        """
+        return self.pairs.pairs[pair].twelvedata_symbol
+
+    @staticmethod
+    def interval(timeframe: str) -> str:
+        """TwelveData interval for a timeframe (e.g. "5M" -> "5min").
+
+        Raises:
+            ValueError: If TwelveData has no matching interval.
+        """
+        try:
+            return TIMEFRAME_INTERVALS[timeframe]
+        except KeyError:
+            raise ValueError(f"No TwelveData interval for timeframe {timeframe!r}") from None
+
+    async def fetch(
+        self,
+        pairs: Iterable[str],
+        timeframes: Iterable[str],
+        *,
+        outputsize: int | None = None,
+        start: datetime | None = None,
+        end: datetime | None = None,
+    ) -> dict[tuple[str, str], CandleSeries]:
+        """Fetch several pairs and timeframes concurrently.
+
+        Args:
+            pairs: Pairs in our format (e.g. "EURUSD").
+            timeframes: Timeframes in our format (e.g. "5M").
+            outputsize: Maximum bars per series (TwelveData caps it at 5000).
+            start: Earliest bar open time (UTC), inclusive.
+            end: Latest bar open time (UTC), inclusive.
+
+        Returns:
+            Series per (pair, timeframe). A symbol TwelveData reports an error
+            for is logged and left out, so one bad symbol does not fail the
+            rest.
+
+        Raises:
+            TwelveDataError: If a whole request fails.
+            KeyError: If a pair is not in pairs.json.
+            ValueError: If a timeframe has no TwelveData interval.
+        """
+        pairs, timeframes = list(pairs), list(timeframes)
+        symbols = {self.symbol(pair): pair for pair in pairs}
+        params = {
+            "outputsize": outputsize,
+            "start_date": start.strftime(_DATE_FORMAT) if start else None,
+            "end_date": end.strftime(_DATE_FORMAT) if end else None,
+        }
+        metrics = get_metrics_registry()
+        # One task per timeframe; the client batches the pairs of each.
+        with metrics.timed("ingest.fetch"):
+            results = await asyncio.gather(
+                *(
+                    self.client.time_series(list(symbols), self.interval(tf), **params)
+                    for tf in timeframes
+                )
+            )
+        series: dict[tuple[str, str], CandleSeries] = {}
+        for timeframe, payloads in zip(timeframes, results, strict=True):
+            for symbol, payload in payloads.items():
+                pair = symbols[symbol]
+                try:
+                    with metrics.timed("ingest.translate", pair, timeframe) as timer:
+                        bars = to_series(pair, timeframe, payload, calendar=self.calendar)
+                        timer.candles = len(bars)
+                    series[pair, timeframe] = bars
+                    if len(bars):
+                        close = bars.open_time[-1] + np.timedelta64(timeframe_duration(timeframe))
+                        metrics.mark_fresh(pair, timeframe, close)
+                except TwelveDataError as exc:
+                    logger.warning(
+                        "twelvedata_symbol_failed",
+                        pair=pair,
+                        timeframe=timeframe,
+                        code=exc.code,
+                        message=exc.message,
+                    )
+        return series
+
+
+def to_series(
+    pair: str,
+    timeframe: str,
+    payload: dict[str, Any],
+    *,
+    calendar: SessionCalendar | None = None,
+) -> CandleSeries:
+    """Translate one symbol's time-series payload into a series.
+
+    The bars are checked with ``validate_candles``. Duplicate, out-of-order
+    and invalid bars are dropped rather than failing the batch, and any
+    finding is logged.
+
+    Args:
+        pair: Pair in our format.
+        timeframe: Timeframe in our format.
+        payload: ``{"values": [{"datetime", "open", "high", "low", "close"},
+            ...], "status": "ok"}`` with UTC datetimes, in either order.
+        calendar: Session calendar for the checks. Defaults to
+            ``SessionCalendar.from_config()``.
+
+    Returns:
+        The usable bars, oldest first.
+
+    Raises:
+        TwelveDataError: If the payload is an error.
+    """
+    if payload.get("status") == "error":
+        raise TwelveDataError(int(payload.get("code", 0)), str(payload.get("message", "")))
+    values = payload.get("values") or []
+    columns = {key: [bar[key] for bar in values] for key in ("open", "high", "low", "close")}
+    open_time = np.array([bar["datetime"] for bar in values], dtype="datetime64[us]")
+    prices = {key: np.array(column, dtype=np.float64) for key, column in columns.items()}
+    if len(open_time) > 1 and open_time[0] > open_time[-1]:
+        open_time = open_time[::-1].copy()
+        prices = {key: column[::-1].copy() for key, column in prices.items()}
+    report = validate_candles(pair, timeframe, open_time, **prices, calendar=calendar)
+    if not report.ok:
+        logger.warning("twelvedata_data_quality", pair=pair, timeframe=timeframe, **report.counts())
+        keep = report.keep_mask()
+        open_time = open_time[keep]
+        prices = {key: column[keep] for key, column in prices.items()}
+    # What remains is ordered, unique and OHLC-consistent: the report checked it.
+    return CandleSeries(pair, timeframe, open_time, **prices, validate=False)
@@ -0,0 +1,313 @@
+"""Build higher-timeframe candles from a base (5M) series.
+
+Every timeframe the strategy needs (15M, 1H, 4H, D, W) can be rolled up
+locally from one 5M series instead of being fetched separately.
+
+Bucketing rules:
+
+- Intraday timeframes (``15M``, ``1H``, ``4H``, any ``<n>M`` / ``<n>H``) are
+  aligned to UTC midnight, so a 4H bar opens at 00:00, 04:00, 08:00, ...
+- ``D`` is the trading day. It opens at the earliest session start in
+  ``config/sessions.json`` (00:00 UTC for ASIA today). Bars falling on a
+  Saturday or Sunday trading day are rolled into the following Monday, so
+  the Sunday-evening open never forms its own daily candle.
+- ``W`` is Monday through Friday of trading days, labelled with Monday's
+  open. Weekend bars therefore start the new week.
+
+A higher-timeframe candle's open_time is its bucket label, not the open time
+of its first source bar (they differ only for a Monday that absorbed weekend
+bars).
+
+``resample`` aggregates a whole history in one vectorised pass
+(``np.maximum.reduceat`` / ``np.minimum.reduceat`` over bucket boundaries).
+``Resampler`` applies the same rules one closed 5M candle at a time, keeping
+the forming bar of every target timeframe and emitting each one as it closes.
+"""
+
+import re
+from collections.abc import Iterable
+from datetime import datetime, timedelta
+
+import numpy as np
+
+from src.domain.structure.models import Candle, CandleSeries
+from src.infrastructure.config import SessionsConfig, get_config_registry
+
+DEFAULT_TIMEFRAMES = ("15M", "1H", "4H", "D", "W")
+
+_INTRADAY_RE = re.compile(r"^([1-9]\d*)([MH])$")
+_UNIT_MINUTES = {"M": 1, "H": 60}
+
+_EPOCH = datetime(1970, 1, 1)
+_US_PER_MINUTE = 60 * 1_000_000
+_US_PER_DAY = 1440 * _US_PER_MINUTE
+# 1970-01-01 was a Thursday: (day_index + _EPOCH_WEEKDAY) % 7 gives Monday = 0.
+_EPOCH_WEEKDAY = 3
+
+
+def trading_day_open(sessions: SessionsConfig | None = None) -> timedelta:
+    """UTC time of day at which the trading day starts.
+
+    Args:
+        sessions: Parsed sessions.json. Defaults to the config registry's copy.
+
+    Returns:
+        The earliest session ``start_utc``, as an offset from midnight UTC.
+    """
+    sessions = sessions or get_config_registry().sessions
+    start = min(window.start_utc for window in sessions.sessions.values())
+    return timedelta(hours=start.hour, minutes=start.minute)
+
+
+def timeframe_duration(timeframe: str) -> timedelta:
+    """Nominal length of one bar.
+
+    Args:
+        timeframe: "<n>M", "<n>H", "D" or "W". A W bar spans five trading
+            days.
+
+    Returns:
+        The bar length, so ``open_time + timeframe_duration(tf)`` is the bar's
+        close time.
+
+    Raises:
+        ValueError: If the timeframe is not supported.
+    """
+    return timedelta(microseconds=_bucket_length_us(timeframe))
+
+
+def resample(
+    series: CandleSeries, timeframe: str, day_open: timedelta | None = None
+) -> CandleSeries:
+    """Aggregate a series into a higher timeframe.
+
+    The last bucket may still be forming (e.g. a 1H bar built from only the
+    first three 5M bars of the hour); it is returned like any other bucket.
+
+    Args:
+        series: Source candles (typically 5M), ascending by open_time.
+        timeframe: Target timeframe, e.g. "1H", "4H", "D" or "W".
+        day_open: Trading-day open for D/W buckets. Defaults to
+            ``trading_day_open()``.
+
+    Returns:
+        A CandleSeries in the target timeframe. OHLC consistency holds by
+        construction, so it is not re-validated.
+
+    Raises:
+        ValueError: If the target timeframe is not a whole multiple of the
+            source timeframe.
+    """
+    _check_timeframes(series.timeframe, timeframe)
+    if day_open is None and timeframe in ("D", "W"):
+        day_open = trading_day_open()
+    labels = _bucket_labels(series.open_time, timeframe, day_open or timedelta())
+
+    n = len(labels)
+    if n == 0:
+        return _empty(series.pair, timeframe)
+    starts = np.flatnonzero(np.concatenate(([True], labels[1:] != labels[:-1])))
+    ends = np.append(starts[1:], n) - 1
+    return CandleSeries(
+        series.pair,
+        timeframe,
+        labels[starts],
+        series.open[starts],
+        np.maximum.reduceat(series.high, starts),
+        np.minimum.reduceat(series.low, starts),
+        series.close[ends],
+        validate=False,
+    )
+
+
+def resample_all(
+    series: CandleSeries,
+    timeframes: Iterable[str] = DEFAULT_TIMEFRAMES,
+    day_open: timedelta | None = None,
+) -> dict[str, CandleSeries]:
+    """Resample one base series into several timeframes.
+
+    Args:
+        series: Source candles (typically 5M).
+        timeframes: Target timeframes. Defaults to 15M, 1H, 4H, D and W.
+        day_open: Trading-day open for D/W buckets. Defaults to
+            ``trading_day_open()``.
+
+    Returns:
+        Mapping of timeframe to resampled series.
+    """
+    timeframes = tuple(timeframes)
+    if day_open is None and any(tf in ("D", "W") for tf in timeframes):
+        day_open = trading_day_open()
+    return {tf: resample(series, tf, day_open) for tf in timeframes}
+
+
+class Resampler:
+    """Incremental roll-up of closed base candles into higher timeframes.
+
+    Keeps one forming bar per (pair, target timeframe). Each ``update`` folds a
+    closed base candle into every forming bar and returns the bars that closed
+    as a result — either because the candle completed the bucket (e.g. the
+    :55 5M bar closes the hour) or because it opened a new one. Output is
+    identical to ``resample`` over the same history.
+
+    Example:
+        resampler = Resampler(("1H", "4H", "D"))
+        for candle in feed_5m:
+            for closed in resampler.update(candle):
+                store(closed)
+    """
+
+    def __init__(
+        self,
+        timeframes: Iterable[str] = DEFAULT_TIMEFRAMES,
+        source_timeframe: str = "5M",
+        day_open: timedelta | None = None,
+    ) -> None:
+        """Create an empty resampler.
+
+        Args:
+            timeframes: Target timeframes to maintain.
+            source_timeframe: Timeframe of the candles passed to ``update``.
+            day_open: Trading-day open for D/W buckets. Defaults to
+                ``trading_day_open()``.
+
+        Raises:
+            ValueError: If a target is not a whole multiple of the source.
+        """
+        self.timeframes = tuple(timeframes)
+        self.source_timeframe = source_timeframe
+        for timeframe in self.timeframes:
+            _check_timeframes(source_timeframe, timeframe)
+        if day_open is None and any(tf in ("D", "W") for tf in self.timeframes):
+            day_open = trading_day_open()
+        self._day_open_us = _to_us(day_open or timedelta())
+        self._source_us = _intraday_us(source_timeframe)
+        # (pair, timeframe) -> [label_us, open, high, low, close]
+        self._forming: dict[tuple[str, str], list] = {}
+        self._last_us: dict[str, int] = {}
+
+    def update(self, candle: Candle) -> list[Candle]:
+        """Fold one closed base candle into every target timeframe.
+
+        Args:
+            candle: The newly closed candle. Must be in ``source_timeframe``
+                and later than the previous candle fed for the same pair.
+
+        Returns:
+            Higher-timeframe candles closed by this update, in target order.
+
+        Raises:
+            ValueError: If the candle has the wrong timeframe or is not
+                strictly after the previous candle for its pair.
+        """
+        if candle.timeframe != self.source_timeframe:
+            raise ValueError(
+                f"Resampler expects {self.source_timeframe} candles, got {candle.timeframe}"
+            )
+        t_us = _to_us(candle.open_time.replace(tzinfo=None) - _EPOCH)
+        last = self._last_us.get(candle.pair)
+        if last is not None and t_us <= last:
+            raise ValueError(
+                "Candles must be fed ascending by open_time with no duplicates. "
+                f"{candle.pair}: {candle.open_time} is not after the previous candle"
+            )
+        self._last_us[candle.pair] = t_us
+
+        closed: list[Candle] = []
+        for timeframe in self.timeframes:
+            key = (candle.pair, timeframe)
+            label = int(_bucket_label_us(t_us, timeframe, self._day_open_us))
+            bar = self._forming.get(key)
+            if bar is not None and bar[0] != label:
+                closed.append(self._to_candle(candle.pair, timeframe, bar))
+                bar = None
+            if bar is None:
+                bar = self._forming[key] = [label, candle.open, candle.high, candle.low, 0.0]
+            else:
+                bar[2] = max(bar[2], candle.high)
+                bar[3] = min(bar[3], candle.low)
+            bar[4] = candle.close
+            if t_us + self._source_us >= label + _bucket_length_us(timeframe):
+                closed.append(self._to_candle(candle.pair, timeframe, bar))
+                del self._forming[key]
+        return closed
+
+    def forming(self, pair: str, timeframe: str) -> Candle | None:
+        """The current, not yet closed bar for a pair/timeframe (None if none)."""
+        bar = self._forming.get((pair, timeframe))
+        return None if bar is None else self._to_candle(pair, timeframe, bar)
+
+    @staticmethod
+    def _to_candle(pair: str, timeframe: str, bar: list) -> Candle:
+        label, open_, high, low, close = bar
+        return Candle.trusted(
+            pair=pair,
+            timeframe=timeframe,
+            open_time=_EPOCH + timedelta(microseconds=label),
+            open=open_,
+            high=high,
+            low=low,
+            close=close,
+        )
+
+
+# -- bucketing -----------------------------------------------------------------
+
+
+def _intraday_us(timeframe: str) -> int:
+    match = _INTRADAY_RE.match(timeframe)
+    if match is None:
+        raise ValueError(f"Unsupported timeframe '{timeframe}'. Expected <n>M, <n>H, 'D' or 'W'.")
+    return int(match.group(1)) * _UNIT_MINUTES[match.group(2)] * _US_PER_MINUTE
+
+
+def _bucket_length_us(timeframe: str) -> int:
+    """Nominal bucket length. A W bucket ends on Saturday's trading-day open."""
+    if timeframe == "D":
+        return _US_PER_DAY
+    if timeframe == "W":
+        return 5 * _US_PER_DAY
+    return _intraday_us(timeframe)
+
+
+def _check_timeframes(source: str, target: str) -> None:
+    source_us = _intraday_us(source)
+    target_us = _US_PER_DAY if target in ("D", "W") else _intraday_us(target)
+    if target_us <= source_us or target_us % source_us:
+        raise ValueError(
+            f"Cannot resample {source} into {target}: target must be a whole multiple "
+            "of the source timeframe"
+        )
+
+
+def _bucket_labels(open_time: np.ndarray, timeframe: str, day_open: timedelta) -> np.ndarray:
+    """Bucket open time for every source bar, as ``datetime64[us]``."""
+    t_us = open_time.astype("datetime64[us]").astype(np.int64)
+    labels = _bucket_label_us(t_us, timeframe, _to_us(day_open))
+    return np.asarray(labels).astype("datetime64[us]")
+
+
+def _bucket_label_us(t_us: np.ndarray | int, timeframe: str, day_open_us: int) -> np.ndarray:
+    """Bucket start in epoch microseconds, for an int64 array or a single int."""
+    if timeframe not in ("D", "W"):
+        size = _intraday_us(timeframe)
+        return t_us - t_us % size
+
+    day = (t_us - day_open_us) // _US_PER_DAY
+    weekday = (day + _EPOCH_WEEKDAY) % 7
+    # Saturday (5) -> +2 days, Sunday (6) -> +1 day: weekend bars join Monday.
+    day = day + np.where(weekday >= 5, 7 - weekday, 0)
+    if timeframe == "W":
+        day = day - (day + _EPOCH_WEEKDAY) % 7
+    return day * _US_PER_DAY + day_open_us
+
+
+def _empty(pair: str, timeframe: str) -> CandleSeries:
+    prices = np.empty(0, dtype=np.float64)
+    times = np.empty(0, dtype="datetime64[us]")
+    return CandleSeries(pair, timeframe, times, prices, prices, prices, prices, validate=False)
+
+
+def _to_us(delta: timedelta) -> int:
+    return (delta.days * 86_400 + delta.seconds) * 1_000_000 + delta.microseconds
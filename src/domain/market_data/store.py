@@ -0,0 +1,216 @@
+"""Local, memory-mapped binary candle store.
+
+One append-only file per pair/timeframe holds fixed-width little-endian
+records (``RECORD_DTYPE``, 40 bytes each) after a 16-byte header. Because
+records are ascending by open_time, the open_time column is its own time
+index: a date-range read is two binary searches over the memory-mapped file
+followed by a zero-copy slice, so only the touched pages are ever read.
+
+Layout::
+
+    root/
+      EURUSD/
+        5M.candles
+        1H.candles
+
+The store holds already-validated data, so reads skip ``CandleSeries``
+validation. Appends validate the incoming series on construction as usual.
+
+A write interrupted mid-record (crash, full disk) leaves a torn tail that is
+not a whole number of records. Readers ignore it; the next append truncates
+it before writing, so later records stay aligned.
+"""
+
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import BinaryIO
+
+import numpy as np
+import structlog
+
+from src.domain.structure.models import CandleSeries
+
+# File header: 8-byte magic + 8 reserved bytes (keeps records 8-byte aligned).
+MAGIC = b"FACNDL01"
+HEADER_SIZE = 16
+HEADER = MAGIC.ljust(HEADER_SIZE, b"\0")
+
+RECORD_DTYPE = np.dtype(
+    [
+        ("open_time", "<M8[us]"),
+        ("open", "<f8"),
+        ("high", "<f8"),
+        ("low", "<f8"),
+        ("close", "<f8"),
+    ]
+)
+
+FILE_SUFFIX = ".candles"
+
+logger = structlog.get_logger(__name__)
+
+
+class CandleStore:
+    """Append-only, memory-mapped candle files under one root directory."""
+
+    def __init__(self, root: Path | str) -> None:
+        """Open (or create) a store rooted at ``root``.
+
+        Args:
+            root: Directory holding one sub-directory per pair.
+        """
+        self.root = Path(root)
+
+    def path(self, pair: str, timeframe: str) -> Path:
+        """File path for a pair/timeframe series."""
+        return self.root / pair / f"{timeframe}{FILE_SUFFIX}"
+
+    def series_keys(self) -> list[tuple[str, str]]:
+        """All stored (pair, timeframe) series, sorted."""
+        return sorted(
+            (path.parent.name, path.name.removesuffix(FILE_SUFFIX))
+            for path in self.root.glob(f"*/*{FILE_SUFFIX}")
+        )
+
+    def count(self, pair: str, timeframe: str) -> int:
+        """Number of stored candles (0 if the series does not exist)."""
+        path = self.path(pair, timeframe)
+        if not path.exists():
+            return 0
+        return max(0, (path.stat().st_size - HEADER_SIZE) // RECORD_DTYPE.itemsize)
+
+    def last_open_time(self, pair: str, timeframe: str) -> np.datetime64 | None:
+        """open_time of the newest stored candle, or None if the series is empty."""
+        path = self.path(pair, timeframe)
+        n = self.count(pair, timeframe)
+        if n == 0:
+            return None
+        with open(path, "rb") as f:
+            self._check_header(f.read(HEADER_SIZE), path)
+            f.seek(HEADER_SIZE + (n - 1) * RECORD_DTYPE.itemsize)
+            record = np.frombuffer(f.read(RECORD_DTYPE.itemsize), dtype=RECORD_DTYPE)
+        return record["open_time"][0]
+
+    def append(self, series: CandleSeries) -> int:
+        """Append candles to the end of their series file.
+
+        Only the file tail is read (to find the last stored open_time), so the
+        cost is O(new rows) regardless of file size. Rows at or before the
+        last stored open_time are treated as already stored and skipped, which
+        makes re-appending an overlapping fetch window safe.
+
+        A torn tail left by an interrupted write is truncated first, and the
+        new records go out in a single write.
+
+        Args:
+            series: Validated candles for one pair/timeframe.
+
+        Returns:
+            Number of rows actually written.
+
+        Raises:
+            ValueError: If the existing file is not a candle store file.
+        """
+        path = self.path(series.pair, series.timeframe)
+        last = self.last_open_time(series.pair, series.timeframe)
+        start = 0 if last is None else int(np.searchsorted(series.open_time, last, side="right"))
+        if start == len(series):
+            return 0
+
+        records = np.empty(len(series) - start, dtype=RECORD_DTYPE)
+        records["open_time"] = series.open_time[start:]
+        records["open"] = series.open[start:]
+        records["high"] = series.high[start:]
+        records["low"] = series.low[start:]
+        records["close"] = series.close[start:]
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "r+b" if path.exists() else "w+b") as f:
+            payload = records.tobytes()
+            end = self._whole_records_end(f, path)
+            if end == 0:
+                payload = HEADER + payload
+            f.seek(end)
+            f.truncate()
+            f.write(payload)
+        return len(records)
+
+    def read(
+        self,
+        pair: str,
+        timeframe: str,
+        start: datetime | np.datetime64 | None = None,
+        end: datetime | np.datetime64 | None = None,
+    ) -> CandleSeries:
+        """Read a date range as a zero-copy view over the memory-mapped file.
+
+        Args:
+            pair: Currency pair (e.g. "EURUSD").
+            timeframe: Timeframe (e.g. "5M").
+            start: Inclusive lower bound on open_time (UTC). None = first candle.
+            end: Exclusive upper bound on open_time (UTC). None = last candle.
+
+        Returns:
+            A CandleSeries whose columns are strided views into the mapping.
+            The mapping stays open for as long as the series (or any slice of
+            it) is referenced.
+
+        Raises:
+            FileNotFoundError: If the series has never been written.
+            ValueError: If the file is not a candle store file.
+        """
+        path = self.path(pair, timeframe)
+        if not path.exists():
+            raise FileNotFoundError(f"No stored candles for {pair} {timeframe} at {path}")
+        with open(path, "rb") as f:
+            self._check_header(f.read(HEADER_SIZE), path)
+
+        n = self.count(pair, timeframe)
+        if n == 0:
+            records = np.empty(0, dtype=RECORD_DTYPE)
+        else:
+            records = np.memmap(path, dtype=RECORD_DTYPE, mode="r", offset=HEADER_SIZE, shape=(n,))
+
+        times = records["open_time"]
+        lo = 0 if start is None else int(np.searchsorted(times, _as_datetime64(start), "left"))
+        hi = n if end is None else int(np.searchsorted(times, _as_datetime64(end), "left"))
+        window = records[lo:hi]
+
+        return CandleSeries(
+            pair,
+            timeframe,
+            window["open_time"],
+            window["open"],
+            window["high"],
+            window["low"],
+            window["close"],
+            validate=False,
+        )
+
+    @staticmethod
+    def _check_header(header: bytes, path: Path) -> None:
+        if header[: len(MAGIC)] != MAGIC:
+            raise ValueError(f"{path} is not a candle store file (bad header)")
+
+    @staticmethod
+    def _whole_records_end(f: BinaryIO, path: Path) -> int:
+        """Offset just past the last whole record (0 if the header is incomplete)."""
+        size = f.seek(0, os.SEEK_END)
+        f.seek(0)
+        header = f.read(HEADER_SIZE)
+        if size < HEADER_SIZE:
+            if not HEADER.startswith(header):
+                raise ValueError(f"{path} is not a candle store file (bad header)")
+            end = 0
+        else:
+            CandleStore._check_header(header, path)
+            whole = (size - HEADER_SIZE) // RECORD_DTYPE.itemsize
+            end = HEADER_SIZE + whole * RECORD_DTYPE.itemsize
+        if end != size:
+            logger.warning("candle_store_torn_tail", path=str(path), discarded_bytes=size - end)
+        return end
+
+
+def _as_datetime64(value: datetime | np.datetime64) -> np.datetime64:
+    return np.datetime64(value, "us")
@@ -0,0 +1,398 @@
+"""Vectorised data-quality checks for candle batches (BLUEPRINT §10.1).
+
+``validate_candles`` checks a batch of raw columns, from one fetch to a
+multi-year history, in one pass of array operations. It never raises on bad
+data. It returns a ``QualityReport`` listing only the flagged rows, each
+with a ``QualityFlag`` bitmask, and the gaps found:
+
+- DUPLICATE: the open_time was already seen earlier in the batch.
+- OUT_OF_ORDER: the bar opens before an earlier bar.
+- INVALID: a price is zero, negative or not finite, or high/low do not
+  bound open and close.
+- OUTLIER: the bar's range exceeds ``outlier_factor`` times the median
+  range of its block of ``outlier_window`` bars (10x by default).
+- OFF_SESSION: the bar opens outside every session, or on a day that is not
+  a trading day.
+
+Gaps are judged against a ``SessionCalendar`` built from
+config/sessions.json. A gap is the time between two consecutive bars. It is
+only reported, with a ``DataGapDetected`` event, if bars were expected in
+it. Weekends, holidays and the hours between sessions are therefore not
+gaps. Callers decide what to drop (``QualityReport.keep_mask``) and can
+batch gap backfills from ``QualityReport.gaps``.
+"""
+
+import warnings
+from collections.abc import Iterable
+from datetime import date, time, timedelta
+from enum import IntFlag
+from functools import cached_property
+from typing import NamedTuple
+
+import numpy as np
+
+from src.domain.market_data.resampler import timeframe_duration, trading_day_open
+from src.domain.structure.models import CandleSeries
+
+# Module reference: src.events.models indirectly imports this package.
+from src.events import models as events
+from src.infrastructure.config import SessionsConfig, get_config_registry
+
+# A bar is an OUTLIER when its range exceeds this multiple of the typical range.
+OUTLIER_FACTOR = 10.0
+# Bars per block the typical (median) range is taken over; one day of 5M bars.
+OUTLIER_WINDOW = 288
+
+# Structured dtype of QualityReport.gaps — one row per gap.
+GAP_DTYPE = np.dtype(
+    [
+        ("index", "i8"),
+        ("start", "datetime64[us]"),
+        ("end", "datetime64[us]"),
+        ("missing_bars", "i8"),
+    ]
+)
+
+_US_PER_MINUTE = 60_000_000
+_US_PER_DAY = 1440 * _US_PER_MINUTE
+_US_PER_WEEK = 7 * _US_PER_DAY
+# 1970-01-05, the first Monday after the epoch, as a day index.
+_FIRST_MONDAY = 4
+
+
+class QualityFlag(IntFlag):
+    """Problems found in one bar. A bar can carry several."""
+
+    DUPLICATE = 1
+    OUT_OF_ORDER = 2
+    INVALID = 4
+    OUTLIER = 8
+    OFF_SESSION = 16
+
+
+# Flags of bars a CandleSeries cannot hold.
+UNUSABLE = QualityFlag.DUPLICATE | QualityFlag.OUT_OF_ORDER | QualityFlag.INVALID
+
+
+class SessionCalendar:
+    """When bars are expected: during a session, on a trading day.
+
+    A trading day starts at ``day_open`` (UTC) and is a trading day when the
+    weekday is in ``weekmask`` and the date is not a holiday. Intraday bars
+    are expected in every bar slot that overlaps a session window. D bars
+    are expected on every trading day, and W bars every Monday.
+    """
+
+    def __init__(
+        self,
+        windows: Iterable[tuple[time, time]],
+        *,
+        holidays: Iterable[date] = (),
+        weekmask: str = "1111100",
+        day_open: timedelta = timedelta(),
+    ) -> None:
+        """Create a calendar.
+
+        Args:
+            windows: (start, end) UTC session windows. A window whose end is
+                not after its start wraps past midnight.
+            holidays: Dates with no trading.
+            weekmask: Trading weekdays, Monday first ("1111100" = Mon-Fri).
+            day_open: UTC time of day each trading day starts.
+
+        Raises:
+            ValueError: If no window is given.
+        """
+        self.windows = tuple(windows)
+        if not self.windows:
+            raise ValueError("A session calendar needs at least one session window")
+        self.day_open = day_open
+        self._day_open_us = round(day_open.total_seconds()) * 1_000_000
+        holidays = np.array(sorted(holidays), dtype="datetime64[D]")
+        self._busdays = np.busdaycalendar(weekmask=weekmask, holidays=holidays)
+
+    @classmethod
+    def from_config(
+        cls, sessions: SessionsConfig | None = None, *, holidays: Iterable[date] = ()
+    ) -> "SessionCalendar":
+        """Calendar of the sessions in sessions.json, Monday to Friday.
+
+        Args:
+            sessions: Parsed sessions.json. Defaults to the config registry's copy.
+            holidays: Dates with no trading.
+        """
+        sessions = sessions or get_config_registry().sessions
+        return cls(
+            ((w.start_utc, w.end_utc) for w in sessions.sessions.values()),
+            holidays=holidays,
+            day_open=trading_day_open(sessions),
+        )
+
+    @cached_property
+    def _session_minutes(self) -> np.ndarray:
+        """Minutes of the trading day inside some session."""
+        minutes = np.zeros(1440, dtype=bool)
+        for start, end in self.windows:
+            s, e = start.hour * 60 + start.minute, end.hour * 60 + end.minute
+            if e > s:
+                minutes[s:e] = True
+            else:
+                minutes[s:] = True
+                minutes[:e] = True
+        return np.roll(minutes, -(self._day_open_us // _US_PER_MINUTE))
+
+    def _grid(self, timeframe: str) -> tuple[int, np.ndarray]:
+        """Bar length and, per slot of the trading day, whether bars are expected."""
+        if timeframe == "D":
+            return _US_PER_DAY, np.array([self._session_minutes.any()])
+        length = _timeframe_us(timeframe)
+        if _US_PER_DAY % length:
+            raise ValueError(f"Timeframe {timeframe} does not divide the day into whole bars")
+        slots = self._session_minutes.reshape(_US_PER_DAY // length, -1).any(axis=1)
+        return length, slots
+
+    def _days(self, t_us: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Trading-day index and offset into the trading day."""
+        return np.divmod(t_us - self._day_open_us, _US_PER_DAY)
+
+    def _is_trading_day(self, day: np.ndarray) -> np.ndarray:
+        return np.is_busday(day.astype("datetime64[D]"), busdaycal=self._busdays)
+
+    def in_session(self, open_time: np.ndarray, timeframe: str) -> np.ndarray:
+        """Whether each bar opens in a slot where bars are expected.
+
+        Args:
+            open_time: Bar open times (``datetime64``).
+            timeframe: "<n>M", "<n>H" (dividing the day), "D" or "W".
+
+        Returns:
+            Boolean array aligned with ``open_time``.
+        """
+        t = np.asarray(open_time, dtype="datetime64[us]").astype(np.int64)
+        if timeframe == "W":
+            return (t - self._day_open_us - _FIRST_MONDAY * _US_PER_DAY) % _US_PER_WEEK == 0
+        length, slots = self._grid(timeframe)
+        day, offset = self._days(t)
+        return self._is_trading_day(day) & slots[offset // length]
+
+    def expected_bars(self, start: np.ndarray, end: np.ndarray, timeframe: str) -> np.ndarray:
+        """Number of expected bars opening in ``[start, end)``, elementwise.
+
+        Args:
+            start: Range starts (``datetime64``).
+            end: Range ends (``datetime64``), aligned with ``start``.
+            timeframe: As for ``in_session``.
+        """
+        start = np.asarray(start, dtype="datetime64[us]").astype(np.int64)
+        end = np.asarray(end, dtype="datetime64[us]").astype(np.int64)
+        if len(start) == 0:
+            return np.zeros(0, dtype=np.int64)
+        if timeframe == "W":
+            origin = self._day_open_us + _FIRST_MONDAY * _US_PER_DAY
+            return -((origin - end) // _US_PER_WEEK) + (origin - start) // _US_PER_WEEK
+        length, slots = self._grid(timeframe)
+        per_slot = np.concatenate([[0], np.cumsum(slots)])
+        day, offset = self._days(np.concatenate([start, end]))
+        # Trading days before each day, relative to the earliest day involved.
+        first = int(day.min())
+        trading = self._is_trading_day(np.arange(first, int(day.max()) + 1))
+        before = np.concatenate([[0], np.cumsum(trading)])
+        slot = -(-offset // length)  # slots of the day opening before t
+        count = before[day - first] * per_slot[-1] + trading[day - first] * per_slot[slot]
+        return count[len(start) :] - count[: len(start)]
+
+
+class QualityReport(NamedTuple):
+    """Flagged rows and gaps of one validated batch.
+
+    Attributes:
+        pair: Currency pair.
+        timeframe: Timeframe of the batch.
+        rows: Number of rows checked.
+        index: Flagged row indices, ascending.
+        flags: ``QualityFlag`` bits per flagged row, aligned with ``index``.
+        gaps: Gaps with expected bars missing, ``GAP_DTYPE``, by start time.
+            ``index`` is the row of the bar before the gap.
+    """
+
+    pair: str
+    timeframe: str
+    rows: int
+    index: np.ndarray
+    flags: np.ndarray
+    gaps: np.ndarray
+
+    @property
+    def ok(self) -> bool:
+        """True when nothing was flagged and no gap was found."""
+        return len(self.index) == 0 and len(self.gaps) == 0
+
+    def flagged(self, flag: QualityFlag) -> np.ndarray:
+        """Rows carrying any of the bits in ``flag``."""
+        return self.index[(self.flags & flag) != 0]
+
+    def keep_mask(self, drop: QualityFlag = UNUSABLE) -> np.ndarray:
+        """Boolean mask over all rows, False for rows carrying any bit in ``drop``."""
+        keep = np.ones(self.rows, dtype=bool)
+        keep[self.flagged(drop)] = False
+        return keep
+
+    def counts(self) -> dict[str, int]:
+        """Flagged rows per flag name, plus the number of gaps."""
+        counts = {flag.name: int(((self.flags & flag) != 0).sum()) for flag in QualityFlag}
+        return {**counts, "gaps": len(self.gaps)}
+
+    def gap_events(self) -> "list[events.DataGapDetected]":
+        """One ``DataGapDetected`` per gap, for publishing on the event bus."""
+        return [
+            events.DataGapDetected(
+                pair=self.pair,
+                timeframe=self.timeframe,
+                start=start,
+                end=end,
+                missing_bars=missing,
+            )
+            for start, end, missing in zip(
+                self.gaps["start"].tolist(),
+                self.gaps["end"].tolist(),
+                self.gaps["missing_bars"].tolist(),
+                strict=True,
+            )
+        ]
+
+
+def validate_candles(
+    pair: str,
+    timeframe: str,
+    open_time: np.ndarray,
+    open: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    *,
+    calendar: SessionCalendar | None = None,
+    outlier_factor: float = OUTLIER_FACTOR,
+    outlier_window: int = OUTLIER_WINDOW,
+) -> QualityReport:
+    """Check a batch of raw candle columns.
+
+    Args:
+        pair: Currency pair.
+        timeframe: "<n>M", "<n>H" (dividing the day), "D" or "W".
+        open_time: Open times convertible to ``datetime64[us]``, in any order.
+        open: Opening prices.
+        high: Highest prices.
+        low: Lowest prices.
+        close: Closing prices.
+        calendar: Expected trading hours. Defaults to
+            ``SessionCalendar.from_config()``.
+        outlier_factor: Range multiple of the block median flagged as OUTLIER.
+        outlier_window: Bars per block for the median range.
+
+    Returns:
+        The report. Duplicates are flagged on every occurrence after the
+        first; gaps are measured between the distinct open times in order.
+
+    Raises:
+        ValueError: If the columns differ in length or a parameter is invalid.
+    """
+    t = np.asarray(open_time, dtype="datetime64[us]").astype(np.int64)
+    o, h, lo, c = (np.asarray(col, dtype=np.float64) for col in (open, high, low, close))
+    n = len(t)
+    if not n == len(o) == len(h) == len(lo) == len(c):
+        raise ValueError("Candle columns must all have the same length")
+    if outlier_factor <= 0 or outlier_window < 1:
+        raise ValueError("outlier_factor must be > 0 and outlier_window >= 1")
+    calendar = calendar or SessionCalendar.from_config()
+    flags = np.zeros(n, dtype=np.uint8)
+
+    order = np.argsort(t, kind="stable")
+    ts = t[order]
+    repeat = np.zeros(n, dtype=bool)
+    repeat[1:] = ts[1:] == ts[:-1]
+    duplicate = np.empty(n, dtype=bool)
+    duplicate[order] = repeat
+    flags[duplicate] |= np.uint8(QualityFlag.DUPLICATE)
+    if n > 1:
+        out_of_order = np.zeros(n, dtype=bool)
+        out_of_order[1:] = t[1:] < np.maximum.accumulate(t)[:-1]
+        flags[out_of_order & ~duplicate] |= np.uint8(QualityFlag.OUT_OF_ORDER)
+
+    with np.errstate(invalid="ignore"):
+        invalid = ~(np.isfinite(o) & np.isfinite(h) & np.isfinite(lo) & np.isfinite(c))
+        invalid |= (o <= 0) | (h <= 0) | (lo <= 0) | (c <= 0)
+        invalid |= (h < np.maximum(o, c)) | (lo > np.minimum(o, c))
+    flags[invalid] |= np.uint8(QualityFlag.INVALID)
+
+    spread = np.where(invalid, np.nan, h - lo)
+    typical = _block_median(spread, outlier_window)
+    with np.errstate(invalid="ignore"):
+        outlier = (typical > 0) & (spread > outlier_factor * typical)
+    flags[outlier] |= np.uint8(QualityFlag.OUTLIER)
+    flags[~calendar.in_session(t.astype("datetime64[us]"), timeframe)] |= np.uint8(
+        QualityFlag.OFF_SESSION
+    )
+
+    index = np.flatnonzero(flags)
+    return QualityReport(
+        pair,
+        timeframe,
+        n,
+        index,
+        flags[index],
+        _gaps(ts[~repeat], order[~repeat], timeframe, calendar),
+    )
+
+
+def validate_series(series: CandleSeries, **kwargs: object) -> QualityReport:
+    """``validate_candles`` on a series' columns (keyword arguments as there).
+
+    A validated series can only be flagged OUTLIER or OFF_SESSION, or have
+    gaps.
+    """
+    return validate_candles(
+        series.pair,
+        series.timeframe,
+        series.open_time,
+        series.open,
+        series.high,
+        series.low,
+        series.close,
+        **kwargs,  # type: ignore[arg-type]
+    )
+
+
+def _timeframe_us(timeframe: str) -> int:
+    return timeframe_duration(timeframe) // timedelta(microseconds=1)
+
+
+def _block_median(values: np.ndarray, window: int) -> np.ndarray:
+    """Median of each block of ``window`` values (NaN ignored), per value."""
+    n = len(values)
+    if n == 0:
+        return values
+    blocks = -(-n // window)
+    padded = np.full(blocks * window, np.nan)
+    padded[:n] = values
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)  # all-NaN blocks
+        medians = np.nanmedian(padded.reshape(blocks, window), axis=1)
+    return np.repeat(medians, window)[:n]
+
+
+def _gaps(
+    times: np.ndarray, rows: np.ndarray, timeframe: str, calendar: SessionCalendar
+) -> np.ndarray:
+    """Gaps between consecutive distinct open times with expected bars missing."""
+    step = _US_PER_WEEK if timeframe == "W" else _timeframe_us(timeframe)
+    after = np.flatnonzero(np.diff(times) > step)
+    start = (times[after] + step).astype("datetime64[us]")
+    end = times[after + 1].astype("datetime64[us]")
+    missing = calendar.expected_bars(start, end, timeframe)
+    real = missing > 0
+    gaps = np.empty(int(real.sum()), dtype=GAP_DTYPE)
+    gaps["index"] = rows[after[real]]
+    gaps["start"] = start[real]
+    gaps["end"] = end[real]
+    gaps["missing_bars"] = missing[real]
+    return gaps
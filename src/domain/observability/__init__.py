@@ -0,0 +1,23 @@
+"""Observability bounded context — pipeline metrics and data freshness."""
+
+from src.domain.observability.metrics import (
+    CONTENT_TYPE,
+    DEFAULT_BUCKETS,
+    MetricsRegistry,
+    MetricsSettings,
+    StageLabels,
+    get_metrics_registry,
+    instrument,
+    timed,
+)
+
+__all__ = [
+    "CONTENT_TYPE",
+    "DEFAULT_BUCKETS",
+    "MetricsRegistry",
+    "MetricsSettings",
+    "StageLabels",
+    "get_metrics_registry",
+    "instrument",
+    "timed",
+]
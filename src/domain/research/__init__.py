@@ -0,0 +1,39 @@
+"""Research bounded context — backtesting and strategy validation."""
+
+from src.domain.research.backtest import (
+    BACKTEST_DTYPE,
+    BacktestSignal,
+    BacktestTrade,
+    backtest,
+    backtest_array,
+)
+from src.domain.research.models import ValidationType
+from src.domain.research.walk_forward import (
+    CellResult,
+    Fold,
+    FoldData,
+    FoldSelection,
+    parameter_grid,
+    run_sweep,
+    select_walk_forward,
+    swing_sweep_objective,
+    walk_forward_folds,
+)
+
+__all__ = [
+    "BACKTEST_DTYPE",
+    "BacktestSignal",
+    "BacktestTrade",
+    "CellResult",
+    "Fold",
+    "FoldData",
+    "FoldSelection",
+    "ValidationType",
+    "backtest",
+    "backtest_array",
+    "parameter_grid",
+    "run_sweep",
+    "select_walk_forward",
+    "swing_sweep_objective",
+    "walk_forward_folds",
+]
@@ -0,0 +1,334 @@
+"""Vectorised backtesting of swing-based signals in R multiples.
+
+Every candidate signal is a trade entered at ``entry_time`` and
+``entry_price`` with a stop loss; its risk R is the entry-to-stop distance
+and each take profit sits ``target_r`` R beyond the entry. A trade is live
+from the first candle opening at or after ``entry_time`` (for a C2-close
+entry, the C2 close time) until ``expiry_hours`` later.
+
+Rather than replaying candles one by one, all signals are resolved together.
+Each signal's live candles are a window of a zero-copy sliding view over the
+high/low columns. One comparison per window marks stop and target hits, and
+``argmax`` finds the first of each. Signals are processed in chunks to bound
+memory, so a year of 5M candles and thousands of signals take milliseconds.
+
+Outcomes (docs/GLOSSARY.md):
+
+- WIN: the target was hit first. ``result_r`` = +target_r.
+- LOSS: the stop was hit first. ``result_r`` = -1. A candle that trades
+  through both is resolved stop-first: without tick data the order inside
+  the candle is unknown, and assuming the stop keeps results conservative.
+- EXPIRED: neither was hit before expiry. The trade is closed at the last
+  live candle's close, and ``result_r`` is that mark in R.
+- CANCELLED: never entered, because the draw on liquidity (``dol_price``)
+  is closer than ``min_dol_r`` R. ``result_r`` = 0.
+
+A trade whose expiry lies beyond the last candle, and which has not hit
+either level yet, is unresolved. Its outcome is empty in the array, None in
+the models.
+"""
+
+from collections.abc import Sequence
+from datetime import datetime
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+from pydantic import BaseModel
+
+from src.domain.execution.models import TradeDirection, TradeOutcome
+from src.domain.structure.models import CandleSeries
+from src.infrastructure.config import get_config_registry
+
+# Structured dtype returned by backtest_array — one row per signal per target.
+BACKTEST_DTYPE = np.dtype(
+    [
+        ("signal", "i8"),
+        ("target_r", "f8"),
+        ("take_profit", "f8"),
+        ("outcome", "U9"),
+        ("entry_index", "i8"),
+        ("exit_index", "i8"),
+        ("exit_time", "datetime64[us]"),
+        ("exit_price", "f8"),
+        ("result_r", "f8"),
+    ]
+)
+
+_NAT = np.datetime64("NaT", "us")
+
+
+class BacktestSignal(BaseModel, frozen=True):
+    """A candidate trade to simulate.
+
+    Attributes:
+        entry_time: UTC time the trade opens. Candles opening at or after it
+            can hit the stop or target.
+        direction: LONG or SHORT.
+        entry_price: Entry price.
+        stop_loss: Stop price, below the entry for LONG and above for SHORT.
+        dol_price: Optional draw on liquidity. When set, the signal is
+            CANCELLED if it lies closer than ``min_dol_r`` R from the entry.
+    """
+
+    entry_time: datetime
+    direction: TradeDirection
+    entry_price: float
+    stop_loss: float
+    dol_price: float | None = None
+
+
+class BacktestTrade(BaseModel, frozen=True):
+    """The simulated result of one signal at one R target.
+
+    Attributes:
+        signal: The simulated signal.
+        target_r: Take profit distance in R.
+        take_profit: Take profit price.
+        outcome: WIN, LOSS, EXPIRED or CANCELLED. None if the candles end
+            before the trade resolved.
+        exit_time: Open time of the candle that closed the trade.
+        exit_price: Stop, target or (EXPIRED) the last live candle's close.
+        result_r: Result in R multiples.
+    """
+
+    signal: BacktestSignal
+    target_r: float
+    take_profit: float
+    outcome: TradeOutcome | None
+    exit_time: datetime | None
+    exit_price: float | None
+    result_r: float | None
+
+
+def _strategy_defaults(
+    expiry_hours: float | None, min_dol_r: float | None, dol_given: bool
+) -> tuple[float, float | None]:
+    if expiry_hours is None or (dol_given and min_dol_r is None):
+        defaults = get_config_registry().tolerances.strategy_defaults
+        if expiry_hours is None:
+            expiry_hours = defaults.expiry_hours
+        if dol_given and min_dol_r is None:
+            min_dol_r = defaults.min_dol_r
+    return expiry_hours, min_dol_r
+
+
+def backtest_array(
+    open_time: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    entry_time: np.ndarray,
+    is_long: np.ndarray,
+    entry_price: np.ndarray,
+    stop_loss: np.ndarray,
+    *,
+    target_r: Sequence[float] = (2.0,),
+    expiry_hours: float | None = None,
+    dol_price: np.ndarray | None = None,
+    min_dol_r: float | None = None,
+    chunk_size: int = 2048,
+) -> np.ndarray:
+    """Simulate signals against columnar candles.
+
+    Args:
+        open_time: Candle open times as ``datetime64``, strictly ascending.
+        high: Candle highs, aligned with ``open_time``.
+        low: Candle lows, aligned with ``open_time``.
+        close: Candle closes, aligned with ``open_time``.
+        entry_time: Signal entry times as ``datetime64`` (any order).
+        is_long: True for LONG signals, False for SHORT.
+        entry_price: Entry prices.
+        stop_loss: Stop prices.
+        target_r: R targets to evaluate every signal at.
+        expiry_hours: Trade lifetime. None = ``strategy_defaults.expiry_hours``.
+        dol_price: Optional draw on liquidity per signal (NaN = none).
+        min_dol_r: Minimum DOL distance in R. None =
+            ``strategy_defaults.min_dol_r`` when ``dol_price`` is given.
+        chunk_size: Signals resolved per vectorised step (bounds memory at
+            roughly ``chunk_size`` x candles-per-expiry x 8 bytes per matrix).
+
+    Returns:
+        Structured array with dtype ``BACKTEST_DTYPE``, one row per signal per
+        target, ordered by signal then by ``target_r``. ``outcome`` is "" for
+        unresolved trades; ``entry_index``/``exit_index`` are -1 and
+        ``exit_time`` is NaT where there is no such candle.
+
+    Raises:
+        ValueError: If the candle or signal columns differ in length.
+        ValueError: If a stop is not on the losing side of its entry.
+        ValueError: If a target_r, expiry_hours or chunk_size is not positive.
+    """
+    open_time = np.asarray(open_time, dtype="datetime64[us]")
+    high, low, close = (np.asarray(c, dtype=np.float64) for c in (high, low, close))
+    if not len(open_time) == len(high) == len(low) == len(close):
+        raise ValueError("Candle columns must all have the same length")
+    entry_time = np.asarray(entry_time, dtype="datetime64[us]")
+    is_long = np.asarray(is_long, dtype=bool)
+    entry_price = np.asarray(entry_price, dtype=np.float64)
+    stop_loss = np.asarray(stop_loss, dtype=np.float64)
+    m = len(entry_time)
+    if not m == len(is_long) == len(entry_price) == len(stop_loss):
+        raise ValueError("Signal columns must all have the same length")
+    targets = np.asarray(target_r, dtype=np.float64)
+    if len(targets) == 0 or (targets <= 0).any():
+        raise ValueError("target_r must be a non-empty sequence of positive R multiples")
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be >= 1")
+    expiry_hours, min_dol_r = _strategy_defaults(expiry_hours, min_dol_r, dol_price is not None)
+    if expiry_hours <= 0:
+        raise ValueError("expiry_hours must be > 0")
+
+    sign = np.where(is_long, 1.0, -1.0)
+    risk = sign * (entry_price - stop_loss)
+    bad = np.flatnonzero(~(risk > 0))
+    if len(bad):
+        i = int(bad[0])
+        side = "below" if is_long[i] else "above"
+        raise ValueError(
+            f"Signal {i}: stop_loss ({stop_loss[i]}) must be {side} entry_price ({entry_price[i]})"
+        )
+
+    cancelled = np.zeros(m, dtype=bool)
+    if dol_price is not None and min_dol_r is not None:
+        dol_r = sign * (np.asarray(dol_price, dtype=np.float64) - entry_price) / risk
+        cancelled = dol_r < min_dol_r  # NaN (no DOL) compares False
+
+    # Live candles of signal i: [first[i], last[i]).
+    n = len(open_time)
+    expiry = np.timedelta64(round(expiry_hours * 3_600_000_000), "us")
+    first = np.searchsorted(open_time, entry_time, "left")
+    last = np.searchsorted(open_time, entry_time + expiry, "left")
+    length = last - first
+    # Without a candle at/after expiry the window may still be growing.
+    covered = last < n
+    width = max(int(length.max()) if m else 0, 1)
+
+    # Padding beyond the last candle can never hit anything.
+    highs = sliding_window_view(np.concatenate([high, np.full(width, -np.inf)]), width)
+    lows = sliding_window_view(np.concatenate([low, np.full(width, np.inf)]), width)
+
+    k = len(targets)
+    out = np.empty(m * k, dtype=BACKTEST_DTYPE)
+    out["signal"] = np.repeat(np.arange(m), k)
+    out["target_r"] = np.tile(targets, m)
+    out["take_profit"] = np.repeat(entry_price, k) + np.repeat(sign * risk, k) * out["target_r"]
+    out["entry_index"] = np.repeat(np.where(length > 0, first, -1), k)
+
+    exit_offset = np.full((m, k), -1, dtype=np.int64)
+    outcome = np.full((m, k), "", dtype="U9")
+    steps = np.arange(width)
+    for lo in range(0, m, chunk_size):
+        rows = slice(lo, lo + chunk_size)
+        live = steps < length[rows, None]
+        long_rows = is_long[rows, None]
+        window_high, window_low = highs[first[rows]], lows[first[rows]]
+        adverse = np.where(long_rows, window_low, window_high)
+        favourable = np.where(long_rows, window_high, window_low)
+        s = sign[rows, None]
+
+        stop_hit = live & (s * (adverse - stop_loss[rows, None]) <= 0)
+        stop_at = np.where(stop_hit.any(axis=1), stop_hit.argmax(axis=1), width)
+        for j, r in enumerate(targets):
+            target = entry_price[rows] + sign[rows] * risk[rows] * r
+            target_hit = live & (s * (favourable - target[:, None]) >= 0)
+            target_at = np.where(target_hit.any(axis=1), target_hit.argmax(axis=1), width)
+            # Ties (both on one candle) go to the stop.
+            loss = (stop_at < width) & (stop_at <= target_at)
+            win = (target_at < width) & (target_at < stop_at)
+            expired = ~loss & ~win & covered[rows]
+            outcome[rows, j] = np.select(
+                [loss, win, expired],
+                [TradeOutcome.LOSS.value, TradeOutcome.WIN.value, TradeOutcome.EXPIRED.value],
+                "",
+            )
+            exit_offset[rows, j] = np.select(
+                [loss, win, expired & (length[rows] > 0)],
+                [stop_at, target_at, length[rows] - 1],
+                -1,
+            )
+
+    outcome[cancelled] = TradeOutcome.CANCELLED.value
+    exit_offset[cancelled] = -1
+    exit_index = np.where(exit_offset >= 0, first[:, None] + exit_offset, -1).ravel()
+    outcome = outcome.ravel()
+    out["outcome"] = outcome
+    out["exit_index"] = exit_index
+    has_exit = exit_index >= 0
+    out["exit_time"] = _NAT
+    out["exit_time"][has_exit] = open_time[exit_index[has_exit]]
+
+    entry_k = np.repeat(entry_price, k)
+    stop_k = np.repeat(stop_loss, k)
+    risk_k = np.repeat(risk, k)
+    sign_k = np.repeat(sign, k)
+    is_loss = outcome == TradeOutcome.LOSS.value
+    is_win = outcome == TradeOutcome.WIN.value
+    is_expired = outcome == TradeOutcome.EXPIRED.value
+    mark = np.where(has_exit, close[np.maximum(exit_index, 0)], entry_k)
+    out["exit_price"] = np.select(
+        [is_loss, is_win, is_expired], [stop_k, out["take_profit"], mark], np.nan
+    )
+    out["result_r"] = np.select(
+        [is_loss, is_win, is_expired, outcome == TradeOutcome.CANCELLED.value],
+        [-1.0, out["target_r"], sign_k * (mark - entry_k) / risk_k, 0.0],
+        np.nan,
+    )
+    return out
+
+
+def backtest(
+    candles: CandleSeries,
+    signals: Sequence[BacktestSignal],
+    target_r: Sequence[float] = (2.0,),
+    expiry_hours: float | None = None,
+    min_dol_r: float | None = None,
+) -> list[BacktestTrade]:
+    """Simulate signals against a candle series.
+
+    Args:
+        candles: Candles covering the signals' lifetimes (e.g. 5M).
+        signals: Signals to simulate.
+        target_r: R targets to evaluate every signal at.
+        expiry_hours: Trade lifetime. None = ``strategy_defaults.expiry_hours``.
+        min_dol_r: Minimum DOL distance in R for signals with a ``dol_price``.
+            None = ``strategy_defaults.min_dol_r``.
+
+    Returns:
+        One BacktestTrade per signal per target, ordered by signal then
+        target.
+
+    Raises:
+        ValueError: As ``backtest_array``.
+    """
+    results = backtest_array(
+        candles.open_time,
+        candles.high,
+        candles.low,
+        candles.close,
+        np.array([s.entry_time for s in signals], dtype="datetime64[us]"),
+        np.array([s.direction is TradeDirection.LONG for s in signals], dtype=bool),
+        np.array([s.entry_price for s in signals], dtype=np.float64),
+        np.array([s.stop_loss for s in signals], dtype=np.float64),
+        target_r=target_r,
+        expiry_hours=expiry_hours,
+        dol_price=np.array(
+            [np.nan if s.dol_price is None else s.dol_price for s in signals], dtype=np.float64
+        ),
+        min_dol_r=min_dol_r,
+    )
+    trades: list[BacktestTrade] = []
+    for row in results.tolist():
+        signal, target, take_profit, outcome, _, exit_index, exit_time, exit_price, result_r = row
+        resolved = outcome != ""
+        trades.append(
+            BacktestTrade(
+                signal=signals[signal],
+                target_r=target,
+                take_profit=take_profit,
+                outcome=TradeOutcome(outcome) if resolved else None,
+                exit_time=exit_time if exit_index >= 0 else None,
+                exit_price=None if np.isnan(exit_price) else exit_price,
+                result_r=result_r if resolved else None,
+            )
+        )
+    return trades
@@ -0,0 +1,17 @@
+"""Domain models for the research bounded context.
+
+Validation vocabulary follows docs/GLOSSARY.md: a result is IN_SAMPLE when
+found and tested on the same data, OUT_OF_SAMPLE when tested on data not
+used for discovery, and WALK_FORWARD when tested on sequential unseen
+periods.
+"""
+
+from enum import StrEnum
+
+
+class ValidationType(StrEnum):
+    """How the data a result was measured on relates to how it was found."""
+
+    IN_SAMPLE = "IN_SAMPLE"
+    OUT_OF_SAMPLE = "OUT_OF_SAMPLE"
+    WALK_FORWARD = "WALK_FORWARD"
@@ -0,0 +1,513 @@
+"""Parallel parameter sweeps with walk-forward validation.
+
+A sweep evaluates every point of a parameter grid (e.g. ``min_swing_pips`` by
+``sweep_tolerance_pips``) on every fold of a walk-forward schedule. Each
+fold has a training segment, whose cells are IN_SAMPLE, followed by a test
+segment on unseen data, whose cells are WALK_FORWARD (docs/GLOSSARY.md).
+``select_walk_forward`` then picks the best point per fold on its training
+segment and reports how that point did on the following test segment.
+
+Work is spread over a process pool one cell (fold, segment, grid point) at
+a time. The series is shipped to each worker once, through the pool
+initializer. Cells are submitted fold by fold, and every worker keeps a
+small cache of ``FoldData``: a segment's candle arrays plus its unfiltered
+swing candidates. Grid points on the same segment therefore only re-apply
+cheap filters, such as the C2 range check behind ``min_swing_pips``.
+
+With a checkpoint path, every finished cell is appended to a JSON-lines
+file as it completes. Re-running the same sweep skips cells already in the
+file, so an interrupted monthly re-validation (BLUEPRINT §9.3) resumes where
+it stopped; a line torn by the crash is cut off before appending resumes.
+The file starts with a fingerprint of the series, folds, grid and
+objective; resuming with a different sweep is refused.
+
+Objectives are plain functions ``objective(data, params) -> metrics`` and
+must be importable at module level so they can be pickled to workers.
+Grid values and metrics must be JSON-serialisable.
+"""
+
+import hashlib
+import itertools
+import json
+import os
+from collections import OrderedDict
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from concurrent.futures import Future, ProcessPoolExecutor, as_completed
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, NamedTuple
+
+import numpy as np
+
+from src.domain.research.models import ValidationType
+from src.domain.structure.level_sweeps import check_levels_array
+from src.domain.structure.models import CandleSeries, LevelStatus, SwingType
+from src.domain.structure.swing_detection import SWING_DTYPE, detect_swings_array, get_pip_value
+from src.infrastructure.config import get_config_registry
+
+Objective = Callable[["FoldData", Mapping[str, Any]], Mapping[str, float]]
+
+# Fold segments each worker keeps in memory.
+_SEGMENT_CACHE_SIZE = 4
+
+_SEGMENT_ORDER = (ValidationType.IN_SAMPLE, ValidationType.WALK_FORWARD)
+
+
+class Fold(NamedTuple):
+    """One walk-forward step. Both ranges are half-open: [start, end)."""
+
+    index: int
+    train_start: datetime
+    train_end: datetime
+    test_start: datetime
+    test_end: datetime
+
+
+class CellResult(NamedTuple):
+    """Metrics for one grid point on one fold segment.
+
+    Attributes:
+        fold: Fold index.
+        validation_type: IN_SAMPLE for the training segment, WALK_FORWARD for
+            the test segment.
+        params: The grid point.
+        metrics: What the objective returned.
+    """
+
+    fold: int
+    validation_type: ValidationType
+    params: dict[str, Any]
+    metrics: dict[str, float]
+
+
+class FoldSelection(NamedTuple):
+    """The grid point chosen on a fold's training segment and its test result."""
+
+    fold: int
+    params: dict[str, Any]
+    in_sample: dict[str, float]
+    walk_forward: dict[str, float]
+
+
+def parameter_grid(grid: Mapping[str, Sequence[Any]]) -> list[dict[str, Any]]:
+    """Expand a grid into every combination of its values.
+
+    Args:
+        grid: Parameter name to candidate values.
+
+    Returns:
+        One dict per combination, in the order the values were given (the
+        last parameter varies fastest). An empty grid yields one empty point.
+
+    Raises:
+        ValueError: If a parameter has no values.
+    """
+    for name, values in grid.items():
+        if len(values) == 0:
+            raise ValueError(f"Parameter '{name}' has no values")
+    names = list(grid)
+    return [dict(zip(names, combo, strict=True)) for combo in itertools.product(*grid.values())]
+
+
+def walk_forward_folds(
+    start: datetime,
+    end: datetime,
+    *,
+    train: timedelta,
+    test: timedelta,
+    step: timedelta | None = None,
+    anchored: bool = False,
+) -> list[Fold]:
+    """Build a walk-forward schedule.
+
+    Fold k tests on ``[start + train + k·step, … + test)`` and trains on the
+    ``train`` period before it, or on everything since ``start`` when
+    anchored. Only folds whose test period ends by ``end`` are returned.
+
+    Args:
+        start: Start of the data.
+        end: End of the data (exclusive).
+        train: Training period length.
+        test: Test period length.
+        step: Distance between consecutive test periods. Defaults to ``test``
+            (back-to-back test periods).
+        anchored: Grow the training period from ``start`` instead of rolling it.
+
+    Returns:
+        Folds in chronological order.
+
+    Raises:
+        ValueError: If a period length is not positive.
+    """
+    step = test if step is None else step
+    if min(train, test, step) <= timedelta(0):
+        raise ValueError("train, test and step must be positive")
+    folds: list[Fold] = []
+    test_start = start + train
+    while test_start + test <= end:
+        train_start = start if anchored else test_start - train
+        folds.append(Fold(len(folds), train_start, test_start, test_start, test_start + test))
+        test_start += step
+    return folds
+
+
+class FoldData:
+    """Per-segment intermediate features shared by every grid point.
+
+    Attributes:
+        series: The segment's candles.
+        pip_value: Pip size of the pair.
+    """
+
+    def __init__(self, series: CandleSeries) -> None:
+        """Precompute unfiltered swing candidates for a segment.
+
+        Args:
+            series: Candles of one fold segment.
+        """
+        self.series = series
+        self.pip_value = get_pip_value(series.pair)
+        if len(series) >= 3:
+            candidates = detect_swings_array(series.open_time, series.high, series.low)
+        else:
+            candidates = np.empty(0, dtype=SWING_DTYPE)
+        self._candidates = candidates
+        position = np.searchsorted(series.open_time, candidates["open_time"])
+        self._range_pips = (series.high[position] - series.low[position]) / self.pip_value
+        self._swings: dict[float | None, np.ndarray] = {}
+
+    @classmethod
+    def from_series(cls, series: CandleSeries, start: datetime, end: datetime) -> "FoldData":
+        """Cut ``[start, end)`` out of a series."""
+        times = series.open_time
+        lo, hi = np.searchsorted(times, np.array([start, end], dtype="datetime64[us]"))
+        return cls(series[int(lo) : int(hi)])
+
+    def swings(self, min_swing_pips: float | None = None) -> np.ndarray:
+        """Swings of the segment, equal to ``detect_swings_array`` with the filter.
+
+        Args:
+            min_swing_pips: Minimum C2 range in pips, or None for no filter.
+
+        Returns:
+            Read-only ``SWING_DTYPE`` array.
+        """
+        swings = self._swings.get(min_swing_pips)
+        if swings is None:
+            if min_swing_pips is None:
+                swings = self._candidates
+            else:
+                # Same ``not <`` comparison as detect_swings_array.
+                swings = self._candidates[~(self._range_pips < min_swing_pips)]
+            swings.flags.writeable = False
+            self._swings[min_swing_pips] = swings
+        return swings
+
+
+_SWING_SWEEP_PARAMS = frozenset(
+    {"min_swing_pips", "sweep_tolerance_pips", "first_touch_tolerance_pips"}
+)
+
+
+def swing_sweep_objective(data: FoldData, params: Mapping[str, Any]) -> dict[str, float]:
+    """How often swings get swept, and how often a sweep reverses.
+
+    Every swing becomes a level once its C3 has closed. Levels are checked
+    against the rest of the segment with ``check_levels_array``.
+
+    Args:
+        data: The fold segment.
+        params: Any of ``min_swing_pips``, ``sweep_tolerance_pips`` and
+            ``first_touch_tolerance_pips``. Missing values come from
+            tolerances.json.
+
+    Returns:
+        ``swings``: swing count. ``sweep_rate``: share of swings swept or
+        closed through. ``reversal_rate``: share of those that were SWEPT
+        (closed back inside). Rates are 0 when there is nothing to measure.
+
+    Raises:
+        ValueError: If ``params`` holds an unknown parameter.
+    """
+    unknown = set(params) - _SWING_SWEEP_PARAMS
+    if unknown:
+        raise ValueError(f"Unknown swing_sweep_objective parameters: {sorted(unknown)}")
+    registry = get_config_registry()
+    tolerances = registry.tolerances.level_tolerances
+    series = data.series
+    min_swing_pips = params.get("min_swing_pips", registry.min_swing_pips(series.timeframe))
+    swings = data.swings(min_swing_pips)
+    if len(swings) == 0:
+        return {"swings": 0, "sweep_rate": 0.0, "reversal_rate": 0.0}
+
+    n = len(series)
+    confirmed = np.searchsorted(series.open_time, swings["open_time"]) + 2
+    after_end = series.open_time[-1] + np.timedelta64(1, "us")
+    active_from = np.where(confirmed < n, series.open_time[np.minimum(confirmed, n - 1)], after_end)
+    checks = check_levels_array(
+        series.open_time,
+        series.high,
+        series.low,
+        series.close,
+        swings["price"],
+        swings["type"] == SwingType.HIGH.value,
+        active_from,
+        pip_value=data.pip_value,
+        sweep_tolerance_pips=params.get("sweep_tolerance_pips", tolerances.sweep_tolerance_pips),
+        first_touch_tolerance_pips=params.get(
+            "first_touch_tolerance_pips", tolerances.first_touch_tolerance_pips
+        ),
+    )
+    swept = int(np.count_nonzero(checks["status"] == LevelStatus.SWEPT.value))
+    closed = int(np.count_nonzero(checks["status"] == LevelStatus.CLOSED_THROUGH.value))
+    taken = swept + closed
+    return {
+        "swings": len(swings),
+        "sweep_rate": taken / len(swings),
+        "reversal_rate": swept / taken if taken else 0.0,
+    }
+
+
+# -- workers -------------------------------------------------------------------
+
+# Per-process worker state: the series under test and an LRU of fold segments.
+_WORKER: dict[str, Any] = {}
+
+
+def _init_worker(series: CandleSeries) -> None:
+    _WORKER.clear()
+    _WORKER["series"] = series
+    _WORKER["segments"] = OrderedDict()
+
+
+def _segment(start: datetime, end: datetime) -> FoldData:
+    segments: OrderedDict[tuple[datetime, datetime], FoldData] = _WORKER["segments"]
+    key = (start, end)
+    data = segments.get(key)
+    if data is not None:
+        segments.move_to_end(key)
+        return data
+    data = segments[key] = FoldData.from_series(_WORKER["series"], start, end)
+    if len(segments) > _SEGMENT_CACHE_SIZE:
+        segments.popitem(last=False)
+    return data
+
+
+def _run_cell(
+    objective: Objective,
+    fold: Fold,
+    validation_type: ValidationType,
+    params: dict[str, Any],
+) -> CellResult:
+    if validation_type is ValidationType.IN_SAMPLE:
+        data = _segment(fold.train_start, fold.train_end)
+    else:
+        data = _segment(fold.test_start, fold.test_end)
+    return CellResult(fold.index, validation_type, params, dict(objective(data, params)))
+
+
+# -- checkpointing ---------------------------------------------------------------
+
+
+def _params_key(params: Mapping[str, Any]) -> str:
+    return json.dumps(params, sort_keys=True)
+
+
+def _cell_key(fold: int, validation_type: ValidationType, params: Mapping[str, Any]) -> tuple:
+    return (fold, validation_type.value, _params_key(params))
+
+
+def _fingerprint(
+    series: CandleSeries, folds: Sequence[Fold], points: Sequence[dict], objective: Objective
+) -> str:
+    times = series.open_time
+    payload = {
+        "series": [series.pair, series.timeframe, len(series)]
+        + ([str(times[0]), str(times[-1])] if len(series) else []),
+        "folds": [[str(v) for v in fold] for fold in folds],
+        "grid": [_params_key(p) for p in points],
+        "objective": f"{objective.__module__}.{objective.__qualname__}",
+    }
+    return hashlib.sha1(json.dumps(payload).encode()).hexdigest()
+
+
+def _truncate_torn_tail(path: Path) -> None:
+    """Cut a partial last line (from a crash mid-write) so appends start on a fresh line."""
+    if not path.exists():
+        return
+    with path.open("r+b") as f:
+        data = f.read()
+        if data and not data.endswith(b"\n"):
+            f.truncate(data.rfind(b"\n") + 1)
+
+
+def _load_checkpoint(path: Path, fingerprint: str) -> dict[tuple, CellResult]:
+    """Read finished cells. Unreadable lines are ignored."""
+    if not path.exists():
+        return {}
+    lines = path.read_text().splitlines()
+    if not lines:
+        return {}
+    header = json.loads(lines[0])
+    if header.get("sweep") != fingerprint:
+        raise ValueError(f"Checkpoint {path} belongs to a different sweep")
+    done: dict[tuple, CellResult] = {}
+    for line in lines[1:]:
+        try:
+            row = json.loads(line)
+        except json.JSONDecodeError:
+            continue
+        cell = CellResult(
+            row["fold"], ValidationType(row["validation_type"]), row["params"], row["metrics"]
+        )
+        done[_cell_key(cell.fold, cell.validation_type, cell.params)] = cell
+    return done
+
+
+def _append(handle: Any, cell: CellResult) -> None:
+    row = {
+        "fold": cell.fold,
+        "validation_type": cell.validation_type.value,
+        "params": cell.params,
+        "metrics": cell.metrics,
+    }
+    handle.write(json.dumps(row) + "\n")
+    handle.flush()
+    os.fsync(handle.fileno())
+
+
+# -- driver ----------------------------------------------------------------------
+
+
+def run_sweep(
+    series: CandleSeries,
+    folds: Sequence[Fold],
+    grid: Mapping[str, Sequence[Any]] | Iterable[dict[str, Any]],
+    objective: Objective = swing_sweep_objective,
+    *,
+    checkpoint: Path | None = None,
+    max_workers: int | None = None,
+) -> list[CellResult]:
+    """Evaluate every grid point on every fold's training and test segments.
+
+    Args:
+        series: Candles covering every fold.
+        folds: Schedule from ``walk_forward_folds``.
+        grid: Parameter grid (name to values) or an explicit list of points.
+        objective: Module-level function scoring one segment for one point.
+        checkpoint: JSON-lines file recording finished cells. Existing cells
+            are reused, new ones appended as they finish.
+        max_workers: Worker processes. None uses every CPU; 0 or 1 runs in
+            this process.
+
+    Returns:
+        Every cell, ordered by fold, then IN_SAMPLE before WALK_FORWARD, then
+        grid order.
+
+    Raises:
+        ValueError: If the checkpoint belongs to a different sweep.
+    """
+    points = parameter_grid(grid) if isinstance(grid, Mapping) else [dict(p) for p in grid]
+    fingerprint = _fingerprint(series, folds, points, objective)
+    done: dict[tuple, CellResult] = {}
+    if checkpoint is not None:
+        _truncate_torn_tail(checkpoint)
+        done = _load_checkpoint(checkpoint, fingerprint)
+
+    pending = [
+        (fold, validation_type, params)
+        for fold in folds
+        for validation_type in _SEGMENT_ORDER
+        for params in points
+        if _cell_key(fold.index, validation_type, params) not in done
+    ]
+
+    handle = None
+    if checkpoint is not None:
+        fresh = not checkpoint.exists() or checkpoint.stat().st_size == 0
+        handle = checkpoint.open("a")
+        if fresh:
+            handle.write(json.dumps({"sweep": fingerprint}) + "\n")
+            handle.flush()
+    try:
+        for cell in _execute(series, objective, pending, max_workers):
+            done[_cell_key(cell.fold, cell.validation_type, cell.params)] = cell
+            if handle is not None:
+                _append(handle, cell)
+    finally:
+        if handle is not None:
+            handle.close()
+
+    return [
+        done[_cell_key(fold.index, validation_type, params)]
+        for fold in folds
+        for validation_type in _SEGMENT_ORDER
+        for params in points
+    ]
+
+
+def _execute(
+    series: CandleSeries,
+    objective: Objective,
+    cells: list[tuple[Fold, ValidationType, dict[str, Any]]],
+    max_workers: int | None,
+) -> Iterable[CellResult]:
+    """Yield results as cells finish, in this process or a pool."""
+    if not cells:
+        return
+    if max_workers is not None and max_workers <= 1:
+        _init_worker(series)
+        try:
+            for fold, validation_type, params in cells:
+                yield _run_cell(objective, fold, validation_type, params)
+        finally:
+            _WORKER.clear()
+        return
+
+    with ProcessPoolExecutor(
+        max_workers=max_workers, initializer=_init_worker, initargs=(series,)
+    ) as pool:
+        futures: list[Future[CellResult]] = [
+            pool.submit(_run_cell, objective, fold, validation_type, params)
+            for fold, validation_type, params in cells
+        ]
+        try:
+            for future in as_completed(futures):
+                yield future.result()
+        finally:
+            for future in futures:
+                future.cancel()
+
+
+def select_walk_forward(
+    results: Iterable[CellResult], metric: str, *, maximize: bool = True
+) -> list[FoldSelection]:
+    """Pick each fold's best grid point in sample and pair it with its test result.
+
+    Args:
+        results: Cells from ``run_sweep``.
+        metric: Metric to rank IN_SAMPLE cells by.
+        maximize: Prefer larger values. Ties go to the earlier grid point.
+
+    Returns:
+        One selection per fold that has both segments, in fold order.
+
+    Raises:
+        KeyError: If a cell lacks ``metric``.
+    """
+    in_sample: dict[int, list[CellResult]] = {}
+    walk_forward: dict[tuple[int, str], CellResult] = {}
+    for cell in results:
+        if cell.validation_type is ValidationType.IN_SAMPLE:
+            in_sample.setdefault(cell.fold, []).append(cell)
+        else:
+            walk_forward[(cell.fold, _params_key(cell.params))] = cell
+
+    selections: list[FoldSelection] = []
+    sign = 1.0 if maximize else -1.0
+    for fold in sorted(in_sample):
+        best = max(in_sample[fold], key=lambda cell: sign * cell.metrics[metric])
+        test = walk_forward.get((fold, _params_key(best.params)))
+        if test is not None:
+            selections.append(FoldSelection(fold, best.params, best.metrics, test.metrics))
+    return selections
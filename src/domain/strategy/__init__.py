@@ -0,0 +1,41 @@
+"""Strategy bounded context — config-driven signal evaluation, filters, scoring."""
+
+from src.domain.strategy.engine import (
+    SIGNAL_DTYPE,
+    StrategyEvaluator,
+    StrategyPlan,
+    assign_risk_tiers,
+    compile_strategy,
+)
+from src.domain.strategy.features import FeatureSet, feature_names
+from src.domain.strategy.filters import FILTERS
+from src.domain.strategy.models import (
+    FilterConfig,
+    FilterType,
+    RiskTier,
+    Signal,
+    StrategyConfig,
+    StrategyStatus,
+)
+from src.domain.strategy.repository import load_strategies, load_strategy
+from src.domain.strategy.scoring import SCORING_MODELS
+
+__all__ = [
+    "FILTERS",
+    "SCORING_MODELS",
+    "SIGNAL_DTYPE",
+    "FeatureSet",
+    "FilterConfig",
+    "FilterType",
+    "RiskTier",
+    "Signal",
+    "StrategyConfig",
+    "StrategyEvaluator",
+    "StrategyPlan",
+    "StrategyStatus",
+    "assign_risk_tiers",
+    "compile_strategy",
+    "feature_names",
+    "load_strategies",
+    "load_strategy",
+]
@@ -0,0 +1,337 @@
+"""Config-driven strategy evaluation.
+
+``compile_strategy`` turns a ``StrategyConfig`` into a ``StrategyPlan``: the
+features it reads, its HARD and SOFT filters with parameters checked against
+the filter implementations, its scoring model and its risk tiers. Unknown
+filters, bad parameters and unknown scoring models fail at compile time, not
+on the first candle.
+
+``StrategyEvaluator`` runs many plans over many series. For every
+(pair, timeframe) it builds one ``FeatureSet``, shared by every strategy that
+reads it, so features and identical filter masks are computed once however
+many strategies trade the pair. Per strategy, the pipeline is:
+
+1. Candidates: bars where the ``cisd`` feature is non-zero (C2 candles).
+2. HARD filters and the trading window, each a boolean mask over all bars,
+   ANDed together.
+3. Entry, stop and take profit for the survivors; zero-risk candidates are
+   dropped because they cannot be sized.
+4. One batched call to the scoring model, minus SOFT filter penalties,
+   clipped to 0-100.
+5. Risk tiers assigned by binary search over the tiers' lower bounds;
+   candidates below ``min_score`` or outside every tier are rejected.
+
+Signals come back as ``SIGNAL_DTYPE`` arrays (``evaluate_array``) or
+``Signal`` models (``evaluate``). The arrays feed ``backtest_array``
+directly: ``entry_time``, ``is_long``, ``entry_price`` and ``stop_loss``.
+"""
+
+from collections.abc import Iterable, Sequence
+from typing import Any, NamedTuple
+
+import numpy as np
+
+from src.domain.execution.models import TradeDirection
+from src.domain.observability.metrics import get_metrics_registry
+from src.domain.strategy.features import FeatureSet, feature_names
+from src.domain.strategy.filters import apply_filter, bind_filter
+from src.domain.strategy.models import (
+    FilterType,
+    RiskTier,
+    Signal,
+    StopPlacement,
+    StrategyConfig,
+)
+from src.domain.strategy.scoring import ScoringModel, get_scoring_model
+from src.domain.structure.models import CandleSeries
+from src.domain.structure.swing_cache import SwingCache
+
+# Structured dtype returned by StrategyEvaluator.evaluate_array.
+SIGNAL_DTYPE = np.dtype(
+    [
+        ("index", "i8"),
+        ("c2_time", "datetime64[us]"),
+        ("entry_time", "datetime64[us]"),
+        ("is_long", "?"),
+        ("entry_price", "f8"),
+        ("stop_loss", "f8"),
+        ("take_profit", "f8"),
+        ("score", "i2"),
+        ("risk_tier", "U16"),
+        ("risk_pct", "f8"),
+    ]
+)
+
+
+class BoundFilter(NamedTuple):
+    """A filter from a strategy config with validated parameters."""
+
+    name: str
+    params: dict[str, Any]
+    type: FilterType
+    penalty: int
+
+
+class StrategyPlan(NamedTuple):
+    """A compiled strategy.
+
+    Attributes:
+        config: The source config.
+        features: Every structure feature the filters and scoring model read.
+        hard: HARD filters, including the trading window.
+        soft: SOFT filters.
+        scoring: The scoring model.
+        needs_entry: Whether a filter reads entry-timeframe candles.
+    """
+
+    config: StrategyConfig
+    features: tuple[str, ...]
+    hard: tuple[BoundFilter, ...]
+    soft: tuple[BoundFilter, ...]
+    scoring: ScoringModel
+    needs_entry: bool
+
+
+def compile_strategy(config: StrategyConfig) -> StrategyPlan:
+    """Resolve a strategy config into an executable plan.
+
+    Args:
+        config: The strategy.
+
+    Returns:
+        The plan.
+
+    Raises:
+        ValueError: If a filter or the scoring model is unknown, a filter's
+            parameters are invalid, or a filter needs entry candles and the
+            config has no entry timeframe.
+    """
+    window = config.trading_window
+    entries = [
+        (
+            "trading_window",
+            FilterType.HARD,
+            0,
+            {
+                "start_utc": window.start_utc,
+                "end_utc": window.end_utc,
+                "days": [day.value for day in window.days],
+            },
+        ),
+        *((f.name, f.type, f.penalty, f.params) for f in config.filters),
+    ]
+    features: set[str] = set()
+    hard: list[BoundFilter] = []
+    soft: list[BoundFilter] = []
+    needs_entry = False
+    for name, filter_type, penalty, raw_params in entries:
+        spec, params = bind_filter(name, raw_params)
+        if spec.needs_entry and config.timeframes.entry is None:
+            raise ValueError(
+                f"Strategy {config.id}: filter '{name}' needs timeframes.entry to be set"
+            )
+        needs_entry |= spec.needs_entry
+        features.update(spec.requires)
+        bound = BoundFilter(name, params, filter_type, penalty)
+        (hard if filter_type is FilterType.HARD else soft).append(bound)
+
+    scoring = get_scoring_model(config.scoring.model)
+    features.update(scoring.requires)
+    missing = features.difference(feature_names())
+    if missing:
+        raise ValueError(f"Strategy {config.id} reads unregistered features {sorted(missing)}")
+    return StrategyPlan(
+        config=config,
+        features=tuple(sorted(features)),
+        hard=tuple(hard),
+        soft=tuple(soft),
+        scoring=scoring,
+        needs_entry=needs_entry,
+    )
+
+
+def assign_risk_tiers(scores: np.ndarray, tiers: Sequence[RiskTier]) -> np.ndarray:
+    """Index of the risk tier each score falls in.
+
+    Args:
+        scores: Integer scores.
+        tiers: Tiers in ascending, non-overlapping order (as validated by
+            ``StrategyConfig``).
+
+    Returns:
+        Tier index per score, -1 where no tier's range contains it.
+    """
+    lows = np.array([tier.score_range[0] for tier in tiers])
+    highs = np.array([tier.score_range[1] for tier in tiers])
+    position = np.searchsorted(lows, scores, side="right") - 1
+    inside = (position >= 0) & (scores <= highs[np.maximum(position, 0)])
+    return np.where(inside, position, -1)
+
+
+class StrategyEvaluator:
+    """Evaluate compiled strategies over candle series in batches.
+
+    Example:
+        evaluator = StrategyEvaluator(load_strategies())
+        signals = evaluator.evaluate([eurusd_1h, eurusd_5m])
+    """
+
+    def __init__(
+        self, strategies: Iterable[StrategyConfig], *, swing_cache: SwingCache | None = None
+    ) -> None:
+        """Compile every strategy.
+
+        Args:
+            strategies: Strategy configs. Ids must be unique.
+            swing_cache: Serve the swing features from this cache, if given.
+
+        Raises:
+            ValueError: If ids repeat or a strategy fails to compile.
+        """
+        self.plans = tuple(compile_strategy(config) for config in strategies)
+        ids = [plan.config.id for plan in self.plans]
+        if len(set(ids)) != len(ids):
+            raise ValueError(f"Duplicate strategy ids: {sorted(ids)}")
+        self._swing_cache = swing_cache
+
+    def feature_sets(self, candles: Iterable[CandleSeries]) -> dict[tuple[str, str], FeatureSet]:
+        """One shared ``FeatureSet`` per (pair, timeframe).
+
+        Raises:
+            ValueError: If two series have the same pair and timeframe.
+        """
+        sets: dict[tuple[str, str], FeatureSet] = {}
+        for series in candles:
+            key = (series.pair, series.timeframe)
+            if key in sets:
+                raise ValueError(f"More than one {series.pair} {series.timeframe} series given")
+            sets[key] = FeatureSet(series, swing_cache=self._swing_cache)
+        return sets
+
+    def evaluate_array(
+        self, candles: Iterable[CandleSeries] | dict[tuple[str, str], FeatureSet]
+    ) -> dict[tuple[str, str], np.ndarray]:
+        """Run every strategy on every pair it trades.
+
+        Args:
+            candles: Candle series (any pairs and timeframes), or feature
+                sets from ``feature_sets`` to reuse across calls.
+
+        Returns:
+            ``SIGNAL_DTYPE`` arrays keyed by (strategy id, pair), for every
+            traded pair whose structure series was given. Rows are in bar
+            order.
+
+        Raises:
+            ValueError: If a strategy needs entry-timeframe candles for a
+                pair and they were not given.
+        """
+        sets = candles if isinstance(candles, dict) else self.feature_sets(candles)
+        metrics = get_metrics_registry()
+        results: dict[tuple[str, str], np.ndarray] = {}
+        for plan in self.plans:
+            config = plan.config
+            for pair in config.pairs:
+                features = sets.get((pair, config.timeframes.structure))
+                if features is None:
+                    continue
+                entry = None
+                if plan.needs_entry:
+                    entry = sets.get((pair, config.timeframes.entry))
+                    if entry is None:
+                        raise ValueError(
+                            f"Strategy {config.id} needs {pair} {config.timeframes.entry} candles"
+                        )
+                timeframe = config.timeframes.structure
+                with metrics.timed("strategy.evaluate", pair, timeframe, len(features)):
+                    rows = _run_plan(plan, features, entry)
+                metrics.count("signals_generated", pair, timeframe, len(rows))
+                results[(config.id, pair)] = rows
+        return results
+
+    def evaluate(
+        self, candles: Iterable[CandleSeries] | dict[tuple[str, str], FeatureSet]
+    ) -> list[Signal]:
+        """Run every strategy and return ``Signal`` models.
+
+        Args:
+            candles: As for ``evaluate_array``.
+
+        Returns:
+            Signals ordered by entry time, then strategy id.
+        """
+        plans = {plan.config.id: plan for plan in self.plans}
+        signals: list[Signal] = []
+        for (strategy_id, pair), rows in self.evaluate_array(candles).items():
+            timeframe = plans[strategy_id].config.timeframes.structure
+            for row in rows:
+                signals.append(
+                    Signal(
+                        strategy_id=strategy_id,
+                        pair=pair,
+                        timeframe=timeframe,
+                        c2_time=row["c2_time"].item(),
+                        entry_time=row["entry_time"].item(),
+                        direction=TradeDirection.LONG if row["is_long"] else TradeDirection.SHORT,
+                        entry_price=float(row["entry_price"]),
+                        stop_loss=float(row["stop_loss"]),
+                        take_profit=float(row["take_profit"]),
+                        score=int(row["score"]),
+                        risk_tier=str(row["risk_tier"]),
+                        risk_pct=float(row["risk_pct"]),
+                    )
+                )
+        signals.sort(key=lambda s: (s.entry_time, s.strategy_id))
+        return signals
+
+
+def _run_plan(plan: StrategyPlan, features: FeatureSet, entry: FeatureSet | None) -> np.ndarray:
+    config = plan.config
+    cisd = features["cisd"]
+    passed = cisd != 0
+    for bound in plan.hard:
+        passed = passed & apply_filter(bound.name, features, entry, bound.params)
+    index = np.flatnonzero(passed)
+
+    series = features.series
+    is_long = cisd[index] > 0
+    entry_price = series.close[index]
+    if config.targets.stop is StopPlacement.C2_BODY_EXTREME:
+        stop = np.where(
+            is_long,
+            np.minimum(series.open[index], entry_price),
+            np.maximum(series.open[index], entry_price),
+        )
+    else:
+        stop = np.where(is_long, series.low[index], series.high[index])
+    risk = np.abs(entry_price - stop)
+    sized = risk > 0
+    index, is_long, entry_price, stop, risk = (
+        a[sized] for a in (index, is_long, entry_price, stop, risk)
+    )
+
+    score = plan.scoring.func(features, index).astype(np.int64)
+    for bound in plan.soft:
+        failed = ~apply_filter(bound.name, features, entry, bound.params)[index]
+        score -= failed * bound.penalty
+    score = np.clip(score, 0, 100)
+
+    tier = assign_risk_tiers(score, config.risk_tiers)
+    keep = (score >= config.scoring.min_score) & (tier >= 0)
+    index = index[keep]
+
+    out = np.empty(len(index), dtype=SIGNAL_DTYPE)
+    out["index"] = index
+    out["c2_time"] = series.open_time[index]
+    out["entry_time"] = features["entry_time"][index]
+    out["is_long"] = is_long[keep]
+    out["entry_price"] = entry_price[keep]
+    out["stop_loss"] = stop[keep]
+    sign = np.where(is_long[keep], 1.0, -1.0)
+    out["take_profit"] = entry_price[keep] + sign * config.targets.primary_r * risk[keep]
+    out["score"] = score[keep]
+    names = np.array([t.name for t in config.risk_tiers])
+    pcts = np.array([t.risk_pct for t in config.risk_tiers])
+    out["risk_tier"] = names[tier[keep]]
+    out["risk_pct"] = pcts[tier[keep]]
+    return out
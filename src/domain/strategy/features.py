@@ -0,0 +1,215 @@
+"""Per-bar features shared by every strategy evaluated on a series.
+
+A ``FeatureSet`` wraps one ``CandleSeries`` and computes named feature
+columns on first access, memoising the result. Filters and scoring models
+ask for features by name, so when several strategies trade the same pair and
+timeframe, candle bodies, runs and swings are computed once, not once per
+strategy. Filter masks are memoised the same way, keyed by filter name and
+parameters.
+
+Features (all aligned with the series):
+
+- ``direction``: +1 for an up-close candle, -1 for a down-close, 0 for a doji.
+- ``body_pips``: absolute body size in pips.
+- ``close_location``: where the close sits in the candle's range, 0 at the
+  low and 1 at the high (0.5 for a zero-range candle).
+- ``run_length``: consecutive candles of the same direction ending at the
+  bar (0 for a doji).
+- ``series_length``: length of the run ending on the previous bar, i.e. the
+  series a reversal at this bar would break.
+- ``series_open``: open of that series' first candle (NaN without a series).
+- ``cisd``: +1 where the bar closes above the open of a preceding down
+  series, -1 where it closes below the open of a preceding up series. These
+  are the candidate C2 candles; the last candle of the series is C1 (see
+  ``structure.cisd_detection``).
+- ``swings``: detected swings (``SWING_DTYPE``).
+- ``swing_high`` / ``swing_low``: the bar is C2 of a detected swing.
+- ``entry_time``: the bar's close time (C2 close), ``datetime64[us]``.
+"""
+
+from collections import Counter
+from collections.abc import Callable, Hashable
+
+import numpy as np
+
+from src.domain.market_data.resampler import timeframe_duration
+from src.domain.structure.cisd_detection import candle_direction, cisd_direction
+from src.domain.structure.models import CandleSeries, SwingType
+from src.domain.structure.swing_cache import SwingCache
+from src.domain.structure.swing_detection import detect_swings_array, get_pip_value
+from src.infrastructure.config import get_config_registry
+
+_FEATURES: dict[str, Callable[["FeatureSet"], np.ndarray]] = {}
+
+
+def _feature(name: str) -> Callable[[Callable[["FeatureSet"], np.ndarray]], Callable]:
+    def register(func: Callable[["FeatureSet"], np.ndarray]) -> Callable:
+        _FEATURES[name] = func
+        return func
+
+    return register
+
+
+class FeatureSet:
+    """Lazily computed, memoised features of one candle series.
+
+    Not thread-safe; build one per series per evaluation.
+
+    Attributes:
+        series: The candles.
+        computed: How many times each feature and mask was computed. Every
+            count is 1 for a set shared correctly between strategies.
+    """
+
+    def __init__(
+        self,
+        series: CandleSeries,
+        *,
+        min_swing_pips: float | None = None,
+        swing_cache: SwingCache | None = None,
+    ) -> None:
+        """Wrap a series.
+
+        Args:
+            series: Candles, ascending by open_time.
+            min_swing_pips: Minimum C2 range for the swing features. Defaults
+                to the config registry value for the series timeframe.
+            swing_cache: Serve swing detection from this cache, if given.
+        """
+        self.series = series
+        self.computed: Counter[str] = Counter()
+        self._min_swing_pips = (
+            min_swing_pips
+            if min_swing_pips is not None
+            else get_config_registry().min_swing_pips(series.timeframe)
+        )
+        self._swing_cache = swing_cache
+        self._values: dict[str, np.ndarray] = {}
+        self._masks: dict[Hashable, np.ndarray] = {}
+
+    @property
+    def pip_value(self) -> float:
+        """Pip size of the series pair."""
+        return get_pip_value(self.series.pair)
+
+    def __len__(self) -> int:
+        return len(self.series)
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        """Return a feature column, computing it on first use.
+
+        Raises:
+            KeyError: If no feature has that name.
+        """
+        value = self._values.get(name)
+        if value is None:
+            compute = _FEATURES.get(name)
+            if compute is None:
+                raise KeyError(f"Unknown feature '{name}'. Available: {sorted(_FEATURES)}")
+            value = compute(self)
+            value.flags.writeable = False
+            self._values[name] = value
+            self.computed[name] += 1
+        return value
+
+    def mask(self, key: Hashable, compute: Callable[[], np.ndarray]) -> np.ndarray:
+        """Return a memoised boolean mask, computing it on first use.
+
+        Args:
+            key: Identifies the mask, e.g. a filter name and its parameters.
+            compute: Builds the mask when it is not cached yet.
+        """
+        value = self._masks.get(key)
+        if value is None:
+            value = np.asarray(compute(), dtype=bool)
+            value.flags.writeable = False
+            self._masks[key] = value
+            self.computed[repr(key)] += 1
+        return value
+
+
+def feature_names() -> list[str]:
+    """Names of every registered feature."""
+    return sorted(_FEATURES)
+
+
+@_feature("direction")
+def _direction(fs: FeatureSet) -> np.ndarray:
+    return candle_direction(fs.series.open, fs.series.close)
+
+
+@_feature("body_pips")
+def _body_pips(fs: FeatureSet) -> np.ndarray:
+    return np.abs(fs.series.close - fs.series.open) / fs.pip_value
+
+
+@_feature("close_location")
+def _close_location(fs: FeatureSet) -> np.ndarray:
+    s = fs.series
+    span = s.high - s.low
+    with np.errstate(invalid="ignore", divide="ignore"):
+        location = (s.close - s.low) / span
+    return np.where(span > 0, location, 0.5)
+
+
+@_feature("run_length")
+def _run_length(fs: FeatureSet) -> np.ndarray:
+    direction = fs["direction"]
+    n = len(direction)
+    index = np.arange(n)
+    starts = np.ones(n, dtype=bool)
+    starts[1:] = direction[1:] != direction[:-1]
+    run_start = np.maximum.accumulate(np.where(starts, index, 0))
+    return np.where(direction != 0, index - run_start + 1, 0)
+
+
+@_feature("series_length")
+def _series_length(fs: FeatureSet) -> np.ndarray:
+    run = fs["run_length"]
+    result = np.zeros(len(run), dtype=np.int64)
+    result[1:] = run[:-1]
+    return result
+
+
+@_feature("series_open")
+def _series_open(fs: FeatureSet) -> np.ndarray:
+    length = fs["series_length"]
+    first = np.arange(len(length)) - length
+    return np.where(length > 0, fs.series.open[first], np.nan)
+
+
+@_feature("cisd")
+def _cisd(fs: FeatureSet) -> np.ndarray:
+    return cisd_direction(fs.series.open, fs.series.close)
+
+
+@_feature("swings")
+def _swings(fs: FeatureSet) -> np.ndarray:
+    s = fs.series
+    if fs._swing_cache is not None:
+        return fs._swing_cache.detect(s, fs._min_swing_pips)
+    return detect_swings_array(s.open_time, s.high, s.low, s.pair, fs._min_swing_pips)
+
+
+def _swing_mask(fs: FeatureSet, swing_type: SwingType) -> np.ndarray:
+    swings = fs["swings"]
+    mask = np.zeros(len(fs), dtype=bool)
+    times = swings["open_time"][swings["type"] == swing_type.value]
+    mask[np.searchsorted(fs.series.open_time, times)] = True
+    return mask
+
+
+@_feature("swing_high")
+def _swing_high(fs: FeatureSet) -> np.ndarray:
+    return _swing_mask(fs, SwingType.HIGH)
+
+
+@_feature("swing_low")
+def _swing_low(fs: FeatureSet) -> np.ndarray:
+    return _swing_mask(fs, SwingType.LOW)
+
+
+@_feature("entry_time")
+def _entry_time(fs: FeatureSet) -> np.ndarray:
+    length = np.timedelta64(timeframe_duration(fs.series.timeframe), "us")
+    return fs.series.open_time.astype("datetime64[us]") + length
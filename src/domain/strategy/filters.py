@@ -0,0 +1,221 @@
+"""Filter implementations.
+
+Each filter turns features into a boolean mask over every bar of the
+structure series: True where a candidate C2 at that bar passes. A filter is
+evaluated on all bars at once and memoised on the ``FeatureSet`` under its
+name and parameters, so strategies sharing a filter configuration share the
+mask too.
+
+Candidate direction comes from the ``cisd`` feature (+1 LONG, -1 SHORT).
+Filters receive the structure ``FeatureSet``, the entry-timeframe
+``FeatureSet`` (None when the strategy has no entry timeframe) and the
+parameters from the strategy config as keyword arguments.
+
+Filters:
+
+- ``series_minimum(param)``: the broken series has at least ``param`` candles.
+- ``c2_body_aligned``: C2 closed in the signal direction.
+- ``c3_first_5m_confirms``: the first entry-timeframe candle of C3 closed
+  in the signal direction.
+- ``body_risk_range(min_pips, max_pips)``: C2's body, which is the risk for a
+  C2_BODY_EXTREME stop, lies within the range (inclusive).
+- ``no_counter_cisd(window)``: no opposite CISD inside the window. Only
+  ``"C1_C2"`` (the C1 candle) is supported.
+- ``trading_window(start_utc, end_utc, days)``: the entry (C2 close) falls in
+  the window. Added by the engine from ``trading_window``, not listed in
+  configs.
+"""
+
+import inspect
+from collections.abc import Callable, Sequence
+from datetime import time
+from typing import Any, NamedTuple, Protocol
+
+import numpy as np
+
+from src.domain.strategy.features import FeatureSet
+
+# Bars before C2 covered by each no_counter_cisd window.
+_COUNTER_WINDOWS = {"C1_C2": 1}
+
+_WEEKDAYS = ("MON", "TUE", "WED", "THU", "FRI", "SAT", "SUN")
+# 1970-01-01 was a Thursday: (day_index + _EPOCH_WEEKDAY) % 7 gives Monday = 0.
+_EPOCH_WEEKDAY = 3
+
+
+class FilterFunc(Protocol):
+    """Signature of a filter implementation."""
+
+    def __call__(
+        self, features: FeatureSet, entry: FeatureSet | None, **params: Any
+    ) -> np.ndarray: ...
+
+
+class FilterSpec(NamedTuple):
+    """A registered filter.
+
+    Attributes:
+        func: The implementation.
+        requires: Features it reads from the structure series.
+        needs_entry: Whether it reads entry-timeframe candles.
+    """
+
+    func: FilterFunc
+    requires: tuple[str, ...]
+    needs_entry: bool = False
+
+
+FILTERS: dict[str, FilterSpec] = {}
+
+
+def _filter(
+    name: str, requires: tuple[str, ...], needs_entry: bool = False
+) -> Callable[[FilterFunc], FilterFunc]:
+    def register(func: FilterFunc) -> FilterFunc:
+        FILTERS[name] = FilterSpec(func, ("cisd", *requires), needs_entry)
+        return func
+
+    return register
+
+
+def bind_filter(name: str, params: dict[str, Any]) -> tuple[FilterSpec, dict[str, Any]]:
+    """Resolve a filter and check its parameters.
+
+    Args:
+        name: Filter name.
+        params: Parameters from the strategy config.
+
+    Returns:
+        The filter spec and the parameters with defaults applied.
+
+    Raises:
+        ValueError: If the filter is unknown or the parameters do not match
+            its signature.
+    """
+    spec = FILTERS.get(name)
+    if spec is None:
+        raise ValueError(f"Unknown filter '{name}'. Available: {sorted(FILTERS)}")
+    try:
+        bound = inspect.signature(spec.func).bind(None, None, **params)
+    except TypeError as exc:
+        raise ValueError(f"Invalid parameters for filter '{name}': {exc}") from None
+    bound.apply_defaults()
+    return spec, {k: v for k, v in bound.arguments.items() if k not in ("features", "entry")}
+
+
+def apply_filter(
+    name: str, features: FeatureSet, entry: FeatureSet | None, params: dict[str, Any]
+) -> np.ndarray:
+    """Evaluate a bound filter, memoised on ``features``.
+
+    Args:
+        name: Filter name.
+        features: Structure-timeframe features.
+        entry: Entry-timeframe features, if the strategy has them.
+        params: Parameters as returned by ``bind_filter``.
+
+    Returns:
+        Read-only boolean mask aligned with the structure series.
+    """
+    spec = FILTERS[name]
+    entry_tf = entry.series.timeframe if entry is not None else None
+    key = (name, entry_tf, tuple(sorted((k, _hashable(v)) for k, v in params.items())))
+    return features.mask(key, lambda: spec.func(features, entry, **params))
+
+
+def _hashable(value: Any) -> Any:
+    return tuple(value) if isinstance(value, list) else value
+
+
+@_filter("series_minimum", ("series_length",))
+def series_minimum(features: FeatureSet, entry: FeatureSet | None, *, param: int) -> np.ndarray:
+    """The series broken by C2 has at least ``param`` candles."""
+    return features["series_length"] >= param
+
+
+@_filter("c2_body_aligned", ("direction",))
+def c2_body_aligned(features: FeatureSet, entry: FeatureSet | None) -> np.ndarray:
+    """C2 closed in the signal direction."""
+    cisd = features["cisd"]
+    return (cisd != 0) & (features["direction"] == cisd)
+
+
+@_filter("c3_first_5m_confirms", ("entry_time",), needs_entry=True)
+def c3_first_5m_confirms(features: FeatureSet, entry: FeatureSet | None) -> np.ndarray:
+    """The entry candle opening at C3's open closed in the signal direction.
+
+    Bars whose C3 has not started in the entry series fail.
+
+    Raises:
+        ValueError: If no entry-timeframe series is available.
+    """
+    if entry is None:
+        raise ValueError("c3_first_5m_confirms needs entry-timeframe candles")
+    c3_open = features["entry_time"]
+    entry_open = entry.series.open_time.astype("datetime64[us]")
+    position = np.searchsorted(entry_open, c3_open)
+    found = position < len(entry_open)
+    position = np.where(found, position, 0)
+    if len(entry_open):
+        found &= entry_open[position] == c3_open
+        direction = entry["direction"][position]
+    else:
+        direction = np.zeros(len(position), dtype=np.int8)
+    cisd = features["cisd"]
+    return found & (cisd != 0) & (direction == cisd)
+
+
+@_filter("body_risk_range", ("body_pips",))
+def body_risk_range(
+    features: FeatureSet, entry: FeatureSet | None, *, min_pips: float, max_pips: float
+) -> np.ndarray:
+    """C2's body size in pips lies within [min_pips, max_pips]."""
+    body = features["body_pips"]
+    return (body >= min_pips) & (body <= max_pips)
+
+
+@_filter("no_counter_cisd", ())
+def no_counter_cisd(
+    features: FeatureSet, entry: FeatureSet | None, *, window: str = "C1_C2"
+) -> np.ndarray:
+    """No CISD in the opposite direction within ``window`` before C2.
+
+    Raises:
+        ValueError: If the window is not supported.
+    """
+    lookback = _COUNTER_WINDOWS.get(window)
+    if lookback is None:
+        raise ValueError(f"Unsupported no_counter_cisd window '{window}'")
+    cisd = features["cisd"]
+    clear = np.ones(len(cisd), dtype=bool)
+    for offset in range(1, lookback + 1):
+        clear[offset:] &= cisd[:-offset] != -cisd[offset:]
+    return clear
+
+
+@_filter("trading_window", ("entry_time",))
+def trading_window(
+    features: FeatureSet,
+    entry: FeatureSet | None,
+    *,
+    start_utc: time,
+    end_utc: time,
+    days: Sequence[str],
+) -> np.ndarray:
+    """The entry time falls inside the UTC window on one of ``days``.
+
+    A window whose end is before its start wraps past midnight; the day is
+    taken from the entry time itself.
+    """
+    t = features["entry_time"]
+    day = t.astype("datetime64[D]")
+    minute = ((t - day) // np.timedelta64(1, "m")).astype(np.int64)
+    start = start_utc.hour * 60 + start_utc.minute
+    end = end_utc.hour * 60 + end_utc.minute
+    if start <= end:
+        in_hours = (minute >= start) & (minute < end)
+    else:
+        in_hours = (minute >= start) | (minute < end)
+    weekday = (day.astype(np.int64) + _EPOCH_WEEKDAY) % 7
+    allowed = np.array([d in days for d in _WEEKDAYS])
+    return in_hours & allowed[weekday]
@@ -0,0 +1,217 @@
+"""Domain models for the strategy bounded context.
+
+A strategy is configuration, not code (BLUEPRINT §3.4). ``StrategyConfig``
+is the schema of a ``config/strategies/*.json`` file: the pairs and
+timeframes it trades, its trading window, the filters a candidate must pass,
+the scoring model, and the risk tiers that turn a score into position size.
+``Signal`` is what the engine emits when a candidate passes (docs/GLOSSARY.md).
+"""
+
+from datetime import datetime, time
+from enum import StrEnum
+from typing import Any
+
+from pydantic import BaseModel, ConfigDict, Field, model_validator
+
+from src.domain.execution.models import TradeDirection
+
+
+class StrategyStatus(StrEnum):
+    """Lifecycle state of a strategy config."""
+
+    ACTIVE = "ACTIVE"
+    PAUSED = "PAUSED"
+
+
+class FilterType(StrEnum):
+    """How a failed filter affects a candidate.
+
+    HARD: the candidate is rejected. SOFT: the candidate survives and its
+    score is reduced by the filter's ``penalty``.
+    """
+
+    HARD = "HARD"
+    SOFT = "SOFT"
+
+
+class Weekday(StrEnum):
+    """Trading-window days."""
+
+    MON = "MON"
+    TUE = "TUE"
+    WED = "WED"
+    THU = "THU"
+    FRI = "FRI"
+    SAT = "SAT"
+    SUN = "SUN"
+
+
+class EntryType(StrEnum):
+    """Where a signal enters. C2_CLOSE: at the close of the C2 candle."""
+
+    C2_CLOSE = "C2_CLOSE"
+
+
+class StopPlacement(StrEnum):
+    """Where the stop loss sits relative to C2.
+
+    C2_BODY_EXTREME: the far end of C2's body (its open for a LONG whose C2
+    closed up). C2_EXTREME: C2's low for a LONG, its high for a SHORT.
+    """
+
+    C2_BODY_EXTREME = "C2_BODY_EXTREME"
+    C2_EXTREME = "C2_EXTREME"
+
+
+class FilterConfig(BaseModel, frozen=True):
+    """One entry of a strategy's ``filters`` list.
+
+    Keys other than ``name``, ``type`` and ``penalty`` are the filter's
+    parameters (e.g. ``param`` or ``min_pips``) and are passed to the filter
+    implementation as keyword arguments.
+
+    Attributes:
+        name: Filter name, a key of ``src.domain.strategy.filters.FILTERS``.
+        type: HARD or SOFT.
+        penalty: Points deducted from the score when a SOFT filter fails.
+    """
+
+    model_config = ConfigDict(extra="allow")
+
+    name: str
+    type: FilterType = FilterType.HARD
+    penalty: int = Field(default=0, ge=0, le=100)
+
+    @property
+    def params(self) -> dict[str, Any]:
+        """The filter's parameters."""
+        return dict(self.model_extra or {})
+
+
+class TimeframesConfig(BaseModel, frozen=True):
+    """Timeframes a strategy reads.
+
+    Attributes:
+        structure: Timeframe whose candles form C1/C2 and are scored.
+        entry: Lower timeframe used to confirm C3, if any filter needs it.
+    """
+
+    structure: str
+    entry: str | None = None
+
+
+class TradingWindow(BaseModel, frozen=True):
+    """UTC window in which signals may enter. ``end_utc`` is exclusive."""
+
+    start_utc: time
+    end_utc: time
+    days: list[Weekday] = Field(
+        default_factory=lambda: [Weekday.MON, Weekday.TUE, Weekday.WED, Weekday.THU, Weekday.FRI]
+    )
+
+
+class EntryConfig(BaseModel, frozen=True):
+    """Entry rule. ``requires`` documents the conditions the filters encode."""
+
+    type: EntryType = EntryType.C2_CLOSE
+    requires: list[str] = Field(default_factory=list)
+
+
+class ScoringConfig(BaseModel, frozen=True):
+    """Scoring model and the minimum score for a signal."""
+
+    model: str
+    min_score: int = Field(ge=0, le=100)
+
+
+class RiskTier(BaseModel, frozen=True):
+    """A score band and the account risk it allows.
+
+    Attributes:
+        name: Tier name (BASE, STANDARD, STRONG or PREMIUM).
+        score_range: Inclusive [low, high] score bounds.
+        risk_pct: Account risk per trade in percent.
+    """
+
+    name: str
+    score_range: tuple[int, int]
+    risk_pct: float = Field(gt=0)
+
+    @model_validator(mode="after")
+    def _check_range(self) -> "RiskTier":
+        low, high = self.score_range
+        if not 0 <= low <= high <= 100:
+            raise ValueError(
+                f"Risk tier {self.name}: score_range must satisfy 0 <= low <= high <= 100"
+            )
+        return self
+
+
+class TargetsConfig(BaseModel, frozen=True):
+    """Take profit distance in R and stop placement."""
+
+    primary_r: float = Field(gt=0)
+    stop: StopPlacement = StopPlacement.C2_BODY_EXTREME
+
+
+class StrategyConfig(BaseModel, frozen=True):
+    """A strategy definition (one ``config/strategies/*.json`` file).
+
+    Raises:
+        pydantic.ValidationError: If risk tiers overlap or are out of order.
+    """
+
+    id: str
+    name: str
+    version: str
+    status: StrategyStatus = StrategyStatus.ACTIVE
+    pairs: list[str] = Field(min_length=1)
+    timeframes: TimeframesConfig
+    trading_window: TradingWindow
+    entry: EntryConfig = Field(default_factory=EntryConfig)
+    filters: list[FilterConfig] = Field(default_factory=list)
+    scoring: ScoringConfig
+    risk_tiers: list[RiskTier] = Field(min_length=1)
+    targets: TargetsConfig
+    expiry_hours: float = Field(gt=0)
+
+    @model_validator(mode="after")
+    def _check_tiers(self) -> "StrategyConfig":
+        for lower, upper in zip(self.risk_tiers, self.risk_tiers[1:], strict=False):
+            if upper.score_range[0] <= lower.score_range[1]:
+                raise ValueError(
+                    f"Risk tiers {lower.name} and {upper.name} overlap or are not ascending"
+                )
+        return self
+
+
+class Signal(BaseModel, frozen=True):
+    """A candidate that passed every HARD filter and scored into a risk tier.
+
+    Attributes:
+        strategy_id: Id of the strategy that produced it.
+        pair: Currency pair.
+        timeframe: Structure timeframe.
+        c2_time: Open time of the C2 candle.
+        entry_time: C2 close time, when the trade enters.
+        direction: LONG or SHORT.
+        entry_price: C2 close.
+        stop_loss: Stop price per ``targets.stop``.
+        take_profit: ``targets.primary_r`` R beyond the entry.
+        score: Quality score, 0-100.
+        risk_tier: Name of the tier the score falls in.
+        risk_pct: That tier's account risk in percent.
+    """
+
+    strategy_id: str
+    pair: str
+    timeframe: str
+    c2_time: datetime
+    entry_time: datetime
+    direction: TradeDirection
+    entry_price: float
+    stop_loss: float
+    take_profit: float
+    score: int
+    risk_tier: str
+    risk_pct: float
@@ -0,0 +1,38 @@
+"""Loading strategy configs from ``config/strategies/*.json``."""
+
+import json
+from pathlib import Path
+
+from src.domain.strategy.models import StrategyConfig, StrategyStatus
+from src.infrastructure.config import CONFIG_DIR
+
+STRATEGIES_DIR = CONFIG_DIR / "strategies"
+
+
+def load_strategy(path: Path) -> StrategyConfig:
+    """Parse and validate one strategy config file.
+
+    Raises:
+        FileNotFoundError: If the file doesn't exist.
+        pydantic.ValidationError: If it fails schema validation.
+    """
+    return StrategyConfig.model_validate(json.loads(Path(path).read_text()))
+
+
+def load_strategies(
+    directory: Path | None = None, *, active_only: bool = False
+) -> list[StrategyConfig]:
+    """Load every ``*.json`` strategy in a directory.
+
+    Args:
+        directory: Directory to scan. Defaults to ``config/strategies``.
+        active_only: Skip strategies whose status is not ACTIVE.
+
+    Returns:
+        Strategies ordered by id.
+    """
+    directory = Path(directory) if directory is not None else STRATEGIES_DIR
+    strategies = [load_strategy(path) for path in sorted(directory.glob("*.json"))]
+    if active_only:
+        strategies = [s for s in strategies if s.status is StrategyStatus.ACTIVE]
+    return sorted(strategies, key=lambda s: s.id)
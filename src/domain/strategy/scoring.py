@@ -0,0 +1,101 @@
+"""Scoring model implementations.
+
+A scoring model rates candidates 0-100 (docs/GLOSSARY.md). Models score a
+batch: they receive the structure ``FeatureSet`` and the bar indices of the
+candidates that survived the HARD filters, and return one integer score per
+index. Only those bars are scored, so the cost follows the candidate count,
+not the series length.
+
+Models are registered in ``SCORING_MODELS`` under the name a strategy
+config's ``scoring.model`` refers to.
+"""
+
+from collections.abc import Callable
+from typing import NamedTuple
+
+import numpy as np
+
+from src.domain.strategy.features import FeatureSet
+
+ScoringFunc = Callable[[FeatureSet, np.ndarray], np.ndarray]
+
+
+class ScoringModel(NamedTuple):
+    """A registered scoring model.
+
+    Attributes:
+        func: Scores a batch of candidate bar indices.
+        requires: Features it reads.
+    """
+
+    func: ScoringFunc
+    requires: tuple[str, ...]
+
+
+SCORING_MODELS: dict[str, ScoringModel] = {}
+
+
+def _model(name: str, requires: tuple[str, ...]) -> Callable[[ScoringFunc], ScoringFunc]:
+    def register(func: ScoringFunc) -> ScoringFunc:
+        SCORING_MODELS[name] = ScoringModel(func, requires)
+        return func
+
+    return register
+
+
+def get_scoring_model(name: str) -> ScoringModel:
+    """Look up a scoring model.
+
+    Raises:
+        ValueError: If no model has that name.
+    """
+    model = SCORING_MODELS.get(name)
+    if model is None:
+        raise ValueError(f"Unknown scoring model '{name}'. Available: {sorted(SCORING_MODELS)}")
+    return model
+
+
+def _window_count(mask: np.ndarray, start: np.ndarray, stop: np.ndarray) -> np.ndarray:
+    """Number of True values in ``mask[start:stop]`` for each pair of bounds."""
+    prefix = np.concatenate(([0], np.cumsum(mask, dtype=np.int64)))
+    return prefix[stop] - prefix[start]
+
+
+@_model(
+    "cisd_v3_score",
+    ("cisd", "series_length", "swing_high", "swing_low", "close_location"),
+)
+def cisd_v3_score(features: FeatureSet, index: np.ndarray) -> np.ndarray:
+    """Score CISD candidates on series length, swing anchoring and close strength.
+
+    Points:
+
+    - 40 for a candidate that passed the HARD filters.
+    - +5 per series candle beyond two, up to +20 (a series of six or more).
+    - +15 when the broken series made a swing on its far side (a swing low
+      inside a down series for a LONG): the reversal starts from structure.
+    - Up to +15 for C2 closing at its extreme in the signal direction,
+      scaled by where the close sits in C2's range.
+
+    Args:
+        features: Structure-timeframe features.
+        index: Bar indices of the candidates (C2 candles).
+
+    Returns:
+        Scores, 40-90, aligned with ``index``.
+    """
+    is_long = features["cisd"][index] > 0
+    length = features["series_length"][index]
+    score = 40 + np.clip(length - 2, 0, 4) * 5
+
+    swing_in_series = np.where(
+        is_long,
+        _window_count(features["swing_low"], index - length, index),
+        _window_count(features["swing_high"], index - length, index),
+    )
+    score += np.where(swing_in_series > 0, 15, 0)
+
+    location = features["close_location"][index]
+    strength = np.where(is_long, location, 1.0 - location)
+    score += np.rint(strength * 15).astype(np.int64)
+    return score.astype(np.int64)
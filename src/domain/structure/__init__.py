@@ -1,12 +1,115 @@
 """Structure bounded context — swing detection, level tracking, CISD patterns."""
 
-from src.domain.structure.models import Candle, Swing, SwingType
-from src.domain.structure.swing_detection import PIP_VALUES, detect_swings
+from src.domain.structure.cisd_detection import (
+    CISD_DTYPE,
+    RUN_DTYPE,
+    CISDDetector,
+    OpenSeries,
+    cisd_direction,
+    detect_cisd,
+    detect_cisd_array,
+    encode_runs,
+)
+from src.domain.structure.fractal_detection import (
+    detect_fractals,
+    detect_fractals_array,
+    detect_fractals_multi,
+    sliding_max,
+    sliding_min,
+)
+from src.domain.structure.fvg_detection import FVG_DTYPE, detect_fvgs, detect_fvgs_array
+from src.domain.structure.key_levels import (
+    KEY_LEVEL_DTYPE,
+    KeyLevelCalendar,
+    build_key_levels,
+    build_key_levels_array,
+)
+from src.domain.structure.level_sweeps import (
+    LEVEL_CHECK_DTYPE,
+    check_levels,
+    check_levels_array,
+    swing_point_mask,
+)
+from src.domain.structure.models import (
+    Candle,
+    CandleSeries,
+    CISDEvent,
+    Direction,
+    FairValueGap,
+    KeyLevel,
+    LevelStatus,
+    Swing,
+    SwingStrength,
+    SwingType,
+)
+from src.domain.structure.swing_cache import (
+    FileCacheBackend,
+    SwingCache,
+    SwingCacheBackend,
+    SwingCacheStats,
+)
+from src.domain.structure.swing_detection import (
+    SWING_DTYPE,
+    detect_swings,
+    detect_swings_array,
+    get_pip_value,
+)
+from src.domain.structure.swing_detector import SwingDetector
+from src.domain.structure.swing_scan import scan_swings
+from src.domain.structure.swing_strength import (
+    STRENGTH_DTYPE,
+    SwingStrengthTracker,
+    classify_swing_strength,
+    classify_swing_strength_array,
+)
 
 __all__ = [
+    "CISD_DTYPE",
+    "FVG_DTYPE",
+    "KEY_LEVEL_DTYPE",
+    "LEVEL_CHECK_DTYPE",
+    "RUN_DTYPE",
+    "STRENGTH_DTYPE",
+    "SWING_DTYPE",
+    "CISDDetector",
+    "CISDEvent",
     "Candle",
+    "CandleSeries",
+    "Direction",
+    "FairValueGap",
+    "FileCacheBackend",
+    "KeyLevel",
+    "KeyLevelCalendar",
+    "LevelStatus",
+    "OpenSeries",
     "Swing",
+    "SwingCache",
+    "SwingCacheBackend",
+    "SwingCacheStats",
+    "SwingDetector",
+    "SwingStrength",
+    "SwingStrengthTracker",
     "SwingType",
-    "PIP_VALUES",
+    "build_key_levels",
+    "build_key_levels_array",
+    "check_levels",
+    "check_levels_array",
+    "cisd_direction",
+    "classify_swing_strength",
+    "classify_swing_strength_array",
+    "detect_cisd",
+    "detect_cisd_array",
+    "detect_fractals",
+    "detect_fractals_array",
+    "detect_fractals_multi",
+    "detect_fvgs",
+    "detect_fvgs_array",
     "detect_swings",
+    "detect_swings_array",
+    "encode_runs",
+    "get_pip_value",
+    "scan_swings",
+    "sliding_max",
+    "sliding_min",
+    "swing_point_mask",
 ]
@@ -0,0 +1,339 @@
+"""CISD (Change in State of Delivery) detection.
+
+A series is a run of consecutive same-direction candles: up-close or
+down-close, with a doji ending any run. A candle (C2) that closes back
+through the open of the series ending on the previous candle (C1) is a CISD:
+
+- BULLISH: the series is down and C2 closes above its first candle's open.
+- BEARISH: the series is up and C2 closes below its first candle's open.
+
+C2's own direction is not part of the rule (the ``c2_body_aligned`` strategy
+filter checks it), so a C2 that extends the series can still qualify.
+
+Candle direction is run-length encoded over the whole array in one pass
+(``encode_runs``). Each bar's series start is then a repeat of its run's
+start, so every candidate C2 is tested with array operations and no Python
+loop. ``CISDDetector`` applies the same rule to one closed candle at a time,
+carrying only the open run per (pair, timeframe).
+"""
+
+from collections.abc import Mapping
+from datetime import datetime
+from typing import Any, NamedTuple
+
+import numpy as np
+
+from src.domain.structure.models import Candle, CandleSeries, CISDEvent, Direction
+
+# Bumped whenever the checkpoint layout changes.
+CHECKPOINT_VERSION = 1
+
+# Structured dtype returned by encode_runs — one row per run.
+RUN_DTYPE = np.dtype(
+    [
+        ("start", "i8"),
+        ("length", "i8"),
+        ("direction", "i1"),
+    ]
+)
+
+# Structured dtype returned by detect_cisd_array — one row per CISD.
+CISD_DTYPE = np.dtype(
+    [
+        ("open_time", "datetime64[us]"),
+        ("direction", "U7"),
+        ("series_length", "i8"),
+        ("series_start", "datetime64[us]"),
+        ("series_open", "f8"),
+    ]
+)
+
+
+class OpenSeries(NamedTuple):
+    """The run a ``CISDDetector`` is tracking for one series.
+
+    Attributes:
+        direction: +1 for an up series, -1 for a down series.
+        length: Candles in the run so far.
+        start: Open time of the run's first candle.
+        open: Open of the run's first candle.
+    """
+
+    direction: int
+    length: int
+    start: datetime
+    open: float
+
+
+def candle_direction(open: np.ndarray, close: np.ndarray) -> np.ndarray:
+    """+1 for an up-close candle, -1 for a down-close, 0 for a doji (int8)."""
+    return np.sign(np.asarray(close) - np.asarray(open)).astype(np.int8)
+
+
+def encode_runs(direction: np.ndarray) -> np.ndarray:
+    """Run-length encode a direction column.
+
+    Args:
+        direction: Per-candle direction (+1, -1 or 0).
+
+    Returns:
+        ``RUN_DTYPE`` array covering every candle once, in order. Doji runs
+        (direction 0) are included.
+    """
+    n = len(direction)
+    starts = np.flatnonzero(direction[1:] != direction[:-1]) + 1
+    starts = np.concatenate([np.zeros(min(n, 1), dtype=np.int64), starts])
+    runs = np.empty(len(starts), dtype=RUN_DTYPE)
+    runs["start"] = starts
+    runs["length"] = np.diff(np.append(starts, n))
+    runs["direction"] = direction[starts]
+    return runs
+
+
+def _cisd_bars(
+    open: np.ndarray, close: np.ndarray, min_series: int
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Find every C2.
+
+    Returns:
+        ``(c2, sign, series_start)``: C2 candle indices, +1 BULLISH / -1
+        BEARISH, and the index of each broken series' first candle.
+    """
+    direction = candle_direction(open, close)
+    runs = encode_runs(direction)
+    run_start = np.repeat(runs["start"], runs["length"])
+    # Candidate C2 = every candle but the first; its series is the run so far
+    # ending on the candle before it.
+    prior = direction[:-1]
+    start = run_start[:-1]
+    length = np.arange(1, len(direction)) - start
+    series_open = open[start]
+    c2_close = close[1:]
+    bullish = (prior == -1) & (c2_close > series_open)
+    bearish = (prior == 1) & (c2_close < series_open)
+    sign = bullish.astype(np.int8) - bearish.astype(np.int8)
+    hit = np.flatnonzero((sign != 0) & (length >= min_series))
+    return hit + 1, sign[hit], start[hit]
+
+
+def cisd_direction(open: np.ndarray, close: np.ndarray, min_series: int = 1) -> np.ndarray:
+    """Per-candle CISD column: +1 at BULLISH C2s, -1 at BEARISH C2s, else 0 (int8)."""
+    open = np.asarray(open, dtype=np.float64)
+    close = np.asarray(close, dtype=np.float64)
+    out = np.zeros(len(open), dtype=np.int8)
+    if len(open):
+        c2, sign, _ = _cisd_bars(open, close, min_series)
+        out[c2] = sign
+    return out
+
+
+def detect_cisd_array(
+    open_time: np.ndarray,
+    open: np.ndarray,
+    close: np.ndarray,
+    min_series: int = 1,
+) -> np.ndarray:
+    """Detect CISDs from columnar candle arrays.
+
+    Args:
+        open_time: Candle open times as ``datetime64`` values, ascending.
+        open: Candle opens, aligned with ``open_time``.
+        close: Candle closes, aligned with ``open_time``.
+        min_series: Shortest series whose break counts.
+
+    Returns:
+        ``CISD_DTYPE`` array, one row per C2, in open_time order.
+
+    Raises:
+        ValueError: If the columns differ in length or min_series < 1.
+    """
+    open_time = np.asarray(open_time, dtype="datetime64[us]")
+    open = np.asarray(open, dtype=np.float64)
+    close = np.asarray(close, dtype=np.float64)
+    if not (len(open_time) == len(open) == len(close)):
+        raise ValueError(
+            "open_time, open and close must have the same length, got "
+            f"{len(open_time)}, {len(open)}, {len(close)}"
+        )
+    if min_series < 1:
+        raise ValueError(f"min_series must be >= 1, got {min_series}")
+    if len(open) == 0:
+        return np.empty(0, dtype=CISD_DTYPE)
+
+    c2, sign, start = _cisd_bars(open, close, min_series)
+    events = np.empty(len(c2), dtype=CISD_DTYPE)
+    events["open_time"] = open_time[c2]
+    events["direction"] = np.where(sign > 0, Direction.BULLISH.value, Direction.BEARISH.value)
+    events["series_length"] = c2 - start
+    events["series_start"] = open_time[start]
+    events["series_open"] = open[start]
+    return events
+
+
+def detect_cisd(candles: CandleSeries, min_series: int = 1) -> list[CISDEvent]:
+    """Detect CISDs in a candle series.
+
+    Args:
+        candles: Candles sorted ascending by open_time (5M for CISD-v3).
+        min_series: Shortest series whose break counts.
+
+    Returns:
+        CISDEvent objects in open_time ascending order.
+
+    Raises:
+        ValueError: Same conditions as ``detect_cisd_array``.
+    """
+    events = detect_cisd_array(candles.open_time, candles.open, candles.close, min_series)
+    return [
+        CISDEvent(
+            pair=candles.pair,
+            timeframe=candles.timeframe,
+            open_time=open_time,
+            direction=Direction(direction),
+            series_length=length,
+            series_start=start,
+            series_open=series_open,
+        )
+        for open_time, direction, length, start, series_open in zip(
+            events["open_time"].tolist(),
+            events["direction"].tolist(),
+            events["series_length"].tolist(),
+            events["series_start"].tolist(),
+            events["series_open"].tolist(),
+            strict=True,
+        )
+    ]
+
+
+class CISDDetector:
+    """Stateful CISD detector fed with closed candles.
+
+    Keeps the open run per (pair, timeframe). Each closed candle is tested
+    against that run, then extends it or starts a new one, so the output is
+    identical to ``detect_cisd`` over the same candles at constant work per
+    candle.
+
+    Example:
+        detector = CISDDetector(min_series=2)
+        for candle in feed_5m:
+            if (event := detector.update(candle)) is not None:
+                publish(event)
+    """
+
+    def __init__(self, min_series: int = 1) -> None:
+        """Create an empty detector.
+
+        Args:
+            min_series: Shortest series whose break counts.
+
+        Raises:
+            ValueError: If min_series < 1.
+        """
+        if min_series < 1:
+            raise ValueError(f"min_series must be >= 1, got {min_series}")
+        self.min_series = min_series
+        self._last: dict[tuple[str, str], datetime] = {}
+        self._runs: dict[tuple[str, str], OpenSeries] = {}
+
+    def update(self, candle: Candle) -> CISDEvent | None:
+        """Feed one closed candle.
+
+        Args:
+            candle: The newly closed candle. Must be later than the previous
+                candle fed for the same pair and timeframe.
+
+        Returns:
+            The CISD with this candle as C2, if any.
+
+        Raises:
+            ValueError: If the candle is not strictly after the previous one
+                for its series.
+        """
+        key = (candle.pair, candle.timeframe)
+        last = self._last.get(key)
+        if last is not None and candle.open_time <= last:
+            raise ValueError(
+                "Candles must be fed ascending by open_time with no duplicates. "
+                f"{candle.pair} {candle.timeframe}: {candle.open_time} <= {last}"
+            )
+        self._last[key] = candle.open_time
+
+        run = self._runs.get(key)
+        event = None
+        if run is not None and run.length >= self.min_series:
+            if run.direction < 0 and candle.close > run.open:
+                event = self._event(candle, Direction.BULLISH, run)
+            elif run.direction > 0 and candle.close < run.open:
+                event = self._event(candle, Direction.BEARISH, run)
+
+        direction = (candle.close > candle.open) - (candle.close < candle.open)
+        if direction == 0:
+            self._runs.pop(key, None)
+        elif run is not None and run.direction == direction:
+            self._runs[key] = run._replace(length=run.length + 1)
+        else:
+            self._runs[key] = OpenSeries(direction, 1, candle.open_time, candle.open)
+        return event
+
+    def open_series(self, pair: str, timeframe: str) -> OpenSeries | None:
+        """The run ending on the last candle fed, or None after a doji."""
+        return self._runs.get((pair, timeframe))
+
+    @staticmethod
+    def _event(candle: Candle, direction: Direction, run: OpenSeries) -> CISDEvent:
+        return CISDEvent(
+            pair=candle.pair,
+            timeframe=candle.timeframe,
+            open_time=candle.open_time,
+            direction=direction,
+            series_length=run.length,
+            series_start=run.start,
+            series_open=run.open,
+        )
+
+    def checkpoint(self) -> dict[str, Any]:
+        """Snapshot the detector state as a JSON-serialisable dict.
+
+        Returns:
+            Dict suitable for ``json.dumps`` and ``CISDDetector.restore``.
+        """
+        return {
+            "version": CHECKPOINT_VERSION,
+            "min_series": self.min_series,
+            "series": [
+                {
+                    "pair": pair,
+                    "timeframe": timeframe,
+                    "last": last.isoformat(),
+                    "run": (
+                        [run.direction, run.length, run.start.isoformat(), run.open]
+                        if (run := self._runs.get((pair, timeframe)))
+                        else None
+                    ),
+                }
+                for (pair, timeframe), last in self._last.items()
+            ],
+        }
+
+    @classmethod
+    def restore(cls, state: Mapping[str, Any]) -> "CISDDetector":
+        """Rebuild a detector from a ``checkpoint()`` snapshot.
+
+        Raises:
+            ValueError: If the checkpoint version is not supported.
+        """
+        if state.get("version") != CHECKPOINT_VERSION:
+            raise ValueError(
+                f"Unsupported CISDDetector checkpoint version {state.get('version')!r}, "
+                f"expected {CHECKPOINT_VERSION}"
+            )
+        detector = cls(min_series=state["min_series"])
+        for series in state["series"]:
+            key = (series["pair"], series["timeframe"])
+            detector._last[key] = datetime.fromisoformat(series["last"])
+            if series["run"] is not None:
+                direction, length, start, open_ = series["run"]
+                detector._runs[key] = OpenSeries(
+                    int(direction), int(length), datetime.fromisoformat(start), float(open_)
+                )
+        return detector
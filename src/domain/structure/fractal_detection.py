@@ -0,0 +1,256 @@
+"""N-bar fractal swing detection.
+
+``detect_swings`` compares each candle with one neighbour on either side
+(C1-C2-C3). A fractal widens that window. A fractal HIGH at candle ``i`` with
+widths ``(left, right)`` has a high above every high in the ``left`` candles
+before it and the ``right`` candles after it; a fractal LOW is the mirror.
+With ``strict=False`` a high only has to be >= its neighbours, so flat tops
+qualify. HIGH and LOW are checked independently, as in ``detect_swings``,
+and a candle can be both.
+
+The neighbourhood extrema are sliding-window maxima and minima, computed
+with the van Herk / Gil-Werman block scheme: prefix and suffix running
+extrema inside fixed blocks of the window length, combined with one more
+elementwise max. That is O(n) whatever the window and fully vectorised.
+``detect_fractals_multi`` computes each distinct window length once and
+shares it across every requested width.
+
+With ``left=right=1`` and ``strict=True`` the output is exactly that of
+``detect_swings_array``, dual swings and ``min_swing_pips`` filter included.
+"""
+
+from collections.abc import Iterable
+
+import numpy as np
+
+from src.domain.structure.models import CandleSeries, Swing, SwingRecord
+from src.domain.structure.swing_detection import (
+    _merge_positions,
+    _swing_models,
+    _swing_rows,
+    _triplet_columns,
+    get_pip_value,
+)
+
+# A width is either symmetric (n candles each side) or (left, right).
+Width = int | tuple[int, int]
+
+
+def _sliding(values: np.ndarray, window: int, op: np.ufunc, fill: float) -> np.ndarray:
+    """``op`` over every ``window``-long slice: ``out[k] = op(values[k:k + window])``.
+
+    Returns ``len(values) - window + 1`` values (empty if the window is longer
+    than the input).
+    """
+    n = len(values)
+    if window == 1:
+        return values
+    if n < window:
+        return values[:0]
+    blocks = np.concatenate([values, np.full(-n % window, fill)]).reshape(-1, window)
+    prefix = op.accumulate(blocks, axis=1).ravel()
+    suffix = op.accumulate(blocks[:, ::-1], axis=1)[:, ::-1].ravel()
+    # A window starting at k spans the tail of k's block (suffix[k]) and the
+    # head of the next block up to k + window - 1 (prefix[k + window - 1]).
+    return op(suffix[: n - window + 1], prefix[window - 1 : n])
+
+
+def sliding_max(values: np.ndarray, window: int) -> np.ndarray:
+    """Maximum of every ``window``-long slice of ``values``, in O(n)."""
+    return _sliding(np.asarray(values, dtype=np.float64), window, np.maximum, -np.inf)
+
+
+def sliding_min(values: np.ndarray, window: int) -> np.ndarray:
+    """Minimum of every ``window``-long slice of ``values``, in O(n)."""
+    return _sliding(np.asarray(values, dtype=np.float64), window, np.minimum, np.inf)
+
+
+def _normalise(width: Width) -> tuple[int, int]:
+    left, right = (width, width) if isinstance(width, int) else width
+    if left < 1 or right < 1:
+        raise ValueError(f"Fractal widths must be >= 1, got {width!r}")
+    return left, right
+
+
+def _fractal_positions(
+    high: np.ndarray,
+    low: np.ndarray,
+    left: int,
+    right: int,
+    strict: bool,
+    extrema: dict[int, tuple[np.ndarray, np.ndarray]],
+    range_ok: np.ndarray | None,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Candle indices and directions of the fractals of one width.
+
+    ``extrema`` caches ``(sliding_max(high, w), sliding_min(low, w))`` per
+    window length, so widths sharing a length share the work.
+    """
+    n = len(high)
+    lo, hi = left, n - right  # candidates with a full window on both sides
+    if hi <= lo:
+        return _merge_positions(np.empty(0, np.intp), np.empty(0, np.intp))
+    for w in (left, right):
+        if w not in extrema:
+            extrema[w] = (sliding_max(high, w), sliding_min(low, w))
+    left_max, left_min = (a[lo - left : hi - left] for a in extrema[left])
+    right_max, right_min = (a[lo + 1 : hi + 1] for a in extrema[right])
+    centre_high, centre_low = high[lo:hi], low[lo:hi]
+
+    if strict:
+        high_mask = (centre_high > left_max) & (centre_high > right_max)
+        low_mask = (centre_low < left_min) & (centre_low < right_min)
+    else:
+        high_mask = (centre_high >= left_max) & (centre_high >= right_max)
+        low_mask = (centre_low <= left_min) & (centre_low <= right_min)
+    if range_ok is not None:
+        high_mask &= range_ok[lo:hi]
+        low_mask &= range_ok[lo:hi]
+    return _merge_positions(np.flatnonzero(high_mask) + lo, np.flatnonzero(low_mask) + lo)
+
+
+def _range_filter(
+    high: np.ndarray, low: np.ndarray, pair: str | None, min_swing_pips: float | None
+) -> np.ndarray | None:
+    """Mask of candles passing ``min_swing_pips``, or None for no filter."""
+    if min_swing_pips is None:
+        return None
+    if pair is None:
+        raise ValueError("pair is required when min_swing_pips is set")
+    # Written as ``not <`` to match detect_swings exactly.
+    return ~((high - low) / get_pip_value(pair) < min_swing_pips)
+
+
+def detect_fractals_multi(
+    open_time: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    widths: Iterable[Width],
+    *,
+    strict: bool = True,
+    pair: str | None = None,
+    min_swing_pips: float | None = None,
+) -> dict[Width, np.ndarray]:
+    """Detect fractals of several widths from one set of columns.
+
+    Each distinct window length's sliding extrema are computed once and
+    shared, so asking for widths 2, 3 and 5 costs about three passes rather
+    than three full detections.
+
+    Args:
+        open_time: Candle open times as ``datetime64`` values (any unit),
+            sorted strictly ascending.
+        high: Candle highs, aligned with ``open_time``.
+        low: Candle lows, aligned with ``open_time``.
+        widths: Widths to detect. An int is symmetric; a ``(left, right)``
+            tuple sets each side.
+        strict: Require strictly higher highs / lower lows than every
+            neighbour. False accepts ties.
+        pair: Currency pair in uppercase format with no slash (e.g. "EURUSD").
+            Only required when ``min_swing_pips`` is set.
+        min_swing_pips: Optional minimum range of the fractal candle in pips.
+            None = no filter.
+
+    Returns:
+        ``SWING_DTYPE`` array per requested width (keyed as given), in
+        open_time ascending order with HIGH before LOW for dual swings.
+        Candles without a full window on both sides are never fractals.
+
+    Raises:
+        ValueError: Same column checks as ``detect_swings_array``.
+        ValueError: If a width is below 1.
+        ValueError: If min_swing_pips is set without a known pair.
+    """
+    widths = list(widths)
+    normalised = [_normalise(w) for w in widths]
+    open_time, high, low = _triplet_columns(open_time, high, low)
+    range_ok = _range_filter(high, low, pair, min_swing_pips)
+    extrema: dict[int, tuple[np.ndarray, np.ndarray]] = {}
+    result: dict[Width, np.ndarray] = {}
+    for width, (left, right) in zip(widths, normalised, strict=True):
+        positions, is_high = _fractal_positions(high, low, left, right, strict, extrema, range_ok)
+        result[width] = _swing_rows(open_time, high, low, positions, is_high)
+    return result
+
+
+def detect_fractals_array(
+    open_time: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    left: int = 2,
+    right: int | None = None,
+    *,
+    strict: bool = True,
+    pair: str | None = None,
+    min_swing_pips: float | None = None,
+) -> np.ndarray:
+    """Detect fractals of one width from columnar candle arrays.
+
+    Args:
+        open_time: Candle open times, sorted strictly ascending.
+        high: Candle highs, aligned with ``open_time``.
+        low: Candle lows, aligned with ``open_time``.
+        left: Candles compared before the fractal candle.
+        right: Candles compared after it. Defaults to ``left``.
+        strict: Require strictly higher highs / lower lows. False accepts ties.
+        pair: Currency pair; only required when ``min_swing_pips`` is set.
+        min_swing_pips: Optional minimum fractal-candle range in pips.
+
+    Returns:
+        ``SWING_DTYPE`` array as for ``detect_swings_array``.
+
+    Raises:
+        ValueError: Same conditions as ``detect_fractals_multi``.
+    """
+    width = (left, left if right is None else right)
+    return detect_fractals_multi(
+        open_time,
+        high,
+        low,
+        [width],
+        strict=strict,
+        pair=pair,
+        min_swing_pips=min_swing_pips,
+    )[width]
+
+
+def detect_fractals(
+    candles: CandleSeries,
+    pair: str,
+    timeframe: str,
+    left: int = 2,
+    right: int | None = None,
+    *,
+    strict: bool = True,
+    min_swing_pips: float | None = None,
+    records: bool = False,
+) -> list[Swing] | list[SwingRecord]:
+    """Detect fractals from a candle series as ``Swing`` models.
+
+    Args:
+        candles: Candles sorted ascending by open_time.
+        pair: Currency pair in uppercase format with no slash (e.g. "EURUSD").
+        timeframe: Timeframe in uppercase with unit (e.g. "4H").
+        left: Candles compared before the fractal candle.
+        right: Candles compared after it. Defaults to ``left``.
+        strict: Require strictly higher highs / lower lows. False accepts ties.
+        min_swing_pips: Optional minimum fractal-candle range in pips.
+        records: Return ``SwingRecord`` tuples instead of ``Swing`` models.
+
+    Returns:
+        Swings in open_time ascending order, HIGH before LOW for dual swings.
+
+    Raises:
+        ValueError: Same conditions as ``detect_fractals_multi``.
+    """
+    swings = detect_fractals_array(
+        candles.open_time,
+        candles.high,
+        candles.low,
+        left,
+        right,
+        strict=strict,
+        pair=pair,
+        min_swing_pips=min_swing_pips,
+    )
+    return _swing_models(swings, pair, timeframe, records)
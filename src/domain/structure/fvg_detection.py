@@ -0,0 +1,120 @@
+"""Fair Value Gap detection for the structure bounded context.
+
+A Fair Value Gap (FVG) is the price range a C1-C2-C3 triplet leaves untraded
+when C2 displaces hard enough that C1 and C3 do not overlap:
+
+- BULLISH: C3.low > C1.high — gap from C1.high up to C3.low.
+- BEARISH: C3.high < C1.low — gap from C3.high up to C1.low.
+
+Like swing detection, the comparisons are shifted-array masks over the whole
+series, so ``detect_fvgs_array`` works on the same columns as
+``detect_swings_array`` without a Python loop.
+"""
+
+import numpy as np
+
+from src.domain.structure.models import CandleSeries, Direction, FairValueGap
+from src.domain.structure.swing_detection import _triplet_columns, get_pip_value
+
+# Structured dtype returned by detect_fvgs_array — one row per gap.
+FVG_DTYPE = np.dtype(
+    [
+        ("open_time", "datetime64[us]"),
+        ("direction", "U7"),
+        ("top", "f8"),
+        ("bottom", "f8"),
+    ]
+)
+
+
+def detect_fvgs_array(
+    open_time: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    pair: str | None = None,
+    min_gap_pips: float | None = None,
+) -> np.ndarray:
+    """Detect Fair Value Gaps from columnar candle arrays.
+
+    Args:
+        open_time: Candle open times as ``datetime64`` values (any unit),
+            sorted strictly ascending.
+        high: Candle highs, aligned with ``open_time``.
+        low: Candle lows, aligned with ``open_time``.
+        pair: Currency pair in uppercase format with no slash (e.g. "EURUSD").
+            Only required when ``min_gap_pips`` is set.
+        min_gap_pips: Optional minimum gap size (top - bottom) in pips.
+            None = keep every gap.
+
+    Returns:
+        Structured array with dtype ``FVG_DTYPE`` (fields ``open_time`` of the
+        C2 candle, ``direction``, ``top`` and ``bottom``) in open_time order.
+
+    Raises:
+        ValueError: If the columns differ in length or hold fewer than 3 candles.
+        ValueError: If open_time is not strictly ascending.
+        ValueError: If min_gap_pips is set without a known pair.
+    """
+    open_time, high, low = _triplet_columns(open_time, high, low)
+
+    c1_high, c1_low = high[:-2], low[:-2]
+    c3_high, c3_low = high[2:], low[2:]
+
+    bullish = c3_low > c1_high
+    bearish = c3_high < c1_low
+    top = np.where(bullish, c3_low, c1_low)
+    bottom = np.where(bullish, c1_high, c3_high)
+
+    mask = bullish | bearish
+    if min_gap_pips is not None:
+        if pair is None:
+            raise ValueError("pair is required when min_gap_pips is set")
+        mask &= (top - bottom) / get_pip_value(pair) >= min_gap_pips
+
+    idx = np.flatnonzero(mask)
+    gaps = np.empty(len(idx), dtype=FVG_DTYPE)
+    gaps["open_time"] = open_time[idx + 1]
+    gaps["direction"] = np.where(bullish[idx], Direction.BULLISH.value, Direction.BEARISH.value)
+    gaps["top"] = top[idx]
+    gaps["bottom"] = bottom[idx]
+    return gaps
+
+
+def detect_fvgs(
+    candles: CandleSeries,
+    pair: str,
+    timeframe: str,
+    min_gap_pips: float | None = None,
+) -> list[FairValueGap]:
+    """Detect Fair Value Gaps in a candle series.
+
+    Args:
+        candles: Candles sorted ascending by open_time (at least 3).
+        pair: Currency pair in uppercase format with no slash (e.g. "EURUSD").
+        timeframe: Timeframe in uppercase with unit (e.g. "1H").
+        min_gap_pips: Optional minimum gap size in pips. None = no filter.
+
+    Returns:
+        List of FairValueGap objects in open_time ascending order.
+
+    Raises:
+        ValueError: Same conditions as ``detect_fvgs_array``.
+    """
+    gaps = detect_fvgs_array(candles.open_time, candles.high, candles.low, pair, min_gap_pips)
+    return [
+        FairValueGap(
+            pair=pair,
+            timeframe=timeframe,
+            open_time=open_time,
+            direction=Direction(direction),
+            top=top,
+            bottom=bottom,
+        )
+        for open_time, direction, top, bottom in zip(
+            gaps["open_time"].tolist(),
+            gaps["direction"].tolist(),
+            gaps["top"].tolist(),
+            gaps["bottom"].tolist(),
+            strict=True,
+        )
+    ]
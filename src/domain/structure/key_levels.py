@@ -0,0 +1,583 @@
+"""Key-level calendar: session, daily, weekly and monthly highs and lows.
+
+Replaces the WF2 Daily Initializer / WF3 Session Tracker aggregations, which
+re-query candles and recompute every level in JavaScript on each run.
+
+Levels (``level_type`` as stored in key_levels):
+
+- ``<SESSION>_HIGH`` / ``<SESSION>_LOW`` for every session in
+  config/sessions.json (ASIA, LONDON, NY), over candles opening inside the
+  session's UTC window.
+- ``PDH`` / ``PDL``: previous trading day. Days are the resampler's D
+  buckets, so weekend bars belong to Monday.
+- ``PWH`` / ``PWL``: previous trading week (the resampler's W buckets).
+- ``PMH`` / ``PML``: previous calendar month of trading days.
+
+A level becomes active when its period ends (``active_from``). Until then it
+is still forming and cannot be touched or swept.
+
+``build_key_levels_array`` computes every level for years of history in one
+vectorised group-by per period: candle times map to period bounds with array
+arithmetic, and ``np.maximum.reduceat`` / ``np.minimum.reduceat`` over the
+group boundaries give the extremes. ``KeyLevelCalendar`` stores the result
+per pair and level type, sorted by ``active_from``, so "which PDH applies at
+time t" is one binary search. Each live candle only folds into the periods
+it belongs to, and a level is appended when its period closes.
+"""
+
+import bisect
+from collections.abc import Iterable, Mapping, Sequence
+from datetime import datetime, time, timedelta
+from typing import NamedTuple
+
+import numpy as np
+
+# Module import: the resampler imports structure models, so importing names
+# from it here would be circular.
+from src.domain.market_data import resampler
+from src.domain.structure.models import Candle, CandleSeries, KeyLevel, SwingType
+from src.infrastructure.config import get_config_registry
+
+DEFAULT_PERIODS = ("D", "W", "M")
+
+# Level names per calendar period: (HIGH, LOW).
+PERIOD_LEVELS = {"D": ("PDH", "PDL"), "W": ("PWH", "PWL"), "M": ("PMH", "PML")}
+
+# Structured dtype returned by build_key_levels_array — one row per level.
+KEY_LEVEL_DTYPE = np.dtype(
+    [
+        ("level_type", "U16"),
+        ("type", "U4"),
+        ("price", "f8"),
+        ("level_time", "datetime64[us]"),
+        ("period_start", "datetime64[us]"),
+        ("active_from", "datetime64[us]"),
+    ]
+)
+
+_EPOCH = datetime(1970, 1, 1)
+_US_PER_MINUTE = 60 * 1_000_000
+_US_PER_DAY = 1440 * _US_PER_MINUTE
+
+
+class _Period(NamedTuple):
+    """One aggregation: a calendar period or a session window."""
+
+    high_type: str
+    low_type: str
+    kind: str  # "D", "W", "M" or "S" (session)
+    start_us: int = 0  # session window, offset from midnight UTC
+    length_us: int = 0
+
+
+class _Forming(NamedTuple):
+    """Extremes of a period that has not closed yet (epoch microseconds)."""
+
+    start: int
+    end: int
+    high: float
+    high_time: int
+    low: float
+    low_time: int
+
+
+def _periods(
+    sessions: Mapping[str, tuple[time, time]] | None, periods: Iterable[str]
+) -> list[_Period]:
+    if sessions is None:
+        sessions = {
+            name: (window.start_utc, window.end_utc)
+            for name, window in get_config_registry().sessions.sessions.items()
+        }
+    specs = []
+    for name, (start, end) in sessions.items():
+        start_us = (start.hour * 60 + start.minute) * _US_PER_MINUTE
+        end_us = (end.hour * 60 + end.minute) * _US_PER_MINUTE
+        length_us = (end_us - start_us) % _US_PER_DAY or _US_PER_DAY
+        specs.append(_Period(f"{name}_HIGH", f"{name}_LOW", "S", start_us, length_us))
+    for period in periods:
+        if period not in PERIOD_LEVELS:
+            raise ValueError(f"Unsupported key-level period {period!r}. Expected D, W or M.")
+        specs.append(_Period(*PERIOD_LEVELS[period], period))
+    return specs
+
+
+def _bounds(
+    t_us: np.ndarray, period: _Period, day_open_us: int
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Period ``(start, end, inside)`` for every candle open time (epoch us).
+
+    ``inside`` is False for candles outside a session window; calendar
+    periods contain every candle.
+    """
+    if period.kind == "S":
+        # The window that could contain t started at most one day earlier.
+        since = (t_us - period.start_us) % _US_PER_DAY
+        start = t_us - since
+        return start, start + period.length_us, since < period.length_us
+    inside = np.ones(np.shape(t_us), dtype=bool)
+    if period.kind in ("D", "W"):
+        start = resampler._bucket_label_us(t_us, period.kind, day_open_us)
+        days = 1 if period.kind == "D" else 5
+        return start, start + days * _US_PER_DAY, inside
+    day = resampler._bucket_label_us(t_us, "D", day_open_us) - day_open_us
+    month = np.asarray(day).astype("datetime64[us]").astype("datetime64[M]")
+    start, end = (
+        (m.astype("datetime64[us]").astype(np.int64) + day_open_us) for m in (month, month + 1)
+    )
+    return start, end, inside
+
+
+def _groups(
+    t_us: np.ndarray, high: np.ndarray, low: np.ndarray, period: _Period, day_open_us: int
+) -> tuple[np.ndarray, ...]:
+    """Per-period ``(start, end, high, high_time, low, low_time)`` columns."""
+    start, end, inside = _bounds(t_us, period, day_open_us)
+    t_us, start, end = t_us[inside], start[inside], end[inside]
+    high, low = high[inside], low[inside]
+    n = len(t_us)
+    if n == 0:
+        empty_i, empty_f = np.empty(0, np.int64), np.empty(0, np.float64)
+        return empty_i, empty_i, empty_f, empty_i, empty_f, empty_i
+    first = np.flatnonzero(np.concatenate(([True], start[1:] != start[:-1])))
+    lengths = np.diff(np.append(first, n))
+    group_high = np.maximum.reduceat(high, first)
+    group_low = np.minimum.reduceat(low, first)
+    group = np.repeat(np.arange(len(first)), lengths)
+    # First candle reaching each group's extreme.
+    _, at_high = np.unique(group[high == group_high[group]], return_index=True)
+    _, at_low = np.unique(group[low == group_low[group]], return_index=True)
+    high_time = t_us[np.flatnonzero(high == group_high[group])[at_high]]
+    low_time = t_us[np.flatnonzero(low == group_low[group])[at_low]]
+    return start[first], end[first], group_high, high_time, group_low, low_time
+
+
+def _rows(period: _Period, columns: Sequence[np.ndarray]) -> np.ndarray:
+    start, end, high, high_time, low, low_time = columns
+    n = len(start)
+    rows = np.empty(2 * n, dtype=KEY_LEVEL_DTYPE)
+    rows["level_type"] = np.repeat([period.high_type, period.low_type], n)
+    rows["type"] = np.repeat([SwingType.HIGH.value, SwingType.LOW.value], n)
+    rows["price"] = np.concatenate([high, low])
+    rows["level_time"] = np.concatenate([high_time, low_time]).astype("datetime64[us]")
+    rows["period_start"] = np.tile(start, 2).astype("datetime64[us]")
+    rows["active_from"] = np.tile(end, 2).astype("datetime64[us]")
+    return rows
+
+
+def _completed(end: np.ndarray, as_of: int) -> np.ndarray:
+    """Groups closed by ``as_of``; every group but the last was closed by its successor."""
+    done = end <= as_of
+    done[:-1] = True
+    return done
+
+
+def _sort(rows: np.ndarray) -> np.ndarray:
+    return rows[np.argsort(rows["active_from"], kind="stable")]
+
+
+def _epoch_us(t: datetime) -> int:
+    return resampler._to_us(t.replace(tzinfo=None) - _EPOCH)
+
+
+def _bar_us(timeframe: str) -> int:
+    return resampler._to_us(resampler.timeframe_duration(timeframe))
+
+
+def _day_open_us(day_open: timedelta | None) -> int:
+    return resampler._to_us(resampler.trading_day_open() if day_open is None else day_open)
+
+
+def build_key_levels_array(
+    open_time: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    timeframe: str,
+    *,
+    sessions: Mapping[str, tuple[time, time]] | None = None,
+    periods: Iterable[str] = DEFAULT_PERIODS,
+    day_open: timedelta | None = None,
+) -> np.ndarray:
+    """Compute every completed key level of a candle history.
+
+    Args:
+        open_time: Candle open times (``datetime64``), ascending.
+        high: Candle highs, aligned with ``open_time``.
+        low: Candle lows, aligned with ``open_time``.
+        timeframe: Candle timeframe. Must divide the session windows for
+            session levels to be exact (5M, 15M or 1H for the default ones).
+        sessions: Session name -> (start, end) UTC window. Defaults to
+            config/sessions.json.
+        periods: Calendar periods to include ("D", "W", "M").
+        day_open: Trading-day open for D/W/M periods. Defaults to
+            ``resampler.trading_day_open()``.
+
+    Returns:
+        ``KEY_LEVEL_DTYPE`` array of the levels whose period closed by the
+        last candle's close, sorted by ``active_from``.
+
+    Raises:
+        ValueError: If a period is not D, W or M, or the timeframe is unknown.
+    """
+    t_us = np.asarray(open_time, dtype="datetime64[us]").astype(np.int64)
+    high = np.asarray(high, dtype=np.float64)
+    low = np.asarray(low, dtype=np.float64)
+    specs = _periods(sessions, periods)
+    if len(t_us) == 0:
+        return np.empty(0, dtype=KEY_LEVEL_DTYPE)
+    as_of = int(t_us[-1]) + _bar_us(timeframe)
+    day_open_us = _day_open_us(day_open)
+    parts = []
+    for spec in specs:
+        columns = _groups(t_us, high, low, spec, day_open_us)
+        done = _completed(columns[1], as_of)
+        parts.append(_rows(spec, [c[done] for c in columns]))
+    return _sort(np.concatenate(parts)) if parts else np.empty(0, dtype=KEY_LEVEL_DTYPE)
+
+
+def build_key_levels(
+    series: CandleSeries,
+    *,
+    sessions: Mapping[str, tuple[time, time]] | None = None,
+    periods: Iterable[str] = DEFAULT_PERIODS,
+    day_open: timedelta | None = None,
+) -> list[KeyLevel]:
+    """``build_key_levels_array`` over a series, as ``KeyLevel`` models.
+
+    Args:
+        series: Candle history for one pair.
+        sessions: As for ``build_key_levels_array``.
+        periods: As for ``build_key_levels_array``.
+        day_open: As for ``build_key_levels_array``.
+
+    Returns:
+        One KeyLevel per row, sorted by ``active_from``.
+    """
+    rows = build_key_levels_array(
+        series.open_time,
+        series.high,
+        series.low,
+        series.timeframe,
+        sessions=sessions,
+        periods=periods,
+        day_open=day_open,
+    )
+    return _to_key_levels(series.pair, rows)
+
+
+def _to_key_levels(pair: str, rows: np.ndarray) -> list[KeyLevel]:
+    kinds = {SwingType.HIGH.value: SwingType.HIGH, SwingType.LOW.value: SwingType.LOW}
+    return [
+        KeyLevel(pair=pair, level_type=level_type, type=kinds[kind], price=price, active_from=at)
+        for level_type, kind, price, at in zip(
+            rows["level_type"].tolist(),
+            rows["type"].tolist(),
+            rows["price"].tolist(),
+            rows["active_from"].tolist(),
+            strict=True,
+        )
+    ]
+
+
+class _LevelColumn:
+    """Completed levels of one (pair, level_type), ascending by active_from."""
+
+    __slots__ = ("active_from", "level_time", "period_start", "price")
+
+    def __init__(self) -> None:
+        self.active_from: list[int] = []
+        self.price: list[float] = []
+        self.level_time: list[int] = []
+        self.period_start: list[int] = []
+
+    def append(self, active_from: int, price: float, level_time: int, period_start: int) -> None:
+        self.active_from.append(active_from)
+        self.price.append(price)
+        self.level_time.append(level_time)
+        self.period_start.append(period_start)
+
+    def extend(
+        self,
+        active_from: np.ndarray,
+        price: np.ndarray,
+        level_time: np.ndarray,
+        period_start: np.ndarray,
+    ) -> None:
+        self.active_from.extend(active_from.tolist())
+        self.price.extend(price.tolist())
+        self.level_time.extend(level_time.tolist())
+        self.period_start.extend(period_start.tolist())
+
+
+class KeyLevelCalendar:
+    """Key levels per pair, indexed by time, kept current from a live feed.
+
+    Load history once with ``load``; then feed closed candles to ``update``.
+    Each candle folds into its forming session, day, week and month only,
+    and a level is stored when its period closes. ``levels`` answers "which
+    levels apply at time t" with one binary search per level type.
+
+    Example:
+        calendar = KeyLevelCalendar()
+        calendar.load(history_5m)
+        for candle in feed_5m:
+            calendar.update(candle)
+            levels = calendar.levels(candle.pair, candle.open_time)
+    """
+
+    def __init__(
+        self,
+        sessions: Mapping[str, tuple[time, time]] | None = None,
+        *,
+        periods: Iterable[str] = DEFAULT_PERIODS,
+        day_open: timedelta | None = None,
+    ) -> None:
+        """Create an empty calendar.
+
+        Args:
+            sessions: Session name -> (start, end) UTC window. Defaults to
+                config/sessions.json.
+            periods: Calendar periods to maintain ("D", "W", "M").
+            day_open: Trading-day open. Defaults to ``resampler.trading_day_open()``.
+
+        Raises:
+            ValueError: If a period is not D, W or M.
+        """
+        self._specs = _periods(sessions, periods)
+        self._types = {
+            name: kind
+            for spec in self._specs
+            for name, kind in ((spec.high_type, SwingType.HIGH), (spec.low_type, SwingType.LOW))
+        }
+        self._day_open_us = _day_open_us(day_open)
+        self._columns: dict[tuple[str, str], _LevelColumn] = {}
+        self._forming: dict[tuple[str, int], _Forming] = {}
+        self._last_us: dict[str, int] = {}
+
+    @property
+    def level_types(self) -> list[str]:
+        """Every level type maintained, in calendar order."""
+        return list(self._types)
+
+    def load(self, series: CandleSeries) -> None:
+        """Replace a pair's levels with those computed from its history.
+
+        Completed periods become levels; the periods still forming at the
+        end of the history are carried over, so ``update`` continues from
+        the next candle exactly as if every candle had been fed to it.
+
+        Args:
+            series: Candle history for one pair, ascending by open_time.
+        """
+        pair = series.pair
+        for key in [k for k in self._columns if k[0] == pair]:
+            del self._columns[key]
+        for key in [k for k in self._forming if k[0] == pair]:
+            del self._forming[key]
+        if len(series) == 0:
+            return
+        t_us = series.open_time.astype(np.int64)
+        as_of = int(t_us[-1]) + _bar_us(series.timeframe)
+        for index, spec in enumerate(self._specs):
+            start, end, high, high_time, low, low_time = _groups(
+                t_us, series.high, series.low, spec, self._day_open_us
+            )
+            done = _completed(end, as_of)
+            self._column(pair, spec.high_type).extend(
+                end[done], high[done], high_time[done], start[done]
+            )
+            self._column(pair, spec.low_type).extend(
+                end[done], low[done], low_time[done], start[done]
+            )
+            if len(done) and not done[-1]:
+                self._forming[pair, index] = _Forming(
+                    int(start[-1]),
+                    int(end[-1]),
+                    float(high[-1]),
+                    int(high_time[-1]),
+                    float(low[-1]),
+                    int(low_time[-1]),
+                )
+        self._last_us[pair] = int(t_us[-1])
+
+    def update(self, candle: Candle) -> list[KeyLevel]:
+        """Fold one closed candle into the periods it belongs to.
+
+        Args:
+            candle: The newly closed candle. Must be later than the previous
+                candle fed (or loaded) for the same pair.
+
+        Returns:
+            The levels whose period this candle closed, or the first candle
+            after that period, completed.
+
+        Raises:
+            ValueError: If the candle is not strictly after the previous one
+                for its pair.
+        """
+        pair = candle.pair
+        t_us = _epoch_us(candle.open_time)
+        last = self._last_us.get(pair)
+        if last is not None and t_us <= last:
+            raise ValueError(
+                "Candles must be fed ascending by open_time with no duplicates. "
+                f"{pair}: {candle.open_time} is not after the previous candle"
+            )
+        self._last_us[pair] = t_us
+        close_us = t_us + _bar_us(candle.timeframe)
+
+        completed: list[KeyLevel] = []
+        for index, spec in enumerate(self._specs):
+            start, end, inside = (int(v) for v in _bounds(np.int64(t_us), spec, self._day_open_us))
+            key = (pair, index)
+            forming = self._forming.get(key)
+            if forming is not None and (forming.start != start or t_us >= forming.end):
+                completed += self._complete(pair, spec, self._forming.pop(key))
+                forming = None
+            if not inside:
+                continue
+            if forming is None:
+                forming = _Forming(start, end, candle.high, t_us, candle.low, t_us)
+            else:
+                if candle.high > forming.high:
+                    forming = forming._replace(high=candle.high, high_time=t_us)
+                if candle.low < forming.low:
+                    forming = forming._replace(low=candle.low, low_time=t_us)
+            if close_us >= end:
+                completed += self._complete(pair, spec, forming)
+                self._forming.pop(key, None)
+            else:
+                self._forming[key] = forming
+        return completed
+
+    def advance(self, pair: str, now: datetime) -> list[KeyLevel]:
+        """Close the forming periods of a pair that ended by ``now``.
+
+        For when no candle arrives to close a period, e.g. NY at the end of
+        Friday. Candles fed later must still be after the last one fed.
+
+        Returns:
+            The levels completed.
+        """
+        now_us = _epoch_us(now)
+        completed: list[KeyLevel] = []
+        for index, spec in enumerate(self._specs):
+            forming = self._forming.get((pair, index))
+            if forming is not None and forming.end <= now_us:
+                completed += self._complete(pair, spec, self._forming.pop((pair, index)))
+        return completed
+
+    def levels(self, pair: str, at: datetime) -> list[KeyLevel]:
+        """The most recent level of each type active at ``at``.
+
+        Args:
+            pair: Currency pair.
+            at: UTC time; a level applies once ``active_from <= at``.
+
+        Returns:
+            One ``KeyLevel`` per level type that has an active level, in
+            ``level_types`` order.
+        """
+        at_us = _epoch_us(at)
+        result = []
+        for level_type, kind in self._types.items():
+            column = self._columns.get((pair, level_type))
+            if column is None:
+                continue
+            i = bisect.bisect_right(column.active_from, at_us) - 1
+            if i >= 0:
+                result.append(self._key_level(pair, level_type, kind, column, i))
+        return result
+
+    def table(
+        self, pair: str, start: datetime | None = None, end: datetime | None = None
+    ) -> np.ndarray:
+        """Stored levels of a pair as ``KEY_LEVEL_DTYPE`` rows.
+
+        Args:
+            pair: Currency pair.
+            start: Earliest ``active_from`` to include.
+            end: Exclusive upper bound on ``active_from``.
+
+        Returns:
+            Rows sorted by ``active_from``, level types in calendar order on
+            ties — the same layout as ``build_key_levels_array``.
+        """
+        lo = None if start is None else _epoch_us(start)
+        hi = None if end is None else _epoch_us(end)
+        parts = []
+        for spec in self._specs:
+            columns = [
+                self._columns.get((pair, t)) or _LevelColumn()
+                for t in (spec.high_type, spec.low_type)
+            ]
+            high, low = columns
+            i = 0 if lo is None else bisect.bisect_left(high.active_from, lo)
+            j = len(high.active_from) if hi is None else bisect.bisect_left(high.active_from, hi)
+            parts.append(
+                _rows(
+                    spec,
+                    [
+                        np.array(high.period_start[i:j], np.int64),
+                        np.array(high.active_from[i:j], np.int64),
+                        np.array(high.price[i:j], np.float64),
+                        np.array(high.level_time[i:j], np.int64),
+                        np.array(low.price[i:j], np.float64),
+                        np.array(low.level_time[i:j], np.int64),
+                    ],
+                )
+            )
+        return _sort(np.concatenate(parts)) if parts else np.empty(0, KEY_LEVEL_DTYPE)
+
+    def forming(self, pair: str) -> dict[str, float]:
+        """Extremes so far of every period still forming, by level type."""
+        result = {}
+        for index, spec in enumerate(self._specs):
+            forming = self._forming.get((pair, index))
+            if forming is not None:
+                result[spec.high_type] = forming.high
+                result[spec.low_type] = forming.low
+        return result
+
+    def _column(self, pair: str, level_type: str) -> _LevelColumn:
+        column = self._columns.get((pair, level_type))
+        if column is None:
+            column = self._columns[pair, level_type] = _LevelColumn()
+        return column
+
+    def _complete(self, pair: str, spec: _Period, forming: _Forming) -> list[KeyLevel]:
+        self._column(pair, spec.high_type).append(
+            forming.end, forming.high, forming.high_time, forming.start
+        )
+        self._column(pair, spec.low_type).append(
+            forming.end, forming.low, forming.low_time, forming.start
+        )
+        active_from = _EPOCH + timedelta(microseconds=forming.end)
+        return [
+            KeyLevel(
+                pair=pair,
+                level_type=spec.high_type,
+                type=SwingType.HIGH,
+                price=forming.high,
+                active_from=active_from,
+            ),
+            KeyLevel(
+                pair=pair,
+                level_type=spec.low_type,
+                type=SwingType.LOW,
+                price=forming.low,
+                active_from=active_from,
+            ),
+        ]
+
+    @staticmethod
+    def _key_level(
+        pair: str, level_type: str, kind: SwingType, column: _LevelColumn, i: int
+    ) -> KeyLevel:
+        return KeyLevel(
+            pair=pair,
+            level_type=level_type,
+            type=kind,
+            price=column.price[i],
+            active_from=_EPOCH + timedelta(microseconds=column.active_from[i]),
+        )
@@ -0,0 +1,237 @@
+"""Key-level sweep and first-touch detection.
+
+Ports the WF3 Session Tracker "Check Sweeps" logic (and the WF2 swept /
+closed-through comparisons) from per-candle JavaScript loops to array
+operations over many levels and many candles at once:
+
+- First touch: the first candle, at or after the level becomes active, whose
+  wick comes within ``first_touch_tolerance_pips`` of the level.
+- Sweep: the first such candle whose wick goes beyond the level by more than
+  ``sweep_tolerance_pips`` (HIGH: high > price + tol, LOW: low < price - tol).
+  The sweeping candle's close classifies it: closing beyond the level is
+  CLOSED_THROUGH, closing back inside is SWEPT.
+
+Instead of testing every level against every candle, levels are grouped by
+the candle index at which they activate. For each group the running maximum
+of highs (and running minimum of lows) from that index is non-decreasing
+(non-increasing), so it is a sorted index: the first candle to reach a price
+is one ``np.searchsorted`` away. Checking m levels with g distinct activation
+times against n candles costs O(g·n + m·log n) rather than O(m·n).
+"""
+
+from collections.abc import Sequence
+
+import numpy as np
+
+from src.domain.structure.models import CandleSeries, KeyLevel, LevelStatus, SwingType
+from src.domain.structure.swing_detection import get_pip_value
+from src.infrastructure.config import LevelTolerances, get_config_registry
+
+# Structured dtype returned by check_levels_array — one row per input level.
+# Indices are -1 and times NaT when the event never happened.
+LEVEL_CHECK_DTYPE = np.dtype(
+    [
+        ("status", "U14"),
+        ("first_touch_index", "i8"),
+        ("first_touch_time", "datetime64[us]"),
+        ("sweep_index", "i8"),
+        ("sweep_time", "datetime64[us]"),
+        ("sweep_price", "f8"),
+        ("sweep_depth_pips", "f8"),
+    ]
+)
+
+
+def check_levels_array(
+    open_time: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    level_price: np.ndarray,
+    level_is_high: np.ndarray,
+    active_from: np.ndarray,
+    *,
+    pip_value: float,
+    sweep_tolerance_pips: float,
+    first_touch_tolerance_pips: float,
+) -> np.ndarray:
+    """Find the first touch and first sweep of every level.
+
+    Args:
+        open_time: Candle open times (``datetime64``), strictly ascending.
+        high: Candle highs, aligned with ``open_time``.
+        low: Candle lows, aligned with ``open_time``.
+        close: Candle closes, aligned with ``open_time``.
+        level_price: Level prices, one per level.
+        level_is_high: True for HIGH levels (PDH, session high, ...), False
+            for LOW levels.
+        active_from: Per-level ``datetime64``; only candles opening at or
+            after it can touch or sweep the level.
+        pip_value: Pip size for the pair.
+        sweep_tolerance_pips: How far beyond the level a wick must reach to
+            count as a sweep.
+        first_touch_tolerance_pips: How close a wick must come to count as a
+            touch.
+
+    Returns:
+        Structured array with dtype ``LEVEL_CHECK_DTYPE``, aligned with the
+        input levels. ``status`` is ACTIVE when the level was never swept.
+
+    Raises:
+        ValueError: If candle or level columns differ in length.
+    """
+    open_time = np.asarray(open_time, dtype="datetime64[us]")
+    high = np.asarray(high, dtype=np.float64)
+    low = np.asarray(low, dtype=np.float64)
+    close = np.asarray(close, dtype=np.float64)
+    price = np.asarray(level_price, dtype=np.float64)
+    is_high = np.asarray(level_is_high, dtype=bool)
+    active_from = np.asarray(active_from, dtype="datetime64[us]")
+
+    n, m = len(open_time), len(price)
+    if not (len(high) == len(low) == len(close) == n):
+        raise ValueError(
+            "open_time, high, low and close must have the same length, got "
+            f"{n}, {len(high)}, {len(low)}, {len(close)}"
+        )
+    if not (len(is_high) == len(active_from) == m):
+        raise ValueError(
+            "level_price, level_is_high and active_from must have the same length, got "
+            f"{m}, {len(is_high)}, {len(active_from)}"
+        )
+
+    touch_tol = first_touch_tolerance_pips * pip_value
+    sweep_tol = sweep_tolerance_pips * pip_value
+    touch = np.full(m, -1, dtype=np.int64)
+    sweep = np.full(m, -1, dtype=np.int64)
+
+    start = np.searchsorted(open_time, active_from, side="left")
+    order = np.argsort(start, kind="stable")
+    group_starts, group_bounds = np.unique(start[order], return_index=True)
+    groups = np.split(order, group_bounds[1:]) if m else []
+    for s, members in zip(group_starts.tolist(), groups, strict=True):
+        if s >= n:
+            continue
+        # Running extremes from the activation candle: sorted, so searchable.
+        run_max = np.maximum.accumulate(high[s:])
+        neg_run_min = -np.minimum.accumulate(low[s:])
+
+        length = n - s
+        hi = members[is_high[members]]
+        lo = members[~is_high[members]]
+        _store_first(touch, hi, s, length, np.searchsorted(run_max, price[hi] - touch_tol))
+        _store_first(sweep, hi, s, length, np.searchsorted(run_max, price[hi] + sweep_tol, "right"))
+        _store_first(touch, lo, s, length, np.searchsorted(neg_run_min, -(price[lo] + touch_tol)))
+        _store_first(
+            sweep, lo, s, length, np.searchsorted(neg_run_min, -(price[lo] - sweep_tol), "right")
+        )
+
+    result = np.empty(m, dtype=LEVEL_CHECK_DTYPE)
+    result["first_touch_index"] = touch
+    result["sweep_index"] = sweep
+    result["first_touch_time"] = np.datetime64("NaT")
+    result["sweep_time"] = np.datetime64("NaT")
+    result["status"] = LevelStatus.ACTIVE.value
+    result["sweep_price"] = np.nan
+    result["sweep_depth_pips"] = np.nan
+
+    touched = np.flatnonzero(touch >= 0)
+    result["first_touch_time"][touched] = open_time[touch[touched]]
+
+    swept = np.flatnonzero(sweep >= 0)
+    at = sweep[swept]
+    level, up = price[swept], is_high[swept]
+    extreme = np.where(up, high[at], low[at])
+    closed_through = np.where(up, close[at] > level, close[at] < level)
+    result["sweep_time"][swept] = open_time[at]
+    result["status"][swept] = np.where(
+        closed_through, LevelStatus.CLOSED_THROUGH.value, LevelStatus.SWEPT.value
+    )
+    result["sweep_price"][swept] = extreme
+    result["sweep_depth_pips"][swept] = np.abs(extreme - level) / pip_value
+    return result
+
+
+def check_levels(
+    candles: CandleSeries,
+    levels: Sequence[KeyLevel],
+    tolerances: LevelTolerances | None = None,
+) -> np.ndarray:
+    """Check key levels for first touches and sweeps against a candle series.
+
+    Args:
+        candles: Candles for the levels' pair, ascending by open_time
+            (typically one day of 5M bars).
+        levels: Levels to check. All must belong to ``candles.pair``.
+        tolerances: Touch and sweep tolerances. Defaults to
+            ``level_tolerances`` in tolerances.json.
+
+    Returns:
+        Structured array with dtype ``LEVEL_CHECK_DTYPE``, aligned with ``levels``.
+
+    Raises:
+        ValueError: If a level belongs to a different pair than the candles.
+        ValueError: If the pair has no configured pip value.
+    """
+    for level in levels:
+        if level.pair != candles.pair:
+            raise ValueError(
+                f"Level {level.level_type} is for {level.pair}, candles are {candles.pair}"
+            )
+    tolerances = tolerances or get_config_registry().tolerances.level_tolerances
+    return check_levels_array(
+        candles.open_time,
+        candles.high,
+        candles.low,
+        candles.close,
+        np.fromiter((lv.price for lv in levels), dtype=np.float64, count=len(levels)),
+        np.fromiter((lv.type is SwingType.HIGH for lv in levels), dtype=bool, count=len(levels)),
+        np.array([lv.active_from for lv in levels], dtype="datetime64[us]"),
+        pip_value=get_pip_value(candles.pair),
+        sweep_tolerance_pips=tolerances.sweep_tolerance_pips,
+        first_touch_tolerance_pips=tolerances.first_touch_tolerance_pips,
+    )
+
+
+def swing_point_mask(
+    level_price: np.ndarray,
+    level_is_high: np.ndarray,
+    swings: np.ndarray,
+    *,
+    pip_value: float,
+    tolerance_pips: float,
+) -> np.ndarray:
+    """Flag levels that coincide with a swing of the same type.
+
+    Swing prices are sorted once per type, so each level is a binary search.
+
+    Args:
+        level_price: Level prices.
+        level_is_high: True for HIGH levels.
+        swings: Swings as returned by ``detect_swings_array`` (``SWING_DTYPE``).
+        pip_value: Pip size for the pair.
+        tolerance_pips: Maximum distance in pips (``swing_point_tolerance_pips``).
+
+    Returns:
+        Boolean array aligned with the levels.
+    """
+    price = np.asarray(level_price, dtype=np.float64)
+    is_high = np.asarray(level_is_high, dtype=bool)
+    tol = tolerance_pips * pip_value
+    mask = np.zeros(len(price), dtype=bool)
+    for swing_type, selected in ((SwingType.HIGH, is_high), (SwingType.LOW, ~is_high)):
+        swing_prices = np.sort(swings["price"][swings["type"] == swing_type.value])
+        if len(swing_prices) == 0:
+            continue
+        pos = np.searchsorted(swing_prices, price[selected] - tol, side="left")
+        nearest = swing_prices[np.minimum(pos, len(swing_prices) - 1)]
+        mask[selected] = (pos < len(swing_prices)) & (nearest <= price[selected] + tol)
+    return mask
+
+
+def _store_first(
+    out: np.ndarray, members: np.ndarray, start: int, length: int, pos: np.ndarray
+) -> None:
+    """Write ``start + pos`` for members whose search found a candle (pos < length)."""
+    found = pos < length
+    out[members[found]] = start + pos[found]
@@ -1,13 +1,103 @@
 """Domain models for the structure bounded context.
 
 Defines the core value objects used by swing detection, level tracking,
-and CISD pattern logic.
+and CISD pattern logic, plus ``CandleSeries`` — the columnar container used on
+hot paths instead of ``list[Candle]``.
+
+Validation policy: constructing ``Candle``/``Swing`` directly validates every
+object, and that stays the rule at system boundaries (API payloads, files,
+third-party feeds). Rows of an already-validated ``CandleSeries`` are
+materialised through ``Candle.trusted``, which skips per-object validation.
+``Swing`` has no such shortcut: it is small enough that validating costs
+about as much as bypassing pydantic. ``SwingRecord`` is a lighter,
+plain-tuple alternative to ``Swing`` for research loops.
+
+Time convention: every time is naive UTC. Timezone-aware inputs are converted
+to UTC and their tzinfo dropped (``utc_naive``) when a model is validated or a
+``CandleSeries`` column is built, so a candle reads back the same whichever
+path it took. ``Candle.trusted`` expects naive UTC already.
 """
 
-from datetime import datetime
+from collections.abc import Iterable, Iterator, Sequence
+from datetime import UTC, datetime
 from enum import StrEnum
+from typing import Annotated, Any, NamedTuple, TypeVar, overload
+
+import numpy as np
+from pydantic import AfterValidator, BaseModel, model_validator
+
+# Rows converted to Python objects per step when iterating a CandleSeries.
+_ITER_CHUNK = 4096
+
+_M = TypeVar("_M", bound=BaseModel)
+
+# One fields-set per model, shared by every unchecked instance (building a set
+# per instance costs as much as the rest of the construction). Sharing is safe:
+# it always holds every field, so pydantic's in-place updates are no-ops, and
+# model_copy copies it before updating.
+_ALL_FIELDS: dict[type[BaseModel], set[str]] = {}
+
+
+# The instance slots pydantic's BaseModel defines; _construct_unchecked fills
+# exactly these. test_trusted_models pins the layout so a pydantic upgrade
+# that changes it fails the suite instead of producing half-built models.
+PYDANTIC_INSTANCE_SLOTS = (
+    "__dict__",
+    "__pydantic_fields_set__",
+    "__pydantic_extra__",
+    "__pydantic_private__",
+)
+
+_new = object.__new__
+_setattr = object.__setattr__
+
+
+def _construct_unchecked(cls: type[_M], values: dict[str, Any]) -> _M:
+    """Instantiate a model from field values that are known to be valid.
+
+    Equivalent to ``cls(**values)`` for correctly typed values but skips
+    validation entirely. Unlike ``model_construct`` (which is slower than
+    validating for models this small) it applies no defaults, so ``values``
+    must hold every field. Only for models without defaults or private
+    attributes.
+    """
+    fields_set = _ALL_FIELDS.get(cls)
+    if fields_set is None:
+        fields_set = _ALL_FIELDS[cls] = set(cls.model_fields)
+    obj = _new(cls)
+    _setattr(obj, "__dict__", values)
+    _setattr(obj, "__pydantic_fields_set__", fields_set)
+    _setattr(obj, "__pydantic_extra__", None)
+    _setattr(obj, "__pydantic_private__", None)
+    return obj
+
+
+def utc_naive(value: datetime) -> datetime:
+    """The same instant as naive UTC: aware times are converted, naive ones kept."""
+    if value.tzinfo is None:
+        return value
+    return value.astimezone(UTC).replace(tzinfo=None)
+
 
-from pydantic import BaseModel, model_validator
+# A model field holding a naive-UTC time (see the module's time convention).
+UtcDatetime = Annotated[datetime, AfterValidator(utc_naive)]
+
+
+def _open_time_column(values: Any) -> np.ndarray:
+    """``datetime64[us]`` column of naive-UTC times.
+
+    A datetime64 array is used as is (no copy when already in microseconds).
+    Anything else is converted element-wise, so timezone-aware datetimes are
+    moved to UTC first instead of having their offset silently dropped.
+    """
+    if isinstance(values, np.ndarray) and values.dtype.kind == "M":
+        return values.astype("datetime64[us]", copy=False)
+    if isinstance(values, np.ndarray) and values.dtype != object:
+        return np.asarray(values, dtype="datetime64[us]")
+    return np.array(
+        [utc_naive(v) if isinstance(v, datetime) else v for v in values],
+        dtype="datetime64[us]",
+    )
 
 
 class SwingType(StrEnum):
@@ -21,6 +111,41 @@ class SwingType(StrEnum):
     LOW = "LOW"
 
 
+class SwingStrength(StrEnum):
+    """How a swing has held up against the swings of its type that followed.
+
+    A swing HIGH is broken by a later swing HIGH priced strictly above it (a
+    swing LOW by a later, strictly lower swing LOW). STRONG swings have not
+    been broken. A WEAK swing was broken by the very next swing of its type;
+    an INTERNAL swing survived that one and was broken further on, so it sits
+    inside the range of the swing that broke it.
+    """
+
+    STRONG = "STRONG"
+    INTERNAL = "INTERNAL"
+    WEAK = "WEAK"
+
+
+class Direction(StrEnum):
+    """Directional bias of a structure pattern (FVG, CISD, sweep reaction)."""
+
+    BULLISH = "BULLISH"
+    BEARISH = "BEARISH"
+
+
+class LevelStatus(StrEnum):
+    """Lifecycle of a key level, mirroring the key_levels ``status`` column.
+
+    ACTIVE levels have not been traded through. A level is SWEPT when a wick
+    exceeds it but the candle closes back inside, and CLOSED_THROUGH when the
+    candle closes beyond it.
+    """
+
+    ACTIVE = "ACTIVE"
+    SWEPT = "SWEPT"
+    CLOSED_THROUGH = "CLOSED_THROUGH"
+
+
 class Candle(BaseModel, frozen=True):
     """An immutable OHLC candle for a given pair and timeframe.
 
@@ -39,7 +164,7 @@ class Candle(BaseModel, frozen=True):
 
     pair: str
     timeframe: str
-    open_time: datetime
+    open_time: UtcDatetime
     open: float
     high: float
     low: float
@@ -60,6 +185,38 @@ class Candle(BaseModel, frozen=True):
             raise ValueError(f"low ({self.low}) must be <= close ({self.close})")
         return self
 
+    @classmethod
+    def trusted(
+        cls,
+        *,
+        pair: str,
+        timeframe: str,
+        open_time: datetime,
+        open: float,
+        high: float,
+        low: float,
+        close: float,
+    ) -> "Candle":
+        """Build a Candle without validation, from already-validated values.
+
+        For rows of a validated ``CandleSeries`` or bars aggregated from
+        validated candles. Values must already have the field types (``str``,
+        ``datetime``, ``float``) and consistent OHLC. Use ``Candle(...)`` for
+        anything arriving from outside the system.
+        """
+        return _construct_unchecked(
+            cls,
+            {
+                "pair": pair,
+                "timeframe": timeframe,
+                "open_time": open_time,
+                "open": open,
+                "high": high,
+                "low": low,
+                "close": close,
+            },
+        )
+
 
 class Swing(BaseModel, frozen=True):
     """An immutable swing point detected in market structure.
@@ -73,6 +230,33 @@ class Swing(BaseModel, frozen=True):
         open_time: UTC open time of the C2 candle that formed the swing.
         type: Swing direction — HIGH or LOW.
         price: The swing price — C2.high for HIGHs, C2.low for LOWs.
+        swing_strength: STRONG, INTERNAL or WEAK once classified by
+            ``swing_strength.classify_swing_strength``; None until then.
+    """
+
+    pair: str
+    timeframe: str
+    open_time: UtcDatetime
+    type: SwingType
+    price: float
+    swing_strength: SwingStrength | None = None
+
+
+class SwingRecord(NamedTuple):
+    """A lightweight, immutable swing for high-volume research paths.
+
+    Carries the same fields as ``Swing`` (so code reading ``.open_time`` or
+    ``.price`` accepts either) but is a plain tuple: no per-instance dict,
+    no validation, several times cheaper to build. Convert with
+    ``to_swing`` before handing a swing to a system boundary.
+
+    Attributes:
+        pair: Currency pair in uppercase format with no slash (e.g. "EURUSD").
+        timeframe: Timeframe in uppercase with unit (e.g. "1H").
+        open_time: Naive-UTC open time of the C2 candle that formed the
+            swing. Not converted here: callers must pass naive UTC.
+        type: Swing direction — HIGH or LOW.
+        price: The swing price — C2.high for HIGHs, C2.low for LOWs.
     """
 
     pair: str
@@ -80,3 +264,347 @@ class Swing(BaseModel, frozen=True):
     open_time: datetime
     type: SwingType
     price: float
+
+    def to_swing(self) -> Swing:
+        """The equivalent (validated) Swing model."""
+        return Swing(
+            pair=self.pair,
+            timeframe=self.timeframe,
+            open_time=self.open_time,
+            type=self.type,
+            price=self.price,
+        )
+
+
+class FairValueGap(BaseModel, frozen=True):
+    """A price imbalance left by a C1-C2-C3 triplet.
+
+    A BULLISH gap exists when C3's low is above C1's high; a BEARISH gap when
+    C3's high is below C1's low. The gap spans ``bottom``..``top``.
+
+    Attributes:
+        pair: Currency pair in uppercase format with no slash (e.g. "EURUSD").
+        timeframe: Timeframe in uppercase with unit (e.g. "1H").
+        open_time: UTC open time of the C2 (displacement) candle.
+        direction: BULLISH or BEARISH.
+        top: Upper edge of the gap (C3.low for BULLISH, C1.low for BEARISH).
+        bottom: Lower edge of the gap (C1.high for BULLISH, C3.high for BEARISH).
+    """
+
+    pair: str
+    timeframe: str
+    open_time: UtcDatetime
+    direction: Direction
+    top: float
+    bottom: float
+
+
+class CISDEvent(BaseModel, frozen=True):
+    """A Change in State of Delivery: a candle closing back through a series.
+
+    A series is a run of consecutive same-direction candles (C1 is its last
+    candle). A BULLISH CISD is a candle (C2) that closes above the open of a
+    down series; a BEARISH CISD closes below the open of an up series.
+
+    Attributes:
+        pair: Currency pair in uppercase format with no slash (e.g. "EURUSD").
+        timeframe: Timeframe in uppercase with unit (e.g. "5M").
+        open_time: UTC open time of the C2 candle.
+        direction: BULLISH (breaks a down series) or BEARISH.
+        series_length: Candles in the broken series.
+        series_start: UTC open time of the series' first candle.
+        series_open: Open of the series' first candle — the level C2 closed
+            through.
+    """
+
+    pair: str
+    timeframe: str
+    open_time: UtcDatetime
+    direction: Direction
+    series_length: int
+    series_start: UtcDatetime
+    series_open: float
+
+
+class KeyLevel(BaseModel, frozen=True):
+    """A significant price level (session H/L, PDH/PDL, PWH/PWL, ...).
+
+    Attributes:
+        pair: Currency pair in uppercase format with no slash (e.g. "EURUSD").
+        level_type: Level name as stored in key_levels (e.g. "PDH", "ASIA_LOW").
+        type: HIGH levels are swept from below, LOW levels from above.
+        price: The level price.
+        active_from: UTC time from which candles can touch or sweep the level
+            (e.g. the close of the session that formed it).
+    """
+
+    pair: str
+    level_type: str
+    type: SwingType
+    price: float
+    active_from: UtcDatetime
+
+
+class CandleSeries:
+    """A compact, array-backed run of candles for one pair and timeframe.
+
+    Stores ``pair`` and ``timeframe`` once and keeps open_time/OHLC as
+    contiguous NumPy columns (``datetime64[us]`` and ``float64``), so a year of
+    5M bars costs a few MB instead of one pydantic model per bar. OHLC
+    consistency and strict ascending open_time are checked for the whole
+    series in one vectorised pass on construction.
+
+    Slicing returns a new series sharing the same buffers (no copy, no
+    re-validation). Indexing with an int or iterating builds ``Candle``
+    objects lazily, only for the rows actually asked for.
+
+    Attributes:
+        pair: Currency pair in uppercase format with no slash (e.g. "EURUSD").
+        timeframe: Timeframe in uppercase with unit (e.g. "5M").
+        open_time: UTC open times, ``datetime64[us]``, strictly ascending.
+        open: Opening prices.
+        high: Highest traded prices.
+        low: Lowest traded prices.
+        close: Closing prices.
+    """
+
+    __slots__ = ("close", "high", "low", "open", "open_time", "pair", "timeframe")
+
+    def __init__(
+        self,
+        pair: str,
+        timeframe: str,
+        open_time: np.ndarray,
+        open: np.ndarray,
+        high: np.ndarray,
+        low: np.ndarray,
+        close: np.ndarray,
+        *,
+        validate: bool = True,
+    ) -> None:
+        """Wrap existing columns without copying them when dtypes already match.
+
+        Args:
+            pair: Currency pair in uppercase format with no slash.
+            timeframe: Timeframe in uppercase with unit.
+            open_time: Open times convertible to ``datetime64[us]``.
+                Timezone-aware datetimes are converted to naive UTC.
+            open: Opening prices.
+            high: Highest traded prices.
+            low: Lowest traded prices.
+            close: Closing prices.
+            validate: Run ``validate()`` on construction. Only pass False for
+                columns that were already validated (e.g. a slice of a series).
+
+        Raises:
+            ValueError: If ``validate`` is True and the columns are inconsistent.
+        """
+        self.pair = pair
+        self.timeframe = timeframe
+        self.open_time = _open_time_column(open_time)
+        self.open = np.asarray(open, dtype=np.float64)
+        self.high = np.asarray(high, dtype=np.float64)
+        self.low = np.asarray(low, dtype=np.float64)
+        self.close = np.asarray(close, dtype=np.float64)
+        if validate:
+            self.validate()
+
+    @classmethod
+    def from_candles(cls, candles: Sequence[Candle]) -> "CandleSeries":
+        """Build a series from Candle models sharing one pair and timeframe.
+
+        Args:
+            candles: Candles sorted ascending by open_time. Must not be empty.
+
+        Returns:
+            A validated CandleSeries holding the same bars.
+
+        Raises:
+            ValueError: If ``candles`` is empty or mixes pairs or timeframes.
+            ValueError: If the candles are not strictly ascending by open_time.
+        """
+        if not candles:
+            raise ValueError("At least 1 candle required to build a CandleSeries")
+        pair, timeframe = candles[0].pair, candles[0].timeframe
+        for i, c in enumerate(candles):
+            if c.pair != pair or c.timeframe != timeframe:
+                raise ValueError(
+                    f"Mixed series at index {i}: {c.pair} {c.timeframe} != {pair} {timeframe}"
+                )
+
+        n = len(candles)
+        return cls(
+            pair,
+            timeframe,
+            _open_time_column([c.open_time for c in candles]),
+            np.fromiter((c.open for c in candles), dtype=np.float64, count=n),
+            np.fromiter((c.high for c in candles), dtype=np.float64, count=n),
+            np.fromiter((c.low for c in candles), dtype=np.float64, count=n),
+            np.fromiter((c.close for c in candles), dtype=np.float64, count=n),
+        )
+
+    @classmethod
+    def from_rows(
+        cls,
+        pair: str,
+        timeframe: str,
+        rows: Iterable[tuple[datetime | np.datetime64, float, float, float, float]],
+        *,
+        validate: bool = True,
+    ) -> "CandleSeries":
+        """Bulk-build a series from ``(open_time, open, high, low, close)`` rows.
+
+        The batch is validated once, vectorised, instead of row by row —
+        e.g. for database cursors or decoded JSON. Use ``.to_candles()`` on
+        the result when Candle objects are needed.
+
+        Args:
+            pair: Currency pair in uppercase format with no slash.
+            timeframe: Timeframe in uppercase with unit.
+            rows: Rows sorted ascending by open_time. May be empty.
+            validate: Validate the batch. Only pass False for rows from a
+                source that already guarantees OHLC consistency and ordering.
+
+        Returns:
+            A CandleSeries holding the rows.
+
+        Raises:
+            ValueError: If ``validate`` is True and a row is inconsistent.
+        """
+        rows = list(rows)
+        if not rows:
+            empty = np.empty(0, dtype=np.float64)
+            return cls(pair, timeframe, np.empty(0, "datetime64[us]"), empty, empty, empty, empty)
+        times, opens, highs, lows, closes = zip(*rows, strict=True)
+        return cls(
+            pair,
+            timeframe,
+            _open_time_column(times),
+            np.array(opens, dtype=np.float64),
+            np.array(highs, dtype=np.float64),
+            np.array(lows, dtype=np.float64),
+            np.array(closes, dtype=np.float64),
+            validate=validate,
+        )
+
+    def validate(self) -> None:
+        """Check column lengths, OHLC consistency and ordering in one pass.
+
+        Applies the same rules as ``Candle.validate_ohlc_consistency`` to every
+        row at once, plus strict ascending open_time (no duplicates).
+
+        Raises:
+            ValueError: Describing the first offending row.
+        """
+        n = len(self.open_time)
+        lengths = {len(col) for col in (self.open, self.high, self.low, self.close)}
+        if lengths != {n}:
+            raise ValueError(f"All columns must have length {n}, got lengths {sorted(lengths)}")
+
+        checks = (
+            (self.high < self.open, "high ({h}) must be >= open ({o})"),
+            (self.high < self.close, "high ({h}) must be >= close ({c})"),
+            (self.high < self.low, "high ({h}) must be >= low ({lo})"),
+            (self.low > self.open, "low ({lo}) must be <= open ({o})"),
+            (self.low > self.close, "low ({lo}) must be <= close ({c})"),
+        )
+        first_bad: tuple[int, str] | None = None
+        for mask, message in checks:
+            hits = np.flatnonzero(mask)
+            if len(hits) and (first_bad is None or hits[0] < first_bad[0]):
+                first_bad = (int(hits[0]), message)
+        if first_bad is not None:
+            i, message = first_bad
+            detail = message.format(o=self.open[i], h=self.high[i], lo=self.low[i], c=self.close[i])
+            raise ValueError(f"Invalid OHLC at index {i}: {detail}")
+
+        violations = np.flatnonzero(self.open_time[1:] <= self.open_time[:-1])
+        if len(violations):
+            i = int(violations[0]) + 1
+            raise ValueError(
+                "Candles must be sorted ascending by open_time with no duplicates. "
+                f"Violation at index {i}: {self.open_time[i]} <= {self.open_time[i - 1]}"
+            )
+
+    @property
+    def nbytes(self) -> int:
+        """Total bytes held by the column buffers."""
+        return sum(
+            col.nbytes for col in (self.open_time, self.open, self.high, self.low, self.close)
+        )
+
+    def __len__(self) -> int:
+        return len(self.open_time)
+
+    @overload
+    def __getitem__(self, index: int) -> Candle: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "CandleSeries": ...
+
+    def __getitem__(self, index: int | slice) -> "Candle | CandleSeries":
+        """Return one Candle for an int, or a zero-copy sub-series for a slice.
+
+        Rows were validated with the series, so Candles are built through
+        ``Candle.trusted``.
+
+        Raises:
+            ValueError: If the slice step is negative (the result would no
+                longer be ascending by open_time).
+        """
+        if isinstance(index, slice):
+            if index.step is not None and index.step < 1:
+                raise ValueError("CandleSeries slices must have a positive step")
+            return CandleSeries(
+                self.pair,
+                self.timeframe,
+                self.open_time[index],
+                self.open[index],
+                self.high[index],
+                self.low[index],
+                self.close[index],
+                validate=False,
+            )
+        return Candle.trusted(
+            pair=self.pair,
+            timeframe=self.timeframe,
+            open_time=self.open_time[index].item(),
+            open=float(self.open[index]),
+            high=float(self.high[index]),
+            low=float(self.low[index]),
+            close=float(self.close[index]),
+        )
+
+    def __iter__(self) -> Iterator[Candle]:
+        """Yield Candle objects lazily, converting the columns in small chunks.
+
+        Rows were validated with the series, so no per-Candle validation runs.
+        """
+        for start in range(0, len(self), _ITER_CHUNK):
+            stop = start + _ITER_CHUNK
+            columns = zip(
+                self.open_time[start:stop].tolist(),
+                self.open[start:stop].tolist(),
+                self.high[start:stop].tolist(),
+                self.low[start:stop].tolist(),
+                self.close[start:stop].tolist(),
+                strict=True,
+            )
+            for open_time, o, h, lo, c in columns:
+                yield Candle.trusted(
+                    pair=self.pair,
+                    timeframe=self.timeframe,
+                    open_time=open_time,
+                    open=o,
+                    high=h,
+                    low=lo,
+                    close=c,
+                )
+
+    def to_candles(self) -> list[Candle]:
+        """Materialise every row as a Candle (for system boundaries only)."""
+        return list(self)
+
+    def __repr__(self) -> str:
+        span = f"{self.open_time[0]} .. {self.open_time[-1]}" if len(self) else "empty"
+        return f"CandleSeries({self.pair} {self.timeframe}, {len(self)} candles, {span})"
@@ -0,0 +1,375 @@
+"""Bounded LRU/TTL cache in front of swing detection.
+
+The Strategy Engine, Alert Processor and Health Check all ask for swings
+over overlapping recent windows of the same series, every 5 minutes. This
+cache keeps one detected swing array per series identity — pair,
+timeframe, ``min_swing_pips`` and the open_time of the series' first
+candle — together with the range it covers (candle count and last
+open_time).
+
+A lookup is answered from the entry whenever the request's range relates
+to the covered one:
+
+- Same range: a hit.
+- A prefix of it: a hit, trimmed to the swings the shorter series can
+  confirm.
+- An extension of it (new candles appended): only the tail is detected.
+  The previously last candle had no C3 and is the only old candle whose
+  swing status can change, so detection restarts one candle before it and
+  the new swings are appended.
+- Anything else (a different first candle, or data that no longer lines
+  up): a miss and a full detection.
+
+Closed candles are treated as append-only. If stored candles are
+rewritten, call ``invalidate`` with the earliest changed open_time; entries
+whose range ends before it stay valid.
+
+An optional ``SwingCacheBackend`` shares entries between processes (e.g.
+uvicorn workers). ``FileCacheBackend`` does so through a directory on the
+local disk with atomic renames; any key/value store (Redis, a database
+table) can implement the same three methods.
+"""
+
+import hashlib
+import io
+import os
+import tempfile
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Callable
+from pathlib import Path
+from typing import NamedTuple
+
+import numpy as np
+from pydantic import BaseModel
+
+from src.domain.observability.metrics import StageLabels, instrument
+from src.domain.structure.models import CandleSeries
+from src.domain.structure.swing_detection import SWING_DTYPE, detect_swings_array
+
+CacheKey = tuple[str, str, float | None, int]
+
+
+class SwingCacheStats(BaseModel, frozen=True):
+    """Point-in-time counters for a SwingCache.
+
+    Attributes:
+        size: Entries held in memory right now.
+        hits: Lookups answered from memory without any detection.
+        shared_hits: Entries loaded from the shared backend after a local
+            miss. The lookup is then also counted as a hit or an extension.
+        extensions: Lookups answered by detecting only appended candles.
+        misses: Lookups that ran a full detection.
+        evictions: Entries dropped to respect ``maxsize``.
+        expirations: Entries dropped because their TTL had passed.
+        invalidations: Entries dropped by ``invalidate``.
+    """
+
+    size: int
+    hits: int
+    shared_hits: int
+    extensions: int
+    misses: int
+    evictions: int
+    expirations: int
+    invalidations: int
+
+
+class _Entry(NamedTuple):
+    swings: np.ndarray
+    n_candles: int
+    last_open_time: np.datetime64
+    stored_at: float
+
+
+class SwingCacheBackend(ABC):
+    """Byte store shared between processes. Keys are short ASCII strings."""
+
+    @abstractmethod
+    def get(self, key: str) -> bytes | None:
+        """Return the stored value, or None if absent."""
+
+    @abstractmethod
+    def set(self, key: str, value: bytes) -> None:
+        """Store a value, replacing any previous one."""
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """Remove a value if present."""
+
+
+class FileCacheBackend(SwingCacheBackend):
+    """One file per key under a directory shared by local processes.
+
+    Writes go to a temporary file that is renamed into place, so readers in
+    other processes never see a partial value.
+    """
+
+    def __init__(self, root: Path | str) -> None:
+        """Use (and create if needed) ``root`` as the cache directory."""
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, key: str) -> Path:
+        return self.root / (hashlib.sha1(key.encode()).hexdigest() + ".swings")
+
+    def get(self, key: str) -> bytes | None:
+        try:
+            return self._path(key).read_bytes()
+        except FileNotFoundError:
+            return None
+
+    def set(self, key: str, value: bytes) -> None:
+        fd, tmp = tempfile.mkstemp(dir=self.root, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(value)
+            os.replace(tmp, self._path(key))
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+
+    def delete(self, key: str) -> None:
+        self._path(key).unlink(missing_ok=True)
+
+
+def _backend_key(key: CacheKey) -> str:
+    pair, timeframe, min_swing_pips, first_us = key
+    return f"swings:{pair}:{timeframe}:{min_swing_pips}:{first_us}"
+
+
+def _encode(entry: _Entry, wall_time: float) -> bytes:
+    buf = io.BytesIO()
+    meta = np.array(
+        [entry.n_candles, entry.last_open_time.astype("datetime64[us]").astype(np.int64)],
+        dtype=np.int64,
+    )
+    np.savez(buf, swings=entry.swings, meta=meta, wall_time=np.float64(wall_time))
+    return buf.getvalue()
+
+
+def _decode(payload: bytes) -> tuple[np.ndarray, int, np.datetime64, float]:
+    with np.load(io.BytesIO(payload), allow_pickle=False) as data:
+        n_candles, last_us = data["meta"].tolist()
+        return (
+            data["swings"].astype(SWING_DTYPE, copy=False),
+            int(n_candles),
+            np.datetime64(last_us, "us"),
+            float(data["wall_time"]),
+        )
+
+
+class SwingCache:
+    """Thread-safe LRU/TTL cache of detected swing arrays.
+
+    Detection itself runs outside the lock, so concurrent lookups for
+    different series never wait on each other's detection.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 256,
+        ttl_s: float | None = 900.0,
+        backend: SwingCacheBackend | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Create an empty cache.
+
+        Args:
+            maxsize: Most entries held in memory; the least recently used is
+                evicted beyond it.
+            ttl_s: Seconds an entry stays valid after it was last stored or
+                extended. None = no expiry.
+            backend: Optional store shared with other processes.
+            clock: Monotonic time source (injectable for tests).
+
+        Raises:
+            ValueError: If maxsize < 1 or ttl_s <= 0.
+        """
+        if maxsize < 1:
+            raise ValueError("maxsize must be >= 1")
+        if ttl_s is not None and ttl_s <= 0:
+            raise ValueError("ttl_s must be > 0 (or None for no expiry)")
+        self.maxsize = maxsize
+        self.ttl_s = ttl_s
+        self.backend = backend
+        self._clock = clock
+        self._entries: OrderedDict[CacheKey, _Entry] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._shared_hits = 0
+        self._extensions = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+        self._invalidations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @instrument(
+        "swing_cache.detect",
+        lambda self, series, *_, **__: StageLabels(series.pair, series.timeframe, len(series)),
+    )
+    def detect(self, series: CandleSeries, min_swing_pips: float | None = None) -> np.ndarray:
+        """Swings for a whole series, as ``detect_swings_array`` would return.
+
+        Args:
+            series: Candles for one pair/timeframe, ascending. May be empty or
+                shorter than 3 candles, which yields no swings.
+            min_swing_pips: Optional minimum C2 range in pips.
+
+        Returns:
+            ``SWING_DTYPE`` array in open_time order. Treat it as read-only:
+            it may be shared with the cache and other callers.
+
+        Raises:
+            ValueError: As ``detect_swings_array`` (e.g. unknown pip value).
+        """
+        n = len(series)
+        if n < 3:
+            return np.empty(0, dtype=SWING_DTYPE)
+        key: CacheKey = (
+            series.pair,
+            series.timeframe,
+            min_swing_pips,
+            int(series.open_time[0].astype(np.int64)),
+        )
+        last = series.open_time[-1]
+
+        entry = self._lookup(key)
+        if entry is not None:
+            if entry.n_candles == n and entry.last_open_time == last:
+                self._count("_hits")
+                return entry.swings
+            if entry.n_candles > n and series.open_time[-1] < entry.last_open_time:
+                # A prefix of the cached range: C2s up to the second-to-last candle.
+                self._count("_hits")
+                cut = np.searchsorted(entry.swings["open_time"], last, "left")
+                return entry.swings[:cut]
+            if (
+                entry.n_candles < n
+                and series.open_time[entry.n_candles - 1] == entry.last_open_time
+            ):
+                tail = series[entry.n_candles - 2 :]
+                appended = detect_swings_array(
+                    tail.open_time, tail.high, tail.low, series.pair, min_swing_pips
+                )
+                swings = np.concatenate([entry.swings, appended])
+                self._store(key, swings, n, last)
+                self._count("_extensions")
+                return swings
+
+        swings = detect_swings_array(
+            series.open_time, series.high, series.low, series.pair, min_swing_pips
+        )
+        self._store(key, swings, n, last)
+        self._count("_misses")
+        return swings
+
+    def invalidate(
+        self,
+        pair: str,
+        timeframe: str,
+        since: np.datetime64 | None = None,
+    ) -> int:
+        """Drop entries affected by rewritten candles.
+
+        Args:
+            pair: Pair whose candles changed.
+            timeframe: Timeframe whose candles changed.
+            since: Earliest changed open_time. Entries whose covered range
+                ends before it are kept. None = drop every entry for the
+                series.
+
+        Returns:
+            Number of in-memory entries dropped. Matching shared-backend
+            entries are deleted as well.
+        """
+        cutoff = None if since is None else np.datetime64(since, "us")
+        with self._lock:
+            doomed = [
+                key
+                for key, entry in self._entries.items()
+                if key[0] == pair
+                and key[1] == timeframe
+                and (cutoff is None or entry.last_open_time >= cutoff)
+            ]
+            for key in doomed:
+                del self._entries[key]
+            self._invalidations += len(doomed)
+        if self.backend is not None:
+            for key in doomed:
+                self.backend.delete(_backend_key(key))
+        return len(doomed)
+
+    def clear(self) -> None:
+        """Drop every in-memory entry (counters are kept)."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> SwingCacheStats:
+        """Snapshot of the cache counters."""
+        with self._lock:
+            return SwingCacheStats(
+                size=len(self._entries),
+                hits=self._hits,
+                shared_hits=self._shared_hits,
+                extensions=self._extensions,
+                misses=self._misses,
+                evictions=self._evictions,
+                expirations=self._expirations,
+                invalidations=self._invalidations,
+            )
+
+    # -- internals -----------------------------------------------------------
+
+    def _count(self, counter: str) -> None:
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def _expired(self, stored_at: float, now: float) -> bool:
+        return self.ttl_s is not None and now - stored_at >= self.ttl_s
+
+    def _lookup(self, key: CacheKey) -> _Entry | None:
+        now = self._clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if not self._expired(entry.stored_at, now):
+                    self._entries.move_to_end(key)
+                    return entry
+                del self._entries[key]
+                self._expirations += 1
+        if self.backend is None:
+            return None
+
+        payload = self.backend.get(_backend_key(key))
+        if payload is None:
+            return None
+        swings, n_candles, last_open_time, wall_time = _decode(payload)
+        if self._expired(wall_time, time.time()):
+            return None
+        # Keep the remaining shared TTL rather than restarting it locally.
+        entry = _Entry(swings, n_candles, last_open_time, now - (time.time() - wall_time))
+        with self._lock:
+            self._shared_hits += 1
+            self._insert(key, entry)
+        return entry
+
+    def _store(self, key: CacheKey, swings: np.ndarray, n: int, last: np.datetime64) -> None:
+        swings.flags.writeable = False
+        entry = _Entry(swings, n, last, self._clock())
+        with self._lock:
+            self._insert(key, entry)
+        if self.backend is not None:
+            self.backend.set(_backend_key(key), _encode(entry, time.time()))
+
+    def _insert(self, key: CacheKey, entry: _Entry) -> None:
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self._evictions += 1
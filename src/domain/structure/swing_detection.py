@@ -4,25 +4,263 @@ Ports the research_detect_swings SQL function to a pure Python function.
 The SQL used LAG/LEAD window functions to examine each candle (C2) against
 its left neighbour (C1) and right neighbour (C3). This module replicates
 that logic exactly, including the dual-swing behaviour.
+
+Two entry points share one vectorised core:
+
+- ``detect_swings`` takes ``Candle`` models (or a ``CandleSeries``) and returns
+  ``Swing`` models.
+- ``detect_swings_array`` takes NumPy columns and returns a structured array
+  (``SWING_DTYPE``), for research runs over years of history.
+
+``detect_swings(..., records=True)`` sits in between: the same inputs, but
+``SwingRecord`` tuples instead of pydantic models.
 """
 
-from src.domain.structure.models import Candle, Swing, SwingType
+from typing import Literal, overload
+
+import numpy as np
+
+from src.domain.observability.metrics import StageLabels, instrument
+from src.domain.structure.models import Candle, CandleSeries, Swing, SwingRecord, SwingType
+from src.infrastructure.config import get_config_registry
+
+# Structured dtype returned by detect_swings_array — one row per swing.
+SWING_DTYPE = np.dtype(
+    [
+        ("open_time", "datetime64[us]"),
+        ("type", "U4"),
+        ("price", "f8"),
+    ]
+)
+
+
+def get_pip_value(pair: str) -> float:
+    """Look up the pip value for a pair from the config registry.
+
+    Args:
+        pair: Currency pair in uppercase format with no slash (e.g. "EURUSD").
+
+    Returns:
+        The pair's pip size (e.g. 0.0001 for EURUSD).
+
+    Raises:
+        ValueError: If the pair has no pip value in pairs.json or tolerances.json.
+    """
+    registry = get_config_registry()
+    try:
+        return registry.pip_value(pair)
+    except KeyError:
+        raise ValueError(
+            f"Unknown pair '{pair}' — pip value required for pip-based thresholds. "
+            f"Known pairs: {sorted(registry.pip_values)}"
+        ) from None
+
+
+def _triplet_columns(
+    open_time: np.ndarray, high: np.ndarray, low: np.ndarray
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Coerce and validate the columns every C1-C2-C3 detector needs.
+
+    Returns:
+        ``(open_time, high, low)`` as ``datetime64[us]`` and ``float64`` arrays.
+
+    Raises:
+        ValueError: If the columns differ in length or hold fewer than 3 candles.
+        ValueError: If open_time is not strictly ascending.
+    """
+    open_time = np.asarray(open_time, dtype="datetime64[us]")
+    high = np.asarray(high, dtype=np.float64)
+    low = np.asarray(low, dtype=np.float64)
+
+    if not (len(open_time) == len(high) == len(low)):
+        raise ValueError(
+            "open_time, high and low must have the same length, got "
+            f"{len(open_time)}, {len(high)}, {len(low)}"
+        )
+    if len(open_time) < 3:
+        raise ValueError(f"At least 3 candles required, got {len(open_time)}")
+
+    violations = np.flatnonzero(open_time[1:] <= open_time[:-1])
+    if len(violations):
+        i = int(violations[0]) + 1
+        raise ValueError(
+            "Candles must be sorted ascending by open_time with no duplicates. "
+            f"Violation at index {i}: {open_time[i]} <= {open_time[i - 1]}"
+        )
+    return open_time, high, low
+
+
+def _swing_positions(
+    high: np.ndarray,
+    low: np.ndarray,
+    pip_value: float | None,
+    min_swing_pips: float | None,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Compute C2 indices and swing directions for every detected swing.
+
+    The C1-C2-C3 comparisons are evaluated as shifted-array masks over the
+    interior candles, so the whole series is processed without a Python loop.
+
+    Args:
+        high: Candle highs, ascending by open_time.
+        low: Candle lows, aligned with ``high``.
+        pip_value: Pip size for the pair, or None when no range filter applies.
+        min_swing_pips: Minimum C2 range in pips, or None for no filter.
+
+    Returns:
+        Tuple ``(positions, is_high)`` where ``positions`` holds the C2 index of
+        each swing and ``is_high`` is True for HIGHs. Rows are ordered by index
+        with HIGH before LOW for dual swings.
+    """
+    c2_high = high[1:-1]
+    c2_low = low[1:-1]
+
+    # Strict comparisons on both sides — equal extremes never form a swing.
+    high_mask = (c2_high > high[:-2]) & (c2_high > high[2:])
+    low_mask = (c2_low < low[:-2]) & (c2_low < low[2:])
+
+    # The range filter drops both HIGH and LOW from a C2 that is too small.
+    # Written as ``not <`` to keep the loop implementation's exact semantics.
+    if pip_value is not None:
+        range_ok = ~((c2_high - c2_low) / pip_value < min_swing_pips)
+        high_mask &= range_ok
+        low_mask &= range_ok
+
+    return _merge_positions(np.flatnonzero(high_mask) + 1, np.flatnonzero(low_mask) + 1)
+
+
+def _merge_positions(high_idx: np.ndarray, low_idx: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Merge HIGH and LOW candle indices into one ordered ``(positions, is_high)``."""
+    positions = np.concatenate([high_idx, low_idx])
+    is_high = np.concatenate(
+        [np.ones(len(high_idx), dtype=bool), np.zeros(len(low_idx), dtype=bool)]
+    )
+
+    # HIGHs are concatenated first, so a stable sort keeps HIGH before LOW
+    # when both fire on the same C2.
+    order = np.argsort(positions, kind="stable")
+    return positions[order], is_high[order]
+
+
+def _swing_rows(
+    open_time: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    positions: np.ndarray,
+    is_high: np.ndarray,
+) -> np.ndarray:
+    """Build the ``SWING_DTYPE`` rows for the swings at ``positions``."""
+    swings = np.empty(len(positions), dtype=SWING_DTYPE)
+    swings["open_time"] = open_time[positions]
+    swings["type"] = np.where(is_high, SwingType.HIGH.value, SwingType.LOW.value)
+    swings["price"] = np.where(is_high, high[positions], low[positions])
+    return swings
+
+
+def _swing_models(
+    swings: np.ndarray, pair: str, timeframe: str, records: bool
+) -> list[Swing] | list[SwingRecord]:
+    """Materialise ``SWING_DTYPE`` rows as ``Swing`` models or records."""
+    make = SwingRecord if records else Swing
+    kinds = {SwingType.HIGH.value: SwingType.HIGH, SwingType.LOW.value: SwingType.LOW}
+    return [
+        make(
+            pair=pair,
+            timeframe=timeframe,
+            open_time=open_time,
+            type=kinds[kind],
+            price=price,
+        )
+        for open_time, kind, price in zip(
+            swings["open_time"].tolist(),
+            swings["type"].tolist(),
+            swings["price"].tolist(),
+            strict=True,
+        )
+    ]
+
+
+def detect_swings_array(
+    open_time: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    pair: str | None = None,
+    min_swing_pips: float | None = None,
+) -> np.ndarray:
+    """Detect swing highs and lows from columnar candle arrays.
+
+    Produces exactly the same swings as ``detect_swings`` — same C1-C2-C3
+    rules, same ``min_swing_pips`` filter, same dual-swing ordering — but
+    operates on NumPy columns and never builds per-candle or per-swing models.
+
+    Args:
+        open_time: Candle open times as ``datetime64`` values (any unit),
+            sorted strictly ascending.
+        high: Candle highs, aligned with ``open_time``.
+        low: Candle lows, aligned with ``open_time``.
+        pair: Currency pair in uppercase format with no slash (e.g. "EURUSD").
+            Only required when ``min_swing_pips`` is set.
+        min_swing_pips: Optional minimum C2 candle range in pips. None = no filter.
+
+    Returns:
+        Structured array with dtype ``SWING_DTYPE`` (fields ``open_time``,
+        ``type`` and ``price``) in open_time ascending order. Dual swings
+        appear with HIGH before LOW.
+
+    Raises:
+        ValueError: If the columns differ in length or hold fewer than 3 candles.
+        ValueError: If open_time is not strictly ascending.
+        ValueError: If min_swing_pips is set without a known pair.
+    """
+    open_time, high, low = _triplet_columns(open_time, high, low)
+
+    pip_value: float | None = None
+    if min_swing_pips is not None:
+        if pair is None:
+            raise ValueError("pair is required when min_swing_pips is set")
+        pip_value = get_pip_value(pair)
+
+    positions, is_high = _swing_positions(high, low, pip_value, min_swing_pips)
+    return _swing_rows(open_time, high, low, positions, is_high)
 
-# Pip value per pair — the smallest price increment that counts as one pip.
-# Extend this dict as new pairs are added to the platform.
-PIP_VALUES: dict[str, float] = {
-    "EURUSD": 0.0001,
-    "GBPUSD": 0.0001,
-    "USDJPY": 0.01,
-}
 
+@overload
+def detect_swings(
+    candles: list[Candle] | CandleSeries,
+    pair: str,
+    timeframe: str,
+    min_swing_pips: float | None = None,
+    *,
+    records: Literal[False] = False,
+) -> list[Swing]: ...
+
+
+@overload
+def detect_swings(
+    candles: list[Candle] | CandleSeries,
+    pair: str,
+    timeframe: str,
+    min_swing_pips: float | None = None,
+    *,
+    records: Literal[True],
+) -> list[SwingRecord]: ...
 
+
+def _detect_labels(
+    candles: list[Candle] | CandleSeries, pair: str, timeframe: str, *_: object, **__: object
+) -> StageLabels:
+    return StageLabels(pair, timeframe, len(candles))
+
+
+@instrument("detect_swings", _detect_labels)
 def detect_swings(
-    candles: list[Candle],
+    candles: list[Candle] | CandleSeries,
     pair: str,
     timeframe: str,
     min_swing_pips: float | None = None,
-) -> list[Swing]:
+    *,
+    records: bool = False,
+) -> list[Swing] | list[SwingRecord]:
     """Detect swing highs and lows from a sequence of candles.
 
     Uses the C1-C2-C3 pattern mirroring the research_detect_swings SQL function:
@@ -38,25 +276,37 @@ def detect_swings(
     function processes ALL candles it receives without any internal trimming.
 
     Args:
-        candles: Sequence of candles sorted ascending by open_time.
+        candles: Sequence of candles sorted ascending by open_time, or a
+            CandleSeries (detected on its columns without building Candles).
             Must contain at least 3 candles.
         pair: Currency pair in uppercase format with no slash (e.g. "EURUSD").
         timeframe: Timeframe in uppercase with unit (e.g. "1H").
         min_swing_pips: Optional minimum candle range filter. When set, a swing
             is only included if the C2 candle range (high - low) converted to
-            pips is >= this value. Requires the pair to be present in PIP_VALUES.
+            pips is >= this value. Requires a pip value for the pair in config.
             Applies to both HIGH and LOW from the same C2. None = no filter.
+        records: Return lightweight ``SwingRecord`` tuples instead of
+            ``Swing`` models (same fields, same order).
 
     Returns:
-        List of Swing objects in open_time ascending order. Dual swings
-        (same open_time) appear with HIGH before LOW.
+        List of Swing objects (or SwingRecords) in open_time ascending order.
+        Dual swings (same open_time) appear with HIGH before LOW.
 
     Raises:
         ValueError: If fewer than 3 candles are provided.
         ValueError: If candles are not sorted strictly ascending by open_time
             (duplicate timestamps are also rejected).
-        ValueError: If min_swing_pips is set for a pair not in PIP_VALUES.
+        ValueError: If min_swing_pips is set for a pair with no configured pip value.
     """
+    if isinstance(candles, CandleSeries):
+        swings = detect_swings_array(
+            candles.open_time, candles.high, candles.low, pair, min_swing_pips
+        )
+        return _swing_models(swings, pair, timeframe, records)
+
+    make = SwingRecord if records else Swing
+    high_type, low_type = SwingType.HIGH, SwingType.LOW
+
     if len(candles) < 3:
         raise ValueError(f"At least 3 candles required, got {len(candles)}")
 
@@ -69,49 +319,19 @@ def detect_swings(
 
     pip_value: float | None = None
     if min_swing_pips is not None:
-        if pair not in PIP_VALUES:
-            raise ValueError(
-                f"Unknown pair '{pair}' — pip value required for min_swing_pips filter. "
-                f"Known pairs: {sorted(PIP_VALUES)}"
-            )
-        pip_value = PIP_VALUES[pair]
-
-    swings: list[Swing] = []
-
-    for i in range(1, len(candles) - 1):
-        c1 = candles[i - 1]
-        c2 = candles[i]
-        c3 = candles[i + 1]
-
-        # Apply optional min_swing_pips filter on the C2 candle range.
-        # If C2 doesn't meet the threshold, skip both HIGH and LOW checks.
-        if pip_value is not None:
-            c2_range_pips = (c2.high - c2.low) / pip_value
-            if c2_range_pips < min_swing_pips:  # type: ignore[operator]
-                continue
-
-        # HIGH check — independent of LOW check, strict greater-than on both sides.
-        if c2.high > c1.high and c2.high > c3.high:
-            swings.append(
-                Swing(
-                    pair=pair,
-                    timeframe=timeframe,
-                    open_time=c2.open_time,
-                    type=SwingType.HIGH,
-                    price=c2.high,
-                )
-            )
+        pip_value = get_pip_value(pair)
 
-        # LOW check — independent of HIGH check, strict less-than on both sides.
-        if c2.low < c1.low and c2.low < c3.low:
-            swings.append(
-                Swing(
-                    pair=pair,
-                    timeframe=timeframe,
-                    open_time=c2.open_time,
-                    type=SwingType.LOW,
-                    price=c2.low,
-                )
-            )
+    high = np.fromiter((c.high for c in candles), dtype=np.float64, count=len(candles))
+    low = np.fromiter((c.low for c in candles), dtype=np.float64, count=len(candles))
+    positions, is_high = _swing_positions(high, low, pip_value, min_swing_pips)
 
-    return swings
+    return [
+        make(
+            pair=pair,
+            timeframe=timeframe,
+            open_time=candles[i].open_time,
+            type=high_type if hi else low_type,
+            price=candles[i].high if hi else candles[i].low,
+        )
+        for i, hi in zip(positions.tolist(), is_high.tolist(), strict=True)
+    ]
@@ -0,0 +1,162 @@
+"""Incremental swing detection for live, one-candle-at-a-time feeds.
+
+``detect_swings`` answers "which swings are in this window?" and has to be
+re-run over the whole buffered window whenever a candle closes. The
+``SwingDetector`` here keeps the last three candles per (pair, timeframe) and,
+on every closed candle, confirms only the swing (if any) at the previous C2 —
+constant work per candle, with output identical to the batch function.
+"""
+
+from collections import deque
+from collections.abc import Mapping
+from datetime import datetime
+from typing import Any
+
+from src.domain.structure.models import Candle, Swing, SwingType
+from src.domain.structure.swing_detection import get_pip_value
+
+# Bumped whenever the checkpoint layout changes.
+CHECKPOINT_VERSION = 1
+
+# (open_time, high, low) — the only candle fields swing detection needs.
+_Bar = tuple[datetime, float, float]
+
+
+class SwingDetector:
+    """Stateful C1-C2-C3 swing detector fed with closed candles.
+
+    Each (pair, timeframe) series has its own 3-candle ring. When a candle
+    closes it becomes C3, the ring's middle candle is C2, and the swing rules
+    of ``detect_swings`` are applied to that single triplet.
+
+    Example:
+        detector = SwingDetector(min_swing_pips={"1H": 5.0})
+        for candle in feed:
+            for swing in detector.update(candle):
+                publish(swing)
+    """
+
+    def __init__(self, min_swing_pips: Mapping[str, float] | None = None) -> None:
+        """Create an empty detector.
+
+        Args:
+            min_swing_pips: Optional C2 range filter per timeframe, in the same
+                shape as ``swing_detection.min_swing_pips`` in tolerances.json.
+                Timeframes not listed are unfiltered.
+        """
+        self._min_swing_pips: dict[str, float] = dict(min_swing_pips or {})
+        self._rings: dict[tuple[str, str], deque[_Bar]] = {}
+
+    def update(self, candle: Candle) -> list[Swing]:
+        """Feed one closed candle and return the swings it confirms.
+
+        Args:
+            candle: The newly closed candle. Must be later than the previous
+                candle fed for the same pair and timeframe.
+
+        Returns:
+            The swings at the previous C2 — empty, one swing, or a dual swing
+            (HIGH before LOW). Always empty for the first two candles of a series.
+
+        Raises:
+            ValueError: If the candle is not strictly after the previous one
+                for its series.
+            ValueError: If a min_swing_pips filter applies to the candle's
+                timeframe but the pair has no known pip value.
+        """
+        key = (candle.pair, candle.timeframe)
+        ring = self._rings.get(key)
+        if ring is None:
+            ring = self._rings[key] = deque(maxlen=3)
+        elif candle.open_time <= ring[-1][0]:
+            raise ValueError(
+                "Candles must be fed ascending by open_time with no duplicates. "
+                f"{candle.pair} {candle.timeframe}: {candle.open_time} <= {ring[-1][0]}"
+            )
+
+        min_swing_pips = self._min_swing_pips.get(candle.timeframe)
+        pip_value = get_pip_value(candle.pair) if min_swing_pips is not None else None
+
+        ring.append((candle.open_time, candle.high, candle.low))
+        if len(ring) < 3:
+            return []
+
+        (_, c1_high, c1_low), (c2_time, c2_high, c2_low), (_, c3_high, c3_low) = ring
+
+        if pip_value is not None and (c2_high - c2_low) / pip_value < min_swing_pips:  # type: ignore[operator]
+            return []
+
+        swings: list[Swing] = []
+        if c2_high > c1_high and c2_high > c3_high:
+            swings.append(
+                Swing(
+                    pair=candle.pair,
+                    timeframe=candle.timeframe,
+                    open_time=c2_time,
+                    type=SwingType.HIGH,
+                    price=c2_high,
+                )
+            )
+        if c2_low < c1_low and c2_low < c3_low:
+            swings.append(
+                Swing(
+                    pair=candle.pair,
+                    timeframe=candle.timeframe,
+                    open_time=c2_time,
+                    type=SwingType.LOW,
+                    price=c2_low,
+                )
+            )
+        return swings
+
+    def checkpoint(self) -> dict[str, Any]:
+        """Snapshot the detector state as a JSON-serialisable dict.
+
+        Only the last two candles per series are kept — the third slot is
+        always refilled by the next update — so a checkpoint stays tiny no
+        matter how long the detector has been running.
+
+        Returns:
+            Dict suitable for ``json.dumps`` and ``SwingDetector.restore``.
+        """
+        return {
+            "version": CHECKPOINT_VERSION,
+            "min_swing_pips": dict(self._min_swing_pips),
+            "series": [
+                {
+                    "pair": pair,
+                    "timeframe": timeframe,
+                    "candles": [[t.isoformat(), high, low] for t, high, low in list(ring)[-2:]],
+                }
+                for (pair, timeframe), ring in self._rings.items()
+            ],
+        }
+
+    @classmethod
+    def restore(cls, state: Mapping[str, Any]) -> "SwingDetector":
+        """Rebuild a detector from a ``checkpoint()`` snapshot.
+
+        Args:
+            state: A dict previously returned by ``checkpoint``.
+
+        Returns:
+            A detector that continues exactly where the checkpointed one stopped.
+
+        Raises:
+            ValueError: If the checkpoint version is not supported.
+        """
+        if state.get("version") != CHECKPOINT_VERSION:
+            raise ValueError(
+                f"Unsupported SwingDetector checkpoint version {state.get('version')!r}, "
+                f"expected {CHECKPOINT_VERSION}"
+            )
+        detector = cls(min_swing_pips=state["min_swing_pips"])
+        for series in state["series"]:
+            detector._rings[(series["pair"], series["timeframe"])] = deque(
+                (
+                    (datetime.fromisoformat(t), float(high), float(low))
+                    for t, high, low in series["candles"]
+                ),
+                maxlen=3,
+            )
+        return detector
@@ -0,0 +1,113 @@
+"""Parallel swing scans across many (pair, timeframe) series.
+
+Research rescans run ``detect_swings`` once per pair in ``config/pairs.json``
+and per timeframe in ``swing_detection.min_swing_pips``. ``scan_swings`` fans
+those independent jobs out over a process or thread pool. Workers only
+receive the open_time/high/low columns of each series, so pickling cost is
+three raw buffers per job, never one object per candle.
+"""
+
+from collections.abc import Mapping, Sequence
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Literal
+
+import numpy as np
+
+from src.domain.structure.models import Candle, CandleSeries
+from src.domain.structure.swing_detection import detect_swings_array
+from src.infrastructure.config import get_config_registry
+
+SeriesKey = tuple[str, str]
+
+
+def default_min_swing_pips() -> dict[str, float]:
+    """Return the per-timeframe min_swing_pips table from tolerances.json.
+
+    Returns:
+        Mapping of timeframe to minimum C2 range in pips (e.g. {"1H": 5.0}).
+    """
+    return dict(get_config_registry().tolerances.swing_detection.min_swing_pips)
+
+
+def _scan_one(
+    pair: str,
+    open_time: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    min_swing_pips: float | None,
+) -> np.ndarray:
+    """Worker entry point — module level so process pools can pickle it."""
+    return detect_swings_array(open_time, high, low, pair, min_swing_pips)
+
+
+def scan_swings(
+    series: Mapping[SeriesKey, CandleSeries | Sequence[Candle]],
+    *,
+    min_swing_pips: Mapping[str, float] | None = None,
+    executor: Literal["process", "thread"] | Executor = "process",
+    max_workers: int | None = None,
+) -> dict[SeriesKey, np.ndarray]:
+    """Detect swings for many (pair, timeframe) series in parallel.
+
+    Args:
+        series: Mapping of (pair, timeframe) to that series' candles, either
+            as a CandleSeries or as a list of Candle models (converted once in
+            the calling process).
+        min_swing_pips: Per-timeframe C2 range filter. None (the default)
+            reads ``swing_detection.min_swing_pips`` from tolerances.json;
+            pass an empty mapping to disable filtering. Timeframes without an
+            entry are scanned unfiltered.
+        executor: "process" (default, uses all cores), "thread", or an
+            existing Executor to reuse across calls. A passed-in executor is
+            not shut down.
+        max_workers: Pool size for "process"/"thread". None = library default
+            (the CPU count for processes).
+
+    Returns:
+        Mapping of (pair, timeframe) to a ``SWING_DTYPE`` structured array,
+        in the same key order as ``series``.
+
+    Raises:
+        ValueError: If any series fails detection. The message names the
+            offending (pair, timeframe); the original error is chained.
+    """
+    filters = default_min_swing_pips() if min_swing_pips is None else dict(min_swing_pips)
+
+    columns: dict[SeriesKey, CandleSeries] = {
+        key: data if isinstance(data, CandleSeries) else CandleSeries.from_candles(data)
+        for key, data in series.items()
+    }
+
+    if isinstance(executor, Executor):
+        return _submit_all(executor, columns, filters)
+
+    pool_cls = ProcessPoolExecutor if executor == "process" else ThreadPoolExecutor
+    with pool_cls(max_workers=max_workers) as pool:
+        return _submit_all(pool, columns, filters)
+
+
+def _submit_all(
+    pool: Executor,
+    columns: Mapping[SeriesKey, CandleSeries],
+    filters: Mapping[str, float],
+) -> dict[SeriesKey, np.ndarray]:
+    """Submit one job per series and collect results in input order."""
+    futures: dict[SeriesKey, Future[np.ndarray]] = {
+        (pair, timeframe): pool.submit(
+            _scan_one,
+            pair,
+            data.open_time,
+            data.high,
+            data.low,
+            filters.get(timeframe),
+        )
+        for (pair, timeframe), data in columns.items()
+    }
+
+    results: dict[SeriesKey, np.ndarray] = {}
+    for (pair, timeframe), future in futures.items():
+        try:
+            results[(pair, timeframe)] = future.result()
+        except ValueError as exc:
+            raise ValueError(f"Swing scan failed for {pair} {timeframe}: {exc}") from exc
+    return results
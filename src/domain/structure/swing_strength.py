@@ -0,0 +1,240 @@
+"""Swing strength classification — STRONG, INTERNAL or WEAK.
+
+A swing HIGH is broken by the first later swing HIGH priced strictly above
+it; a swing LOW by the first later swing LOW priced strictly below it (see
+``SwingStrength``). Checking every swing against every later one is
+quadratic. Here each swing type keeps a monotonic stack of the swings not
+yet broken: highs non-increasing, lows non-decreasing. A new swing pops
+exactly the swings it breaks, and each swing is pushed and popped at most
+once, so a whole series is classified in O(n).
+
+The swing on top of a stack is always the previous swing of that type, so
+the first swing a new one pops is WEAK and any further ones are INTERNAL.
+
+Three entry points share the rule:
+
+- ``classify_swing_strength_array`` takes a ``SWING_DTYPE`` array and returns
+  a row-aligned ``STRENGTH_DTYPE`` array with the breaking swing and time.
+- ``classify_swing_strength`` takes ``detect_swings`` output and returns the
+  swings with ``swing_strength`` set.
+- ``SwingStrengthTracker`` is fed swings one at a time, as ``SwingDetector``
+  confirms them, and returns only the swings each one reclassifies.
+"""
+
+from collections.abc import Mapping, Sequence
+from datetime import datetime
+from typing import Any
+
+import numpy as np
+
+from src.domain.structure.models import Swing, SwingRecord, SwingStrength, SwingType
+
+# Bumped whenever the checkpoint layout changes.
+CHECKPOINT_VERSION = 1
+
+# Structured dtype returned by classify_swing_strength_array — one row per
+# input swing. broken_by is the row of the breaking swing (-1 if unbroken)
+# and broken_time its open time (NaT if unbroken).
+STRENGTH_DTYPE = np.dtype(
+    [
+        ("strength", "U8"),
+        ("broken_by", "i8"),
+        ("broken_time", "datetime64[us]"),
+    ]
+)
+
+
+def _breaks(swing_type: SwingType | str, price: float, unbroken: float) -> bool:
+    if swing_type == SwingType.HIGH:
+        return price > unbroken
+    return price < unbroken
+
+
+def _sweep(highs: list[bool], prices: list[float]) -> tuple[list[int], list[bool]]:
+    """One pass of the two monotonic stacks.
+
+    Returns:
+        Per swing, the index of the swing that broke it (-1 if none) and
+        whether that was the next swing of its type (WEAK).
+    """
+    n = len(prices)
+    broken_by = [-1] * n
+    weak = [False] * n
+    stacks: dict[bool, list[int]] = {True: [], False: []}
+    for j in range(n):
+        price, high, stack = prices[j], highs[j], stacks[highs[j]]
+        first = True
+        while stack and (prices[stack[-1]] < price if high else prices[stack[-1]] > price):
+            i = stack.pop()
+            broken_by[i] = j
+            weak[i] = first
+            first = False
+        stack.append(j)
+    return broken_by, weak
+
+
+def classify_swing_strength_array(swings: np.ndarray) -> np.ndarray:
+    """Classify a detected swing array.
+
+    Args:
+        swings: ``SWING_DTYPE`` array for one pair and timeframe, in time
+            order (as returned by ``detect_swings_array``).
+
+    Returns:
+        ``STRENGTH_DTYPE`` array aligned with ``swings``.
+    """
+    broken_by, weak = _sweep((swings["type"] == SwingType.HIGH).tolist(), swings["price"].tolist())
+    out = np.empty(len(swings), dtype=STRENGTH_DTYPE)
+    by = np.array(broken_by, dtype=np.int64)
+    broken = by >= 0
+    out["broken_by"] = by
+    out["strength"] = np.where(
+        broken,
+        np.where(weak, SwingStrength.WEAK, SwingStrength.INTERNAL),
+        SwingStrength.STRONG,
+    )
+    out["broken_time"] = np.where(
+        broken, swings["open_time"][np.where(broken, by, 0)], np.datetime64("NaT", "us")
+    )
+    return out
+
+
+def classify_swing_strength(swings: Sequence[Swing | SwingRecord]) -> list[Swing]:
+    """Classify ``detect_swings`` output.
+
+    Args:
+        swings: Swings for one pair and timeframe, in time order. ``Swing``
+            models or ``SwingRecord`` tuples.
+
+    Returns:
+        The same swings as ``Swing`` models with ``swing_strength`` set.
+
+    Raises:
+        ValueError: If the swings span more than one pair or timeframe.
+    """
+    if len({(s.pair, s.timeframe) for s in swings}) > 1:
+        raise ValueError("classify_swing_strength expects swings of one pair and timeframe")
+    broken_by, weak = _sweep([s.type == SwingType.HIGH for s in swings], [s.price for s in swings])
+    return [
+        _classified(
+            s,
+            SwingStrength.STRONG
+            if by < 0
+            else SwingStrength.WEAK
+            if is_weak
+            else SwingStrength.INTERNAL,
+        )
+        for s, by, is_weak in zip(swings, broken_by, weak, strict=True)
+    ]
+
+
+def _classified(swing: Swing | SwingRecord, strength: SwingStrength) -> Swing:
+    return Swing(
+        pair=swing.pair,
+        timeframe=swing.timeframe,
+        open_time=swing.open_time,
+        type=swing.type,
+        price=swing.price,
+        swing_strength=strength,
+    )
+
+
+class SwingStrengthTracker:
+    """Incremental strength classifier fed with confirmed swings.
+
+    Keeps the unbroken swings of each (pair, timeframe, type) on a monotonic
+    stack. A new swing reclassifies only the swings it breaks — popped from
+    the top of its stack — so each update costs O(1) amortised.
+
+    Example:
+        detector, tracker = SwingDetector(), SwingStrengthTracker()
+        for candle in feed:
+            for swing in detector.update(candle):
+                for classified in tracker.update(swing):
+                    publish(classified)
+    """
+
+    def __init__(self) -> None:
+        """Create an empty tracker."""
+        self._stacks: dict[tuple[str, str, SwingType], list[Swing]] = {}
+
+    def update(self, swing: Swing) -> list[Swing]:
+        """Feed one newly confirmed swing.
+
+        Args:
+            swing: The swing. Must not be earlier than the previous swing fed
+                for the same pair and timeframe.
+
+        Returns:
+            The swings whose strength changed, in time order: the swings
+            this one breaks (now WEAK or INTERNAL), then the new swing itself
+            as STRONG.
+        """
+        stack = self._stacks.setdefault((swing.pair, swing.timeframe, swing.type), [])
+        broken: list[Swing] = []
+        strength = SwingStrength.WEAK
+        while stack and _breaks(swing.type, swing.price, stack[-1].price):
+            broken.append(_classified(stack.pop(), strength))
+            strength = SwingStrength.INTERNAL
+        classified = _classified(swing, SwingStrength.STRONG)
+        stack.append(classified)
+        broken.reverse()
+        broken.append(classified)
+        return broken
+
+    def unbroken(self, pair: str, timeframe: str) -> list[Swing]:
+        """The STRONG swings of one series, HIGHs and LOWs merged in time order."""
+        swings = [
+            *self._stacks.get((pair, timeframe, SwingType.HIGH), []),
+            *self._stacks.get((pair, timeframe, SwingType.LOW), []),
+        ]
+        return sorted(swings, key=lambda s: s.open_time)
+
+    def checkpoint(self) -> dict[str, Any]:
+        """Snapshot the tracker state as a JSON-serialisable dict.
+
+        Only unbroken swings are kept; broken ones can never change again.
+
+        Returns:
+            Dict suitable for ``json.dumps`` and ``SwingStrengthTracker.restore``.
+        """
+        return {
+            "version": CHECKPOINT_VERSION,
+            "series": [
+                {
+                    "pair": pair,
+                    "timeframe": timeframe,
+                    "type": str(swing_type),
+                    "swings": [[s.open_time.isoformat(), s.price] for s in stack],
+                }
+                for (pair, timeframe, swing_type), stack in self._stacks.items()
+            ],
+        }
+
+    @classmethod
+    def restore(cls, state: Mapping[str, Any]) -> "SwingStrengthTracker":
+        """Rebuild a tracker from a ``checkpoint()`` snapshot.
+
+        Raises:
+            ValueError: If the checkpoint version is not supported.
+        """
+        if state.get("version") != CHECKPOINT_VERSION:
+            raise ValueError(
+                f"Unsupported SwingStrengthTracker checkpoint version {state.get('version')!r}, "
+                f"expected {CHECKPOINT_VERSION}"
+            )
+        tracker = cls()
+        for series in state["series"]:
+            swing_type = SwingType(series["type"])
+            tracker._stacks[(series["pair"], series["timeframe"], swing_type)] = [
+                Swing(
+                    pair=series["pair"],
+                    timeframe=series["timeframe"],
+                    open_time=datetime.fromisoformat(t),
+                    type=swing_type,
+                    price=float(price),
+                    swing_strength=SwingStrength.STRONG,
+                )
+                for t, price in series["swings"]
+            ]
+        return tracker
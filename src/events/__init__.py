@@ -0,0 +1,40 @@
+"""Domain events — typed events, the asyncio event bus and its transports."""
+
+from src.events.bus import EventBus, OverflowPolicy, Subscription, SubscriptionMetrics
+from src.events.models import (
+    EVENT_TYPES,
+    CandleClosed,
+    CISDDetected,
+    DataGapDetected,
+    Event,
+    StopHit,
+    SwingDetected,
+    TargetHit,
+    TradeExit,
+    TradeExpired,
+    decode_event,
+    encode_event,
+)
+from src.events.transport import LocalTransport, PostgresNotifyTransport, Transport
+
+__all__ = [
+    "EVENT_TYPES",
+    "CISDDetected",
+    "CandleClosed",
+    "DataGapDetected",
+    "Event",
+    "EventBus",
+    "LocalTransport",
+    "OverflowPolicy",
+    "PostgresNotifyTransport",
+    "StopHit",
+    "Subscription",
+    "SubscriptionMetrics",
+    "SwingDetected",
+    "TargetHit",
+    "TradeExit",
+    "TradeExpired",
+    "Transport",
+    "decode_event",
+    "encode_event",
+]
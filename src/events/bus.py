@@ -0,0 +1,422 @@
+"""In-process asyncio event bus with micro-batching and backpressure.
+
+Each subscription owns a bounded queue for its topic and one or more worker
+tasks. Workers hand events to the handler in batches: everything already
+queued (up to ``max_batch``) is delivered in one call, so a burst of
+backfilled candles costs one handler invocation instead of hundreds. A
+subscription can also linger ``max_wait_s`` to let a batch fill up.
+
+When a queue is full the subscription's ``OverflowPolicy`` decides:
+
+- BLOCK: ``publish`` waits for space — backpressure reaches the producer.
+- DROP_NEWEST: the new event is discarded and counted.
+- DROP_OLDEST: the oldest queued event is discarded and counted.
+
+Events received from a transport cannot wait for space — the transport
+delivers from a callback — so they land in a bounded inbox per topic, each
+drained by its own pump task. A BLOCK subscription that falls behind stalls
+only its own topic's pump; once that topic's inbox is full, further
+deliveries for it are discarded and counted as dropped on each of the
+topic's subscriptions. Other topics keep flowing.
+
+Per-subscription counters (enqueued, delivered, dropped, handler errors,
+batches) and queue latency are exposed through ``EventBus.metrics``.
+
+Example:
+    async def on_candles(events: list[CandleClosed]) -> None:
+        ...
+
+    async with EventBus() as bus:
+        bus.subscribe(CandleClosed, on_candles, max_batch=500)
+        await bus.publish(CandleClosed(candle=candle))
+"""
+
+import asyncio
+from collections import defaultdict
+from collections.abc import Awaitable, Callable
+from enum import StrEnum
+from typing import Any, Self, TypeVar
+
+import structlog
+from pydantic import BaseModel
+
+from src.events.models import Event, decode_event, encode_event
+from src.events.transport import Transport
+
+logger = structlog.get_logger(__name__)
+
+E = TypeVar("E", bound=Event)
+Handler = Callable[[list[E]], Awaitable[None]]
+
+
+class OverflowPolicy(StrEnum):
+    """What ``publish`` does when a subscription's queue is full."""
+
+    BLOCK = "BLOCK"
+    DROP_NEWEST = "DROP_NEWEST"
+    DROP_OLDEST = "DROP_OLDEST"
+
+
+class SubscriptionMetrics(BaseModel, frozen=True):
+    """Point-in-time counters for one subscription.
+
+    Attributes:
+        topic: Event topic.
+        name: Subscription name.
+        enqueued: Events accepted into the queue.
+        delivered: Events passed to the handler.
+        dropped: Events discarded by the overflow policy.
+        errors: Handler calls that raised.
+        batches: Handler calls made.
+        queue_depth: Events waiting right now.
+        max_batch_size: Largest batch delivered so far.
+        mean_latency_s: Mean time from enqueue to handler start.
+        max_latency_s: Worst time from enqueue to handler start.
+    """
+
+    topic: str
+    name: str
+    enqueued: int
+    delivered: int
+    dropped: int
+    errors: int
+    batches: int
+    queue_depth: int
+    max_batch_size: int
+    mean_latency_s: float
+    max_latency_s: float
+
+
+class Subscription:
+    """A handler bound to one topic, with its own bounded queue and workers."""
+
+    def __init__(
+        self,
+        topic: str,
+        name: str,
+        handler: Handler[Any],
+        *,
+        maxsize: int,
+        max_batch: int,
+        max_wait_s: float,
+        concurrency: int,
+        overflow: OverflowPolicy,
+    ) -> None:
+        if maxsize < 1 or max_batch < 1 or concurrency < 1:
+            raise ValueError("maxsize, max_batch and concurrency must all be >= 1")
+        if max_wait_s < 0:
+            raise ValueError("max_wait_s must be >= 0")
+        self.topic = topic
+        self.name = name
+        self.handler = handler
+        self.max_batch = max_batch
+        self.max_wait_s = max_wait_s
+        self.concurrency = concurrency
+        self.overflow = overflow
+        # Items are (event, enqueue time on the loop clock).
+        self._queue: asyncio.Queue[tuple[Event, float]] = asyncio.Queue(maxsize)
+        self._workers: list[asyncio.Task[None]] = []
+        self._enqueued = 0
+        self._delivered = 0
+        self._dropped = 0
+        self._errors = 0
+        self._batches = 0
+        self._max_batch_size = 0
+        self._latency_total = 0.0
+        self._latency_max = 0.0
+
+    # -- producer side -------------------------------------------------------
+
+    async def put(self, event: Event) -> None:
+        """Enqueue, applying the overflow policy when full."""
+        if self.overflow is OverflowPolicy.BLOCK:
+            await self._queue.put((event, asyncio.get_running_loop().time()))
+            self._enqueued += 1
+        else:
+            self.put_nowait(event)
+
+    def put_nowait(self, event: Event) -> bool:
+        """Enqueue without waiting. Returns False if the new event was dropped.
+
+        A full DROP_OLDEST queue discards its head instead; any other policy
+        (including BLOCK, on this non-waiting path) discards the new event.
+        """
+        if self._queue.full():
+            self._dropped += 1
+            if self.overflow is not OverflowPolicy.DROP_OLDEST:
+                return False
+            self._queue.get_nowait()
+            self._queue.task_done()
+        self._queue.put_nowait((event, asyncio.get_running_loop().time()))
+        self._enqueued += 1
+        return True
+
+    def count_dropped(self) -> None:
+        """Count an event discarded before it reached this queue (a full bus inbox)."""
+        self._dropped += 1
+
+    # -- consumer side -------------------------------------------------------
+
+    def start(self) -> None:
+        """Spawn the worker tasks (idempotent)."""
+        if not self._workers:
+            self._workers = [
+                asyncio.create_task(self._run(), name=f"event-bus:{self.topic}:{self.name}:{i}")
+                for i in range(self.concurrency)
+            ]
+
+    async def _next_batch(self) -> list[tuple[Event, float]]:
+        batch = [await self._queue.get()]
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.max_wait_s
+        while len(batch) < self.max_batch:
+            try:
+                batch.append(self._queue.get_nowait())
+                continue
+            except asyncio.QueueEmpty:
+                pass
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            try:
+                async with asyncio.timeout(remaining):
+                    batch.append(await self._queue.get())
+            except TimeoutError:
+                break
+        return batch
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = await self._next_batch()
+            started = loop.time()
+            for _, enqueued_at in batch:
+                latency = started - enqueued_at
+                self._latency_total += latency
+                self._latency_max = max(self._latency_max, latency)
+            self._batches += 1
+            self._delivered += len(batch)
+            self._max_batch_size = max(self._max_batch_size, len(batch))
+            try:
+                await self.handler([event for event, _ in batch])
+            except Exception:
+                self._errors += 1
+                logger.exception(
+                    "event_handler_failed",
+                    topic=self.topic,
+                    subscription=self.name,
+                    batch_size=len(batch),
+                )
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    async def drain(self) -> None:
+        """Wait until every queued event has been handled."""
+        await self._queue.join()
+
+    async def stop(self) -> None:
+        """Cancel the workers. Queued events are discarded."""
+        for task in self._workers:
+            task.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+    def metrics(self) -> SubscriptionMetrics:
+        """Snapshot of this subscription's counters."""
+        return SubscriptionMetrics(
+            topic=self.topic,
+            name=self.name,
+            enqueued=self._enqueued,
+            delivered=self._delivered,
+            dropped=self._dropped,
+            errors=self._errors,
+            batches=self._batches,
+            queue_depth=self._queue.qsize(),
+            max_batch_size=self._max_batch_size,
+            mean_latency_s=self._latency_total / self._delivered if self._delivered else 0.0,
+            max_latency_s=self._latency_max,
+        )
+
+
+class EventBus:
+    """Topic-based publish/subscribe over asyncio, optionally via a transport.
+
+    Without a transport, ``publish`` enqueues directly into the topic's
+    subscriptions. With one, ``publish`` only sends through the transport,
+    and events received from it (from this or any other process) are fed to
+    local subscriptions in arrival order, per topic.
+    """
+
+    def __init__(self, transport: Transport | None = None, *, inbox_maxsize: int = 10_000) -> None:
+        """Create a bus.
+
+        Args:
+            transport: Optional cross-process transport (e.g.
+                ``PostgresNotifyTransport``). None = in-process only.
+            inbox_maxsize: Capacity of each topic's inbox for transport
+                deliveries. Deliveries to a full inbox are dropped.
+        """
+        if inbox_maxsize < 1:
+            raise ValueError("inbox_maxsize must be >= 1")
+        self.transport = transport
+        self.inbox_maxsize = inbox_maxsize
+        self._subscriptions: dict[str, list[Subscription]] = defaultdict(list)
+        # Transport deliveries land in their topic's inbox; one pump per topic
+        # dispatches them in order.
+        self._inboxes: dict[str, asyncio.Queue[bytes]] = {}
+        self._pumps: dict[str, asyncio.Task[None]] = {}
+        self._started = False
+
+    async def __aenter__(self) -> Self:
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.close()
+
+    def subscribe(
+        self,
+        event_type: type[E],
+        handler: Handler[E],
+        *,
+        name: str | None = None,
+        maxsize: int = 1_000,
+        max_batch: int = 100,
+        max_wait_s: float = 0.0,
+        concurrency: int = 1,
+        overflow: OverflowPolicy = OverflowPolicy.BLOCK,
+    ) -> Subscription:
+        """Register a batch handler for an event type.
+
+        Args:
+            event_type: Event class to receive (its ``topic`` is used).
+            handler: Coroutine function taking a non-empty list of events.
+            name: Subscription name for metrics. Defaults to the handler's
+                qualified name.
+            maxsize: Queue capacity.
+            max_batch: Largest batch passed to one handler call.
+            max_wait_s: How long a worker lingers for more events once it has
+                one. 0 = deliver whatever is already queued.
+            concurrency: Worker tasks (concurrent handler calls) for this
+                subscription. Above 1, batches may complete out of order.
+            overflow: Policy when the queue is full.
+
+        Returns:
+            The subscription, for inspecting metrics.
+
+        Raises:
+            RuntimeError: If the bus uses a transport and is already started
+                (transport listeners are set up by ``start``).
+        """
+        if self._started and self.transport is not None:
+            raise RuntimeError("Subscribe before start() when the bus uses a transport")
+        subscription = Subscription(
+            event_type.topic,
+            name or getattr(handler, "__qualname__", repr(handler)),
+            handler,
+            maxsize=maxsize,
+            max_batch=max_batch,
+            max_wait_s=max_wait_s,
+            concurrency=concurrency,
+            overflow=overflow,
+        )
+        self._subscriptions[event_type.topic].append(subscription)
+        if self._started:
+            subscription.start()
+        return subscription
+
+    async def start(self) -> None:
+        """Start workers (and transport listeners) for every subscription."""
+        self._started = True
+        for subscriptions in self._subscriptions.values():
+            for subscription in subscriptions:
+                subscription.start()
+        if self.transport is not None:
+            for topic in self._subscriptions:
+                await self._listen(topic)
+
+    async def _listen(self, topic: str) -> None:
+        assert self.transport is not None
+        if topic not in self._inboxes:
+            inbox: asyncio.Queue[bytes] = asyncio.Queue(self.inbox_maxsize)
+            self._inboxes[topic] = inbox
+            self._pumps[topic] = asyncio.create_task(
+                self._run_pump(topic, inbox), name=f"event-bus:pump:{topic}"
+            )
+            await self.transport.listen(topic, self._receive)
+
+    def _receive(self, topic: str, payload: bytes) -> None:
+        inbox = self._inboxes.get(topic)
+        if inbox is None:
+            return
+        try:
+            inbox.put_nowait(payload)
+        except asyncio.QueueFull:
+            for subscription in self._subscriptions.get(topic, ()):
+                subscription.count_dropped()
+
+    async def _run_pump(self, topic: str, inbox: asyncio.Queue[bytes]) -> None:
+        while True:
+            payload = await inbox.get()
+            try:
+                await self._dispatch(decode_event(topic, payload))
+            except Exception:
+                logger.exception("event_decode_failed", topic=topic)
+            finally:
+                inbox.task_done()
+
+    async def _dispatch(self, event: Event) -> None:
+        for subscription in self._subscriptions.get(event.topic, ()):
+            await subscription.put(event)
+
+    async def publish(self, event: Event) -> None:
+        """Publish one event, waiting for queue space under BLOCK policies."""
+        if self.transport is not None:
+            await self.transport.send(event.topic, encode_event(event))
+        else:
+            await self._dispatch(event)
+
+    async def publish_many(self, events: list[Event]) -> None:
+        """Publish events in order (e.g. a backfilled candle burst)."""
+        for event in events:
+            await self.publish(event)
+
+    async def drain(self) -> None:
+        """Wait until every published event has been handled."""
+        if self.transport is not None:
+            # Let transport deliveries scheduled so far reach the inbox.
+            await asyncio.sleep(0)
+            for inbox in self._inboxes.values():
+                await inbox.join()
+        for subscriptions in self._subscriptions.values():
+            for subscription in subscriptions:
+                await subscription.drain()
+
+    async def close(self, drain: bool = True) -> None:
+        """Stop the bus.
+
+        Args:
+            drain: Handle everything already published before stopping.
+        """
+        if drain:
+            await self.drain()
+        for pump in self._pumps.values():
+            pump.cancel()
+        await asyncio.gather(*self._pumps.values(), return_exceptions=True)
+        self._pumps.clear()
+        for subscriptions in self._subscriptions.values():
+            for subscription in subscriptions:
+                await subscription.stop()
+        if self.transport is not None:
+            await self.transport.close()
+        self._inboxes.clear()
+        self._started = False
+
+    def metrics(self) -> list[SubscriptionMetrics]:
+        """Counters for every subscription, ordered by topic then registration."""
+        return [
+            subscription.metrics()
+            for topic in sorted(self._subscriptions)
+            for subscription in self._subscriptions[topic]
+        ]
@@ -0,0 +1,152 @@
+"""Typed domain events.
+
+Every event is an immutable pydantic model with a class-level ``topic``.
+Subclasses register themselves by topic, so a payload received from a
+transport (e.g. a PostgreSQL NOTIFY) can be turned back into the right type
+with ``decode_event``.
+
+Topics follow BLUEPRINT §3.3: ``candle.closed`` → ``swing.detected`` → ...
+"""
+
+import uuid
+from datetime import UTC, datetime
+from typing import Any, ClassVar
+
+from pydantic import BaseModel, Field
+
+from src.domain.execution.models import TradeDirection
+from src.domain.structure.models import Candle, CISDEvent, Swing
+
+# topic -> event class, filled in by Event.__init_subclass__.
+EVENT_TYPES: dict[str, type["Event"]] = {}
+
+
+class Event(BaseModel, frozen=True):
+    """Base class for domain events.
+
+    Attributes:
+        event_id: Unique id, for de-duplication across transports.
+        occurred_at: UTC time the event was created.
+    """
+
+    topic: ClassVar[str]
+
+    event_id: str = Field(default_factory=lambda: uuid.uuid4().hex)
+    occurred_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        topic = cls.__dict__.get("topic")
+        if topic is not None:
+            if topic in EVENT_TYPES:
+                raise ValueError(f"Duplicate event topic '{topic}'")
+            EVENT_TYPES[topic] = cls
+
+
+class CandleClosed(Event, frozen=True):
+    """A candle has closed and been stored.
+
+    Attributes:
+        candle: The closed candle.
+    """
+
+    topic: ClassVar[str] = "candle.closed"
+
+    candle: Candle
+
+
+class SwingDetected(Event, frozen=True):
+    """Structure detection confirmed a swing.
+
+    Attributes:
+        swing: The confirmed swing.
+    """
+
+    topic: ClassVar[str] = "swing.detected"
+
+    swing: Swing
+
+
+class CISDDetected(Event, frozen=True):
+    """Structure detection found a CISD.
+
+    Attributes:
+        cisd: The CISD, with its C2 candle and broken series.
+    """
+
+    topic: ClassVar[str] = "cisd.detected"
+
+    cisd: CISDEvent
+
+
+class DataGapDetected(Event, frozen=True):
+    """Bars expected by the session calendar are missing from stored data.
+
+    Attributes:
+        pair: Currency pair.
+        timeframe: Timeframe of the series with the gap.
+        start: Open time of the first missing bar (UTC).
+        end: Open time of the first bar after the gap (UTC).
+        missing_bars: In-session bars missing between ``start`` and ``end``.
+    """
+
+    topic: ClassVar[str] = "data.gap_detected"
+
+    pair: str
+    timeframe: str
+    start: datetime
+    end: datetime
+    missing_bars: int
+
+
+class TradeExit(Event, frozen=True):
+    """Base for events closing an open trade. Has no topic of its own.
+
+    Attributes:
+        trade_id: Id of the closed trade.
+        pair: Currency pair.
+        direction: LONG or SHORT.
+        exit_time: Close time of the candle that closed the trade.
+        exit_price: Stop, target, or (expiry) that candle's close.
+        result_r: Result in R multiples.
+    """
+
+    trade_id: str
+    pair: str
+    direction: TradeDirection
+    exit_time: datetime
+    exit_price: float
+    result_r: float
+
+
+class StopHit(TradeExit, frozen=True):
+    """A trade's stop loss was reached."""
+
+    topic: ClassVar[str] = "trade.stop_hit"
+
+
+class TargetHit(TradeExit, frozen=True):
+    """A trade's take profit was reached."""
+
+    topic: ClassVar[str] = "trade.target_hit"
+
+
+class TradeExpired(TradeExit, frozen=True):
+    """A trade reached its expiry without hitting its stop or target."""
+
+    topic: ClassVar[str] = "trade.expired"
+
+
+def encode_event(event: Event) -> bytes:
+    """Serialise an event to JSON bytes for a transport."""
+    return event.model_dump_json().encode()
+
+
+def decode_event(topic: str, payload: bytes | str) -> Event:
+    """Rebuild an event from a transport payload.
+
+    Raises:
+        KeyError: If no event type is registered for the topic.
+        pydantic.ValidationError: If the payload does not match the event schema.
+    """
+    return EVENT_TYPES[topic].model_validate_json(payload)
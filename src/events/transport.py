@@ -0,0 +1,167 @@
+"""Pluggable transports that carry encoded events between processes.
+
+The ``EventBus`` delivers in-process by default. Given a transport, it
+publishes every event through it and feeds whatever the transport receives
+back into its local subscriptions, so the same handlers run unchanged
+whether events come from this process or from another one.
+
+- ``PostgresNotifyTransport`` uses PostgreSQL LISTEN/NOTIFY (one channel per
+  topic), on the existing psycopg2 dependency.
+- ``LocalTransport`` is an in-process stand-in with the same semantics
+  (asynchronous delivery, text payloads, 8000-byte limit) for tests and for
+  running without a database.
+"""
+
+import asyncio
+from abc import ABC, abstractmethod
+from collections import defaultdict
+from collections.abc import Callable
+
+import psycopg2
+from psycopg2.extensions import ISOLATION_LEVEL_AUTOCOMMIT
+
+# PostgreSQL rejects NOTIFY payloads of 8000 bytes or more (default build).
+MAX_PAYLOAD_BYTES = 7999
+
+Deliver = Callable[[str, bytes], None]
+
+
+def channel_name(topic: str) -> str:
+    """PostgreSQL channel for a topic ("candle.closed" -> "fractal_candle_closed")."""
+    return "fractal_" + topic.replace(".", "_")
+
+
+class Transport(ABC):
+    """Carries ``(topic, payload)`` messages to every listener of a topic."""
+
+    @abstractmethod
+    async def listen(self, topic: str, deliver: Deliver) -> None:
+        """Start receiving a topic. ``deliver`` is called on the event loop."""
+
+    @abstractmethod
+    async def send(self, topic: str, payload: bytes) -> None:
+        """Publish one encoded event.
+
+        Raises:
+            ValueError: If the payload exceeds ``MAX_PAYLOAD_BYTES``.
+        """
+
+    @abstractmethod
+    async def close(self) -> None:
+        """Stop listening and release connections."""
+
+
+def _check_payload(topic: str, payload: bytes) -> None:
+    if len(payload) > MAX_PAYLOAD_BYTES:
+        raise ValueError(
+            f"Payload for '{topic}' is {len(payload)} bytes; NOTIFY allows at most "
+            f"{MAX_PAYLOAD_BYTES}"
+        )
+
+
+class LocalTransport(Transport):
+    """In-process LISTEN/NOTIFY stand-in.
+
+    Delivery is scheduled with ``call_soon`` rather than made inline, so
+    publishers never run handlers on their own stack — as with a real NOTIFY.
+    """
+
+    def __init__(self) -> None:
+        self._listeners: dict[str, list[Deliver]] = defaultdict(list)
+        self.sent = 0
+
+    async def listen(self, topic: str, deliver: Deliver) -> None:
+        self._listeners[topic].append(deliver)
+
+    async def send(self, topic: str, payload: bytes) -> None:
+        _check_payload(topic, payload)
+        self.sent += 1
+        loop = asyncio.get_running_loop()
+        for deliver in self._listeners.get(topic, ()):
+            loop.call_soon(deliver, topic, payload)
+
+    async def close(self) -> None:
+        self._listeners.clear()
+
+
+class PostgresNotifyTransport(Transport):
+    """LISTEN/NOTIFY over psycopg2, integrated with the asyncio event loop.
+
+    A dedicated autocommit connection LISTENs on one channel per topic; its
+    socket is watched with ``loop.add_reader`` so notifications are read
+    without a polling thread. LISTEN statements and sends (on a second
+    connection) run on a worker thread, so the loop never waits on the
+    database.
+    """
+
+    def __init__(self, dsn: str) -> None:
+        """Create the transport. Connections open lazily on first use.
+
+        Args:
+            dsn: PostgreSQL connection string.
+        """
+        self._dsn = dsn
+        self._listen_conn: psycopg2.extensions.connection | None = None
+        self._send_conn: psycopg2.extensions.connection | None = None
+        self._send_lock = asyncio.Lock()
+        self._topics: dict[str, str] = {}
+        self._listeners: dict[str, list[Deliver]] = defaultdict(list)
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    def _connect(self) -> psycopg2.extensions.connection:
+        conn = psycopg2.connect(self._dsn)
+        conn.set_isolation_level(ISOLATION_LEVEL_AUTOCOMMIT)
+        return conn
+
+    async def listen(self, topic: str, deliver: Deliver) -> None:
+        if self._listen_conn is None:
+            self._listen_conn = await asyncio.to_thread(self._connect)
+            self._loop = asyncio.get_running_loop()
+            self._loop.add_reader(self._listen_conn.fileno(), self._on_readable)
+        channel = channel_name(topic)
+        if channel not in self._topics:
+            self._topics[channel] = topic
+            await asyncio.to_thread(self._listen_channel, channel)
+        self._listeners[topic].append(deliver)
+
+    def _listen_channel(self, channel: str) -> None:
+        assert self._listen_conn is not None
+        with self._listen_conn.cursor() as cur:
+            cur.execute(f'LISTEN "{channel}"')
+
+    def _on_readable(self) -> None:
+        assert self._listen_conn is not None
+        self._listen_conn.poll()
+        notifies = self._listen_conn.notifies
+        while notifies:
+            notify = notifies.pop(0)
+            topic = self._topics.get(notify.channel)
+            if topic is None:
+                continue
+            payload = notify.payload.encode()
+            for deliver in self._listeners[topic]:
+                deliver(topic, payload)
+
+    async def send(self, topic: str, payload: bytes) -> None:
+        _check_payload(topic, payload)
+        async with self._send_lock:
+            if self._send_conn is None:
+                self._send_conn = await asyncio.to_thread(self._connect)
+            await asyncio.to_thread(self._notify, channel_name(topic), payload.decode())
+
+    def _notify(self, channel: str, payload: str) -> None:
+        assert self._send_conn is not None
+        with self._send_conn.cursor() as cur:
+            cur.execute("SELECT pg_notify(%s, %s)", (channel, payload))
+
+    async def close(self) -> None:
+        if self._listen_conn is not None:
+            if self._loop is not None:
+                self._loop.remove_reader(self._listen_conn.fileno())
+            self._listen_conn.close()
+            self._listen_conn = None
+        if self._send_conn is not None:
+            self._send_conn.close()
+            self._send_conn = None
+        self._listeners.clear()
+        self._topics.clear()
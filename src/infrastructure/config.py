@@ -2,17 +2,39 @@
 
 Loads strategy configs, tolerances, session definitions, and pair parameters
 from JSON files in the config/ directory. Validates against Pydantic schemas.
+
+``load_json_config`` reads a file as a plain dict on every call. Hot-path code
+should use the process-wide ``ConfigRegistry`` (``get_config_registry()``)
+instead: it parses pairs.json, sessions.json and tolerances.json once into
+typed models, answers lookups from memory, and re-reads a file only when its
+mtime changes.
 """
 
 from __future__ import annotations
 
 import json
+import threading
+import time as _time
+from datetime import time
+from functools import cache
 from pathlib import Path
 from typing import Any
 
+import structlog
+from pydantic import BaseModel, Field
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+from src.domain.observability.metrics import get_metrics_registry
+
+logger = structlog.get_logger(__name__)
+
 # Config directory relative to project root
 CONFIG_DIR = Path(__file__).parent.parent.parent / "config"
 
+PAIRS_FILE = "pairs.json"
+SESSIONS_FILE = "sessions.json"
+TOLERANCES_FILE = "tolerances.json"
+
 
 def load_json_config(filename: str) -> dict[str, Any]:
     """Load a JSON configuration file from the config directory.
@@ -30,3 +52,298 @@ def load_json_config(filename: str) -> dict[str, Any]:
     path = CONFIG_DIR / filename
     with open(path) as f:
         return json.load(f)
+
+
+# ---------------------------------------------------------------------------
+# Typed config schemas
+# ---------------------------------------------------------------------------
+
+
+class PairConfig(BaseModel, frozen=True):
+    """Parameters for one pair in pairs.json."""
+
+    pip_value: float = Field(gt=0)
+    pip_digits: int
+    typical_spread_pips: float
+    twelvedata_symbol: str
+    active: bool
+
+
+class PairsConfig(BaseModel, frozen=True):
+    """pairs.json — pair-specific parameters keyed by pair (e.g. "EURUSD")."""
+
+    pairs: dict[str, PairConfig]
+
+
+class SessionWindow(BaseModel, frozen=True):
+    """A UTC time window from sessions.json."""
+
+    start_utc: time
+    end_utc: time
+    description: str = ""
+
+
+class SessionsConfig(BaseModel, frozen=True):
+    """sessions.json — trading sessions and the primary trading window."""
+
+    sessions: dict[str, SessionWindow]
+    trading_window: SessionWindow
+
+
+class SwingDetectionTolerances(BaseModel, frozen=True):
+    """tolerances.json ``swing_detection`` block."""
+
+    min_swing_pips: dict[str, float]
+
+
+class LevelTolerances(BaseModel, frozen=True):
+    """tolerances.json ``level_tolerances`` block (all in pips)."""
+
+    sweep_tolerance_pips: float
+    first_touch_tolerance_pips: float
+    swing_point_tolerance_pips: float
+
+
+class SessionTimes(BaseModel, frozen=True):
+    """tolerances.json ``session_times_utc`` entry."""
+
+    start: time
+    end: time
+
+
+class StrategyDefaults(BaseModel, frozen=True):
+    """tolerances.json ``strategy_defaults`` block."""
+
+    expiry_hours: float
+    max_c3_pips: float
+    min_dol_r: float
+
+
+class TolerancesConfig(BaseModel, frozen=True):
+    """tolerances.json — thresholds and constants."""
+
+    pip_values: dict[str, float]
+    swing_detection: SwingDetectionTolerances
+    level_tolerances: LevelTolerances
+    session_times_utc: dict[str, SessionTimes]
+    strategy_defaults: StrategyDefaults
+
+
+class ConfigSettings(BaseSettings):
+    """Environment overrides for the config registry.
+
+    Attributes:
+        config_dir: Directory holding the JSON config files
+            (env ``FRACTAL_CONFIG_DIR``).
+        reload_interval_s: Minimum seconds between mtime checks
+            (env ``FRACTAL_CONFIG_RELOAD_INTERVAL_S``). Lookups inside the
+            interval never touch the filesystem.
+    """
+
+    model_config = SettingsConfigDict(env_prefix="FRACTAL_")
+
+    config_dir: Path = CONFIG_DIR
+    reload_interval_s: float = 5.0
+
+
+# ---------------------------------------------------------------------------
+# Registry
+# ---------------------------------------------------------------------------
+
+_SCHEMAS: dict[str, type[BaseModel]] = {
+    PAIRS_FILE: PairsConfig,
+    SESSIONS_FILE: SessionsConfig,
+    TOLERANCES_FILE: TolerancesConfig,
+}
+
+
+class ConfigRegistry:
+    """Parsed, validated config served from memory with mtime-based reloads.
+
+    Every accessor first checks whether ``reload_interval_s`` has elapsed
+    since the last check; only then are the files stat-ed, and only files
+    whose mtime changed are re-parsed. Derived lookup tables (pip values,
+    min swing pips, session windows) are rebuilt after a reload so each
+    lookup is a single dict access.
+
+    A file that fails to load during these background checks (bad JSON, a
+    schema error, or a file caught mid-replace) is logged and skipped, and
+    lookups keep serving the last good snapshot. Only an explicit
+    ``refresh()`` raises.
+    """
+
+    def __init__(self, config_dir: Path | None = None, reload_interval_s: float = 5.0) -> None:
+        """Load all config files.
+
+        Args:
+            config_dir: Directory holding pairs/sessions/tolerances JSON.
+                Defaults to the project ``config/`` directory.
+            reload_interval_s: Minimum seconds between mtime checks. 0 checks
+                on every lookup.
+
+        Raises:
+            FileNotFoundError: If a config file is missing.
+            pydantic.ValidationError: If a config file fails schema validation.
+            ValueError: If pip values in pairs.json and tolerances.json disagree.
+        """
+        self.config_dir = Path(config_dir) if config_dir is not None else CONFIG_DIR
+        self.reload_interval_s = reload_interval_s
+        self._lock = threading.Lock()
+        self._mtimes: dict[str, int] = {}
+        self._models: dict[str, BaseModel] = {}
+        self._last_check = 0.0
+        self._pip_values: dict[str, float] = {}
+        self._failed_mtimes: dict[str, int] = {}
+        self.refresh(force=True)
+
+    # -- typed views ---------------------------------------------------------
+
+    @property
+    def pairs(self) -> PairsConfig:
+        """The parsed pairs.json."""
+        self._maybe_refresh()
+        return self._models[PAIRS_FILE]  # type: ignore[return-value]
+
+    @property
+    def sessions(self) -> SessionsConfig:
+        """The parsed sessions.json."""
+        self._maybe_refresh()
+        return self._models[SESSIONS_FILE]  # type: ignore[return-value]
+
+    @property
+    def tolerances(self) -> TolerancesConfig:
+        """The parsed tolerances.json."""
+        self._maybe_refresh()
+        return self._models[TOLERANCES_FILE]  # type: ignore[return-value]
+
+    # -- O(1) lookups --------------------------------------------------------
+
+    @property
+    def pip_values(self) -> dict[str, float]:
+        """Merged pip table: tolerances.json ``pip_values`` plus pairs.json entries."""
+        self._maybe_refresh()
+        return dict(self._pip_values)
+
+    def pip_value(self, pair: str) -> float:
+        """Pip size for a pair.
+
+        Raises:
+            KeyError: If the pair is in neither pairs.json nor tolerances.json.
+        """
+        self._maybe_refresh()
+        return self._pip_values[pair]
+
+    def min_swing_pips(self, timeframe: str) -> float | None:
+        """Minimum C2 range in pips for a timeframe, or None if unfiltered."""
+        return self.tolerances.swing_detection.min_swing_pips.get(timeframe)
+
+    def session_window(self, session: str) -> SessionWindow:
+        """UTC window for a session (e.g. "LONDON").
+
+        Raises:
+            KeyError: If the session is not defined in sessions.json.
+        """
+        return self.sessions.sessions[session]
+
+    # -- reloading -----------------------------------------------------------
+
+    def refresh(self, force: bool = False) -> bool:
+        """Re-read any config file whose mtime changed.
+
+        Args:
+            force: Reload every file regardless of mtime.
+
+        Returns:
+            True if at least one file was reloaded.
+
+        Raises:
+            OSError: If a config file cannot be read.
+            pydantic.ValidationError: If a changed file fails schema validation.
+            ValueError: If a changed file is not valid JSON or the pip values
+                disagree. The previous snapshot stays in place.
+        """
+        return self._reload(force=force, skip_failed=False)
+
+    def _reload(self, *, force: bool, skip_failed: bool) -> bool:
+        metrics = get_metrics_registry()
+        with self._lock, metrics.timed("config.refresh"):
+            self._last_check = _time.monotonic()
+            changed: dict[str, BaseModel] = {}
+            mtimes: dict[str, int] = {}
+            for filename, schema in _SCHEMAS.items():
+                path = self.config_dir / filename
+                mtime = path.stat().st_mtime_ns
+                if not force and self._mtimes.get(filename) == mtime:
+                    continue
+                if skip_failed and self._failed_mtimes.get(filename) == mtime:
+                    continue
+                text = path.read_text()
+                try:
+                    changed[filename] = schema.model_validate(json.loads(text))
+                except ValueError:
+                    # Remember only the file that is itself broken, so
+                    # background checks skip it until it changes again.
+                    self._failed_mtimes[filename] = mtime
+                    raise
+                mtimes[filename] = mtime
+            if not changed:
+                return False
+
+            # A cross-file conflict marks nothing as failed: the next check
+            # re-reads both files, so an edit split across them lands once
+            # the second file agrees.
+            models = {**self._models, **changed}
+            pip_values = _merge_pip_values(models[PAIRS_FILE], models[TOLERANCES_FILE])  # type: ignore[arg-type]
+
+            # Commit only after every changed file validated, so a bad edit
+            # leaves the previous consistent snapshot in place.
+            self._models = models
+            self._mtimes.update(mtimes)
+            self._pip_values = pip_values
+            for filename in mtimes:
+                self._failed_mtimes.pop(filename, None)
+            metrics.count("config_files_reloaded", n=len(changed))
+            return True
+
+    def _maybe_refresh(self) -> None:
+        """Background reload: a bad or half-written file never fails a lookup.
+
+        The error is logged and lookups keep serving the previous snapshot. A
+        file that failed to parse is not re-parsed until its mtime changes
+        again; a pip conflict between files is retried on every check.
+        """
+        if _time.monotonic() - self._last_check < self.reload_interval_s:
+            return
+        try:
+            self._reload(force=False, skip_failed=True)
+        except (OSError, ValueError) as exc:
+            logger.warning(
+                "config_reload_failed",
+                config_dir=str(self.config_dir),
+                error=f"{type(exc).__name__}: {exc}",
+            )
+
+
+def _merge_pip_values(pairs: PairsConfig, tolerances: TolerancesConfig) -> dict[str, float]:
+    """Combine both pip tables, rejecting pairs where they disagree."""
+    merged = dict(tolerances.pip_values)
+    for pair, params in pairs.pairs.items():
+        existing = merged.get(pair)
+        if existing is not None and existing != params.pip_value:
+            raise ValueError(
+                f"Conflicting pip value for {pair}: pairs.json has {params.pip_value}, "
+                f"tolerances.json has {existing}"
+            )
+        merged[pair] = params.pip_value
+    return merged
+
+
+@cache
+def get_config_registry() -> ConfigRegistry:
+    """Return the process-wide ConfigRegistry, created on first use.
+
+    The config directory and reload interval come from ``ConfigSettings``
+    (``FRACTAL_CONFIG_DIR`` / ``FRACTAL_CONFIG_RELOAD_INTERVAL_S``).
+    """
+    settings = ConfigSettings()
+    return ConfigRegistry(settings.config_dir, settings.reload_interval_s)
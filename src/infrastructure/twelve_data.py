@@ -0,0 +1,293 @@
+"""TwelveData API client.
+
+``TwelveDataClient`` wraps one ``httpx.AsyncClient``, so every request shares
+a keep-alive connection pool. It adds three things on top:
+
+- Credits. TwelveData bills one credit per symbol per request and caps
+  credits per minute by plan. A ``TokenBucket`` sized to the plan
+  (``TWELVEDATA_CREDITS_PER_MINUTE``) holds each request back until its
+  credits are available, so concurrent callers never trip the limit.
+- Batching. ``time_series`` sends several symbols in one request
+  (``symbol=EUR/USD,GBP/USD``). A batch never costs more than the bucket can
+  hold, and several batches are in flight at once.
+- Retries. Transport errors, HTTP 429/5xx and error bodies with those codes
+  (TwelveData often reports errors with HTTP 200) are retried with
+  exponential backoff and full jitter. Other errors raise
+  ``TwelveDataError`` immediately.
+
+Payloads are returned as parsed JSON. Translating them into candles is the
+market-data adapter's job (``src.domain.market_data.ingestion``).
+"""
+
+import asyncio
+import random
+import time
+from collections.abc import Callable, Sequence
+from typing import Any
+
+import httpx
+from pydantic_settings import BaseSettings
+
+# TwelveData accepts at most this many symbols per batch request.
+MAX_BATCH_SYMBOLS = 120
+
+_RETRY_STATUS = frozenset({429, 500, 502, 503, 504})
+
+# Codes TwelveData uses for a bad or unknown symbol (rather than a bad key,
+# plan or rate limit). A one-symbol batch answers them with a top-level error
+# body, which is that symbol's error, not the request's.
+_SYMBOL_ERROR_CODES = frozenset({400, 404})
+
+
+class TwelveDataError(Exception):
+    """An error response from TwelveData.
+
+    Attributes:
+        code: TwelveData error code (mirrors HTTP status codes).
+        message: Error message from the response.
+    """
+
+    def __init__(self, code: int, message: str) -> None:
+        super().__init__(f"TwelveData error {code}: {message}")
+        self.code = code
+        self.message = message
+
+
+class TwelveDataSettings(BaseSettings):
+    """Client settings, read from the environment (see .env.example).
+
+    Attributes:
+        twelvedata_api_key: API key (env ``TWELVEDATA_API_KEY``).
+        twelvedata_base_url: API root (env ``TWELVEDATA_BASE_URL``).
+        twelvedata_credits_per_minute: Plan limit; 8 on the free tier
+            (env ``TWELVEDATA_CREDITS_PER_MINUTE``).
+        twelvedata_max_connections: Pooled connections
+            (env ``TWELVEDATA_MAX_CONNECTIONS``).
+        twelvedata_timeout_s: Per-request timeout (env ``TWELVEDATA_TIMEOUT_S``).
+        twelvedata_max_retries: Retries after the first attempt
+            (env ``TWELVEDATA_MAX_RETRIES``).
+        twelvedata_backoff_base_s: First retry's maximum delay; doubles per
+            retry (env ``TWELVEDATA_BACKOFF_BASE_S``).
+        twelvedata_backoff_max_s: Upper bound on a retry delay
+            (env ``TWELVEDATA_BACKOFF_MAX_S``).
+    """
+
+    twelvedata_api_key: str = ""
+    twelvedata_base_url: str = "https://api.twelvedata.com"
+    twelvedata_credits_per_minute: int = 8
+    twelvedata_max_connections: int = 4
+    twelvedata_timeout_s: float = 30.0
+    twelvedata_max_retries: int = 4
+    twelvedata_backoff_base_s: float = 1.0
+    twelvedata_backoff_max_s: float = 60.0
+
+
+class TokenBucket:
+    """Async token bucket: ``capacity`` tokens, refilled continuously at ``rate``.
+
+    Waiters are served in arrival order, so a large request is not starved by
+    a stream of small ones.
+    """
+
+    def __init__(
+        self,
+        rate_per_s: float,
+        capacity: float,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Create a full bucket.
+
+        Args:
+            rate_per_s: Tokens added per second.
+            capacity: Maximum tokens held, and the largest allowed acquire.
+            clock: Monotonic clock in seconds.
+
+        Raises:
+            ValueError: If the rate or capacity is not positive.
+        """
+        if rate_per_s <= 0 or capacity <= 0:
+            raise ValueError("rate_per_s and capacity must be > 0")
+        self.rate_per_s = rate_per_s
+        self.capacity = capacity
+        self._clock = clock
+        self._tokens = capacity
+        self._updated = clock()
+        self._lock = asyncio.Lock()
+
+    @classmethod
+    def per_minute(cls, credits: int) -> "TokenBucket":
+        """Bucket allowing ``credits`` per minute, all of them in one burst."""
+        return cls(credits / 60.0, credits)
+
+    @property
+    def tokens(self) -> float:
+        """Tokens available now."""
+        self._refill()
+        return self._tokens
+
+    async def acquire(self, tokens: float = 1.0) -> None:
+        """Wait until ``tokens`` are available and take them.
+
+        Raises:
+            ValueError: If more than ``capacity`` tokens are requested.
+        """
+        if tokens > self.capacity:
+            raise ValueError(f"Cannot acquire {tokens} tokens from a bucket of {self.capacity}")
+        async with self._lock:
+            self._refill()
+            while self._tokens < tokens:
+                await asyncio.sleep((tokens - self._tokens) / self.rate_per_s)
+                self._refill()
+            self._tokens -= tokens
+
+    def _refill(self) -> None:
+        now = self._clock()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate_per_s)
+        self._updated = now
+
+
+class TwelveDataClient:
+    """Pooled, rate-limited async access to the TwelveData REST API.
+
+    Example:
+        async with TwelveDataClient() as client:
+            payloads = await client.time_series(["EUR/USD", "GBP/USD"], "5min")
+    """
+
+    def __init__(
+        self,
+        settings: TwelveDataSettings | None = None,
+        *,
+        limiter: TokenBucket | None = None,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ) -> None:
+        """Open the connection pool.
+
+        Args:
+            settings: Client settings. Defaults to the environment.
+            limiter: Credit bucket, shareable between clients using the same
+                key. Defaults to one sized to ``twelvedata_credits_per_minute``.
+            transport: httpx transport override (e.g. ``httpx.MockTransport``).
+        """
+        self.settings = settings or TwelveDataSettings()
+        self.limiter = limiter or TokenBucket.per_minute(
+            self.settings.twelvedata_credits_per_minute
+        )
+        self.batch_size = max(1, min(MAX_BATCH_SYMBOLS, int(self.limiter.capacity)))
+        self._http = httpx.AsyncClient(
+            base_url=self.settings.twelvedata_base_url,
+            timeout=self.settings.twelvedata_timeout_s,
+            limits=httpx.Limits(
+                max_connections=self.settings.twelvedata_max_connections,
+                max_keepalive_connections=self.settings.twelvedata_max_connections,
+            ),
+            transport=transport,
+        )
+
+    async def __aenter__(self) -> "TwelveDataClient":
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close every pooled connection."""
+        await self._http.aclose()
+
+    async def time_series(
+        self, symbols: Sequence[str], interval: str, **params: Any
+    ) -> dict[str, dict[str, Any]]:
+        """Fetch bars for several symbols at one interval.
+
+        Symbols are sent in batches of up to ``batch_size``, concurrently.
+        Times are requested in UTC, oldest first.
+
+        Args:
+            symbols: TwelveData symbols (e.g. "EUR/USD").
+            interval: TwelveData interval (e.g. "5min", "1h", "1day").
+            **params: Extra query parameters (``outputsize``, ``start_date``,
+                ``end_date``, ...). None values are dropped.
+
+        Returns:
+            Payload per symbol. A payload is either ``{"meta", "values",
+            "status": "ok"}`` or a per-symbol error (``"status": "error"``).
+
+        Raises:
+            TwelveDataError: If a whole request fails (bad key, exhausted
+                retries, ...).
+        """
+        symbols = list(dict.fromkeys(symbols))
+        query = {"interval": interval, "timezone": "UTC", "order": "ASC"}
+        query |= {k: v for k, v in params.items() if v is not None}
+        batches = [
+            symbols[i : i + self.batch_size] for i in range(0, len(symbols), self.batch_size)
+        ]
+        results = await asyncio.gather(*(self._time_series_batch(b, query) for b in batches))
+        return {symbol: payload for result in results for symbol, payload in result.items()}
+
+    async def _time_series_batch(
+        self, symbols: list[str], query: dict[str, Any]
+    ) -> dict[str, dict[str, Any]]:
+        try:
+            body = await self.request(
+                "/time_series", {**query, "symbol": ",".join(symbols)}, len(symbols)
+            )
+        except TwelveDataError as exc:
+            if len(symbols) == 1 and exc.code in _SYMBOL_ERROR_CODES:
+                # Same shape as a multi-symbol batch's per-symbol error.
+                return {symbols[0]: {"code": exc.code, "message": exc.message, "status": "error"}}
+            raise
+        if len(symbols) == 1:
+            return {symbols[0]: body}
+        return {symbol: body.get(symbol, _missing(symbol)) for symbol in symbols}
+
+    async def request(self, path: str, params: dict[str, Any], credits: int = 1) -> dict[str, Any]:
+        """GET an endpoint, spending ``credits`` per attempt, with retries.
+
+        Returns:
+            The decoded JSON body.
+
+        Raises:
+            TwelveDataError: On a non-retryable error, or once retries run out.
+        """
+        params = {**params, "apikey": self.settings.twelvedata_api_key}
+        attempt = 0
+        while True:
+            await self.limiter.acquire(credits)
+            try:
+                response = await self._http.get(path, params=params)
+                error = _error(response)
+            except httpx.TransportError as exc:
+                error = TwelveDataError(503, f"{type(exc).__name__}: {exc}")
+            if error is None:
+                return response.json()
+            if error.code not in _RETRY_STATUS or attempt >= self.settings.twelvedata_max_retries:
+                raise error
+            await asyncio.sleep(self._backoff(attempt))
+            attempt += 1
+
+    def _backoff(self, attempt: int) -> float:
+        """Full jitter: uniform in [0, min(max, base * 2**attempt)]."""
+        ceiling = min(
+            self.settings.twelvedata_backoff_max_s,
+            self.settings.twelvedata_backoff_base_s * 2**attempt,
+        )
+        return random.uniform(0.0, ceiling)
+
+
+def _error(response: httpx.Response) -> TwelveDataError | None:
+    """The error a response carries, in its status line or its body."""
+    try:
+        body = response.json()
+    except ValueError:
+        body = None
+    if isinstance(body, dict) and body.get("status") == "error" and "code" in body:
+        return TwelveDataError(int(body["code"]), str(body.get("message", "")))
+    if response.is_error or not isinstance(body, dict):
+        return TwelveDataError(response.status_code, response.text[:200])
+    return None
+
+
+def _missing(symbol: str) -> dict[str, Any]:
+    return {"code": 404, "message": f"{symbol} missing from batch response", "status": "error"}
@@ -0,0 +1 @@
+"""Performance benchmarks — see ``tests/benchmarks/harness.py``."""
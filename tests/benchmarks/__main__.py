@@ -0,0 +1,7 @@
+"""``python -m tests.benchmarks`` — run the benchmark suite from the command line."""
+
+import sys
+
+from tests.benchmarks.harness import main
+
+sys.exit(main())
@@ -0,0 +1,389 @@
+"""Benchmark harness for swing detection, candle ingestion and metrics overhead.
+
+Generates synthetic random-walk OHLC series, times each tracked path, and
+records throughput, peak traced memory and retained allocations per candle
+as machine-readable JSON. ``compare`` checks a run against a saved baseline
+and reports every (case, size) that slowed down beyond a threshold.
+
+Run from the repository root:
+
+    python -m tests.benchmarks --sizes 1000 100000 --output bench.json
+    python -m tests.benchmarks --compare bench.json --threshold 0.2
+
+Timing is the best of ``repeats`` runs (setup excluded). Memory is measured in
+a separate run under ``tracemalloc`` so tracing overhead never skews timing.
+"""
+
+import gc
+import json
+import platform
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Callable, Iterable, Sequence
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from src.domain.observability.metrics import MetricsRegistry
+from src.domain.structure.models import Candle, CandleSeries
+from src.domain.structure.swing_detection import detect_swings, detect_swings_array
+
+RESULTS_VERSION = 1
+DEFAULT_SIZES = (1_000, 10_000, 100_000, 1_000_000, 10_000_000)
+DEFAULT_THRESHOLD = 0.2
+DEFAULT_MIN_SECONDS = 1e-3
+
+# Paths that build one pydantic model per candle are capped: 10M Candle
+# objects need >10 GB and say nothing a 1M run does not.
+_MODEL_PATH_MAX_SIZE = 1_000_000
+
+
+@dataclass(frozen=True)
+class BenchmarkCase:
+    """A tracked path: ``setup(n)`` builds inputs (untimed), ``run`` is timed."""
+
+    name: str
+    setup: Callable[[int], Any]
+    run: Callable[[Any], Any]
+    max_size: int | None = None
+    teardown: Callable[[Any], None] | None = None
+
+
+def random_walk(n: int, seed: int = 0, pair: str = "EURUSD", timeframe: str = "5M") -> CandleSeries:
+    """Synthetic OHLC random walk with valid bars and strictly ascending times.
+
+    Args:
+        n: Number of candles.
+        seed: RNG seed, so every run benchmarks identical data.
+        pair: Pair stored on the series.
+        timeframe: Timeframe stored on the series (bars are 5 minutes apart).
+    """
+    rng = np.random.default_rng(seed)
+    close = 1.05 + np.cumsum(rng.normal(0, 0.0004, n))
+    open_ = np.concatenate([[1.05], close[:-1]])
+    high = np.maximum(open_, close) + np.abs(rng.normal(0, 0.0002, n))
+    low = np.minimum(open_, close) - np.abs(rng.normal(0, 0.0002, n))
+    open_time = np.datetime64("2020-01-01T00:00", "us") + np.arange(n) * np.timedelta64(5, "m")
+    return CandleSeries(pair, timeframe, open_time, open_, high, low, close)
+
+
+def _fixture_rows(n: int) -> dict[str, Any]:
+    series = random_walk(n)
+    return {
+        "pair": series.pair,
+        "timeframe": series.timeframe,
+        "candles": [
+            {"open_time": t, "open": o, "high": h, "low": lo, "close": c}
+            for t, o, h, lo, c in zip(
+                np.datetime_as_string(series.open_time, unit="s").tolist(),
+                series.open.tolist(),
+                series.high.tolist(),
+                series.low.tolist(),
+                series.close.tolist(),
+                strict=True,
+            )
+        ],
+    }
+
+
+def _build_candles(data: dict[str, Any]) -> list[Candle]:
+    """Mirror of the tests' ``_fixture_candles`` helper."""
+    return [
+        Candle(
+            pair=data["pair"],
+            timeframe=data["timeframe"],
+            open_time=datetime.fromisoformat(row["open_time"]),
+            open=row["open"],
+            high=row["high"],
+            low=row["low"],
+            close=row["close"],
+        )
+        for row in data["candles"]
+    ]
+
+
+def _build_candles_trusted(data: dict[str, Any]) -> list[Candle]:
+    """Same input as ``_build_candles``, validated once as a batch."""
+    rows = (
+        (
+            datetime.fromisoformat(row["open_time"]),
+            row["open"],
+            row["high"],
+            row["low"],
+            row["close"],
+        )
+        for row in data["candles"]
+    )
+    return CandleSeries.from_rows(data["pair"], data["timeframe"], rows).to_candles()
+
+
+def _write_fixture(n: int) -> Path:
+    path = Path(tempfile.mkdtemp(prefix="fractal-bench-")) / "candles.json"
+    path.write_text(json.dumps(_fixture_rows(n)))
+    return path
+
+
+def _series_columns(series: CandleSeries) -> tuple[Any, ...]:
+    return (
+        series.pair,
+        series.timeframe,
+        series.open_time,
+        series.open,
+        series.high,
+        series.low,
+        series.close,
+    )
+
+
+def _timed_calls(inputs: tuple[MetricsRegistry, int]) -> None:
+    """``n`` empty stage calls: the per-call cost instrumentation adds."""
+    metrics, n = inputs
+    for _ in range(n):
+        with metrics.timed("bench", "EURUSD", "5M", 1):
+            pass
+
+
+CASES: tuple[BenchmarkCase, ...] = (
+    BenchmarkCase(
+        "detect_swings_array",
+        random_walk,
+        lambda s: detect_swings_array(s.open_time, s.high, s.low, s.pair, 5.0),
+    ),
+    BenchmarkCase(
+        "detect_swings[CandleSeries]",
+        random_walk,
+        lambda s: detect_swings(s, s.pair, s.timeframe, 5.0),
+        _MODEL_PATH_MAX_SIZE,
+    ),
+    BenchmarkCase(
+        "detect_swings[records]",
+        random_walk,
+        lambda s: detect_swings(s, s.pair, s.timeframe, 5.0, records=True),
+        _MODEL_PATH_MAX_SIZE,
+    ),
+    BenchmarkCase(
+        "detect_swings[list[Candle]]",
+        lambda n: random_walk(n).to_candles(),
+        lambda candles: detect_swings(candles, "EURUSD", "5M", 5.0),
+        _MODEL_PATH_MAX_SIZE,
+    ),
+    BenchmarkCase(
+        "Candle construction",
+        _fixture_rows,
+        _build_candles,
+        _MODEL_PATH_MAX_SIZE,
+    ),
+    BenchmarkCase(
+        "Candle construction (batch-validated)",
+        _fixture_rows,
+        _build_candles_trusted,
+        _MODEL_PATH_MAX_SIZE,
+    ),
+    BenchmarkCase(
+        "CandleSeries construction",
+        lambda n: _series_columns(random_walk(n)),
+        lambda columns: CandleSeries(*columns),
+    ),
+    BenchmarkCase(
+        "JSON fixture load",
+        _write_fixture,
+        lambda path: _build_candles(json.loads(path.read_text())),
+        _MODEL_PATH_MAX_SIZE,
+        lambda path: shutil.rmtree(path.parent),
+    ),
+    BenchmarkCase(
+        "metrics timed (enabled)",
+        lambda n: (MetricsRegistry(enabled=True), n),
+        _timed_calls,
+        _MODEL_PATH_MAX_SIZE,
+    ),
+    BenchmarkCase(
+        "metrics timed (disabled)",
+        lambda n: (MetricsRegistry(enabled=False), n),
+        _timed_calls,
+        _MODEL_PATH_MAX_SIZE,
+    ),
+)
+
+
+def _time_best(run: Callable[[Any], Any], inputs: Any, repeats: int) -> float:
+    best = float("inf")
+    for _ in range(repeats):
+        gc.collect()
+        started = time.perf_counter()
+        run(inputs)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def _trace_memory(run: Callable[[Any], Any], inputs: Any) -> tuple[int, int]:
+    """Peak traced bytes and memory blocks still held by the result."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        baseline = tracemalloc.take_snapshot()
+        result = run(inputs)
+        _, peak = tracemalloc.get_traced_memory()
+        retained = tracemalloc.take_snapshot().compare_to(baseline, "filename")
+        blocks = sum(stat.count_diff for stat in retained)
+    finally:
+        tracemalloc.stop()
+    del result
+    return peak, blocks
+
+
+def run_benchmarks(
+    sizes: Iterable[int] = DEFAULT_SIZES,
+    cases: Sequence[BenchmarkCase] = CASES,
+    repeats: int = 3,
+    progress: Callable[[dict[str, Any]], None] | None = None,
+) -> dict[str, Any]:
+    """Run every case at every size it supports.
+
+    Args:
+        sizes: Candle counts to benchmark.
+        cases: Paths to benchmark. Defaults to all tracked paths.
+        repeats: Timed runs per (case, size); the fastest is kept. Sizes of
+            1M and above run once.
+        progress: Optional callback receiving each result row as it completes.
+
+    Returns:
+        JSON-serialisable results document (see ``RESULTS_VERSION``).
+    """
+    rows: list[dict[str, Any]] = []
+    for size in sizes:
+        for case in cases:
+            if case.max_size is not None and size > case.max_size:
+                continue
+            inputs = case.setup(size)
+            seconds = _time_best(case.run, inputs, 1 if size >= 1_000_000 else repeats)
+            peak, blocks = _trace_memory(case.run, inputs)
+            row = {
+                "case": case.name,
+                "size": size,
+                "seconds": seconds,
+                "candles_per_s": size / seconds if seconds > 0 else float("inf"),
+                "peak_mb": peak / 2**20,
+                "allocations_per_candle": blocks / size,
+            }
+            rows.append(row)
+            if progress is not None:
+                progress(row)
+            if case.teardown is not None:
+                case.teardown(inputs)
+            del inputs
+    return {
+        "version": RESULTS_VERSION,
+        "created_at": datetime.now(UTC).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "results": rows,
+    }
+
+
+def compare(
+    baseline: dict[str, Any],
+    current: dict[str, Any],
+    threshold: float = DEFAULT_THRESHOLD,
+    min_seconds: float = DEFAULT_MIN_SECONDS,
+) -> list[dict[str, Any]]:
+    """Find (case, size) pairs that got slower than the baseline allows.
+
+    Only pairs present in both documents are compared.
+
+    Args:
+        baseline: A saved ``run_benchmarks`` document.
+        current: The document for the change under test.
+        threshold: Allowed relative slowdown (0.2 = 20% slower).
+        min_seconds: Baseline timings below this are timer noise and are
+            not gated.
+
+    Returns:
+        One entry per regression with both timings and the ratio; empty if
+        nothing regressed.
+
+    Raises:
+        ValueError: If either document has an unsupported version.
+    """
+    for name, doc in (("baseline", baseline), ("current", current)):
+        if doc.get("version") != RESULTS_VERSION:
+            raise ValueError(
+                f"Unsupported {name} results version {doc.get('version')!r}, "
+                f"expected {RESULTS_VERSION}"
+            )
+    before = {(r["case"], r["size"]): r["seconds"] for r in baseline["results"]}
+    regressions = []
+    for row in current["results"]:
+        key = (row["case"], row["size"])
+        if key not in before or before[key] < min_seconds:
+            continue
+        ratio = row["seconds"] / before[key]
+        if ratio > 1 + threshold:
+            regressions.append(
+                {
+                    "case": row["case"],
+                    "size": row["size"],
+                    "baseline_seconds": before[key],
+                    "seconds": row["seconds"],
+                    "ratio": ratio,
+                }
+            )
+    return regressions
+
+
+def format_row(row: dict[str, Any]) -> str:
+    """One human-readable line per result row."""
+    return (
+        f"{row['case']:<30} {row['size']:>10,} {row['seconds'] * 1e3:>11.2f} ms "
+        f"{row['candles_per_s']:>14,.0f}/s {row['peak_mb']:>9.1f} MB "
+        f"{row['allocations_per_candle']:>8.2f} allocs/candle"
+    )
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """CLI entry point. Returns 1 when ``--compare`` finds a regression."""
+    import argparse
+
+    parser = argparse.ArgumentParser(prog="python -m tests.benchmarks", description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES))
+    parser.add_argument("--cases", nargs="+", help="Case names to run (default: all)")
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--output", type=Path, help="Write results JSON here")
+    parser.add_argument("--compare", type=Path, help="Baseline results JSON to gate against")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    parser.add_argument("--min-seconds", type=float, default=DEFAULT_MIN_SECONDS)
+    args = parser.parse_args(argv)
+
+    cases = CASES
+    if args.cases:
+        unknown = set(args.cases) - {c.name for c in CASES}
+        if unknown:
+            parser.error(f"Unknown cases: {sorted(unknown)}")
+        cases = tuple(c for c in CASES if c.name in args.cases)
+
+    results = run_benchmarks(
+        args.sizes, cases, args.repeats, progress=lambda row: print(format_row(row), flush=True)
+    )
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2))
+
+    if args.compare:
+        regressions = compare(
+            json.loads(args.compare.read_text()), results, args.threshold, args.min_seconds
+        )
+        for r in regressions:
+            print(
+                f"REGRESSION {r['case']} @ {r['size']:,}: "
+                f"{r['baseline_seconds'] * 1e3:.2f} ms -> {r['seconds'] * 1e3:.2f} ms "
+                f"({r['ratio']:.2f}x)",
+                file=sys.stderr,
+            )
+        return 1 if regressions else 0
+    return 0
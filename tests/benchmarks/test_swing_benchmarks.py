@@ -0,0 +1,114 @@
+"""Tests for the benchmark harness.
+
+Covers:
+  - Synthetic random walks are valid, deterministic series
+  - Regression gating in ``compare`` (threshold, noise floor, versions)
+  - Default sizes up to 10M, with per-candle model paths capped at 1M
+  - A small end-to-end run and the CLI exit code (``slow``)
+"""
+
+import json
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from tests.benchmarks.harness import (
+    CASES,
+    DEFAULT_SIZES,
+    RESULTS_VERSION,
+    BenchmarkCase,
+    compare,
+    main,
+    random_walk,
+    run_benchmarks,
+)
+
+
+def _doc(*rows: tuple[str, int, float]) -> dict:
+    return {
+        "version": RESULTS_VERSION,
+        "results": [{"case": c, "size": n, "seconds": s} for c, n, s in rows],
+    }
+
+
+class TestRandomWalk:
+    """Benchmark inputs must be realistic and repeatable."""
+
+    def test_series_is_valid_and_deterministic(self) -> None:
+        a, b = random_walk(5_000), random_walk(5_000)
+        a.validate()
+        np.testing.assert_array_equal(a.close, b.close)
+        assert len(a) == 5_000
+
+
+class TestSizes:
+    """The default run reaches 10M candles on the array paths only."""
+
+    def test_defaults_reach_10m_with_model_paths_capped(self) -> None:
+        assert max(DEFAULT_SIZES) == 10_000_000
+        at_10m = {c.name for c in CASES if c.max_size is None or c.max_size >= 10_000_000}
+        assert at_10m == {"detect_swings_array", "CandleSeries construction"}
+
+    def test_cases_are_skipped_above_their_cap(self) -> None:
+        cases = [
+            BenchmarkCase("capped", lambda n: n, lambda n: None, max_size=1_000),
+            BenchmarkCase("uncapped", lambda n: n, lambda n: None),
+        ]
+        results = run_benchmarks(sizes=[1_000, 2_000], cases=cases, repeats=1)
+        assert [(r["case"], r["size"]) for r in results["results"]] == [
+            ("capped", 1_000),
+            ("uncapped", 1_000),
+            ("uncapped", 2_000),
+        ]
+
+
+class TestCompare:
+    """Regression gating."""
+
+    def test_slowdown_beyond_threshold_is_reported(self) -> None:
+        baseline = _doc(("detect_swings_array", 100_000, 0.010), ("x", 1_000, 0.010))
+        current = _doc(("detect_swings_array", 100_000, 0.013), ("x", 1_000, 0.011))
+        regressions = compare(baseline, current, threshold=0.2)
+        assert [(r["case"], r["size"]) for r in regressions] == [("detect_swings_array", 100_000)]
+        assert regressions[0]["ratio"] == pytest.approx(1.3)
+
+    def test_speedups_and_new_cases_pass(self) -> None:
+        baseline = _doc(("a", 1_000, 0.010))
+        current = _doc(("a", 1_000, 0.002), ("b", 1_000, 5.0))
+        assert compare(baseline, current) == []
+
+    def test_sub_millisecond_baselines_are_not_gated(self) -> None:
+        assert compare(_doc(("a", 1_000, 0.0002)), _doc(("a", 1_000, 0.0009))) == []
+
+    def test_version_mismatch_raises(self) -> None:
+        with pytest.raises(ValueError, match="version"):
+            compare({"version": 0, "results": []}, _doc())
+
+
+@pytest.mark.slow
+class TestEndToEnd:
+    """Small real runs of every tracked path."""
+
+    def test_run_records_every_case(self) -> None:
+        results = run_benchmarks(sizes=[1_000], repeats=1)
+        assert results["version"] == RESULTS_VERSION
+        assert [r["case"] for r in results["results"]] == [c.name for c in CASES]
+        for row in results["results"]:
+            assert row["seconds"] > 0
+            assert row["candles_per_s"] > 0
+            assert row["peak_mb"] >= 0
+        json.dumps(results)
+
+    def test_cli_writes_results_and_gates(self, tmp_path: Path) -> None:
+        output = tmp_path / "bench.json"
+        args = ["--sizes", "2000", "--repeats", "1", "--cases", "detect_swings_array"]
+        assert main([*args, "--output", str(output)]) == 0
+        assert json.loads(output.read_text())["results"][0]["size"] == 2_000
+
+        # A baseline claiming 1 s for this case can never be regressed against...
+        fast = tmp_path / "fast.json"
+        fast.write_text(json.dumps(_doc(("detect_swings_array", 2_000, 1.0))))
+        assert main([*args, "--compare", str(fast)]) == 0
+        # ...while a threshold of -100% turns any timing into a regression.
+        assert main([*args, "--compare", str(fast), "--threshold", "-1.0"]) == 1
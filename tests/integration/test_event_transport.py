@@ -0,0 +1,70 @@
+"""Integration tests for the PostgreSQL LISTEN/NOTIFY event transport.
+
+Skipped unless LOCAL_DATABASE_URL points at a reachable PostgreSQL (see
+tests/integration/test_database.py for the docker-compose setup).
+"""
+
+import asyncio
+import os
+from datetime import datetime
+
+import pytest
+
+from src.domain.structure.models import Candle
+from src.events.bus import EventBus
+from src.events.models import CandleClosed
+from src.events.transport import PostgresNotifyTransport
+
+pytestmark = pytest.mark.integration
+
+
+@pytest.fixture
+def dsn() -> str:
+    dsn = os.environ.get("LOCAL_DATABASE_URL")
+    if not dsn:
+        pytest.skip("LOCAL_DATABASE_URL not set")
+    psycopg2 = pytest.importorskip("psycopg2")
+    try:
+        psycopg2.connect(dsn).close()
+    except psycopg2.OperationalError as exc:
+        pytest.skip(f"PostgreSQL unreachable: {exc}")
+    return dsn
+
+
+def test_events_cross_buses_over_notify(dsn: str) -> None:
+    async def scenario() -> list[CandleClosed]:
+        received: list[CandleClosed] = []
+        done = asyncio.Event()
+
+        async def handler(events: list[CandleClosed]) -> None:
+            received.extend(events)
+            if len(received) == 3:
+                done.set()
+
+        consumer = EventBus(PostgresNotifyTransport(dsn))
+        consumer.subscribe(CandleClosed, handler)
+        producer = EventBus(PostgresNotifyTransport(dsn))
+        await consumer.start()
+        await producer.start()
+        events = [
+            CandleClosed(
+                candle=Candle(
+                    pair="EURUSD",
+                    timeframe="5M",
+                    open_time=datetime(2025, 2, 3, 0, 5 * i),
+                    open=1.1,
+                    high=1.2,
+                    low=1.0,
+                    close=1.15,
+                )
+            )
+            for i in range(3)
+        ]
+        await producer.publish_many(events)
+        await asyncio.wait_for(done.wait(), 5.0)
+        await producer.close()
+        await consumer.close()
+        assert received == events
+        return received
+
+    assert len(asyncio.run(scenario())) == 3
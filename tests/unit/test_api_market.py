@@ -0,0 +1,279 @@
+"""Unit tests for the streaming candle and swing endpoints.
+
+Covers:
+  - NDJSON candle streaming, date-range bounds and chunking
+  - Swing detection over a range, including swings on the range edges
+  - min_swing_pips defaults from config and explicit overrides
+  - gzip negotiation and Arrow format negotiation
+  - Detection running off the event loop, through the swing cache
+  - Unknown pairs and timeframes rejected before the store is touched
+"""
+
+import asyncio
+import json
+from collections.abc import Iterator
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+import orjson
+import pytest
+from fastapi.testclient import TestClient
+
+from src.api import encoding
+from src.api.dependencies import (
+    ApiSettings,
+    get_api_settings,
+    get_candle_store,
+    get_swing_cache,
+)
+from src.api.main import app
+from src.api.routes import market
+from src.domain.market_data.store import CandleStore
+from src.domain.structure import swing_cache
+from src.domain.structure.models import Candle, CandleSeries
+from src.domain.structure.swing_cache import SwingCache
+from src.domain.structure.swing_detection import detect_swings_array
+
+FIXTURES_PATH = Path(__file__).parent.parent / "fixtures" / "candles.json"
+
+
+def _fixture_series() -> CandleSeries:
+    data = json.loads(FIXTURES_PATH.read_text())
+    return CandleSeries.from_candles(
+        [
+            Candle(
+                pair=data["pair"],
+                timeframe=data["timeframe"],
+                open_time=datetime.fromisoformat(row["open_time"]),
+                open=row["open"],
+                high=row["high"],
+                low=row["low"],
+                close=row["close"],
+            )
+            for row in data["candles"]
+        ]
+    )
+
+
+@pytest.fixture
+def series() -> CandleSeries:
+    return _fixture_series()
+
+
+@pytest.fixture
+def client(tmp_path: Path, series: CandleSeries) -> Iterator[TestClient]:
+    store = CandleStore(tmp_path)
+    store.append(series)
+    app.dependency_overrides[get_candle_store] = lambda: store
+    app.dependency_overrides[get_api_settings] = lambda: ApiSettings(
+        candle_store_dir=tmp_path, stream_chunk_rows=7
+    )
+    cache = SwingCache()
+    app.dependency_overrides[get_swing_cache] = lambda: cache
+    with TestClient(app) as test_client:
+        yield test_client
+    app.dependency_overrides.clear()
+
+
+def _rows(body: bytes) -> list[dict]:
+    return [orjson.loads(line) for line in body.splitlines()]
+
+
+class TestCandles:
+    """GET /candles/{pair}/{timeframe}."""
+
+    def test_streams_every_candle_as_ndjson(self, client: TestClient, series: CandleSeries) -> None:
+        response = client.get("/candles/EURUSD/1H")
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/x-ndjson"
+        assert response.headers["x-row-count"] == str(len(series))
+        rows = _rows(response.content)
+        assert len(rows) == len(series)
+        first = series[0]
+        assert rows[0] == {
+            "open_time": first.open_time.isoformat(),
+            "open": first.open,
+            "high": first.high,
+            "low": first.low,
+            "close": first.close,
+        }
+        assert [r["close"] for r in rows] == series.close.tolist()
+
+    def test_range_is_half_open(self, client: TestClient) -> None:
+        response = client.get(
+            "/candles/EURUSD/1H",
+            params={"start": "2025-02-03T00:00:00", "end": "2025-02-03T03:00:00"},
+        )
+        times = [r["open_time"] for r in _rows(response.content)]
+        assert times == ["2025-02-03T00:00:00", "2025-02-03T01:00:00", "2025-02-03T02:00:00"]
+
+    def test_offset_bounds_are_converted_to_utc(self, client: TestClient) -> None:
+        response = client.get(
+            "/candles/EURUSD/1H",
+            params={"start": "2025-02-03T01:00:00+01:00", "end": "2025-02-03T01:00:00Z"},
+        )
+        assert [r["open_time"] for r in _rows(response.content)] == ["2025-02-03T00:00:00"]
+
+    def test_pair_and_timeframe_are_case_insensitive(self, client: TestClient) -> None:
+        assert client.get("/candles/eurusd/1h").status_code == 200
+
+    def test_empty_range(self, client: TestClient) -> None:
+        response = client.get("/candles/EURUSD/1H", params={"start": "2030-01-01T00:00:00"})
+        assert response.status_code == 200
+        assert response.content == b""
+        assert response.headers["x-row-count"] == "0"
+
+    def test_unknown_series_is_404(self, client: TestClient) -> None:
+        response = client.get("/candles/GBPUSD/1H")
+        assert response.status_code == 404
+        assert "GBPUSD 1H" in response.json()["detail"]
+
+
+class TestSeriesKey:
+    """Path segments are validated before any filesystem access."""
+
+    @pytest.mark.parametrize(
+        ("path", "detail"),
+        [
+            ("/candles/%2E%2E/1H", "Unknown pair '..'"),
+            ("/candles/EURUSD/%2E%2E", "Unsupported timeframe '..'"),
+            ("/swings/%2E%2E/1H", "Unknown pair '..'"),
+            ("/swings/XAUUSD/1H", "Unknown pair 'XAUUSD'"),
+            ("/swings/EURUSD/1Y", "Unsupported timeframe '1Y'"),
+        ],
+    )
+    def test_rejected_without_reading(
+        self, client: TestClient, monkeypatch: pytest.MonkeyPatch, path: str, detail: str
+    ) -> None:
+        def read(*args: object) -> None:
+            raise AssertionError("store read for an invalid series")
+
+        monkeypatch.setattr(CandleStore, "read", read)
+        response = client.get(path)
+        assert response.status_code == 404
+        assert response.json()["detail"].startswith(detail)
+
+    def test_stored_but_unconfigured_pair_is_404(
+        self, client: TestClient, tmp_path: Path, series: CandleSeries
+    ) -> None:
+        CandleStore(tmp_path).append(
+            CandleSeries(
+                "XAUUSD",
+                "1H",
+                series.open_time,
+                series.open,
+                series.high,
+                series.low,
+                series.close,
+            )
+        )
+        assert client.get("/candles/XAUUSD/1H").status_code == 404
+
+
+class TestSwings:
+    """GET /swings/{pair}/{timeframe}."""
+
+    def test_matches_detect_swings_array(self, client: TestClient, series: CandleSeries) -> None:
+        expected = detect_swings_array(
+            series.open_time, series.high, series.low, "EURUSD", min_swing_pips=5.0
+        )
+        rows = _rows(client.get("/swings/EURUSD/1H").content)
+        assert [r["open_time"] for r in rows] == np.datetime_as_string(
+            expected["open_time"], unit="s"
+        ).tolist()
+        assert [r["type"] for r in rows] == expected["type"].tolist()
+        assert [r["price"] for r in rows] == expected["price"].tolist()
+
+    def test_explicit_filter_overrides_config(
+        self, client: TestClient, series: CandleSeries
+    ) -> None:
+        unfiltered = detect_swings_array(series.open_time, series.high, series.low)
+        rows = _rows(client.get("/swings/EURUSD/1H", params={"min_swing_pips": 0}).content)
+        assert len(rows) == len(unfiltered)
+
+    def test_swings_on_range_edges_are_confirmed(
+        self, client: TestClient, series: CandleSeries
+    ) -> None:
+        swings = detect_swings_array(series.open_time, series.high, series.low)
+        edge = swings["open_time"][len(swings) // 2]
+        after = edge + np.timedelta64(1, "h")
+        params = {"start": str(edge), "end": str(after), "min_swing_pips": 0}
+        rows = _rows(client.get("/swings/EURUSD/1H", params=params).content)
+        assert rows
+        assert {r["open_time"] for r in rows} == {np.datetime_as_string(edge, unit="s")}
+
+    def test_negative_filter_rejected(self, client: TestClient) -> None:
+        response = client.get("/swings/EURUSD/1H", params={"min_swing_pips": -1})
+        assert response.status_code == 422
+
+    def test_detection_runs_off_the_event_loop(
+        self, client: TestClient, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        loops: list[bool] = []
+        detect = swing_cache.detect_swings_array
+
+        def spy(*args: object, **kwargs: object) -> np.ndarray:
+            try:
+                asyncio.get_running_loop()
+                loops.append(True)
+            except RuntimeError:
+                loops.append(False)
+            return detect(*args, **kwargs)
+
+        monkeypatch.setattr(swing_cache, "detect_swings_array", spy)
+        assert client.get("/swings/EURUSD/1H").status_code == 200
+        assert loops == [False]
+
+    def test_repeated_queries_reuse_the_cache(self, client: TestClient) -> None:
+        first = client.get("/swings/EURUSD/1H").content
+        windowed = client.get("/swings/EURUSD/1H", params={"start": "2025-02-03T05:00:00"})
+        assert client.get("/swings/EURUSD/1H").content == first
+        assert windowed.status_code == 200
+        stats = app.dependency_overrides[get_swing_cache]().stats()
+        assert (stats.misses, stats.hits) == (1, 2)
+
+
+class TestNegotiation:
+    """Compression and wire-format negotiation."""
+
+    def test_gzip_when_accepted(self, client: TestClient) -> None:
+        response = client.get("/candles/EURUSD/1H", headers={"Accept-Encoding": "gzip"})
+        assert response.headers["content-encoding"] == "gzip"
+        assert len(_rows(response.content)) == 26
+
+    def test_identity_when_gzip_not_accepted(self, client: TestClient) -> None:
+        response = client.get("/candles/EURUSD/1H", headers={"Accept-Encoding": "identity"})
+        assert "content-encoding" not in response.headers
+        assert len(_rows(response.content)) == 26
+
+    def test_arrow_without_pyarrow_is_406(
+        self, client: TestClient, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(market, "arrow_available", lambda: False)
+        response = client.get("/candles/EURUSD/1H", params={"format": "arrow"})
+        assert response.status_code == 406
+        accept = {"Accept": encoding.ARROW_MEDIA_TYPE}
+        assert client.get("/swings/EURUSD/1H", headers=accept).status_code == 406
+
+    def test_arrow_round_trip(self, client: TestClient, series: CandleSeries) -> None:
+        pa = pytest.importorskip("pyarrow")
+        response = client.get("/candles/EURUSD/1H", headers={"Accept": encoding.ARROW_MEDIA_TYPE})
+        assert response.headers["content-type"] == encoding.ARROW_MEDIA_TYPE
+        table = pa.ipc.open_stream(response.content).read_all()
+        assert table.num_rows == len(series)
+        assert table.column("high").to_pylist() == series.high.tolist()
+
+
+class TestEncoding:
+    """The NDJSON encoder on its own."""
+
+    def test_chunks_split_on_row_boundaries(self) -> None:
+        columns = {"x": np.arange(5), "y": np.array(["a", "b", "c", "d", "e"])}
+        chunks = list(encoding.iter_ndjson(columns, chunk_rows=2))
+        assert len(chunks) == 3
+        assert _rows(b"".join(chunks)) == [{"x": i, "y": "abcde"[i]} for i in range(5)]
+
+    def test_unequal_columns_rejected(self) -> None:
+        with pytest.raises(ValueError, match="equal lengths"):
+            list(encoding.iter_ndjson({"x": np.arange(2), "y": np.arange(3)}))
@@ -0,0 +1,220 @@
+"""Unit tests for the vectorised backtester.
+
+Covers:
+  - WIN / LOSS / EXPIRED outcomes and result_r for LONG and SHORT
+  - Stop-first resolution when one candle hits both levels
+  - Several R targets per signal, min_dol_r cancellation
+  - Unresolved trades at the end of the data
+  - strategy_defaults fallbacks and input validation
+  - Parity with a candle-by-candle replay on a random walk
+"""
+
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from src.domain.execution.models import TradeDirection, TradeOutcome
+from src.domain.research.backtest import (
+    BacktestSignal,
+    backtest,
+    backtest_array,
+)
+from src.domain.structure.models import CandleSeries
+
+_T0 = datetime(2025, 2, 3, 0, 0)
+
+
+def _series(bars: list[tuple[float, float, float, float]]) -> CandleSeries:
+    """1H candles from (open, high, low, close) tuples starting at _T0."""
+    o, h, lo, c = (np.array(col, dtype=np.float64) for col in zip(*bars, strict=True))
+    times = np.datetime64(_T0, "us") + np.arange(len(bars)) * np.timedelta64(1, "h")
+    return CandleSeries("EURUSD", "1H", times, o, h, lo, c)
+
+
+def _long(stop: float = 1.0990, dol: float | None = None) -> BacktestSignal:
+    return BacktestSignal(
+        entry_time=_T0 + timedelta(hours=1),
+        direction=TradeDirection.LONG,
+        entry_price=1.1000,
+        stop_loss=stop,
+        dol_price=dol,
+    )
+
+
+def _short() -> BacktestSignal:
+    return BacktestSignal(
+        entry_time=_T0 + timedelta(hours=1),
+        direction=TradeDirection.SHORT,
+        entry_price=1.1000,
+        stop_loss=1.1010,
+    )
+
+
+# Entry candle (ignored: opens before the entry time) followed by quiet bars.
+_FLAT = (1.1000, 1.1002, 1.0998, 1.1000)
+
+
+class TestOutcomes:
+    """Single-signal outcomes."""
+
+    def test_long_win(self) -> None:
+        candles = _series([_FLAT, _FLAT, (1.1000, 1.1025, 1.0995, 1.1020), *[_FLAT] * 5])
+        [trade] = backtest(candles, [_long()], target_r=(2.0,), expiry_hours=5)
+        assert trade.outcome is TradeOutcome.WIN
+        assert trade.result_r == 2.0
+        assert trade.take_profit == pytest.approx(1.1020)
+        assert trade.exit_time == _T0 + timedelta(hours=2)
+
+    def test_long_loss(self) -> None:
+        candles = _series([_FLAT, (1.1000, 1.1005, 1.0985, 1.0990), *[_FLAT] * 5])
+        [trade] = backtest(candles, [_long()], expiry_hours=5)
+        assert trade.outcome is TradeOutcome.LOSS
+        assert trade.result_r == -1.0
+        assert trade.exit_price == 1.0990
+        assert trade.exit_time == _T0 + timedelta(hours=1)
+
+    def test_candle_hitting_both_resolves_stop_first(self) -> None:
+        candles = _series([_FLAT, (1.1000, 1.1030, 1.0980, 1.1000), *[_FLAT] * 5])
+        [trade] = backtest(candles, [_long()], expiry_hours=5)
+        assert trade.outcome is TradeOutcome.LOSS
+
+    def test_expired_is_marked_at_last_live_close(self) -> None:
+        candles = _series([_FLAT, *[_FLAT] * 4, (1.1000, 1.1008, 1.0999, 1.1005), *[_FLAT] * 3])
+        [trade] = backtest(candles, [_long()], expiry_hours=5)
+        assert trade.outcome is TradeOutcome.EXPIRED
+        assert trade.exit_time == _T0 + timedelta(hours=5)
+        assert trade.exit_price == 1.1005
+        assert trade.result_r == pytest.approx(0.5)
+
+    def test_short_mirrors_long(self) -> None:
+        candles = _series([_FLAT, _FLAT, (1.1000, 1.1005, 1.0975, 1.0980), *[_FLAT] * 5])
+        [trade] = backtest(candles, [_short()], target_r=(2.0,), expiry_hours=5)
+        assert trade.outcome is TradeOutcome.WIN
+        assert trade.take_profit == pytest.approx(1.0980)
+
+    def test_several_targets(self) -> None:
+        candles = _series(
+            [_FLAT, (1.1000, 1.1025, 1.0995, 1.1020), (1.1020, 1.1022, 1.0980, 1.0985), _FLAT]
+        )
+        trades = backtest(candles, [_long()], target_r=(2.0, 3.0), expiry_hours=2)
+        assert [(t.target_r, t.outcome, t.result_r) for t in trades] == [
+            (2.0, TradeOutcome.WIN, 2.0),
+            (3.0, TradeOutcome.LOSS, -1.0),
+        ]
+
+    def test_dol_too_close_is_cancelled(self) -> None:
+        candles = _series([_FLAT] * 8)
+        near, far = _long(dol=1.1010), _long(dol=1.1030)
+        trades = backtest(candles, [near, far], expiry_hours=5, min_dol_r=1.5)
+        assert trades[0].outcome is TradeOutcome.CANCELLED
+        assert trades[0].result_r == 0.0
+        assert trades[0].exit_price is None
+        assert trades[1].outcome is TradeOutcome.EXPIRED
+
+    def test_unresolved_at_end_of_data(self) -> None:
+        candles = _series([_FLAT] * 4)
+        [trade] = backtest(candles, [_long()], expiry_hours=5)
+        assert trade.outcome is None
+        assert trade.result_r is None
+
+
+class TestDefaultsAndValidation:
+    """strategy_defaults fallbacks and argument checks."""
+
+    def test_expiry_defaults_to_strategy_defaults(self) -> None:
+        # tolerances.json: expiry_hours = 48
+        candles = _series([_FLAT] * 60)
+        [trade] = backtest(candles, [_long()])
+        assert trade.outcome is TradeOutcome.EXPIRED
+        assert trade.exit_time == _T0 + timedelta(hours=48)
+
+    def test_min_dol_r_defaults_to_strategy_defaults(self) -> None:
+        # tolerances.json: min_dol_r = 1.5 -> a 1.2R DOL is cancelled
+        candles = _series([_FLAT] * 8)
+        [trade] = backtest(candles, [_long(dol=1.1012)], expiry_hours=5)
+        assert trade.outcome is TradeOutcome.CANCELLED
+
+    def test_stop_on_wrong_side_rejected(self) -> None:
+        with pytest.raises(ValueError, match="must be below entry_price"):
+            backtest(_series([_FLAT] * 4), [_long(stop=1.1010)], expiry_hours=5)
+
+    def test_non_positive_target_rejected(self) -> None:
+        with pytest.raises(ValueError, match="target_r"):
+            backtest(_series([_FLAT] * 4), [_long()], target_r=(0.0,), expiry_hours=5)
+
+    def test_no_signals(self) -> None:
+        assert backtest(_series([_FLAT] * 4), [], expiry_hours=5) == []
+
+
+def _replay(
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    first: int,
+    last: int,
+    n: int,
+    is_long: bool,
+    entry: float,
+    stop: float,
+    target: float,
+) -> tuple[str, int]:
+    """Reference candle-by-candle simulation of one trade."""
+    for i in range(first, last):
+        hit_stop = low[i] <= stop if is_long else high[i] >= stop
+        hit_target = high[i] >= target if is_long else low[i] <= target
+        if hit_stop:
+            return "LOSS", i
+        if hit_target:
+            return "WIN", i
+    if last >= n:
+        return "", -1
+    return "EXPIRED", last - 1 if last > first else -1
+
+
+class TestReplayParity:
+    """The vectorised scan agrees with a naive replay."""
+
+    @pytest.mark.parametrize("chunk_size", [1, 7, 2048])
+    def test_random_walk(self, chunk_size: int) -> None:
+        rng = np.random.default_rng(3)
+        n = 3_000
+        close = 1.1 + np.cumsum(rng.normal(0, 0.0005, n))
+        open_ = np.concatenate([[1.1], close[:-1]])
+        high = np.maximum(open_, close) + np.abs(rng.normal(0, 0.0003, n))
+        low = np.minimum(open_, close) - np.abs(rng.normal(0, 0.0003, n))
+        open_time = np.datetime64("2025-01-01", "us") + np.arange(n) * np.timedelta64(5, "m")
+
+        m = 400
+        at = rng.integers(0, n, m)
+        entry_time = open_time[at] + np.timedelta64(150, "s")
+        is_long = rng.random(m) < 0.5
+        entry = close[at]
+        risk = rng.uniform(0.0005, 0.003, m)
+        stop = np.where(is_long, entry - risk, entry + risk)
+
+        results = backtest_array(
+            open_time,
+            high,
+            low,
+            close,
+            entry_time,
+            is_long,
+            entry,
+            stop,
+            target_r=(1.0, 3.0),
+            expiry_hours=8,
+            chunk_size=chunk_size,
+        )
+        assert len(results) == 2 * m
+        outcomes = set()
+        for row in results:
+            i = int(row["signal"])
+            first = int(np.searchsorted(open_time, entry_time[i]))
+            last = int(np.searchsorted(open_time, entry_time[i] + np.timedelta64(8, "h")))
+            outcome, exit_index = _replay(
+                high, low, close, first, last, n, is_long[i], entry[i], stop[i], row["take_profit"]
+            )
+            assert (row["outcome"], row["exit_index"]) == (outcome, exit_index)
+            outcomes.add(outcome)
+        assert {"WIN", "LOSS", "EXPIRED"} <= outcomes
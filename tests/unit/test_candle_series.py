@@ -0,0 +1,222 @@
+"""Unit tests for the array-backed CandleSeries container.
+
+Covers:
+  - Construction from Candle models and from raw columns
+  - Vectorised OHLC consistency and ordering validation
+  - Zero-copy slicing and lazy Candle materialisation
+  - detect_swings accepting a CandleSeries directly
+  - Timezone-aware open times normalised to naive UTC on every path
+"""
+
+import json
+import warnings
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from src.domain.structure.models import Candle, CandleSeries
+from src.domain.structure.swing_detection import detect_swings
+
+FIXTURES_PATH = Path(__file__).parent.parent / "fixtures" / "candles.json"
+
+_T0 = datetime(2025, 1, 1, 0, 0, 0)
+_T1 = datetime(2025, 1, 1, 1, 0, 0)
+_T2 = datetime(2025, 1, 1, 2, 0, 0)
+
+
+def _fixture_candles() -> list[Candle]:
+    data = json.loads(FIXTURES_PATH.read_text())
+    return [
+        Candle(
+            pair=data["pair"],
+            timeframe=data["timeframe"],
+            open_time=datetime.fromisoformat(row["open_time"]),
+            open=row["open"],
+            high=row["high"],
+            low=row["low"],
+            close=row["close"],
+        )
+        for row in data["candles"]
+    ]
+
+
+def _series(
+    open_: list[float],
+    high: list[float],
+    low: list[float],
+    close: list[float],
+    times: list[datetime] | None = None,
+) -> CandleSeries:
+    times = times or [_T0, _T1, _T2][: len(open_)]
+    return CandleSeries(
+        "EURUSD", "1H", np.array(times, dtype="datetime64[us]"), open_, high, low, close
+    )
+
+
+class TestCandleSeriesConstruction:
+    """Building series from models and columns."""
+
+    def test_from_candles_round_trips(self) -> None:
+        candles = _fixture_candles()
+        series = CandleSeries.from_candles(candles)
+        assert len(series) == len(candles)
+        assert series.pair == "EURUSD"
+        assert series.timeframe == "1H"
+        assert series.to_candles() == candles
+
+    def test_columns_are_contiguous_float64(self) -> None:
+        series = CandleSeries.from_candles(_fixture_candles())
+        assert series.open_time.dtype == np.dtype("datetime64[us]")
+        for col in (series.open, series.high, series.low, series.close):
+            assert col.dtype == np.float64
+            assert col.flags.c_contiguous
+
+    def test_nbytes_is_40_bytes_per_candle(self) -> None:
+        series = CandleSeries.from_candles(_fixture_candles())
+        assert series.nbytes == 40 * len(series)
+
+    def test_from_empty_list_raises(self) -> None:
+        with pytest.raises(ValueError, match="At least 1 candle"):
+            CandleSeries.from_candles([])
+
+    def test_from_mixed_timeframes_raises(self) -> None:
+        candles = _fixture_candles()[:2]
+        mixed = [candles[0], candles[1].model_copy(update={"timeframe": "4H"})]
+        with pytest.raises(ValueError, match="Mixed series"):
+            CandleSeries.from_candles(mixed)
+
+
+class TestCandleSeriesValidation:
+    """Vectorised checks mirror Candle.validate_ohlc_consistency."""
+
+    def test_high_below_open_reports_index(self) -> None:
+        with pytest.raises(ValueError, match=r"index 1: high .* must be >= open"):
+            _series([1.02, 1.03], [1.03, 1.02], [1.01, 1.01], [1.02, 1.02])
+
+    def test_low_above_close_raises(self) -> None:
+        with pytest.raises(ValueError, match=r"low .* must be <= close"):
+            _series([1.023], [1.025], [1.022], [1.020])
+
+    def test_first_violation_wins(self) -> None:
+        with pytest.raises(ValueError, match="index 0"):
+            _series([1.02, 1.02], [1.03, 1.01], [1.025, 1.00], [1.02, 1.00])
+
+    def test_duplicate_timestamps_raise(self) -> None:
+        with pytest.raises(ValueError, match="sorted ascending"):
+            _series([1.02, 1.02], [1.03, 1.03], [1.01, 1.01], [1.02, 1.02], [_T0, _T0])
+
+    def test_column_length_mismatch_raises(self) -> None:
+        with pytest.raises(ValueError, match="length"):
+            _series([1.02, 1.02], [1.03], [1.01, 1.01], [1.02, 1.02])
+
+    def test_validate_false_skips_checks(self) -> None:
+        times = np.array([_T1, _T0], dtype="datetime64[us]")
+        series = CandleSeries(
+            "EURUSD", "1H", times, [1.0, 1.0], [1.0, 1.0], [1.0, 1.0], [1.0, 1.0], validate=False
+        )
+        assert len(series) == 2
+
+
+class TestCandleSeriesAccess:
+    """Slicing shares buffers; indexing builds Candles on demand."""
+
+    def test_slice_is_zero_copy(self) -> None:
+        series = CandleSeries.from_candles(_fixture_candles())
+        sub = series[5:10]
+        assert len(sub) == 5
+        assert np.shares_memory(sub.high, series.high)
+        assert np.shares_memory(sub.open_time, series.open_time)
+
+    def test_negative_step_slice_raises(self) -> None:
+        series = CandleSeries.from_candles(_fixture_candles())
+        with pytest.raises(ValueError, match="positive step"):
+            series[::-1]
+
+    def test_int_index_returns_candle(self) -> None:
+        candles = _fixture_candles()
+        series = CandleSeries.from_candles(candles)
+        assert series[3] == candles[3]
+        assert series[-1] == candles[-1]
+
+    def test_iteration_is_lazy(self) -> None:
+        series = CandleSeries.from_candles(_fixture_candles())
+        it = iter(series)
+        first = next(it)
+        assert isinstance(first, Candle)
+        assert first.open_time == datetime(2025, 2, 2, 22, 0, 0)
+
+
+class TestDetectSwingsOnSeries:
+    """detect_swings accepts a CandleSeries and matches the list path."""
+
+    def test_series_matches_list_input(self) -> None:
+        candles = _fixture_candles()
+        expected = detect_swings(candles, "EURUSD", "1H", min_swing_pips=5.0)
+        got = detect_swings(CandleSeries.from_candles(candles), "EURUSD", "1H", min_swing_pips=5.0)
+        assert got == expected
+
+    def test_series_slice_matches_list_slice(self) -> None:
+        candles = _fixture_candles()
+        series = CandleSeries.from_candles(candles)
+        assert detect_swings(series[1:], "EURUSD", "1H") == detect_swings(
+            candles[1:], "EURUSD", "1H"
+        )
+
+    def test_short_series_raises(self) -> None:
+        series = CandleSeries.from_candles(_fixture_candles())
+        with pytest.raises(ValueError, match="3 candles"):
+            detect_swings(series[:2], "EURUSD", "1H")
+
+
+class TestAwareOpenTimes:
+    """Aware open times become naive UTC, whichever way candles arrive."""
+
+    _CET = timezone(timedelta(hours=1))
+
+    def _aware_candles(self) -> list[Candle]:
+        return [
+            c.model_copy(update={"open_time": c.open_time.replace(tzinfo=self._CET)})
+            for c in _fixture_candles()
+        ]
+
+    def test_candle_open_time_is_converted(self) -> None:
+        candle = Candle(
+            pair="EURUSD",
+            timeframe="1H",
+            open_time=datetime(2025, 1, 1, 1, 0, tzinfo=self._CET),
+            open=1.1,
+            high=1.2,
+            low=1.0,
+            close=1.1,
+        )
+        assert candle.open_time == _T0
+        assert candle.open_time.tzinfo is None
+
+    def test_every_path_agrees(self) -> None:
+        aware = [
+            Candle.model_validate({**c.model_dump(), "open_time": c.open_time})
+            for c in self._aware_candles()
+        ]
+        naive = _fixture_candles()
+        assert aware == [
+            c.model_copy(update={"open_time": c.open_time - timedelta(hours=1)}) for c in naive
+        ]
+        rows = [
+            (c.open_time.replace(tzinfo=self._CET), c.open, c.high, c.low, c.close) for c in naive
+        ]
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            from_candles = CandleSeries.from_candles(aware)
+            from_rows = CandleSeries.from_rows("EURUSD", "1H", rows)
+        np.testing.assert_array_equal(from_candles.open_time, from_rows.open_time)
+        assert from_candles.to_candles() == aware
+        assert from_candles[0] == aware[0]
+
+    def test_detect_swings_paths_match(self) -> None:
+        aware = [Candle.model_validate(c.model_dump()) for c in self._aware_candles()]
+        expected = detect_swings(aware, "EURUSD", "1H", min_swing_pips=5.0)
+        got = detect_swings(CandleSeries.from_candles(aware), "EURUSD", "1H", min_swing_pips=5.0)
+        assert expected and got == expected
+        assert all(s.open_time.tzinfo is None for s in got)
@@ -0,0 +1,150 @@
+"""Unit tests for the memory-mapped CandleStore."""
+
+import json
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from src.domain.market_data.store import HEADER_SIZE, RECORD_DTYPE, CandleStore
+from src.domain.structure.models import Candle, CandleSeries
+from src.domain.structure.swing_detection import detect_swings
+
+FIXTURES_PATH = Path(__file__).parent.parent / "fixtures" / "candles.json"
+
+
+def _fixture_series() -> CandleSeries:
+    data = json.loads(FIXTURES_PATH.read_text())
+    return CandleSeries.from_candles(
+        [
+            Candle(
+                pair=data["pair"],
+                timeframe=data["timeframe"],
+                open_time=datetime.fromisoformat(row["open_time"]),
+                open=row["open"],
+                high=row["high"],
+                low=row["low"],
+                close=row["close"],
+            )
+            for row in data["candles"]
+        ]
+    )
+
+
+def _columns(series: CandleSeries) -> tuple[np.ndarray, ...]:
+    return series.open_time, series.open, series.high, series.low, series.close
+
+
+@pytest.fixture
+def store(tmp_path: Path) -> CandleStore:
+    return CandleStore(tmp_path)
+
+
+class TestCandleStoreAppend:
+    """Append-only writes of fixed-width records."""
+
+    def test_append_writes_fixed_width_records(self, store: CandleStore) -> None:
+        series = _fixture_series()
+        assert store.append(series) == len(series)
+        size = store.path("EURUSD", "1H").stat().st_size
+        assert size == HEADER_SIZE + len(series) * RECORD_DTYPE.itemsize
+        assert store.count("EURUSD", "1H") == len(series)
+
+    def test_append_in_chunks_equals_single_append(self, store: CandleStore) -> None:
+        series = _fixture_series()
+        store.append(series[:10])
+        store.append(series[10:])
+        stored = store.read("EURUSD", "1H")
+        np.testing.assert_array_equal(stored.open_time, series.open_time)
+        np.testing.assert_array_equal(stored.close, series.close)
+
+    def test_overlapping_rows_are_skipped(self, store: CandleStore) -> None:
+        series = _fixture_series()
+        store.append(series[:15])
+        assert store.append(series[10:]) == len(series) - 15
+        assert store.append(series) == 0
+        assert store.count("EURUSD", "1H") == len(series)
+
+    def test_last_open_time(self, store: CandleStore) -> None:
+        series = _fixture_series()
+        assert store.last_open_time("EURUSD", "1H") is None
+        store.append(series)
+        assert store.last_open_time("EURUSD", "1H") == series.open_time[-1]
+
+    def test_append_after_torn_tail_stays_aligned(self, store: CandleStore) -> None:
+        series = _fixture_series()
+        store.append(series[:10])
+        path = store.path("EURUSD", "1H")
+        with open(path, "ab") as f:
+            f.write(b"\x01" * (RECORD_DTYPE.itemsize // 2))  # interrupted write
+        assert store.count("EURUSD", "1H") == 10
+        assert store.append(series[10:]) == len(series) - 10
+        assert path.stat().st_size == HEADER_SIZE + len(series) * RECORD_DTYPE.itemsize
+        stored = store.read("EURUSD", "1H")
+        for got, expected in zip(_columns(stored), _columns(series), strict=True):
+            np.testing.assert_array_equal(got, expected)
+
+    def test_append_after_torn_header(self, store: CandleStore) -> None:
+        series = _fixture_series()
+        path = store.path("EURUSD", "1H")
+        path.parent.mkdir(parents=True)
+        path.write_bytes(b"FACN")
+        assert store.count("EURUSD", "1H") == 0
+        assert store.append(series) == len(series)
+        np.testing.assert_array_equal(store.read("EURUSD", "1H").close, series.close)
+
+    def test_append_to_foreign_file_raises(self, store: CandleStore) -> None:
+        path = store.path("EURUSD", "1H")
+        path.parent.mkdir(parents=True)
+        path.write_bytes(b"not a candle file at all")
+        with pytest.raises(ValueError, match="bad header"):
+            store.append(_fixture_series())
+        assert path.read_bytes() == b"not a candle file at all"
+
+    def test_series_keys(self, store: CandleStore) -> None:
+        series = _fixture_series()
+        store.append(series)
+        store.append(CandleSeries("GBPUSD", "5M", *_columns(series)))
+        assert store.series_keys() == [("EURUSD", "1H"), ("GBPUSD", "5M")]
+
+
+class TestCandleStoreRead:
+    """Range reads are zero-copy views over the mapping."""
+
+    def test_read_is_memory_mapped_view(self, store: CandleStore) -> None:
+        store.append(_fixture_series())
+        stored = store.read("EURUSD", "1H")
+        assert isinstance(stored.high.base, np.memmap)
+        assert not stored.high.flags.writeable
+
+    def test_range_is_start_inclusive_end_exclusive(self, store: CandleStore) -> None:
+        series = _fixture_series()
+        store.append(series)
+        stored = store.read(
+            "EURUSD", "1H", start=datetime(2025, 2, 3, 0, 0), end=datetime(2025, 2, 3, 6, 0)
+        )
+        assert len(stored) == 6
+        assert stored.open_time[0] == np.datetime64("2025-02-03T00:00")
+        assert stored.open_time[-1] == np.datetime64("2025-02-03T05:00")
+
+    def test_range_outside_data_is_empty(self, store: CandleStore) -> None:
+        store.append(_fixture_series())
+        assert len(store.read("EURUSD", "1H", start=datetime(2030, 1, 1))) == 0
+
+    def test_detect_swings_on_stored_range(self, store: CandleStore) -> None:
+        series = _fixture_series()
+        store.append(series)
+        stored = store.read("EURUSD", "1H")
+        assert detect_swings(stored, "EURUSD", "1H") == detect_swings(series, "EURUSD", "1H")
+
+    def test_missing_series_raises(self, store: CandleStore) -> None:
+        with pytest.raises(FileNotFoundError):
+            store.read("EURUSD", "1H")
+
+    def test_foreign_file_raises(self, store: CandleStore) -> None:
+        path = store.path("EURUSD", "1H")
+        path.parent.mkdir(parents=True)
+        path.write_bytes(b"not a candle file at all")
+        with pytest.raises(ValueError, match="bad header"):
+            store.read("EURUSD", "1H")
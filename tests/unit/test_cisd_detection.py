@@ -0,0 +1,217 @@
+"""Unit tests for CISD detection.
+
+Covers:
+  - Run-length encoding of candle direction (doji runs, empty input)
+  - BULLISH / BEARISH CISDs, series length and open, doji breaking a series
+  - Parity with a candle-walking reference on random 5M data
+  - min_series threshold and argument errors
+  - Streaming detector: parity with batch, open series, ordering, checkpoint
+  - CISDDetected event round trip
+"""
+
+import json
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from src.domain.structure.cisd_detection import (
+    CISD_DTYPE,
+    CISDDetector,
+    OpenSeries,
+    cisd_direction,
+    detect_cisd,
+    detect_cisd_array,
+    encode_runs,
+)
+from src.domain.structure.models import CandleSeries, CISDEvent, Direction
+from src.events import CISDDetected, decode_event, encode_event
+
+_T0 = datetime(2025, 2, 3, 8)
+
+
+def _series(opens: list[float], closes: list[float], pair: str = "EURUSD") -> CandleSeries:
+    open_, close = np.array(opens), np.array(closes)
+    times = np.datetime64(_T0, "us") + np.arange(len(opens)) * np.timedelta64(5, "m")
+    return CandleSeries(
+        pair,
+        "5M",
+        times,
+        open_,
+        np.maximum(open_, close) + 1e-4,
+        np.minimum(open_, close) - 1e-4,
+        close,
+    )
+
+
+def _random_series(n: int, seed: int) -> CandleSeries:
+    rng = np.random.default_rng(seed)
+    # Coarse rounding produces dojis; the occasional gap lets a C2 close
+    # through the series open without reversing direction.
+    step = np.round(rng.normal(0, 2e-4, n), 4)
+    gap = np.where(rng.random(n) < 0.05, np.round(rng.normal(0, 4e-4, n), 4), 0.0)
+    open_ = 1.1 + np.cumsum(gap + np.r_[0.0, step[:-1]])
+    close = open_ + step
+    return _series(open_.tolist(), close.tolist())
+
+
+def _walk(series: CandleSeries, min_series: int = 1) -> list[tuple[int, str, int, int]]:
+    """Reference: walk the candles, tracking the current run."""
+    out = []
+    run_dir, run_len, run_start = 0, 0, 0
+    for i, (o, c) in enumerate(zip(series.open.tolist(), series.close.tolist(), strict=True)):
+        if run_len >= min_series:
+            first_open = series.open[run_start]
+            if run_dir == -1 and c > first_open:
+                out.append((i, "BULLISH", run_len, run_start))
+            elif run_dir == 1 and c < first_open:
+                out.append((i, "BEARISH", run_len, run_start))
+        d = (c > o) - (c < o)
+        if d != 0 and d == run_dir:
+            run_len += 1
+        elif d != 0:
+            run_dir, run_len, run_start = d, 1, i
+        else:
+            run_dir, run_len = 0, 0
+    return out
+
+
+def _rows(series: CandleSeries, events: np.ndarray) -> list[tuple[int, str, int, int]]:
+    c2 = np.searchsorted(series.open_time, events["open_time"])
+    start = np.searchsorted(series.open_time, events["series_start"])
+    return list(
+        zip(
+            c2.tolist(),
+            events["direction"].tolist(),
+            events["series_length"].tolist(),
+            start.tolist(),
+            strict=True,
+        )
+    )
+
+
+class TestEncodeRuns:
+    """Run-length encoding."""
+
+    def test_runs(self) -> None:
+        runs = encode_runs(np.array([1, 1, -1, 0, 0, -1, -1, -1], dtype=np.int8))
+        assert runs["start"].tolist() == [0, 2, 3, 5]
+        assert runs["length"].tolist() == [2, 1, 2, 3]
+        assert runs["direction"].tolist() == [1, -1, 0, -1]
+
+    def test_empty(self) -> None:
+        assert len(encode_runs(np.array([], dtype=np.int8))) == 0
+
+
+class TestDetectCISD:
+    """Batch detection."""
+
+    def test_bullish_and_bearish(self) -> None:
+        # down, down, up through the down series' open, up, down through the up open
+        series = _series([1.10, 1.09, 1.08, 1.105, 1.12], [1.09, 1.08, 1.105, 1.12, 1.07])
+        events = detect_cisd(series)
+        assert [(e.direction, e.series_length, e.series_open) for e in events] == [
+            (Direction.BULLISH, 2, 1.10),
+            (Direction.BEARISH, 2, 1.08),
+        ]
+        assert events[0].open_time == _T0 + timedelta(minutes=10)
+        assert events[0].series_start == _T0
+        assert all(isinstance(e, CISDEvent) for e in events)
+
+    def test_close_must_pass_the_series_open(self) -> None:
+        series = _series([1.10, 1.09, 1.08], [1.09, 1.08, 1.10])  # closes at the open
+        assert detect_cisd(series) == []
+
+    def test_doji_ends_the_series(self) -> None:
+        series = _series([1.10, 1.09, 1.08, 1.08], [1.09, 1.08, 1.08, 1.11])
+        assert detect_cisd(series) == []
+
+    @pytest.mark.parametrize("seed", [1, 2, 3])
+    @pytest.mark.parametrize("min_series", [1, 2])
+    def test_matches_candle_walk(self, seed: int, min_series: int) -> None:
+        series = _random_series(5000, seed)
+        events = detect_cisd_array(series.open_time, series.open, series.close, min_series)
+        assert events.dtype == CISD_DTYPE
+        expected = _walk(series, min_series)
+        assert _rows(series, events) == expected
+        assert len(expected) > 20
+        np.testing.assert_array_equal(
+            events["series_open"], series.open[[start for *_, start in expected]]
+        )
+
+    def test_direction_column(self) -> None:
+        series = _random_series(2000, 4)
+        column = cisd_direction(series.open, series.close, min_series=2)
+        events = detect_cisd_array(series.open_time, series.open, series.close, min_series=2)
+        c2 = np.searchsorted(series.open_time, events["open_time"])
+        assert np.count_nonzero(column) == len(events)
+        np.testing.assert_array_equal(column[c2], np.where(events["direction"] == "BULLISH", 1, -1))
+        assert cisd_direction(np.array([]), np.array([])).tolist() == []
+
+    def test_empty_and_errors(self) -> None:
+        empty = np.array([])
+        assert len(detect_cisd_array(empty.astype("datetime64[us]"), empty, empty)) == 0
+        with pytest.raises(ValueError, match="same length"):
+            detect_cisd_array(np.array(["2025-01-01"], "datetime64[us]"), empty, empty)
+        with pytest.raises(ValueError, match="min_series"):
+            detect_cisd_array(empty.astype("datetime64[us]"), empty, empty, min_series=0)
+
+
+class TestCISDDetector:
+    """Streaming detection."""
+
+    @pytest.mark.parametrize("min_series", [1, 3])
+    def test_matches_batch(self, min_series: int) -> None:
+        series = _random_series(3000, 5)
+        detector = CISDDetector(min_series=min_series)
+        streamed = [e for c in series.to_candles() if (e := detector.update(c)) is not None]
+        assert streamed == detect_cisd(series, min_series)
+
+    def test_open_series(self) -> None:
+        candles = _series([1.10, 1.09, 1.08, 1.08], [1.09, 1.08, 1.07, 1.08]).to_candles()
+        detector = CISDDetector()
+        for candle in candles[:3]:
+            detector.update(candle)
+        assert detector.open_series("EURUSD", "5M") == OpenSeries(-1, 3, _T0, 1.10)
+        detector.update(candles[3])  # doji
+        assert detector.open_series("EURUSD", "5M") is None
+
+    def test_series_are_isolated(self) -> None:
+        detector = CISDDetector()
+        down = _series([1.10], [1.09]).to_candles()[0]
+        up = _series([1.10, 1.09], [1.09, 1.12], pair="GBPUSD").to_candles()
+        detector.update(down)
+        assert detector.update(up[0]) is None
+        event = detector.update(up[1])
+        assert event is not None and event.pair == "GBPUSD"
+        assert detector.open_series("EURUSD", "5M") == OpenSeries(-1, 1, _T0, 1.10)
+
+    def test_rejects_out_of_order(self) -> None:
+        candles = _series([1.1, 1.1], [1.2, 1.0]).to_candles()
+        detector = CISDDetector()
+        detector.update(candles[1])
+        with pytest.raises(ValueError, match="ascending"):
+            detector.update(candles[0])
+
+    def test_checkpoint_restore(self) -> None:
+        candles = _random_series(1000, 6).to_candles()
+        live = CISDDetector(min_series=2)
+        for candle in candles[:500]:
+            live.update(candle)
+        restored = CISDDetector.restore(json.loads(json.dumps(live.checkpoint())))
+        for candle in candles[500:]:
+            assert restored.update(candle) == live.update(candle)
+        with pytest.raises(ValueError, match="version"):
+            CISDDetector.restore({"version": 0})
+
+
+class TestCISDDetected:
+    """Event wrapper."""
+
+    def test_round_trip(self) -> None:
+        [cisd, _] = detect_cisd(
+            _series([1.10, 1.09, 1.08, 1.105, 1.12], [1.09, 1.08, 1.105, 1.12, 1.07])
+        )
+        event = CISDDetected(cisd=cisd)
+        assert event.topic == "cisd.detected"
+        assert decode_event(event.topic, encode_event(event)) == event
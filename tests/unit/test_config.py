@@ -0,0 +1,150 @@
+"""Unit tests for the cached, typed configuration registry."""
+
+import json
+import os
+import shutil
+from datetime import time
+from pathlib import Path
+
+import pytest
+from pydantic import ValidationError
+
+from src.infrastructure.config import (
+    CONFIG_DIR,
+    ConfigRegistry,
+    PairConfig,
+    get_config_registry,
+)
+
+
+@pytest.fixture
+def config_dir(tmp_path: Path) -> Path:
+    """A writable copy of the project config directory."""
+    for name in ("pairs.json", "sessions.json", "tolerances.json"):
+        shutil.copy(CONFIG_DIR / name, tmp_path / name)
+    return tmp_path
+
+
+def _edit(path: Path, mutate) -> None:
+    """Rewrite a JSON file and bump its mtime so the change is always visible."""
+    data = json.loads(path.read_text())
+    mutate(data)
+    stat = path.stat()
+    path.write_text(json.dumps(data))
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+class TestConfigRegistryLookups:
+    """Typed views and O(1) lookups over the real config files."""
+
+    def test_pairs_are_typed(self) -> None:
+        registry = ConfigRegistry()
+        eurusd = registry.pairs.pairs["EURUSD"]
+        assert isinstance(eurusd, PairConfig)
+        assert eurusd.twelvedata_symbol == "EUR/USD"
+
+    def test_pip_values_merge_both_files(self) -> None:
+        registry = ConfigRegistry()
+        assert registry.pip_value("EURUSD") == 0.0001
+        assert registry.pip_value("USDJPY") == 0.01
+
+    def test_unknown_pair_raises_key_error(self) -> None:
+        with pytest.raises(KeyError):
+            ConfigRegistry().pip_value("XYZUSD")
+
+    def test_min_swing_pips_per_timeframe(self) -> None:
+        registry = ConfigRegistry()
+        assert registry.min_swing_pips("1H") == 5.0
+        assert registry.min_swing_pips("D") == 20.0
+        assert registry.min_swing_pips("5M") is None
+
+    def test_session_window_parses_times(self) -> None:
+        window = ConfigRegistry().session_window("LONDON")
+        assert window.start_utc == time(8, 0)
+        assert window.end_utc == time(16, 0)
+
+    def test_process_wide_registry_is_shared(self) -> None:
+        assert get_config_registry() is get_config_registry()
+
+
+class TestConfigRegistryReload:
+    """Files are re-parsed only when their mtime changes."""
+
+    def test_reloads_changed_file(self, config_dir: Path) -> None:
+        registry = ConfigRegistry(config_dir, reload_interval_s=0)
+        _edit(
+            config_dir / "tolerances.json",
+            lambda d: d["swing_detection"]["min_swing_pips"].update({"1H": 7.5}),
+        )
+        assert registry.min_swing_pips("1H") == 7.5
+
+    def test_unchanged_files_are_not_reloaded(self, config_dir: Path) -> None:
+        registry = ConfigRegistry(config_dir, reload_interval_s=0)
+        tolerances = registry.tolerances
+        assert registry.refresh() is False
+        assert registry.tolerances is tolerances
+
+    def test_interval_skips_filesystem_checks(self, config_dir: Path) -> None:
+        registry = ConfigRegistry(config_dir, reload_interval_s=3600)
+        _edit(
+            config_dir / "tolerances.json",
+            lambda d: d["swing_detection"]["min_swing_pips"].update({"1H": 7.5}),
+        )
+        assert registry.min_swing_pips("1H") == 5.0
+        assert registry.refresh() is True
+        assert registry.min_swing_pips("1H") == 7.5
+
+    def test_invalid_edit_keeps_previous_snapshot(self, config_dir: Path) -> None:
+        registry = ConfigRegistry(config_dir, reload_interval_s=0)
+        _edit(config_dir / "pairs.json", lambda d: d["pairs"]["EURUSD"].update({"pip_value": -1}))
+        for _ in range(3):
+            assert registry.pip_value("EURUSD") == 0.0001
+        with pytest.raises(ValidationError):
+            registry.refresh()  # an explicit refresh still reports the error
+        assert registry.pip_value("EURUSD") == 0.0001
+
+    def test_malformed_json_is_parsed_once(
+        self, config_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        registry = ConfigRegistry(config_dir, reload_interval_s=0)
+        path = config_dir / "tolerances.json"
+        path.write_text("{not json")
+        os.utime(path, ns=(0, path.stat().st_mtime_ns + 1_000_000_000))
+        reads = []
+        read_text = Path.read_text
+        monkeypatch.setattr(Path, "read_text", lambda p: reads.append(p.name) or read_text(p))
+        for _ in range(3):
+            assert registry.pip_value("EURUSD") == 0.0001
+            assert registry.min_swing_pips("1H") == 5.0
+        assert reads == ["tolerances.json"]
+
+        # A fixed file is picked up again.
+        shutil.copy(CONFIG_DIR / "tolerances.json", path)
+        _edit(path, lambda d: d["swing_detection"]["min_swing_pips"].update({"1H": 7.5}))
+        assert registry.min_swing_pips("1H") == 7.5
+
+    def test_pip_change_split_across_files_lands(self, config_dir: Path) -> None:
+        registry = ConfigRegistry(config_dir, reload_interval_s=0)
+        _edit(
+            config_dir / "pairs.json", lambda d: d["pairs"]["EURUSD"].update({"pip_value": 0.001})
+        )
+        assert registry.pip_value("EURUSD") == 0.0001  # conflict: previous snapshot
+        _edit(config_dir / "tolerances.json", lambda d: d["pip_values"].update({"EURUSD": 0.001}))
+        assert registry.pip_value("EURUSD") == 0.001
+        assert registry.pairs.pairs["EURUSD"].pip_value == 0.001
+
+    def test_file_missing_mid_replace_keeps_serving(self, config_dir: Path) -> None:
+        registry = ConfigRegistry(config_dir, reload_interval_s=0)
+        (config_dir / "sessions.json").unlink()
+        assert registry.session_window("LONDON").start_utc == time(8, 0)
+        assert registry.pip_value("EURUSD") == 0.0001
+
+    def test_conflicting_pip_values_raise(self, config_dir: Path) -> None:
+        _edit(config_dir / "tolerances.json", lambda d: d["pip_values"].update({"EURUSD": 0.01}))
+        with pytest.raises(ValueError, match="Conflicting pip value for EURUSD"):
+            ConfigRegistry(config_dir)
+
+    def test_missing_file_raises(self, config_dir: Path) -> None:
+        (config_dir / "sessions.json").unlink()
+        with pytest.raises(FileNotFoundError):
+            ConfigRegistry(config_dir)
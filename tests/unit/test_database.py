@@ -0,0 +1,53 @@
+"""Unit tests for CandleRepository helpers that need no database.
+
+End-to-end behaviour is covered in tests/integration/test_database.py.
+"""
+
+from datetime import datetime
+
+import numpy as np
+
+from src.domain.structure.models import CandleSeries
+from src.infrastructure.database import _copy_buffer, _rows_to_series
+
+
+def _series() -> CandleSeries:
+    times = np.array([datetime(2025, 2, 3, 0, 0), datetime(2025, 2, 3, 0, 5)], "datetime64[us]")
+    return CandleSeries(
+        "EURUSD", "5M", times, [1.02471, 1.1], [1.04, 1.1], [1.02096, 1.1], [1 / 3 + 0.7, 1.1]
+    )
+
+
+class TestCopyBuffer:
+    """COPY text rendering must round-trip every value exactly."""
+
+    def test_rows_are_tab_separated(self) -> None:
+        lines = _copy_buffer(_series()).getvalue().splitlines()
+        assert lines[0].split("\t") == [
+            "2025-02-03T00:00:00.000000",
+            "1.02471",
+            "1.04",
+            "1.02096",
+            "1.0333333333333332",
+        ]
+        assert len(lines) == 2
+
+    def test_floats_round_trip(self) -> None:
+        series = _series()
+        rows = [line.split("\t") for line in _copy_buffer(series).getvalue().splitlines()]
+        parsed = [
+            (datetime.fromisoformat(t), float(o), float(h), float(lo), float(c))
+            for t, o, h, lo, c in rows
+        ]
+        restored = _rows_to_series("EURUSD", "5M", parsed)
+        np.testing.assert_array_equal(restored.open_time, series.open_time)
+        np.testing.assert_array_equal(restored.close, series.close)
+
+
+class TestRowsToSeries:
+    """Fetched batches become validated columns."""
+
+    def test_empty_batch_gives_empty_series(self) -> None:
+        series = _rows_to_series("EURUSD", "5M", [])
+        assert len(series) == 0
+        assert series.open_time.dtype == np.dtype("datetime64[us]")
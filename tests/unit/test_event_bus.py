@@ -0,0 +1,327 @@
+"""Unit tests for the asyncio event bus.
+
+Covers:
+  - Event encoding, decoding and topic registration
+  - Micro-batching of queued bursts and lingering batches
+  - BLOCK backpressure and DROP_NEWEST / DROP_OLDEST overflow
+  - Handler errors, concurrent workers and metrics
+  - Delivery through the LocalTransport stand-in
+  - Bounded per-topic transport inboxes: overflow drops, topic isolation
+  - PostgresNotifyTransport issuing LISTEN off the event loop thread
+"""
+
+import asyncio
+import socket
+import threading
+from datetime import datetime
+from typing import ClassVar
+
+import pytest
+
+from src.domain.structure.models import Candle, Swing, SwingType
+from src.events.bus import EventBus, OverflowPolicy
+from src.events.models import (
+    EVENT_TYPES,
+    CandleClosed,
+    Event,
+    SwingDetected,
+    decode_event,
+    encode_event,
+)
+from src.events.transport import MAX_PAYLOAD_BYTES, LocalTransport, PostgresNotifyTransport
+
+pytestmark = pytest.mark.asyncio
+
+
+def _candle(hour: int) -> Candle:
+    return Candle(
+        pair="EURUSD",
+        timeframe="1H",
+        open_time=datetime(2025, 2, 3, hour % 24),
+        open=1.1,
+        high=1.2,
+        low=1.0,
+        close=1.15,
+    )
+
+
+def _events(n: int) -> list[CandleClosed]:
+    return [CandleClosed(candle=_candle(i)) for i in range(n)]
+
+
+class _Recorder:
+    def __init__(self) -> None:
+        self.batches: list[list[Event]] = []
+
+    async def __call__(self, events: list[Event]) -> None:
+        self.batches.append(events)
+
+    @property
+    def events(self) -> list[Event]:
+        return [e for batch in self.batches for e in batch]
+
+
+class TestEventModels:
+    """Typed events survive a transport round trip."""
+
+    async def test_round_trip(self) -> None:
+        swing = Swing(
+            pair="EURUSD",
+            timeframe="1H",
+            open_time=datetime(2025, 2, 3, 15),
+            type=SwingType.HIGH,
+            price=1.03368,
+        )
+        event = SwingDetected(swing=swing)
+        decoded = decode_event("swing.detected", encode_event(event))
+        assert decoded == event
+        assert isinstance(decoded, SwingDetected)
+
+    async def test_topics_are_registered(self) -> None:
+        assert EVENT_TYPES["candle.closed"] is CandleClosed
+        assert EVENT_TYPES["swing.detected"] is SwingDetected
+
+    async def test_duplicate_topic_rejected(self) -> None:
+        with pytest.raises(ValueError, match="Duplicate event topic"):
+
+            class Again(Event, frozen=True):
+                topic: ClassVar[str] = "candle.closed"
+
+
+class TestBatching:
+    """Bursts are delivered as batches."""
+
+    async def test_queued_burst_is_batched(self) -> None:
+        recorder = _Recorder()
+        bus = EventBus()
+        bus.subscribe(CandleClosed, recorder, max_batch=100)
+        events = _events(250)
+        await bus.publish_many(events)  # queued before workers start
+        await bus.start()
+        await bus.close()
+        assert [len(b) for b in recorder.batches] == [100, 100, 50]
+        assert recorder.events == events
+
+    async def test_linger_collects_trickle(self) -> None:
+        recorder = _Recorder()
+        async with EventBus() as bus:
+            bus.subscribe(CandleClosed, recorder, max_batch=10, max_wait_s=0.2)
+            for event in _events(3):
+                await bus.publish(event)
+                await asyncio.sleep(0.01)
+        assert [len(b) for b in recorder.batches] == [3]
+
+    async def test_topics_are_isolated(self) -> None:
+        candles, swings = _Recorder(), _Recorder()
+        async with EventBus() as bus:
+            bus.subscribe(CandleClosed, candles)
+            bus.subscribe(SwingDetected, swings)
+            await bus.publish_many(_events(5))
+        assert len(candles.events) == 5
+        assert swings.batches == []
+
+
+class TestBackpressure:
+    """Full queues block producers or drop according to policy."""
+
+    async def test_block_waits_for_space(self) -> None:
+        release = asyncio.Event()
+
+        async def slow(events: list[CandleClosed]) -> None:
+            await release.wait()
+
+        async with EventBus() as bus:
+            bus.subscribe(CandleClosed, slow, maxsize=2, max_batch=1)
+            events = _events(4)
+            await bus.publish(events[0])
+            await asyncio.sleep(0)  # worker takes events[0] and blocks
+            await bus.publish(events[1])
+            await bus.publish(events[2])
+            blocked = asyncio.create_task(bus.publish(events[3]))
+            await asyncio.sleep(0.01)
+            assert not blocked.done()
+            release.set()
+            await asyncio.wait_for(blocked, 1.0)
+        [metrics] = bus.metrics()
+        assert (metrics.enqueued, metrics.delivered, metrics.dropped) == (4, 4, 0)
+
+    @pytest.mark.parametrize(
+        ("policy", "kept"),
+        [(OverflowPolicy.DROP_NEWEST, [0, 1, 2]), (OverflowPolicy.DROP_OLDEST, [3, 4, 5])],
+    )
+    async def test_drop_policies(self, policy: OverflowPolicy, kept: list[int]) -> None:
+        recorder = _Recorder()
+        bus = EventBus()
+        bus.subscribe(CandleClosed, recorder, maxsize=3, overflow=policy)
+        events = _events(6)
+        await bus.publish_many(events)
+        await bus.start()
+        await bus.close()
+        assert recorder.events == [events[i] for i in kept]
+        [metrics] = bus.metrics()
+        assert metrics.dropped == 3
+
+
+class TestWorkers:
+    """Handler failures and concurrency."""
+
+    async def test_handler_error_is_counted_and_worker_survives(self) -> None:
+        calls = 0
+
+        async def flaky(events: list[CandleClosed]) -> None:
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                raise RuntimeError("boom")
+
+        async with EventBus() as bus:
+            bus.subscribe(CandleClosed, flaky, max_batch=1, name="flaky")
+            await bus.publish_many(_events(3))
+        [metrics] = bus.metrics()
+        assert (metrics.name, metrics.errors, metrics.delivered, metrics.batches) == (
+            "flaky",
+            1,
+            3,
+            3,
+        )
+
+    async def test_concurrent_workers(self) -> None:
+        active = peak = 0
+
+        async def handler(events: list[CandleClosed]) -> None:
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+
+        async with EventBus() as bus:
+            bus.subscribe(CandleClosed, handler, max_batch=1, concurrency=4)
+            await bus.publish_many(_events(8))
+        assert peak == 4
+
+    async def test_latency_metrics(self) -> None:
+        async def slow(events: list[CandleClosed]) -> None:
+            await asyncio.sleep(0.01)
+
+        async with EventBus() as bus:
+            bus.subscribe(CandleClosed, slow, max_batch=1)
+            await bus.publish_many(_events(3))
+        [metrics] = bus.metrics()
+        assert metrics.max_latency_s >= 0.01
+        assert 0 < metrics.mean_latency_s <= metrics.max_latency_s
+        assert metrics.queue_depth == 0
+        assert metrics.max_batch_size == 1
+
+
+class TestLocalTransport:
+    """Events published through a transport reach every listening bus."""
+
+    async def test_two_buses_share_a_transport(self) -> None:
+        transport = LocalTransport()
+        first, second = _Recorder(), _Recorder()
+        producer = EventBus(transport)
+        consumer = EventBus(transport)
+        producer.subscribe(CandleClosed, first)
+        consumer.subscribe(CandleClosed, second)
+        await producer.start()
+        await consumer.start()
+        events = _events(5)
+        await producer.publish_many(events)
+        await producer.drain()
+        await consumer.drain()
+        assert first.events == events
+        assert second.events == events
+        assert transport.sent == 5
+        await consumer.close()
+        await producer.close()
+
+    async def test_blocked_topic_does_not_stall_others(self) -> None:
+        release = asyncio.Event()
+
+        async def slow(events: list[CandleClosed]) -> None:
+            await release.wait()
+
+        swings = _Recorder()
+        bus = EventBus(LocalTransport(), inbox_maxsize=2)
+        bus.subscribe(CandleClosed, slow, maxsize=1, max_batch=1)
+        bus.subscribe(SwingDetected, swings)
+        await bus.start()
+        await bus.publish_many(_events(6))
+        await asyncio.sleep(0.01)
+        swing = Swing(
+            pair="EURUSD",
+            timeframe="1H",
+            open_time=datetime(2025, 2, 3, 15),
+            type=SwingType.HIGH,
+            price=1.03368,
+        )
+        detected = SwingDetected(swing=swing)
+        await bus.publish(detected)
+        async with asyncio.timeout(1.0):
+            while not swings.events:
+                await asyncio.sleep(0.001)
+        assert swings.events == [detected]
+        # Inbox of 2: the first two candles queue, the other four are dropped.
+        candles = next(m for m in bus.metrics() if m.topic == CandleClosed.topic)
+        assert candles.dropped == 4
+        release.set()
+        await bus.close()
+        candles = next(m for m in bus.metrics() if m.topic == CandleClosed.topic)
+        assert (candles.delivered, candles.dropped) == (2, 4)
+
+    async def test_inbox_maxsize_validated(self) -> None:
+        with pytest.raises(ValueError, match="inbox_maxsize"):
+            EventBus(LocalTransport(), inbox_maxsize=0)
+
+    async def test_oversized_payload_rejected(self) -> None:
+        with pytest.raises(ValueError, match="NOTIFY allows"):
+            await LocalTransport().send("candle.closed", b"x" * (MAX_PAYLOAD_BYTES + 1))
+
+    async def test_subscribe_after_start_rejected(self) -> None:
+        async with EventBus(LocalTransport()) as bus:
+            with pytest.raises(RuntimeError, match="before start"):
+                bus.subscribe(CandleClosed, _Recorder())
+
+
+class _FakeConnection:
+    """Just enough of a psycopg2 connection to record where LISTEN runs."""
+
+    def __init__(self) -> None:
+        self._sock, self._peer = socket.socketpair()
+        self.statements: list[tuple[str, str]] = []
+        self.notifies: list[object] = []
+
+    def fileno(self) -> int:
+        return self._sock.fileno()
+
+    def cursor(self) -> "_FakeConnection":
+        return self
+
+    def __enter__(self) -> "_FakeConnection":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        pass
+
+    def execute(self, sql: str) -> None:
+        self.statements.append((sql, threading.current_thread().name))
+
+    def close(self) -> None:
+        self._sock.close()
+        self._peer.close()
+
+
+class TestPostgresNotifyTransport:
+    """LISTEN never blocks the event loop."""
+
+    async def test_listen_runs_on_a_worker_thread(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        conn = _FakeConnection()
+        transport = PostgresNotifyTransport("postgresql://unused")
+        monkeypatch.setattr(transport, "_connect", lambda: conn)
+        await transport.listen("candle.closed", lambda topic, payload: None)
+        await transport.listen("candle.closed", lambda topic, payload: None)
+        await transport.close()
+        [(sql, thread)] = conn.statements
+        assert sql == 'LISTEN "fractal_candle_closed"'
+        assert thread != threading.current_thread().name
@@ -0,0 +1,166 @@
+"""Unit tests for N-bar fractal swing detection.
+
+Covers:
+  - Sliding max/min against a brute-force window scan, every window length
+  - Width 1 reproduces detect_swings_array exactly (dual swings, pip filter)
+  - Wider and asymmetric fractals against a brute-force reference
+  - Strict vs non-strict ties
+  - Several widths in one call equal separate calls
+  - Model wrapper and argument errors
+"""
+
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+from src.domain.structure.fractal_detection import (
+    detect_fractals,
+    detect_fractals_array,
+    detect_fractals_multi,
+    sliding_max,
+    sliding_min,
+)
+from src.domain.structure.models import CandleSeries, SwingType
+from src.domain.structure.swing_detection import SWING_DTYPE, detect_swings, detect_swings_array
+
+_T0 = np.datetime64(datetime(2024, 1, 1), "us")
+
+
+def _columns(n: int, seed: int, decimals: int = 4) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    rng = np.random.default_rng(seed)
+    close = 1.05 + np.cumsum(rng.normal(0, 0.0008, n))
+    high = np.round(close + np.abs(rng.normal(0, 0.0004, n)), decimals)
+    low = np.round(close - np.abs(rng.normal(0, 0.0004, n)), decimals)
+    return _T0 + np.arange(n) * np.timedelta64(1, "h"), high, low
+
+
+def _reference(
+    high: np.ndarray, low: np.ndarray, left: int, right: int, strict: bool
+) -> list[tuple[int, str]]:
+    above = np.greater if strict else np.greater_equal
+    below = np.less if strict else np.less_equal
+    out = []
+    for i in range(left, len(high) - right):
+        neighbours = np.r_[i - left : i, i + 1 : i + 1 + right]
+        if above(high[i], high[neighbours]).all():
+            out.append((i, "HIGH"))
+        if below(low[i], low[neighbours]).all():
+            out.append((i, "LOW"))
+    return out
+
+
+def _as_rows(open_time: np.ndarray, swings: np.ndarray) -> list[tuple[int, str]]:
+    index = np.searchsorted(open_time, swings["open_time"])
+    return list(zip(index.tolist(), swings["type"].tolist(), strict=True))
+
+
+class TestSliding:
+    """Van Herk / Gil-Werman sliding extrema."""
+
+    @pytest.mark.parametrize("window", [1, 2, 3, 5, 7, 16, 33])
+    def test_matches_brute_force(self, window: int) -> None:
+        values = np.random.default_rng(window).normal(size=101)
+        windows = np.lib.stride_tricks.sliding_window_view(values, window)
+        np.testing.assert_array_equal(sliding_max(values, window), windows.max(axis=1))
+        np.testing.assert_array_equal(sliding_min(values, window), windows.min(axis=1))
+
+    def test_window_longer_than_input(self) -> None:
+        assert len(sliding_max(np.arange(3.0), 5)) == 0
+
+
+class TestWidthOne:
+    """Parity with the C1-C2-C3 detector."""
+
+    @pytest.mark.parametrize("seed", [1, 2, 3])
+    def test_reproduces_detect_swings(self, seed: int) -> None:
+        columns = _columns(5000, seed, decimals=4)  # coarse rounding gives ties
+        np.testing.assert_array_equal(
+            detect_fractals_array(*columns, 1), detect_swings_array(*columns)
+        )
+
+    def test_dual_swing_order(self) -> None:
+        open_time = _T0 + np.arange(3) * np.timedelta64(1, "h")
+        high, low = np.array([1.1, 1.2, 1.1]), np.array([1.0, 0.9, 1.0])
+        swings = detect_fractals_array(open_time, high, low, 1)
+        assert swings["type"].tolist() == ["HIGH", "LOW"]
+        np.testing.assert_array_equal(swings, detect_swings_array(open_time, high, low))
+
+    def test_pip_filter(self) -> None:
+        columns = _columns(2000, 4)
+        np.testing.assert_array_equal(
+            detect_fractals_array(*columns, 1, pair="EURUSD", min_swing_pips=8.0),
+            detect_swings_array(*columns, pair="EURUSD", min_swing_pips=8.0),
+        )
+
+
+class TestWiderFractals:
+    """N-bar windows against a brute-force reference."""
+
+    @pytest.mark.parametrize("width", [2, 3, 5, (2, 1), (1, 3)])
+    @pytest.mark.parametrize("strict", [True, False])
+    def test_matches_reference(self, width: int | tuple[int, int], strict: bool) -> None:
+        open_time, high, low = _columns(3000, 5)
+        left, right = (width, width) if isinstance(width, int) else width
+        swings = detect_fractals_array(open_time, high, low, left, right, strict=strict)
+        assert swings.dtype == SWING_DTYPE
+        assert _as_rows(open_time, swings) == _reference(high, low, left, right, strict)
+
+    def test_ties_need_non_strict(self) -> None:
+        open_time = _T0 + np.arange(5) * np.timedelta64(1, "h")
+        high = np.array([1.0, 1.1, 1.2, 1.2, 1.0])
+        low = high - 0.05
+        assert len(detect_fractals_array(open_time, high, low, 2, strict=True)) == 0
+        flat = detect_fractals_array(open_time, high, low, 2, strict=False)
+        assert _as_rows(open_time, flat) == [(2, "HIGH")]
+
+    def test_wider_windows_are_subsets(self) -> None:
+        columns = _columns(3000, 6)
+        found = {
+            w: set(_as_rows(columns[0], detect_fractals_array(*columns, w))) for w in (1, 2, 5)
+        }
+        assert found[5] <= found[2] <= found[1]
+        assert len(found[5]) < len(found[2]) < len(found[1])
+
+    def test_series_shorter_than_window(self) -> None:
+        columns = _columns(6, 7)
+        assert len(detect_fractals_array(*columns, 3)) == 0
+
+
+class TestMultiWidth:
+    """Several widths from one call."""
+
+    def test_equals_separate_calls(self) -> None:
+        columns = _columns(4000, 8)
+        widths = [1, 2, 3, 5, (2, 3)]
+        result = detect_fractals_multi(*columns, widths, pair="EURUSD", min_swing_pips=2.0)
+        assert list(result) == widths
+        for width in widths:
+            left, right = (width, width) if isinstance(width, int) else width
+            np.testing.assert_array_equal(
+                result[width],
+                detect_fractals_array(*columns, left, right, pair="EURUSD", min_swing_pips=2.0),
+            )
+
+    @pytest.mark.parametrize("width", [0, (1, 0), (-1, 2)])
+    def test_invalid_width(self, width: int | tuple[int, int]) -> None:
+        with pytest.raises(ValueError, match="widths must be >= 1"):
+            detect_fractals_multi(*_columns(10, 9), [width])
+
+    def test_filter_needs_pair(self) -> None:
+        with pytest.raises(ValueError, match="pair is required"):
+            detect_fractals_multi(*_columns(10, 9), [2], min_swing_pips=1.0)
+
+
+class TestDetectFractals:
+    """Model wrapper."""
+
+    def test_models_match_detect_swings_at_width_one(self) -> None:
+        open_time, high, low = _columns(1000, 10)
+        close = (high + low) / 2
+        series = CandleSeries("EURUSD", "4H", open_time, close, high, low, close)
+        assert detect_fractals(series, "EURUSD", "4H", 1) == detect_swings(series, "EURUSD", "4H")
+        records = detect_fractals(series, "EURUSD", "4H", 3, records=True)
+        models = detect_fractals(series, "EURUSD", "4H", 3)
+        assert [r.to_swing() for r in records] == models
+        assert all(s.type in (SwingType.HIGH, SwingType.LOW) for s in models)
@@ -0,0 +1,111 @@
+"""Unit tests for Fair Value Gap detection.
+
+Covers:
+  - Known gaps in the EURUSD 1H fixture
+  - Bullish and bearish gap edges
+  - Parity with a brute-force triplet scan on a random walk
+  - min_gap_pips filter and input validation
+"""
+
+import json
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from src.domain.structure.fvg_detection import detect_fvgs, detect_fvgs_array
+from src.domain.structure.models import CandleSeries, Direction
+
+FIXTURES_PATH = Path(__file__).parent.parent / "fixtures" / "candles.json"
+
+
+def _fixture_series() -> CandleSeries:
+    data = json.loads(FIXTURES_PATH.read_text())
+    rows = data["candles"]
+    return CandleSeries(
+        data["pair"],
+        data["timeframe"],
+        np.array([datetime.fromisoformat(r["open_time"]) for r in rows], "datetime64[us]"),
+        np.array([r["open"] for r in rows]),
+        np.array([r["high"] for r in rows]),
+        np.array([r["low"] for r in rows]),
+        np.array([r["close"] for r in rows]),
+    )
+
+
+def _series(highs: list[float], lows: list[float]) -> CandleSeries:
+    start = datetime(2025, 2, 3)
+    times = np.array([start + timedelta(hours=i) for i in range(len(highs))], "datetime64[us]")
+    mid = (np.array(highs) + np.array(lows)) / 2
+    return CandleSeries("EURUSD", "1H", times, mid, highs, lows, mid)
+
+
+class TestDetectFvgs:
+    """C1-C3 gap rules."""
+
+    def test_fixture_gaps(self) -> None:
+        gaps = detect_fvgs(_fixture_series(), "EURUSD", "1H")
+        assert [g.open_time.hour for g in gaps] == [4, 11, 12, 15, 21]
+        assert all(g.direction is Direction.BULLISH for g in gaps)
+        last = gaps[-1]
+        assert (last.bottom, last.top) == (1.03, 1.03306)
+
+    def test_bullish_gap_edges(self) -> None:
+        gaps = detect_fvgs_array(*_columns(_series([1.10, 1.13, 1.14], [1.09, 1.10, 1.12])))
+        assert gaps["direction"].tolist() == ["BULLISH"]
+        assert (gaps["bottom"][0], gaps["top"][0]) == (1.10, 1.12)
+
+    def test_bearish_gap_edges(self) -> None:
+        gaps = detect_fvgs_array(*_columns(_series([1.14, 1.13, 1.10], [1.12, 1.09, 1.08])))
+        assert gaps["direction"].tolist() == ["BEARISH"]
+        assert (gaps["bottom"][0], gaps["top"][0]) == (1.10, 1.12)
+
+    def test_touching_wicks_are_not_a_gap(self) -> None:
+        gaps = detect_fvgs_array(*_columns(_series([1.10, 1.13, 1.14], [1.09, 1.10, 1.10])))
+        assert len(gaps) == 0
+
+    def test_matches_brute_force(self) -> None:
+        rng = np.random.default_rng(7)
+        close = 1.05 + np.cumsum(rng.normal(0, 0.001, 2_000))
+        high = close + np.abs(rng.normal(0, 0.0005, 2_000))
+        low = close - np.abs(rng.normal(0, 0.0005, 2_000))
+        times = np.datetime64("2025-01-01") + np.arange(2_000) * np.timedelta64(1, "h")
+
+        expected = []
+        for i in range(1, len(close) - 1):
+            if low[i + 1] > high[i - 1]:
+                expected.append((i, "BULLISH", low[i + 1], high[i - 1]))
+            elif high[i + 1] < low[i - 1]:
+                expected.append((i, "BEARISH", low[i - 1], high[i + 1]))
+
+        gaps = detect_fvgs_array(times, high, low)
+        assert len(gaps) == len(expected) > 0
+        assert gaps["open_time"].tolist() == [times[i].item() for i, *_ in expected]
+        assert gaps["direction"].tolist() == [d for _, d, *_ in expected]
+        assert gaps["top"].tolist() == [t for *_, t, _ in expected]
+        assert gaps["bottom"].tolist() == [b for *_, b in expected]
+
+
+class TestMinGapFilter:
+    """Gap-size filter in pips."""
+
+    def test_filter_drops_small_gaps(self) -> None:
+        gaps = detect_fvgs(_fixture_series(), "EURUSD", "1H", min_gap_pips=5.0)
+        assert [g.open_time.hour for g in gaps] == [11, 15, 21]
+
+    def test_filter_requires_pair(self) -> None:
+        with pytest.raises(ValueError, match="pair is required"):
+            detect_fvgs_array(*_columns(_fixture_series()), min_gap_pips=1.0)
+
+    def test_unknown_pair_raises(self) -> None:
+        with pytest.raises(ValueError, match="Unknown pair"):
+            detect_fvgs(_fixture_series(), "XYZUSD", "1H", min_gap_pips=1.0)
+
+    def test_too_few_candles(self) -> None:
+        with pytest.raises(ValueError, match="At least 3 candles"):
+            detect_fvgs_array(*_columns(_fixture_series()[:2]))
+
+
+def _columns(series: CandleSeries) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    return series.open_time, series.high, series.low
@@ -0,0 +1,241 @@
+"""Unit tests for the key-level calendar.
+
+Covers:
+  - Session, PDH/PDL, PWH/PWL and PMH/PML levels against a candle-walking reference
+  - Weekend bars joining Monday, sessions wrapping midnight, forming periods excluded
+  - Point-in-time lookups and range queries
+  - Incremental updates: parity with batch, load-then-update, advance, forming
+  - Argument errors
+"""
+
+from collections import defaultdict
+from datetime import datetime, time, timedelta
+
+import numpy as np
+import pytest
+
+from src.domain.structure.key_levels import (
+    KEY_LEVEL_DTYPE,
+    KeyLevelCalendar,
+    build_key_levels,
+    build_key_levels_array,
+)
+from src.domain.structure.models import CandleSeries, KeyLevel, SwingType
+
+_SESSIONS = {
+    "ASIA": (time(0, 0), time(8, 0)),
+    "LONDON": (time(8, 0), time(16, 0)),
+    "NY": (time(13, 0), time(21, 0)),
+}
+_KWARGS = {"sessions": _SESSIONS, "day_open": timedelta()}
+
+# Monday.
+_T0 = datetime(2025, 1, 6)
+
+
+def _series(times: list[datetime], seed: int = 0, timeframe: str = "1H") -> CandleSeries:
+    rng = np.random.default_rng(seed)
+    close = 1.1 + np.cumsum(rng.normal(0, 5e-4, len(times)))
+    open_ = np.r_[1.1, close[:-1]]
+    high = np.maximum(open_, close) + np.abs(rng.normal(0, 3e-4, len(times)))
+    low = np.minimum(open_, close) - np.abs(rng.normal(0, 3e-4, len(times)))
+    return CandleSeries(
+        "EURUSD", timeframe, np.array(times, "datetime64[us]"), open_, high, low, close
+    )
+
+
+def _weekday_hours(days: int, start: datetime = _T0) -> list[datetime]:
+    hours = (start + timedelta(hours=h) for h in range(24 * days))
+    return [t for t in hours if t.weekday() < 5]
+
+
+def _reference(series: CandleSeries) -> set[tuple[str, float, datetime]]:
+    """Walk the candles, bucketing each into its periods by hand."""
+    buckets: dict[tuple[str, datetime, datetime], list[int]] = defaultdict(list)
+    times = series.open_time.astype("datetime64[us]").tolist()
+    for i, t in enumerate(times):
+        day = datetime(t.year, t.month, t.day)
+        if day.weekday() >= 5:  # weekend bars join Monday
+            day += timedelta(days=7 - day.weekday())
+        monday = day - timedelta(days=day.weekday())
+        month = datetime(day.year, day.month, 1)
+        next_month = datetime(day.year + day.month // 12, day.month % 12 + 1, 1)
+        buckets["D", day, day + timedelta(days=1)].append(i)
+        buckets["W", monday, monday + timedelta(days=5)].append(i)
+        buckets["M", month, next_month].append(i)
+        for name, (start, end) in _SESSIONS.items():
+            window = datetime.combine(t.date(), start)
+            if window <= t < datetime.combine(t.date(), end):
+                buckets[name, window, datetime.combine(t.date(), end)].append(i)
+    last_close = times[-1] + timedelta(hours=1)
+    names = {"D": ("PDH", "PDL"), "W": ("PWH", "PWL"), "M": ("PMH", "PML")}
+    levels = set()
+    for (kind, _, end), rows in buckets.items():
+        if end > last_close:
+            continue
+        high_name, low_name = names.get(kind, (f"{kind}_HIGH", f"{kind}_LOW"))
+        levels.add((high_name, float(series.high[rows].max()), end))
+        levels.add((low_name, float(series.low[rows].min()), end))
+    return levels
+
+
+def _as_set(rows: np.ndarray) -> set[tuple[str, float, datetime]]:
+    return set(
+        zip(
+            rows["level_type"].tolist(),
+            rows["price"].tolist(),
+            rows["active_from"].tolist(),
+            strict=True,
+        )
+    )
+
+
+class TestBuild:
+    """Batch computation."""
+
+    def test_matches_reference(self) -> None:
+        # Mid-January to mid-March, weekdays only, plus Sunday-evening bars.
+        times = _weekday_hours(70, datetime(2025, 1, 13))
+        times += [t for t in (_T0 + timedelta(days=d, hours=22) for d in range(6, 70, 7))]
+        series = _series(sorted(times))
+        rows = build_key_levels_array(series.open_time, series.high, series.low, "1H", **_KWARGS)
+        assert rows.dtype == KEY_LEVEL_DTYPE
+        assert _as_set(rows) == _reference(series)
+        assert np.all(np.diff(rows["active_from"].astype(np.int64)) >= 0)
+        assert {"PMH", "PWL", "ASIA_HIGH", "NY_LOW"} <= set(rows["level_type"].tolist())
+
+    def test_level_time_and_period(self) -> None:
+        series = _series(_weekday_hours(2))
+        rows = build_key_levels_array(series.open_time, series.high, series.low, "1H", **_KWARGS)
+        pdh = rows[rows["level_type"] == "PDH"][0]
+        monday = series.high[:24]
+        assert pdh["price"] == monday.max()
+        assert pdh["level_time"] == series.open_time[int(np.argmax(monday))]
+        assert pdh["period_start"] == np.datetime64(_T0)
+        assert pdh["active_from"] == np.datetime64(_T0 + timedelta(days=1))
+
+    def test_forming_periods_are_left_out(self) -> None:
+        series = _series(_weekday_hours(1)[:10])  # Monday 00:00-09:00
+        rows = build_key_levels_array(series.open_time, series.high, series.low, "1H", **_KWARGS)
+        assert rows["level_type"].tolist() == ["ASIA_HIGH", "ASIA_LOW"]
+
+    def test_session_wrapping_midnight(self) -> None:
+        times = [_T0 + timedelta(hours=h) for h in range(20, 30)]
+        series = _series(times)
+        rows = build_key_levels_array(
+            series.open_time,
+            series.high,
+            series.low,
+            "1H",
+            sessions={"SYDNEY": (time(22, 0), time(2, 0))},
+            periods=(),
+            day_open=timedelta(),
+        )
+        assert rows["price"].tolist() == [series.high[2:6].max(), series.low[2:6].min()]
+        assert rows["active_from"][0] == np.datetime64(_T0 + timedelta(hours=26))
+
+    def test_models(self) -> None:
+        levels = build_key_levels(_series(_weekday_hours(2)), **_KWARGS)
+        assert all(isinstance(level, KeyLevel) for level in levels)
+        pdl = next(level for level in levels if level.level_type == "PDL")
+        assert pdl.type == SwingType.LOW and pdl.pair == "EURUSD"
+
+    def test_sessions_default_to_config(self) -> None:
+        series = _series(_weekday_hours(2))
+        rows = build_key_levels_array(series.open_time, series.high, series.low, "1H")
+        assert {"ASIA_HIGH", "LONDON_LOW", "NY_HIGH"} <= set(rows["level_type"].tolist())
+
+    def test_empty_and_errors(self) -> None:
+        empty = np.array([])
+        rows = build_key_levels_array(empty.astype("datetime64[us]"), empty, empty, "1H")
+        assert len(rows) == 0
+        with pytest.raises(ValueError, match="period 'Y'"):
+            KeyLevelCalendar(_SESSIONS, periods=("D", "Y"))
+
+
+class TestCalendar:
+    """Lookups and incremental updates."""
+
+    def test_levels_at(self) -> None:
+        calendar = KeyLevelCalendar(**_KWARGS)
+        series = _series(_weekday_hours(3))
+        calendar.load(series)
+        tuesday_10 = _T0 + timedelta(days=1, hours=10)
+        levels = {level.level_type: level for level in calendar.levels("EURUSD", tuesday_10)}
+        assert levels["PDH"].price == series.high[:24].max()
+        assert levels["ASIA_HIGH"].price == series.high[24:32].max()  # Tuesday's Asia
+        assert levels["LONDON_LOW"].price == series.low[8:16].min()  # still Monday's
+        assert levels["LONDON_LOW"].active_from == _T0 + timedelta(hours=16)
+        assert "PWH" not in levels
+        assert list(levels) == [t for t in calendar.level_types if t in levels]
+        assert calendar.levels("GBPUSD", tuesday_10) == []
+
+    def test_table_range(self) -> None:
+        calendar = KeyLevelCalendar(**_KWARGS)
+        series = _series(_weekday_hours(10))
+        calendar.load(series)
+        full = calendar.table("EURUSD")
+        np.testing.assert_array_equal(
+            full, build_key_levels_array(series.open_time, series.high, series.low, "1H", **_KWARGS)
+        )
+        start, end = _T0 + timedelta(days=2), _T0 + timedelta(days=3)
+        window = calendar.table("EURUSD", start, end)
+        assert len(window) and set(window["active_from"].tolist()) <= {
+            start,
+            start + timedelta(hours=8),
+            start + timedelta(hours=16),
+            start + timedelta(hours=21),
+        }
+
+    def test_incremental_matches_batch(self) -> None:
+        series = _series(_weekday_hours(40), seed=3)
+        calendar = KeyLevelCalendar(**_KWARGS)
+        completed = [level for c in series.to_candles() for level in calendar.update(c)]
+        batch = build_key_levels(series, **_KWARGS)
+        assert sorted(completed, key=repr) == sorted(batch, key=repr)
+        np.testing.assert_array_equal(
+            calendar.table("EURUSD"),
+            build_key_levels_array(series.open_time, series.high, series.low, "1H", **_KWARGS),
+        )
+
+    def test_load_then_update(self) -> None:
+        series = _series(_weekday_hours(40), seed=4)
+        candles = series.to_candles()
+        live = KeyLevelCalendar(**_KWARGS)
+        live.load(CandleSeries.from_candles(candles[:333]))
+        for candle in candles[333:]:
+            live.update(candle)
+        streamed = KeyLevelCalendar(**_KWARGS)
+        for candle in candles:
+            streamed.update(candle)
+        np.testing.assert_array_equal(live.table("EURUSD"), streamed.table("EURUSD"))
+        assert live.forming("EURUSD") == streamed.forming("EURUSD")
+
+    def test_update_returns_closed_levels(self) -> None:
+        calendar = KeyLevelCalendar(**_KWARGS)
+        candles = _series(_weekday_hours(1)).to_candles()
+        closed = [calendar.update(c) for c in candles]
+        assert [level.level_type for level in closed[7]] == ["ASIA_HIGH", "ASIA_LOW"]
+        assert {level.level_type for level in closed[23]} == {"PDH", "PDL"}
+        assert set(calendar.forming("EURUSD")) == {"PWH", "PWL", "PMH", "PML"}
+        assert sum(map(len, closed)) == 2 * 4
+
+    def test_forming_and_advance(self) -> None:
+        calendar = KeyLevelCalendar(**_KWARGS)
+        candles = _series(_weekday_hours(1)).to_candles()[:18]  # through Monday 17:00
+        for candle in candles:
+            calendar.update(candle)
+        forming = calendar.forming("EURUSD")
+        assert forming["NY_HIGH"] == max(c.high for c in candles[13:18])
+        assert "LONDON_HIGH" not in forming
+        assert calendar.advance("EURUSD", _T0 + timedelta(hours=20)) == []
+        advanced = calendar.advance("EURUSD", _T0 + timedelta(hours=21))
+        assert [level.level_type for level in advanced] == ["NY_HIGH", "NY_LOW"]
+        assert "NY_HIGH" not in calendar.forming("EURUSD")
+
+    def test_rejects_out_of_order(self) -> None:
+        candles = _series(_weekday_hours(1)).to_candles()
+        calendar = KeyLevelCalendar(**_KWARGS)
+        calendar.update(candles[1])
+        with pytest.raises(ValueError, match="ascending"):
+            calendar.update(candles[0])
@@ -0,0 +1,223 @@
+"""Unit tests for key-level sweep and first-touch detection.
+
+Covers:
+  - SWEPT vs CLOSED_THROUGH classification (WF3 Check Sweeps semantics)
+  - Sweep and first-touch tolerances, activation times
+  - Parity with a brute-force per-level candle scan
+  - KeyLevel / CandleSeries entry point and swing-point flags
+"""
+
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from src.domain.structure.level_sweeps import check_levels, check_levels_array, swing_point_mask
+from src.domain.structure.models import CandleSeries, KeyLevel, LevelStatus, SwingType
+from src.domain.structure.swing_detection import SWING_DTYPE
+from src.infrastructure.config import LevelTolerances
+
+PIP = 0.0001
+START = datetime(2025, 2, 3)
+
+
+def _series(rows: list[tuple[float, float, float, float]]) -> CandleSeries:
+    times = np.array([START + timedelta(minutes=5 * i) for i in range(len(rows))], "datetime64[us]")
+    o, h, lo, c = (np.array(col) for col in zip(*rows, strict=True))
+    return CandleSeries("EURUSD", "5M", times, o, h, lo, c)
+
+
+def _level(price: float, kind: SwingType, minutes: int = 0, name: str = "PDH") -> KeyLevel:
+    return KeyLevel(
+        pair="EURUSD",
+        level_type=name,
+        type=kind,
+        price=price,
+        active_from=START + timedelta(minutes=minutes),
+    )
+
+
+_NO_TOLERANCE = LevelTolerances(
+    sweep_tolerance_pips=0.0, first_touch_tolerance_pips=0.0, swing_point_tolerance_pips=0.0
+)
+
+# Rows are (open, high, low, close).
+CANDLES = _series(
+    [
+        (1.1000, 1.1010, 1.0990, 1.1005),
+        (1.1005, 1.1030, 1.1000, 1.1020),  # wicks above 1.1025, closes back below
+        (1.1020, 1.1050, 1.1015, 1.1045),  # closes above 1.1040
+        (1.1045, 1.1046, 1.0970, 1.0980),  # closes below 1.0985, only wicks below 1.0975
+    ]
+)
+
+
+class TestSweepClassification:
+    """Wick beyond the level = SWEPT, close beyond = CLOSED_THROUGH."""
+
+    def test_high_levels(self) -> None:
+        levels = [
+            _level(1.1025, SwingType.HIGH),
+            _level(1.1040, SwingType.HIGH),
+            _level(1.2000, SwingType.HIGH),
+        ]
+        result = check_levels(CANDLES, levels, _NO_TOLERANCE)
+        assert result["status"].tolist() == ["SWEPT", "CLOSED_THROUGH", "ACTIVE"]
+        assert result["sweep_index"].tolist() == [1, 2, -1]
+        assert result["sweep_price"][:2].tolist() == [1.1030, 1.1050]
+        assert result["sweep_depth_pips"][0] == pytest.approx(5.0)
+        assert np.isnan(result["sweep_price"][2])
+        assert np.isnat(result["sweep_time"][2])
+
+    def test_low_levels(self) -> None:
+        levels = [_level(1.0985, SwingType.LOW), _level(1.0975, SwingType.LOW)]
+        result = check_levels(CANDLES, levels, _NO_TOLERANCE)
+        assert result["status"].tolist() == ["CLOSED_THROUGH", "SWEPT"]
+        assert result["sweep_index"].tolist() == [3, 3]
+
+    def test_equal_wick_is_a_touch_not_a_sweep(self) -> None:
+        result = check_levels(CANDLES, [_level(1.1050, SwingType.HIGH)], _NO_TOLERANCE)
+        assert result["status"][0] == LevelStatus.ACTIVE
+        assert result["first_touch_index"][0] == 2
+
+
+class TestTolerances:
+    """level_tolerances widen touches and demand deeper sweeps."""
+
+    def test_sweep_tolerance_requires_depth(self) -> None:
+        tol = LevelTolerances(
+            sweep_tolerance_pips=6.0, first_touch_tolerance_pips=0.0, swing_point_tolerance_pips=0
+        )
+        result = check_levels(CANDLES, [_level(1.1025, SwingType.HIGH)], tol)
+        # 5-pip wick at index 1 is not enough; index 2 reaches 25 pips beyond.
+        assert result["sweep_index"][0] == 2
+
+    def test_first_touch_tolerance(self) -> None:
+        tol = LevelTolerances(
+            sweep_tolerance_pips=0.0, first_touch_tolerance_pips=2.0, swing_point_tolerance_pips=0
+        )
+        result = check_levels(CANDLES, [_level(1.1012, SwingType.HIGH)], tol)
+        assert result["first_touch_index"][0] == 0
+        assert result["first_touch_time"][0] == np.datetime64(START)
+        assert result["sweep_index"][0] == 1
+
+    def test_default_tolerances_from_config(self) -> None:
+        # tolerances.json: 2-pip sweep tolerance — a 1-pip overshoot is not a sweep.
+        result = check_levels(CANDLES, [_level(1.1049, SwingType.HIGH)])
+        assert result["status"][0] == LevelStatus.ACTIVE
+        assert result["first_touch_index"][0] == 2
+
+
+class TestActivation:
+    """Candles before a level's active_from are ignored."""
+
+    def test_level_ignores_earlier_candles(self) -> None:
+        levels = [_level(1.1025, SwingType.HIGH, 0), _level(1.1025, SwingType.HIGH, 10)]
+        result = check_levels(CANDLES, levels, _NO_TOLERANCE)
+        assert result["sweep_index"].tolist() == [1, 2]
+
+    def test_level_activating_after_last_candle(self) -> None:
+        result = check_levels(CANDLES, [_level(1.0, SwingType.LOW, 60)], _NO_TOLERANCE)
+        assert result["status"][0] == LevelStatus.ACTIVE
+        assert result["first_touch_index"][0] == -1
+
+    def test_empty_inputs(self) -> None:
+        assert len(check_levels(CANDLES, [], _NO_TOLERANCE)) == 0
+        result = check_levels(CANDLES[:0], [_level(1.1, SwingType.HIGH)], _NO_TOLERANCE)
+        assert result["status"].tolist() == ["ACTIVE"]
+
+
+class TestBruteForceParity:
+    """Sorted-index lookups must agree with the nested loop they replace."""
+
+    def test_random_levels_and_candles(self) -> None:
+        rng = np.random.default_rng(11)
+        n, m = 288, 300
+        close = 1.05 + np.cumsum(rng.normal(0, 0.0004, n))
+        open_ = np.concatenate([[1.05], close[:-1]])
+        high = np.maximum(open_, close) + np.abs(rng.normal(0, 0.0003, n))
+        low = np.minimum(open_, close) - np.abs(rng.normal(0, 0.0003, n))
+        times = np.datetime64("2025-02-03") + np.arange(n) * np.timedelta64(5, "m")
+
+        price = rng.uniform(low.min() - 0.002, high.max() + 0.002, m)
+        is_high = rng.random(m) < 0.5
+        active_from = times[rng.integers(0, n + 5, m) % n]
+        sweep_tol, touch_tol = 2.0 * PIP, 1.5 * PIP
+
+        result = check_levels_array(
+            times,
+            high,
+            low,
+            close,
+            price,
+            is_high,
+            active_from,
+            pip_value=PIP,
+            sweep_tolerance_pips=2.0,
+            first_touch_tolerance_pips=1.5,
+        )
+
+        for j in range(m):
+            touch = sweep = -1
+            for i in np.flatnonzero(times >= active_from[j]):
+                if is_high[j]:
+                    touched, swept = high[i] >= price[j] - touch_tol, high[i] > price[j] + sweep_tol
+                else:
+                    touched, swept = low[i] <= price[j] + touch_tol, low[i] < price[j] - sweep_tol
+                if touched and touch < 0:
+                    touch = i
+                if swept:
+                    sweep = i
+                    break
+            assert result["first_touch_index"][j] == touch
+            assert result["sweep_index"][j] == sweep
+            if sweep >= 0:
+                beyond = close[sweep] > price[j] if is_high[j] else close[sweep] < price[j]
+                assert result["status"][j] == ("CLOSED_THROUGH" if beyond else "SWEPT")
+
+
+class TestLevelValidation:
+    """Mismatched inputs are rejected."""
+
+    def test_level_for_other_pair(self) -> None:
+        level = KeyLevel(
+            pair="GBPUSD", level_type="PDH", type=SwingType.HIGH, price=1.3, active_from=START
+        )
+        with pytest.raises(ValueError, match="GBPUSD"):
+            check_levels(CANDLES, [level])
+
+    def test_level_columns_must_align(self) -> None:
+        with pytest.raises(ValueError, match="same length"):
+            check_levels_array(
+                CANDLES.open_time,
+                CANDLES.high,
+                CANDLES.low,
+                CANDLES.close,
+                np.array([1.1, 1.2]),
+                np.array([True]),
+                np.array([START], "datetime64[us]"),
+                pip_value=PIP,
+                sweep_tolerance_pips=0,
+                first_touch_tolerance_pips=0,
+            )
+
+
+class TestSwingPointMask:
+    """Levels within swing_point_tolerance_pips of a same-type swing."""
+
+    def test_matches_same_type_within_tolerance(self) -> None:
+        swings = np.array(
+            [
+                (np.datetime64("2025-02-03T01:00"), "HIGH", 1.1030),
+                (np.datetime64("2025-02-03T02:00"), "LOW", 1.0970),
+            ],
+            dtype=SWING_DTYPE,
+        )
+        mask = swing_point_mask(
+            np.array([1.1032, 1.1040, 1.0970, 1.1030]),
+            np.array([True, True, False, False]),
+            swings,
+            pip_value=PIP,
+            tolerance_pips=3.0,
+        )
+        assert mask.tolist() == [True, False, True, False]
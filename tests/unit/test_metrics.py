@@ -0,0 +1,327 @@
+"""Unit tests for pipeline metrics and the /metrics endpoint.
+
+Covers:
+  - Latency histograms (bucket edges, sums, counts), errors, candles and throughput
+  - Event counters, freshness watermarks and staleness
+  - Prometheus text rendering and label escaping
+  - Disabled registries: nothing recorded, no clock reads
+  - instrument decorator on sync and async functions
+  - Instrumented pipeline stages and the API middleware and endpoint
+"""
+
+import asyncio
+from collections.abc import Iterator
+from datetime import UTC, datetime, timedelta, timezone
+from pathlib import Path
+
+import numpy as np
+import pytest
+from fastapi.testclient import TestClient
+
+from src.api.dependencies import get_candle_store, get_swing_cache
+from src.api.main import app
+from src.domain.market_data.store import CandleStore
+from src.domain.observability import (
+    CONTENT_TYPE,
+    MetricsRegistry,
+    StageLabels,
+    get_metrics_registry,
+    instrument,
+    timed,
+)
+from src.domain.structure.models import CandleSeries
+from src.domain.structure.swing_cache import SwingCache
+from src.domain.structure.swing_detection import detect_swings
+from src.infrastructure.config import ConfigRegistry
+
+
+class _Clock:
+    """Manual clock: each read returns the current value."""
+
+    def __init__(self, now: float = 0.0) -> None:
+        self.now = now
+        self.reads = 0
+
+    def __call__(self) -> float:
+        self.reads += 1
+        return self.now
+
+
+def _samples(text: str) -> dict[str, float]:
+    """``{'name{labels}': value}`` for every sample line."""
+    return {
+        line.rsplit(" ", 1)[0]: float(line.rsplit(" ", 1)[1])
+        for line in text.splitlines()
+        if not line.startswith("#")
+    }
+
+
+def _series(n: int = 50, pair: str = "EURUSD", timeframe: str = "1H") -> CandleSeries:
+    rng = np.random.default_rng(0)
+    close = 1.1 + np.cumsum(rng.normal(0, 5e-4, n))
+    open_ = np.r_[1.1, close[:-1]]
+    high = np.maximum(open_, close) + 2e-4
+    low = np.minimum(open_, close) - 2e-4
+    times = np.datetime64("2025-02-03T00:00", "us") + np.arange(n) * np.timedelta64(1, "h")
+    return CandleSeries(pair, timeframe, times, open_, high, low, close)
+
+
+@pytest.fixture
+def metrics() -> Iterator[MetricsRegistry]:
+    """The process-wide registry, enabled and emptied for the test."""
+    registry = get_metrics_registry()
+    enabled = registry.enabled
+    registry.enabled = True
+    registry.reset()
+    yield registry
+    registry.enabled = enabled
+    registry.reset()
+
+
+class TestRecording:
+    """Stage timings, counters and watermarks."""
+
+    def test_histogram_buckets(self) -> None:
+        clock = _Clock()
+        registry = MetricsRegistry(buckets=(0.25, 1.0), clock=clock)
+        for seconds in (0.125, 0.25, 0.5, 2.0):
+            with registry.timed("scan", "EURUSD", "1H"):
+                clock.now += seconds
+        samples = _samples(registry.render())
+        labels = 'stage="scan",pair="EURUSD",timeframe="1H"'
+        bucket = f"fractal_stage_duration_seconds_bucket{{{labels},le="
+        assert samples[bucket + '"0.25"}'] == 2  # le is inclusive
+        assert samples[bucket + '"1.0"}'] == 3
+        assert samples[bucket + '"+Inf"}'] == 4
+        assert samples[f"fractal_stage_duration_seconds_count{{{labels}}}"] == 4
+        assert samples[f"fractal_stage_duration_seconds_sum{{{labels}}}"] == 2.875
+
+    def test_errors_are_recorded_and_raised(self) -> None:
+        registry = MetricsRegistry()
+        with pytest.raises(KeyError), registry.timed("load"):
+            raise KeyError("x")
+        samples = _samples(registry.render())
+        assert samples['fractal_stage_errors_total{stage="load",pair="",timeframe=""}'] == 1
+        assert (
+            samples['fractal_stage_duration_seconds_count{stage="load",pair="",timeframe=""}'] == 1
+        )
+
+    def test_candles_and_throughput(self) -> None:
+        clock = _Clock()
+        registry = MetricsRegistry(clock=clock)
+        with registry.timed("detect", "EURUSD", "5M") as timer:
+            clock.now += 0.5
+            timer.candles = 1000
+        registry.observe("detect", 0.25, "EURUSD", "5M", 1000)
+        samples = _samples(registry.render())
+        labels = '{stage="detect",pair="EURUSD",timeframe="5M"}'
+        assert samples["fractal_stage_candles_total" + labels] == 2000
+        assert samples["fractal_stage_candles_per_second" + labels] == 4000  # latest call
+
+    def test_event_counts(self) -> None:
+        registry = MetricsRegistry()
+        registry.count("signals_generated", "EURUSD", "1H", 3)
+        registry.count("signals_generated", "EURUSD", "1H")
+        samples = _samples(registry.render())
+        key = 'fractal_events_total{event="signals_generated",pair="EURUSD",timeframe="1H"}'
+        assert samples[key] == 4
+
+    def test_watermark_only_advances(self) -> None:
+        registry = MetricsRegistry(
+            wall_clock=lambda: datetime(2025, 2, 3, 12, tzinfo=UTC).timestamp()
+        )
+        registry.mark_fresh("EURUSD", "5M", datetime(2025, 2, 3, 11, 55))
+        registry.mark_fresh("EURUSD", "5M", np.datetime64("2025-02-03T11:00", "us"))
+        assert registry.watermark("EURUSD", "5M") == datetime(2025, 2, 3, 11, 55)
+        registry.mark_fresh(
+            "EURUSD", "5M", datetime(2025, 2, 3, 12, 58, tzinfo=timezone(timedelta(hours=1)))
+        )
+        assert registry.watermark("EURUSD", "5M") == datetime(2025, 2, 3, 11, 58)
+        assert registry.watermark("GBPUSD", "5M") is None
+        samples = _samples(registry.render())
+        assert samples['fractal_series_staleness_seconds{pair="EURUSD",timeframe="5M"}'] == 120
+        assert samples['fractal_series_watermark_seconds{pair="EURUSD",timeframe="5M"}'] == (
+            datetime(2025, 2, 3, 11, 58, tzinfo=UTC).timestamp()
+        )
+
+    def test_render_format(self) -> None:
+        registry = MetricsRegistry()
+        assert registry.render() == ""
+        registry.count('odd"name\\\n')
+        text = registry.render()
+        assert text.splitlines()[:2] == [
+            "# HELP fractal_events_total Named pipeline events, e.g. signals evaluated.",
+            "# TYPE fractal_events_total counter",
+        ]
+        assert 'event="odd\\"name\\\\\\n"' in text
+        assert text.endswith("\n")
+
+    def test_reset_and_bad_buckets(self) -> None:
+        registry = MetricsRegistry()
+        registry.count("x")
+        registry.reset()
+        assert registry.render() == ""
+        with pytest.raises(ValueError, match="ascending"):
+            MetricsRegistry(buckets=(1.0, 0.5))
+        with pytest.raises(ValueError, match="ascending"):
+            MetricsRegistry(buckets=())
+
+
+class TestDisabled:
+    """Instrumentation switched off."""
+
+    def test_nothing_recorded_and_no_clock_reads(self) -> None:
+        clock = _Clock()
+        registry = MetricsRegistry(enabled=False, clock=clock)
+        with registry.timed("detect", "EURUSD", "5M") as timer:
+            timer.candles = 10
+        registry.observe("detect", 1.0)
+        registry.count("x")
+        registry.mark_fresh("EURUSD", "5M", datetime(2025, 1, 1))
+        registry.observe_http("GET", "/health", 200, 0.1)
+        assert registry.render() == ""
+        assert clock.reads == 0
+
+    def test_instrument_passes_through(self) -> None:
+        clock = _Clock()
+        registry = MetricsRegistry(enabled=False, clock=clock)
+        calls = []
+
+        @instrument("stage", lambda x: calls.append(x) or StageLabels(), registry=registry)
+        def double(x: int) -> int:
+            return 2 * x
+
+        assert double(4) == 8
+        assert calls == [] and clock.reads == 0  # labels are not even computed
+        registry.enabled = True
+        double(5)
+        assert calls == [5] and registry.render()
+
+
+class TestInstrument:
+    """The decorator."""
+
+    def test_sync(self) -> None:
+        registry = MetricsRegistry()
+
+        @instrument(
+            "resample",
+            lambda series, tf: StageLabels(series.pair, tf, len(series)),
+            registry=registry,
+        )
+        def resample(series: CandleSeries, tf: str) -> int:
+            """Docstring kept."""
+            return len(series)
+
+        assert resample(_series(24), "D") == 24
+        assert resample.__doc__ == "Docstring kept."
+        samples = _samples(registry.render())
+        assert (
+            samples['fractal_stage_candles_total{stage="resample",pair="EURUSD",timeframe="D"}']
+            == 24
+        )
+
+    def test_async_and_errors(self) -> None:
+        registry = MetricsRegistry()
+
+        @instrument("fetch", registry=registry)
+        async def fetch(fail: bool) -> str:
+            await asyncio.sleep(0)
+            if fail:
+                raise RuntimeError("down")
+            return "ok"
+
+        assert asyncio.run(fetch(False)) == "ok"
+        with pytest.raises(RuntimeError):
+            asyncio.run(fetch(True))
+        samples = _samples(registry.render())
+        assert (
+            samples['fractal_stage_duration_seconds_count{stage="fetch",pair="",timeframe=""}'] == 2
+        )
+        assert samples['fractal_stage_errors_total{stage="fetch",pair="",timeframe=""}'] == 1
+
+    def test_module_level_timed_uses_process_registry(self, metrics: MetricsRegistry) -> None:
+        with timed("adhoc"):
+            pass
+        assert "adhoc" in metrics.render()
+
+
+class TestPipelineStages:
+    """Stages instrumented in place."""
+
+    def test_detect_swings(self, metrics: MetricsRegistry) -> None:
+        series = _series(50)
+        detect_swings(series, "EURUSD", "1H")
+        detect_swings(series.to_candles(), "EURUSD", "1H")
+        samples = _samples(metrics.render())
+        labels = '{stage="detect_swings",pair="EURUSD",timeframe="1H"}'
+        assert samples["fractal_stage_duration_seconds_count" + labels] == 2
+        assert samples["fractal_stage_candles_total" + labels] == 100
+
+    def test_swing_cache_detect(self, metrics: MetricsRegistry) -> None:
+        SwingCache().detect(_series(30, timeframe="5M"))
+        key = 'fractal_stage_candles_total{stage="swing_cache.detect",pair="EURUSD",timeframe="5M"}'
+        assert _samples(metrics.render())[key] == 30
+
+    def test_config_refresh(self, metrics: MetricsRegistry) -> None:
+        registry = ConfigRegistry(reload_interval_s=0)
+        registry.refresh()
+        samples = _samples(metrics.render())
+        labels = '{stage="config.refresh",pair="",timeframe=""}'
+        assert samples["fractal_stage_duration_seconds_count" + labels] == 2
+        assert (
+            samples['fractal_events_total{event="config_files_reloaded",pair="",timeframe=""}'] == 3
+        )
+
+
+class TestMetricsEndpoint:
+    """API middleware and GET /metrics."""
+
+    @pytest.fixture
+    def client(self, tmp_path: Path, metrics: MetricsRegistry) -> Iterator[TestClient]:
+        store = CandleStore(tmp_path)
+        store.append(_series(48))
+        cache = SwingCache()
+        app.dependency_overrides[get_candle_store] = lambda: store
+        app.dependency_overrides[get_swing_cache] = lambda: cache
+        with TestClient(app) as test_client:
+            yield test_client
+        app.dependency_overrides.clear()
+
+    def test_exposes_requests(self, client: TestClient) -> None:
+        assert client.get("/candles/EURUSD/1H").status_code == 200
+        assert client.get("/swings/EURUSD/1H").status_code == 200
+        assert client.get("/candles/GBPUSD/1H").status_code == 404
+        response = client.get("/metrics")
+        assert response.status_code == 200
+        assert response.headers["content-type"] == CONTENT_TYPE
+        samples = _samples(response.text)
+        http = "fractal_http_request_duration_seconds_count"
+        assert (
+            samples[f'{http}{{method="GET",route="/candles/{{pair}}/{{timeframe}}",status="200"}}']
+            == 1
+        )
+        assert (
+            samples[f'{http}{{method="GET",route="/candles/{{pair}}/{{timeframe}}",status="404"}}']
+            == 1
+        )
+        assert (
+            samples[f'{http}{{method="GET",route="/swings/{{pair}}/{{timeframe}}",status="200"}}']
+            == 1
+        )
+        # Freshness tracks ingestion only: reading the store leaves it alone.
+        assert "fractal_series_watermark_seconds{" not in response.text
+        assert 'stage="swing_cache.detect"' in response.text
+
+    def test_unmatched_routes_share_a_label(self, client: TestClient) -> None:
+        client.get("/no/such/path")
+        client.get("/another")
+        samples = _samples(client.get("/metrics").text)
+        key = 'fractal_http_request_duration_seconds_count{method="GET",route="<unmatched>",status="404"}'
+        assert samples[key] == 2
+
+    def test_disabled(self, client: TestClient, metrics: MetricsRegistry) -> None:
+        metrics.enabled = False
+        client.get("/health")
+        response = client.get("/metrics")
+        assert response.status_code == 200 and response.text == ""
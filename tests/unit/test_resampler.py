@@ -0,0 +1,173 @@
+"""Unit tests for timeframe resampling.
+
+Covers:
+  - Intraday roll-ups (15M/1H/4H) aligned to UTC midnight
+  - Session-aware D/W buckets, with weekend bars rolled into Monday
+  - Incremental Resampler parity with the vectorised resample
+  - Bars closing on their final source candle vs on the next bucket
+  - Timeframe and ordering errors
+"""
+
+from datetime import datetime, time, timedelta
+
+import numpy as np
+import pytest
+
+from src.domain.market_data.resampler import Resampler, resample, resample_all, trading_day_open
+from src.domain.structure.models import CandleSeries
+from src.infrastructure.config import SessionsConfig, SessionWindow
+
+
+def _series(start: datetime, n: int, seed: int = 0, pair: str = "EURUSD") -> CandleSeries:
+    """Random-walk 5M candles from ``start``, skipping the FX weekend (Fri 21:00 - Sun 21:00)."""
+    rng = np.random.default_rng(seed)
+    times: list[datetime] = []
+    t = start
+    while len(times) < n:
+        weekday, hour = t.weekday(), t.hour
+        closed = (weekday == 4 and hour >= 21) or weekday == 5 or (weekday == 6 and hour < 21)
+        if not closed:
+            times.append(t)
+        t += timedelta(minutes=5)
+    close = 1.05 + np.cumsum(rng.normal(0, 0.0003, n))
+    open_ = np.concatenate([[1.05], close[:-1]])
+    high = np.maximum(open_, close) + np.abs(rng.normal(0, 0.0002, n))
+    low = np.minimum(open_, close) - np.abs(rng.normal(0, 0.0002, n))
+    return CandleSeries(pair, "5M", np.array(times, "datetime64[us]"), open_, high, low, close)
+
+
+# Friday 2025-01-31 12:00 through Tuesday 2025-02-04 (crosses one weekend).
+FRIDAY = datetime(2025, 1, 31, 12, 0)
+
+
+class TestIntradayResample:
+    """15M/1H/4H buckets are fixed-width and aligned to midnight UTC."""
+
+    def test_one_hour_aggregates(self) -> None:
+        series = _series(datetime(2025, 2, 3, 0, 0), 36)
+        hourly = resample(series, "1H")
+        assert len(hourly) == 3
+        assert hourly.open_time[1] == np.datetime64("2025-02-03T01:00")
+        assert hourly.open[1] == series.open[12]
+        assert hourly.high[1] == series.high[12:24].max()
+        assert hourly.low[1] == series.low[12:24].min()
+        assert hourly.close[1] == series.close[23]
+
+    def test_four_hour_buckets_align_to_midnight(self) -> None:
+        series = _series(datetime(2025, 2, 3, 2, 0), 60)
+        four_hour = resample(series, "4H")
+        assert four_hour.open_time.tolist() == [datetime(2025, 2, 3, 0), datetime(2025, 2, 3, 4)]
+        # The first bucket only saw 02:00-03:55 bars.
+        assert four_hour.open[0] == series.open[0]
+
+    def test_resampled_series_is_valid(self) -> None:
+        for resampled in resample_all(_series(FRIDAY, 1_500), day_open=timedelta()).values():
+            resampled.validate()
+
+    def test_empty_series(self) -> None:
+        assert len(resample(_series(FRIDAY, 10)[:0], "1H")) == 0
+
+
+class TestSessionAwareResample:
+    """D/W use the trading-day open and fold weekend bars into Monday."""
+
+    def test_trading_day_open_from_sessions(self) -> None:
+        assert trading_day_open() == timedelta(0)
+        sessions = SessionsConfig(
+            sessions={
+                "SYDNEY": SessionWindow(start_utc=time(21, 0), end_utc=time(6, 0)),
+                "LONDON": SessionWindow(start_utc=time(8, 0), end_utc=time(16, 0)),
+            },
+            trading_window=SessionWindow(start_utc=time(8, 0), end_utc=time(16, 0)),
+        )
+        assert trading_day_open(sessions) == timedelta(hours=8)
+
+    def test_sunday_bars_roll_into_monday(self) -> None:
+        series = _series(FRIDAY, 1_200)
+        daily = resample(series, "D", timedelta())
+        labels = daily.open_time.astype("datetime64[D]").tolist()
+        assert [d.weekday() for d in labels] == [4, 0, 1, 2, 3]
+        sunday_open = np.flatnonzero(series.open_time >= np.datetime64("2025-02-02T21:00"))[0]
+        assert daily.open[1] == series.open[sunday_open]
+
+    def test_day_open_offset(self) -> None:
+        series = _series(datetime(2025, 2, 4, 0, 0), 288)
+        daily = resample(series, "D", timedelta(hours=8))
+        assert daily.open_time.tolist() == [datetime(2025, 2, 3, 8), datetime(2025, 2, 4, 8)]
+
+    def test_week_is_labelled_with_monday(self) -> None:
+        series = _series(FRIDAY, 1_200)
+        weekly = resample(series, "W", timedelta())
+        assert weekly.open_time.tolist() == [datetime(2025, 1, 27), datetime(2025, 2, 3)]
+        # The new week starts with Sunday's 21:00 open.
+        sunday_open = np.datetime64("2025-02-02T21:00")
+        assert weekly.high[1] == series.high[series.open_time >= sunday_open].max()
+
+
+class TestIncrementalResampler:
+    """Resampler.update must reproduce resample exactly."""
+
+    @pytest.mark.parametrize("seed", [0, 1])
+    def test_matches_vectorised(self, seed: int) -> None:
+        series = _series(FRIDAY, 2_000, seed)
+        timeframes = ("15M", "1H", "4H", "D", "W")
+        resampler = Resampler(timeframes, day_open=timedelta())
+        closed: dict[str, list] = {tf: [] for tf in timeframes}
+        for candle in series:
+            for bar in resampler.update(candle):
+                closed[bar.timeframe].append(bar)
+
+        expected = resample_all(series, timeframes, timedelta())
+        for tf in timeframes:
+            forming = resampler.forming("EURUSD", tf)
+            bars = closed[tf] + ([forming] if forming else [])
+            assert [b.open_time for b in bars] == expected[tf].open_time.tolist()
+            assert [b.high for b in bars] == expected[tf].high.tolist()
+            assert [b.low for b in bars] == expected[tf].low.tolist()
+            assert [b.open for b in bars] == expected[tf].open.tolist()
+            assert [b.close for b in bars] == expected[tf].close.tolist()
+
+    def test_bar_closes_on_last_source_candle(self) -> None:
+        series = _series(datetime(2025, 2, 3, 0, 0), 13)
+        resampler = Resampler(("1H",))
+        emitted = [resampler.update(candle) for candle in series]
+        assert all(not bars for bars in emitted[:11])
+        assert [b.open_time for b in emitted[11]] == [datetime(2025, 2, 3, 0)]
+        assert resampler.forming("EURUSD", "1H").open_time == datetime(2025, 2, 3, 1)
+
+    def test_friday_daily_closes_when_week_reopens(self) -> None:
+        series = _series(datetime(2025, 1, 31, 20, 0), 13)
+        resampler = Resampler(("D",), day_open=timedelta())
+        emitted = [bar for candle in series for bar in resampler.update(candle)]
+        # The 20:55 bar does not reach the day boundary; Sunday's 21:00 bar closes Friday.
+        assert [b.open_time for b in emitted] == [datetime(2025, 1, 31)]
+        assert resampler.forming("EURUSD", "D").open_time == datetime(2025, 2, 3)
+
+    def test_pairs_are_independent(self) -> None:
+        resampler = Resampler(("1H",))
+        resampler.update(_series(datetime(2025, 2, 3), 1, pair="EURUSD")[0])
+        resampler.update(_series(datetime(2025, 2, 3), 1, pair="GBPUSD")[0])
+        assert resampler.forming("EURUSD", "1H") is not None
+        assert resampler.forming("GBPUSD", "1H") is not None
+        assert resampler.forming("USDJPY", "1H") is None
+
+    def test_out_of_order_raises(self) -> None:
+        series = _series(datetime(2025, 2, 3), 2)
+        resampler = Resampler(("1H",))
+        resampler.update(series[1])
+        with pytest.raises(ValueError, match="ascending"):
+            resampler.update(series[0])
+
+    def test_wrong_source_timeframe_raises(self) -> None:
+        hourly = resample(_series(datetime(2025, 2, 3), 24), "1H")
+        with pytest.raises(ValueError, match="expects 5M"):
+            Resampler(("4H",)).update(hourly[0])
+
+
+class TestTimeframeValidation:
+    """Targets must be whole multiples of the source."""
+
+    @pytest.mark.parametrize("target", ["5M", "1M", "7M", "X"])
+    def test_invalid_targets(self, target: str) -> None:
+        with pytest.raises(ValueError):
+            resample(_series(FRIDAY, 10), target)
@@ -37,7 +37,7 @@ class TestProjectSetup:
         """The /health endpoint should be registered."""
         from src.api.main import app
 
-        routes = [route.path for route in app.routes]
+        routes = [getattr(route, "path", None) for route in app.routes]
         assert "/health" in routes
 
     def test_conventions_pair_format(self, eurusd_pair):
@@ -0,0 +1,298 @@
+"""Unit tests for the config-driven strategy engine.
+
+Covers:
+  - Loading and validating config/strategies/cisd_v3.json
+  - Run-length, series and CISD features against a naive scan
+  - HARD filters, the trading window, SOFT penalties and risk tiers
+  - Compile-time errors for unknown filters, parameters and models
+  - Features and filter masks shared across strategies on one series
+  - Signals feeding the backtester
+  - Evaluation latency and signal counts in the metrics registry
+"""
+
+import json
+from datetime import datetime
+from typing import Any
+
+import numpy as np
+import pytest
+from pydantic import ValidationError
+
+from src.domain.execution.models import TradeDirection
+from src.domain.market_data.resampler import resample
+from src.domain.observability.metrics import get_metrics_registry
+from src.domain.research.backtest import backtest_array
+from src.domain.strategy import (
+    FeatureSet,
+    StrategyConfig,
+    StrategyEvaluator,
+    assign_risk_tiers,
+    compile_strategy,
+    load_strategies,
+)
+from src.domain.strategy.repository import STRATEGIES_DIR
+from src.domain.structure.models import CandleSeries
+
+# Monday 08:00 UTC.
+_T0 = np.datetime64("2025-02-03T08:00", "us")
+
+# A three-candle down series broken by a 6-pip up-close C2 at index 4.
+_BARS = [
+    (1.1000, 1.1012, 1.0998, 1.1010),
+    (1.1010, 1.1011, 1.1006, 1.1007),
+    (1.1007, 1.1008, 1.1004, 1.1005),
+    (1.1005, 1.1007, 1.1000, 1.1003),
+    (1.1006, 1.1013, 1.1005, 1.1012),
+    (1.1012, 1.1014, 1.1010, 1.1013),
+]
+
+
+def _series(bars: list[tuple[float, ...]], timeframe: str, start: np.datetime64) -> CandleSeries:
+    o, h, lo, c = (np.array(col, dtype=np.float64) for col in zip(*bars, strict=True))
+    step = np.timedelta64(1, "h") if timeframe == "1H" else np.timedelta64(5, "m")
+    return CandleSeries("EURUSD", timeframe, start + np.arange(len(bars)) * step, o, h, lo, c)
+
+
+def _market(start: np.datetime64 = _T0, c3_up: bool = True) -> list[CandleSeries]:
+    """The 1H bars plus the first 5M candle of C3 (13:00)."""
+    c3 = (1.1012, 1.1016, 1.1011, 1.1015) if c3_up else (1.1012, 1.1013, 1.1008, 1.1009)
+    return [
+        _series(_BARS, "1H", start),
+        _series([c3], "5M", start + np.timedelta64(5, "h")),
+    ]
+
+
+def _config(**overrides: Any) -> StrategyConfig:
+    raw = json.loads((STRATEGIES_DIR / "cisd_v3.json").read_text())
+    raw.update(overrides)
+    return StrategyConfig.model_validate(raw)
+
+
+def _filters(**changes: dict[str, Any]) -> list[dict[str, Any]]:
+    raw = json.loads((STRATEGIES_DIR / "cisd_v3.json").read_text())["filters"]
+    return [{**f, **changes.get(f["name"], {})} for f in raw]
+
+
+class TestConfig:
+    """Strategy config schema."""
+
+    def test_shipped_config_loads(self) -> None:
+        [config] = load_strategies()
+        assert config.id == "CISD-v3"
+        assert config.filters[0].name == "series_minimum"
+        assert config.filters[3].params == {"min_pips": 1, "max_pips": 6}
+        assert [t.name for t in config.risk_tiers] == ["BASE", "STANDARD", "STRONG", "PREMIUM"]
+
+    def test_overlapping_tiers_rejected(self) -> None:
+        tiers = [
+            {"name": "BASE", "score_range": [40, 60], "risk_pct": 0.25},
+            {"name": "STANDARD", "score_range": [55, 100], "risk_pct": 0.5},
+        ]
+        with pytest.raises(ValidationError, match="overlap"):
+            _config(risk_tiers=tiers)
+
+    def test_plan_collects_features(self) -> None:
+        plan = compile_strategy(_config())
+        assert plan.needs_entry
+        assert plan.hard[0].name == "trading_window"
+        assert {"cisd", "series_length", "body_pips", "swing_low"} <= set(plan.features)
+
+
+class TestCompileErrors:
+    """Mistakes in a config fail at compile time."""
+
+    def test_unknown_filter(self) -> None:
+        with pytest.raises(ValueError, match="Unknown filter 'no_such_filter'"):
+            compile_strategy(_config(filters=[{"name": "no_such_filter"}]))
+
+    def test_missing_parameter(self) -> None:
+        with pytest.raises(ValueError, match="body_risk_range"):
+            compile_strategy(_config(filters=[{"name": "body_risk_range", "min_pips": 1}]))
+
+    def test_unexpected_parameter(self) -> None:
+        with pytest.raises(ValueError, match="c2_body_aligned"):
+            compile_strategy(_config(filters=[{"name": "c2_body_aligned", "param": 3}]))
+
+    def test_unknown_scoring_model(self) -> None:
+        with pytest.raises(ValueError, match="Unknown scoring model"):
+            compile_strategy(_config(scoring={"model": "nope", "min_score": 40}))
+
+    def test_entry_filter_without_entry_timeframe(self) -> None:
+        with pytest.raises(ValueError, match=r"needs timeframes\.entry"):
+            compile_strategy(_config(timeframes={"structure": "1H"}))
+
+    def test_duplicate_ids(self) -> None:
+        with pytest.raises(ValueError, match="Duplicate strategy ids"):
+            StrategyEvaluator([_config(), _config()])
+
+
+class TestFeatures:
+    """Vectorised features."""
+
+    def test_series_and_cisd(self) -> None:
+        fs = FeatureSet(_series(_BARS, "1H", _T0))
+        assert fs["direction"].tolist() == [1, -1, -1, -1, 1, 1]
+        assert fs["run_length"].tolist() == [1, 1, 2, 3, 1, 2]
+        assert fs["series_length"].tolist() == [0, 1, 1, 2, 3, 1]
+        assert fs["series_open"][4] == 1.1010
+        assert fs["cisd"].tolist() == [0, 0, 0, 0, 1, 0]
+        assert np.flatnonzero(fs["swing_low"]).tolist() == [3]
+
+    def test_features_are_memoised_and_read_only(self) -> None:
+        fs = FeatureSet(_series(_BARS, "1H", _T0))
+        assert fs["cisd"] is fs["cisd"]
+        assert fs.computed["cisd"] == 1
+        with pytest.raises(ValueError, match="read-only"):
+            fs["body_pips"][0] = 0.0
+
+    def test_unknown_feature(self) -> None:
+        with pytest.raises(KeyError, match="Unknown feature"):
+            FeatureSet(_series(_BARS, "1H", _T0))["nope"]
+
+    def test_matches_naive_scan(self) -> None:
+        rng = np.random.default_rng(11)
+        n = 2_000
+        close = 1.1 + np.cumsum(rng.normal(0, 0.0005, n))
+        open_ = np.concatenate([[1.1], close[:-1]]) + rng.normal(0, 0.0001, n)
+        doji = rng.random(n) < 0.05
+        open_[doji] = close[doji]
+        spread = np.abs(rng.normal(0, 0.0003, n))
+        high, low = np.maximum(open_, close) + spread, np.minimum(open_, close) - spread
+        times = _T0 + np.arange(n) * np.timedelta64(1, "h")
+        fs = FeatureSet(CandleSeries("EURUSD", "1H", times, open_, high, low, close))
+
+        direction = np.sign(close - open_)
+        for i in range(1, n):
+            d = direction[i - 1]
+            length = 0
+            while d != 0 and i - 1 - length >= 0 and direction[i - 1 - length] == d:
+                length += 1
+            assert fs["series_length"][i] == length
+            expected = 0
+            if length:
+                series_open = open_[i - length]
+                if d < 0 and close[i] > series_open:
+                    expected = 1
+                elif d > 0 and close[i] < series_open:
+                    expected = -1
+            assert fs["cisd"][i] == expected
+
+
+class TestEvaluation:
+    """Filters, scoring and tiers on a hand-built CISD."""
+
+    def test_signal(self) -> None:
+        [signal] = StrategyEvaluator([_config()]).evaluate(_market())
+        assert signal.direction is TradeDirection.LONG
+        assert signal.c2_time == datetime(2025, 2, 3, 12, 0)
+        assert signal.entry_time == datetime(2025, 2, 3, 13, 0)
+        assert signal.entry_price == 1.1012
+        assert signal.stop_loss == 1.1006
+        assert signal.take_profit == pytest.approx(1.1030)
+        # 40 base + 5 (series of 3) + 15 (swing low in series) + 13 (close at 7/8)
+        assert (signal.score, signal.risk_tier, signal.risk_pct) == (73, "STRONG", 0.75)
+
+    def test_metrics(self) -> None:
+        metrics = get_metrics_registry()
+        enabled, metrics.enabled = metrics.enabled, True
+        metrics.reset()
+        try:
+            StrategyEvaluator([_config()]).evaluate(_market())
+            text = metrics.render()
+        finally:
+            metrics.enabled = enabled
+            metrics.reset()
+        labels = 'pair="EURUSD",timeframe="1H"'
+        assert f'fractal_events_total{{event="signals_generated",{labels}}} 1' in text
+        assert f'fractal_stage_candles_total{{stage="strategy.evaluate",{labels}}} 6' in text
+
+    def test_c3_must_confirm(self) -> None:
+        assert StrategyEvaluator([_config()]).evaluate(_market(c3_up=False)) == []
+
+    def test_entry_candles_required(self) -> None:
+        with pytest.raises(ValueError, match="needs EURUSD 5M candles"):
+            StrategyEvaluator([_config()]).evaluate(_market()[:1])
+
+    def test_outside_trading_days(self) -> None:
+        saturday = _T0 + np.timedelta64(5, "D")
+        assert StrategyEvaluator([_config()]).evaluate(_market(saturday)) == []
+
+    def test_wrapping_trading_window(self) -> None:
+        window = {"start_utc": "22:00", "end_utc": "14:00"}
+        assert len(StrategyEvaluator([_config(trading_window=window)]).evaluate(_market())) == 1
+        window = {"start_utc": "14:00", "end_utc": "12:00"}
+        assert StrategyEvaluator([_config(trading_window=window)]).evaluate(_market()) == []
+
+    def test_hard_filter_rejects(self) -> None:
+        config = _config(filters=_filters(body_risk_range={"max_pips": 5}))
+        assert StrategyEvaluator([config]).evaluate(_market()) == []
+
+    def test_soft_filter_deducts_penalty(self) -> None:
+        filters = _filters(body_risk_range={"max_pips": 5, "type": "SOFT", "penalty": 10})
+        [signal] = StrategyEvaluator([_config(filters=filters)]).evaluate(_market())
+        assert (signal.score, signal.risk_tier) == (63, "STANDARD")
+
+    def test_min_score(self) -> None:
+        config = _config(scoring={"model": "cisd_v3_score", "min_score": 74})
+        assert StrategyEvaluator([config]).evaluate(_market()) == []
+
+    def test_other_pairs_are_skipped(self) -> None:
+        evaluator = StrategyEvaluator([_config(pairs=["GBPUSD"])])
+        assert evaluator.evaluate_array(_market()) == {}
+
+
+class TestRiskTiers:
+    """Binary-search tier assignment."""
+
+    def test_boundaries_and_gaps(self) -> None:
+        tiers = _config().risk_tiers[:2] + _config().risk_tiers[3:]  # no STRONG band
+        scores = np.array([0, 39, 40, 54, 55, 64, 65, 74, 75, 100])
+        assert assign_risk_tiers(scores, tiers).tolist() == [-1, -1, 0, 0, 1, 1, -1, -1, 2, 2]
+
+
+class TestSharing:
+    """Strategies on one series share features and masks."""
+
+    def test_features_computed_once(self) -> None:
+        strict = _config(id="CISD-v3-strict", scoring={"model": "cisd_v3_score", "min_score": 70})
+        evaluator = StrategyEvaluator([_config(), strict])
+        sets = evaluator.feature_sets(_market())
+        results = evaluator.evaluate_array(sets)
+        assert len(results[("CISD-v3", "EURUSD")]) == len(results[("CISD-v3-strict", "EURUSD")])
+        computed = sets[("EURUSD", "1H")].computed
+        assert computed and set(computed.values()) == {1}
+        assert any("body_risk_range" in key for key in computed)
+
+
+class TestBacktestBridge:
+    """Signal arrays feed backtest_array."""
+
+    def test_random_walk(self) -> None:
+        rng = np.random.default_rng(5)
+        n = 12 * 24 * 60
+        close = 1.1 + np.cumsum(rng.normal(0, 0.0002, n))
+        open_ = np.concatenate([[1.1], close[:-1]])
+        spread = np.abs(rng.normal(0, 0.0001, n))
+        high, low = np.maximum(open_, close) + spread, np.minimum(open_, close) - spread
+        m5 = CandleSeries(
+            "EURUSD", "5M", _T0 + np.arange(n) * np.timedelta64(5, "m"), open_, high, low, close
+        )
+        h1 = resample(m5, "1H")
+        [rows] = StrategyEvaluator([_config()]).evaluate_array([h1, m5]).values()
+        assert len(rows) > 0
+        assert np.all(rows["score"] >= 40)
+        assert np.all(np.where(rows["is_long"], rows["stop_loss"] < rows["entry_price"], True))
+
+        results = backtest_array(
+            m5.open_time,
+            m5.high,
+            m5.low,
+            m5.close,
+            rows["entry_time"],
+            rows["is_long"],
+            rows["entry_price"],
+            rows["stop_loss"],
+            target_r=(3.0,),
+            expiry_hours=48,
+        )
+        np.testing.assert_allclose(results["take_profit"], rows["take_profit"])
@@ -0,0 +1,172 @@
+"""Unit tests for the swing result cache.
+
+Covers:
+  - Hits, prefix hits and incremental extension matching full detection
+  - Keying by pair/timeframe/min_swing_pips/first candle
+  - LRU eviction, TTL expiry and range-aware invalidation
+  - Sharing entries through FileCacheBackend
+"""
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from src.domain.structure.models import CandleSeries
+from src.domain.structure.swing_cache import FileCacheBackend, SwingCache
+from src.domain.structure.swing_detection import detect_swings_array
+
+
+def _series(n: int, seed: int = 7, pair: str = "EURUSD") -> CandleSeries:
+    rng = np.random.default_rng(seed)
+    close = 1.1 + np.cumsum(rng.normal(0, 0.0005, n))
+    open_ = np.concatenate([[1.1], close[:-1]])
+    spread = np.abs(rng.normal(0, 0.0004, n))
+    return CandleSeries(
+        pair,
+        "1H",
+        np.datetime64("2025-01-06T00:00", "us") + np.arange(n) * np.timedelta64(1, "h"),
+        open_,
+        np.maximum(open_, close) + spread,
+        np.minimum(open_, close) - spread,
+        close,
+    )
+
+
+def _expected(series: CandleSeries, min_swing_pips: float | None = None) -> np.ndarray:
+    return detect_swings_array(
+        series.open_time, series.high, series.low, series.pair, min_swing_pips
+    )
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestLookups:
+    """Results always equal a fresh detection."""
+
+    def test_miss_then_hit(self) -> None:
+        cache = SwingCache()
+        series = _series(300)
+        first = cache.detect(series)
+        second = cache.detect(series)
+        np.testing.assert_array_equal(first, _expected(series))
+        assert second is first
+        stats = cache.stats()
+        assert (stats.misses, stats.hits, stats.size) == (1, 1, 1)
+
+    @pytest.mark.parametrize("cut", [3, 4, 50, 151, 299])
+    def test_extension_matches_full_detection(self, cut: int) -> None:
+        cache = SwingCache()
+        series = _series(300)
+        cache.detect(series[:cut])
+        np.testing.assert_array_equal(cache.detect(series), _expected(series))
+        assert cache.stats().extensions == 1
+
+    def test_repeated_single_candle_extensions(self) -> None:
+        cache = SwingCache()
+        series = _series(120)
+        for n in range(3, 121):
+            result = cache.detect(series[:n], min_swing_pips=2.0)
+        np.testing.assert_array_equal(result, _expected(series, 2.0))
+        stats = cache.stats()
+        assert (stats.misses, stats.extensions) == (1, 117)
+
+    def test_prefix_is_served_from_longer_entry(self) -> None:
+        cache = SwingCache()
+        series = _series(300)
+        cache.detect(series)
+        np.testing.assert_array_equal(cache.detect(series[:180]), _expected(series[:180]))
+        assert cache.stats().hits == 1
+
+    def test_keys_separate_filters_pairs_and_start(self) -> None:
+        cache = SwingCache()
+        series = _series(200)
+        cache.detect(series)
+        np.testing.assert_array_equal(cache.detect(series, 5.0), _expected(series, 5.0))
+        cache.detect(_series(200, pair="GBPUSD"))
+        cache.detect(series[10:])
+        assert cache.stats().misses == 4
+
+    def test_short_series_yields_no_swings(self) -> None:
+        assert len(SwingCache().detect(_series(2))) == 0
+
+    def test_results_are_read_only(self) -> None:
+        swings = SwingCache().detect(_series(100))
+        with pytest.raises(ValueError, match="read-only"):
+            swings["price"][0] = 0.0
+
+
+class TestEviction:
+    """Bounded size, expiry and invalidation."""
+
+    def test_least_recently_used_is_evicted(self) -> None:
+        cache = SwingCache(maxsize=2)
+        a, b, c = _series(50, pair="EURUSD"), _series(50, pair="GBPUSD"), _series(50, pair="USDJPY")
+        cache.detect(a)
+        cache.detect(b)
+        cache.detect(a)  # b is now least recently used
+        cache.detect(c)
+        cache.detect(a)
+        stats = cache.stats()
+        assert (stats.evictions, stats.hits, stats.size) == (1, 2, 2)
+
+    def test_entries_expire(self) -> None:
+        clock = _Clock()
+        cache = SwingCache(ttl_s=60.0, clock=clock)
+        series = _series(50)
+        cache.detect(series)
+        clock.now = 59.0
+        cache.detect(series)
+        clock.now = 60.0
+        cache.detect(series)
+        stats = cache.stats()
+        assert (stats.hits, stats.expirations, stats.misses) == (1, 1, 2)
+
+    def test_invalidate_keeps_entries_ending_before_change(self) -> None:
+        cache = SwingCache()
+        series = _series(100)
+        cache.detect(series[:40])
+        cache.detect(series[20:])
+        cache.detect(_series(100, pair="GBPUSD"))
+        assert cache.invalidate("EURUSD", "1H", since=series.open_time[60]) == 1
+        assert cache.invalidate("EURUSD", "1H") == 1
+        stats = cache.stats()
+        assert (stats.invalidations, stats.size) == (2, 1)
+
+    def test_invalid_arguments(self) -> None:
+        with pytest.raises(ValueError, match="maxsize"):
+            SwingCache(maxsize=0)
+        with pytest.raises(ValueError, match="ttl_s"):
+            SwingCache(ttl_s=0)
+
+
+class TestSharedBackend:
+    """Entries written by one cache are reused by another."""
+
+    def test_second_process_reuses_entry(self, tmp_path: Path) -> None:
+        series = _series(200)
+        SwingCache(backend=FileCacheBackend(tmp_path)).detect(series)
+        other = SwingCache(backend=FileCacheBackend(tmp_path))
+        np.testing.assert_array_equal(other.detect(series), _expected(series))
+        stats = other.stats()
+        assert (stats.shared_hits, stats.hits, stats.misses) == (1, 1, 0)
+
+    def test_shared_entry_can_be_extended(self, tmp_path: Path) -> None:
+        series = _series(200)
+        SwingCache(backend=FileCacheBackend(tmp_path)).detect(series[:150])
+        other = SwingCache(backend=FileCacheBackend(tmp_path))
+        np.testing.assert_array_equal(other.detect(series), _expected(series))
+        assert other.stats().extensions == 1
+
+    def test_invalidate_deletes_shared_entry(self, tmp_path: Path) -> None:
+        series = _series(100)
+        cache = SwingCache(backend=FileCacheBackend(tmp_path))
+        cache.detect(series)
+        cache.invalidate("EURUSD", "1H")
+        assert list(tmp_path.iterdir()) == []
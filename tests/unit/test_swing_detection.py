@@ -7,17 +7,19 @@ Covers:
   - min_swing_pips filter
   - SQL regression: 26-candle EURUSD dataset must produce exact 10 swings
   - Jan-23 bug regression: buffer candles are caller's responsibility
+  - Columnar detect_swings_array parity with detect_swings
 """
 
 import json
 from datetime import datetime
 from pathlib import Path
 
+import numpy as np
 import pytest
 from pydantic import ValidationError
 
 from src.domain.structure.models import Candle, Swing, SwingType
-from src.domain.structure.swing_detection import detect_swings
+from src.domain.structure.swing_detection import SWING_DTYPE, detect_swings, detect_swings_array
 
 # ---------------------------------------------------------------------------
 # Helpers
@@ -479,3 +481,118 @@ class TestBufferCandleRegression:
         assert last_swing_time not in [s.open_time for s in trimmed_swings], (
             "Without the last buffer candle the boundary swing MUST be missed"
         )
+
+
+# ---------------------------------------------------------------------------
+# Columnar detection: detect_swings_array
+# ---------------------------------------------------------------------------
+
+
+def _columns(candles: list[Candle]) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Split candles into (open_time, high, low) NumPy columns."""
+    open_time = np.array([c.open_time for c in candles], dtype="datetime64[us]")
+    high = np.array([c.high for c in candles])
+    low = np.array([c.low for c in candles])
+    return open_time, high, low
+
+
+def _random_walk_candles(n: int, seed: int) -> list[Candle]:
+    """Random-walk EURUSD 1H candles with rounded prices, so equal extremes occur."""
+    rng = np.random.default_rng(seed)
+    closes = 1.05 + np.cumsum(rng.normal(0, 0.0008, n))
+    candles = []
+    prev_close = 1.05
+    for i, close in enumerate(closes):
+        o = round(prev_close, 4)
+        c = round(float(close), 4)
+        h = round(max(o, c) + abs(rng.normal(0, 0.0004)), 4)
+        lo = round(min(o, c) - abs(rng.normal(0, 0.0004)), 4)
+        candles.append(_candle(datetime(2024, 1, 1) + i * (_T1 - _T0), o, h, lo, c))
+        prev_close = c
+    return candles
+
+
+def _as_tuples(swings: list[Swing]) -> list[tuple[datetime, str, float]]:
+    return [(s.open_time, s.type.value, s.price) for s in swings]
+
+
+def _array_as_tuples(swings: np.ndarray) -> list[tuple[datetime, str, float]]:
+    return [
+        (t.astype(datetime), str(kind), float(price))
+        for t, kind, price in zip(swings["open_time"], swings["type"], swings["price"], strict=True)
+    ]
+
+
+class TestDetectSwingsArray:
+    """The columnar entry point must match detect_swings exactly."""
+
+    def test_returns_structured_swing_dtype(self) -> None:
+        candles, _ = _load_fixture()
+        swings = detect_swings_array(*_columns(candles))
+        assert swings.dtype == SWING_DTYPE
+
+    def test_eurusd_feb_2025_matches_sql_fixture(self) -> None:
+        candles, expected = _load_fixture()
+        swings = detect_swings_array(*_columns(candles))
+
+        assert len(swings) == len(expected)
+        for row, exp in zip(swings, expected, strict=True):
+            assert row["open_time"].astype(datetime) == datetime.fromisoformat(exp["open_time"])
+            assert row["type"] == exp["type"]
+            assert abs(row["price"] - exp["price"]) < 1e-8
+
+    def test_matches_detect_swings_on_fixture(self) -> None:
+        candles, _ = _load_fixture()
+        expected = _as_tuples(detect_swings(candles, "EURUSD", "1H"))
+        assert _array_as_tuples(detect_swings_array(*_columns(candles))) == expected
+
+    @pytest.mark.parametrize("min_swing_pips", [None, 5.0, 12.0])
+    def test_matches_detect_swings_on_random_walk(self, min_swing_pips: float | None) -> None:
+        candles = _random_walk_candles(2_000, seed=7)
+        expected = _as_tuples(detect_swings(candles, "EURUSD", "1H", min_swing_pips))
+        got = detect_swings_array(*_columns(candles), "EURUSD", min_swing_pips)
+        assert _array_as_tuples(got) == expected
+
+    def test_dual_swing_high_before_low(self) -> None:
+        candles = [
+            _candle(_T0, 1.0220, 1.0230, 1.0170, 1.0220),
+            _candle(_T1, 1.0200, 1.0280, 1.0120, 1.0200),
+            _candle(_T2, 1.0200, 1.0250, 1.0160, 1.0200),
+        ]
+        swings = detect_swings_array(*_columns(candles))
+        assert swings["type"].tolist() == ["HIGH", "LOW"]
+        assert swings["price"].tolist() == [1.0280, 1.0120]
+
+    def test_no_swings_returns_empty_array(self) -> None:
+        candles = [
+            _candle(_T0, 1.0200, 1.0210, 1.0190, 1.0205),
+            _candle(_T1, 1.0205, 1.0220, 1.0200, 1.0215),
+            _candle(_T2, 1.0215, 1.0230, 1.0210, 1.0225),
+        ]
+        swings = detect_swings_array(*_columns(candles))
+        assert len(swings) == 0
+        assert swings.dtype == SWING_DTYPE
+
+    def test_raises_on_two_candles(self) -> None:
+        open_time, high, low = _columns(_load_fixture()[0][:2])
+        with pytest.raises(ValueError, match="3 candles"):
+            detect_swings_array(open_time, high, low)
+
+    def test_raises_on_length_mismatch(self) -> None:
+        open_time, high, low = _columns(_load_fixture()[0])
+        with pytest.raises(ValueError, match="same length"):
+            detect_swings_array(open_time, high[:-1], low)
+
+    def test_raises_on_duplicate_timestamps(self) -> None:
+        open_time, high, low = _columns(_load_fixture()[0])
+        open_time[5] = open_time[4]
+        with pytest.raises(ValueError, match="sorted ascending"):
+            detect_swings_array(open_time, high, low)
+
+    def test_filter_unknown_pair_raises_value_error(self) -> None:
+        with pytest.raises(ValueError, match="Unknown pair"):
+            detect_swings_array(*_columns(_load_fixture()[0]), "XYZUSD", 5.0)
+
+    def test_filter_without_pair_raises_value_error(self) -> None:
+        with pytest.raises(ValueError, match="pair is required"):
+            detect_swings_array(*_columns(_load_fixture()[0]), min_swing_pips=5.0)
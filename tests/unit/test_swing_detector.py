@@ -0,0 +1,170 @@
+"""Unit tests for the incremental SwingDetector.
+
+Covers:
+  - Parity with batch detect_swings (fixture and random walk, with and without filter)
+  - Per-(pair, timeframe) isolation of the 3-candle ring
+  - Ordering and unknown-pair errors
+  - Checkpoint / restore resuming mid-stream without replaying history
+"""
+
+import json
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from src.domain.structure.models import Candle, SwingType
+from src.domain.structure.swing_detection import detect_swings
+from src.domain.structure.swing_detector import SwingDetector
+
+FIXTURES_PATH = Path(__file__).parent.parent / "fixtures" / "candles.json"
+
+
+def _fixture_candles() -> list[Candle]:
+    data = json.loads(FIXTURES_PATH.read_text())
+    return [
+        Candle(
+            pair=data["pair"],
+            timeframe=data["timeframe"],
+            open_time=datetime.fromisoformat(row["open_time"]),
+            open=row["open"],
+            high=row["high"],
+            low=row["low"],
+            close=row["close"],
+        )
+        for row in data["candles"]
+    ]
+
+
+def _random_walk_candles(n: int, seed: int, pair: str = "EURUSD", tf: str = "1H") -> list[Candle]:
+    rng = np.random.default_rng(seed)
+    candles = []
+    prev_close = 1.05
+    for i in range(n):
+        o = round(prev_close, 4)
+        c = round(o + rng.normal(0, 0.0008), 4)
+        h = round(max(o, c) + abs(rng.normal(0, 0.0004)), 4)
+        lo = round(min(o, c) - abs(rng.normal(0, 0.0004)), 4)
+        candles.append(
+            Candle(
+                pair=pair,
+                timeframe=tf,
+                open_time=datetime(2024, 1, 1) + timedelta(hours=i),
+                open=o,
+                high=h,
+                low=lo,
+                close=c,
+            )
+        )
+        prev_close = c
+    return candles
+
+
+def _stream(detector: SwingDetector, candles: list[Candle]) -> list:
+    return [swing for candle in candles for swing in detector.update(candle)]
+
+
+class TestSwingDetectorParity:
+    """Streaming output must equal batch detect_swings output."""
+
+    def test_fixture_matches_batch(self) -> None:
+        candles = _fixture_candles()
+        assert _stream(SwingDetector(), candles) == detect_swings(candles, "EURUSD", "1H")
+
+    @pytest.mark.parametrize("min_swing_pips", [None, 5.0, 12.0])
+    def test_random_walk_matches_batch(self, min_swing_pips: float | None) -> None:
+        candles = _random_walk_candles(1_500, seed=11)
+        filters = {"1H": min_swing_pips} if min_swing_pips is not None else None
+        expected = detect_swings(candles, "EURUSD", "1H", min_swing_pips)
+        assert _stream(SwingDetector(filters), candles) == expected
+
+    def test_filter_only_applies_to_listed_timeframe(self) -> None:
+        candles = _random_walk_candles(300, seed=3, tf="4H")
+        detector = SwingDetector({"1H": 1_000.0})
+        assert _stream(detector, candles) == detect_swings(candles, "EURUSD", "4H")
+
+
+class TestSwingDetectorBehaviour:
+    """Ring handling and error paths."""
+
+    def test_first_two_candles_emit_nothing(self) -> None:
+        detector = SwingDetector()
+        candles = _fixture_candles()
+        assert detector.update(candles[0]) == []
+        assert detector.update(candles[1]) == []
+
+    def test_dual_swing_emitted_high_first(self) -> None:
+        detector = SwingDetector()
+        candles = _fixture_candles()
+        dual_time = datetime(2025, 2, 3, 15, 0, 0)
+        emitted = []
+        for candle in candles:
+            swings = detector.update(candle)
+            if swings and swings[0].open_time == dual_time:
+                emitted = swings
+        assert [s.type for s in emitted] == [SwingType.HIGH, SwingType.LOW]
+
+    def test_series_are_isolated(self) -> None:
+        eurusd = _random_walk_candles(200, seed=1)
+        gbpusd = _random_walk_candles(200, seed=2, pair="GBPUSD")
+        detector = SwingDetector()
+        interleaved = [c for pair in zip(eurusd, gbpusd, strict=True) for c in pair]
+        swings = _stream(detector, interleaved)
+        assert [s for s in swings if s.pair == "EURUSD"] == detect_swings(eurusd, "EURUSD", "1H")
+        assert [s for s in swings if s.pair == "GBPUSD"] == detect_swings(gbpusd, "GBPUSD", "1H")
+
+    def test_out_of_order_candle_raises(self) -> None:
+        detector = SwingDetector()
+        candles = _fixture_candles()
+        detector.update(candles[1])
+        with pytest.raises(ValueError, match="ascending"):
+            detector.update(candles[0])
+
+    def test_duplicate_candle_raises(self) -> None:
+        detector = SwingDetector()
+        candles = _fixture_candles()
+        detector.update(candles[0])
+        with pytest.raises(ValueError, match="ascending"):
+            detector.update(candles[0])
+
+    def test_unknown_pair_with_filter_raises(self) -> None:
+        detector = SwingDetector({"1H": 5.0})
+        candle = _fixture_candles()[0].model_copy(update={"pair": "XYZUSD"})
+        with pytest.raises(ValueError, match="Unknown pair"):
+            detector.update(candle)
+
+
+class TestSwingDetectorCheckpoint:
+    """A restored detector resumes without replaying history."""
+
+    def test_checkpoint_is_json_serialisable(self) -> None:
+        detector = SwingDetector({"1H": 5.0})
+        _stream(detector, _fixture_candles())
+        state = json.loads(json.dumps(detector.checkpoint()))
+        assert state["min_swing_pips"] == {"1H": 5.0}
+        assert len(state["series"][0]["candles"]) == 2
+
+    def test_restore_resumes_mid_stream(self) -> None:
+        candles = _random_walk_candles(500, seed=5)
+        expected = detect_swings(candles, "EURUSD", "1H", 5.0)
+
+        first = SwingDetector({"1H": 5.0})
+        head = _stream(first, candles[:250])
+        state = json.loads(json.dumps(first.checkpoint()))
+
+        resumed = SwingDetector.restore(state)
+        tail = _stream(resumed, candles[250:])
+        assert head + tail == expected
+
+    def test_restored_detector_rejects_old_candles(self) -> None:
+        candles = _fixture_candles()
+        detector = SwingDetector()
+        _stream(detector, candles[:10])
+        resumed = SwingDetector.restore(detector.checkpoint())
+        with pytest.raises(ValueError, match="ascending"):
+            resumed.update(candles[5])
+
+    def test_unknown_version_raises(self) -> None:
+        with pytest.raises(ValueError, match="checkpoint version"):
+            SwingDetector.restore({"version": 99, "min_swing_pips": {}, "series": []})
@@ -0,0 +1,86 @@
+"""Unit tests for the parallel multi-series swing scan."""
+
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from src.domain.structure.models import CandleSeries
+from src.domain.structure.swing_detection import SWING_DTYPE, detect_swings_array
+from src.domain.structure.swing_scan import default_min_swing_pips, scan_swings
+
+
+def _random_series(pair: str, timeframe: str, n: int, seed: int) -> CandleSeries:
+    rng = np.random.default_rng(seed)
+    close = np.round(1.05 + np.cumsum(rng.normal(0, 0.0008, n)), 4)
+    open_ = np.concatenate([[1.05], close[:-1]])
+    high = np.maximum(open_, close) + np.round(np.abs(rng.normal(0, 0.0004, n)), 4)
+    low = np.minimum(open_, close) - np.round(np.abs(rng.normal(0, 0.0004, n)), 4)
+    open_time = np.datetime64(datetime(2024, 1, 1)) + np.arange(n) * np.timedelta64(
+        timedelta(hours=1)
+    )
+    return CandleSeries(pair, timeframe, open_time, open_, high, low, close)
+
+
+def _universe() -> dict[tuple[str, str], CandleSeries]:
+    return {
+        (pair, tf): _random_series(pair, tf, 1_000, seed=i)
+        for i, (pair, tf) in enumerate(
+            (p, t) for p in ("EURUSD", "GBPUSD") for t in ("1H", "4H", "D", "5M")
+        )
+    }
+
+
+def _expected(
+    universe: dict[tuple[str, str], CandleSeries], filters: dict[str, float]
+) -> dict[tuple[str, str], np.ndarray]:
+    return {
+        (pair, tf): detect_swings_array(s.open_time, s.high, s.low, pair, filters.get(tf))
+        for (pair, tf), s in universe.items()
+    }
+
+
+class TestScanSwings:
+    """Parallel scans must match serial detect_swings_array per series."""
+
+    @pytest.mark.parametrize("executor", ["thread", "process"])
+    def test_matches_serial_detection(self, executor: str) -> None:
+        universe = _universe()
+        filters = {"1H": 5.0, "4H": 10.0}
+        results = scan_swings(universe, min_swing_pips=filters, executor=executor, max_workers=2)
+
+        assert list(results) == list(universe)
+        for key, expected in _expected(universe, filters).items():
+            assert results[key].dtype == SWING_DTYPE
+            np.testing.assert_array_equal(results[key], expected)
+
+    def test_defaults_to_tolerances_config(self) -> None:
+        universe = _universe()
+        results = scan_swings(universe, executor="thread")
+        expected = _expected(universe, default_min_swing_pips())
+        for key in universe:
+            np.testing.assert_array_equal(results[key], expected[key])
+
+    def test_default_table_covers_structure_timeframes(self) -> None:
+        assert set(default_min_swing_pips()) == {"1H", "4H", "D"}
+
+    def test_empty_filter_disables_filtering(self) -> None:
+        universe = _universe()
+        results = scan_swings(universe, min_swing_pips={}, executor="thread")
+        for key, expected in _expected(universe, {}).items():
+            np.testing.assert_array_equal(results[key], expected)
+
+    def test_accepts_candle_lists_and_external_executor(self) -> None:
+        series = _random_series("EURUSD", "1H", 200, seed=9)
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            results = scan_swings({("EURUSD", "1H"): series.to_candles()}, executor=pool)
+        np.testing.assert_array_equal(
+            results[("EURUSD", "1H")],
+            detect_swings_array(series.open_time, series.high, series.low, "EURUSD", 5.0),
+        )
+
+    def test_failure_names_the_series(self) -> None:
+        series = _random_series("XYZUSD", "1H", 50, seed=1)
+        with pytest.raises(ValueError, match=r"XYZUSD 1H.*Unknown pair"):
+            scan_swings({("XYZUSD", "1H"): series}, executor="thread")
@@ -0,0 +1,192 @@
+"""Unit tests for swing strength classification.
+
+Covers:
+  - STRONG / INTERNAL / WEAK labels, strict breaks, HIGH and LOW independence
+  - Parity of the O(n) sweep with a quadratic reference on random walks
+  - Array entry point: breaking swing row and time
+  - Incremental tracker: only broken swings reclassified, parity with batch
+  - Tracker checkpoint / restore
+"""
+
+import json
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from src.domain.structure.models import CandleSeries, Swing, SwingStrength, SwingType
+from src.domain.structure.swing_detection import (
+    SWING_DTYPE,
+    detect_swings,
+    detect_swings_array,
+)
+from src.domain.structure.swing_strength import (
+    STRENGTH_DTYPE,
+    SwingStrengthTracker,
+    classify_swing_strength,
+    classify_swing_strength_array,
+)
+
+_T0 = datetime(2024, 1, 1)
+STRONG, INTERNAL, WEAK = SwingStrength.STRONG, SwingStrength.INTERNAL, SwingStrength.WEAK
+
+
+def _swings(spec: list[tuple[str, float]], pair: str = "EURUSD") -> list[Swing]:
+    return [
+        Swing(
+            pair=pair,
+            timeframe="1H",
+            open_time=_T0 + timedelta(hours=i),
+            type=SwingType(t),
+            price=p,
+        )
+        for i, (t, p) in enumerate(spec)
+    ]
+
+
+def _random_series(n: int, seed: int) -> CandleSeries:
+    rng = np.random.default_rng(seed)
+    close = 1.05 + np.cumsum(rng.normal(0, 0.0008, n))
+    open_ = np.concatenate([[1.05], close[:-1]])
+    high = np.maximum(open_, close) + np.abs(rng.normal(0, 0.0004, n))
+    low = np.minimum(open_, close) - np.abs(rng.normal(0, 0.0004, n))
+    times = np.datetime64(_T0, "us") + np.arange(n) * np.timedelta64(1, "h")
+    return CandleSeries("EURUSD", "1H", times, open_, high, low, close)
+
+
+def _reference(swings: list[Swing]) -> list[SwingStrength]:
+    """Quadratic definition: scan forward for the first breaking swing."""
+    out = []
+    for i, s in enumerate(swings):
+        later = [t for t in swings[i + 1 :] if t.type == s.type]
+        strength = STRONG
+        for k, t in enumerate(later):
+            if (t.price > s.price) if s.type == SwingType.HIGH else (t.price < s.price):
+                strength = WEAK if k == 0 else INTERNAL
+                break
+        out.append(strength)
+    return out
+
+
+class TestClassification:
+    """Labels from a hand-built sequence."""
+
+    def test_labels(self) -> None:
+        swings = _swings(
+            [
+                ("HIGH", 1.10),  # broken by 1.12, two highs later -> INTERNAL
+                ("HIGH", 1.09),  # broken by the next high -> WEAK
+                ("HIGH", 1.095),  # broken by the next high -> WEAK
+                ("HIGH", 1.12),  # never broken -> STRONG
+                ("LOW", 1.00),
+                ("LOW", 1.00),  # equal price does not break
+            ]
+        )
+        result = classify_swing_strength(swings)
+        assert [s.swing_strength for s in result] == [INTERNAL, WEAK, WEAK, STRONG, STRONG, STRONG]
+        assert [s.price for s in result] == [s.price for s in swings]
+
+    def test_types_are_independent(self) -> None:
+        swings = _swings([("LOW", 1.0), ("HIGH", 1.1), ("LOW", 0.9), ("HIGH", 1.2)])
+        assert [s.swing_strength for s in classify_swing_strength(swings)] == [
+            WEAK,
+            WEAK,
+            STRONG,
+            STRONG,
+        ]
+
+    @pytest.mark.parametrize("seed", [1, 2, 3])
+    def test_matches_quadratic_reference(self, seed: int) -> None:
+        swings = detect_swings(_random_series(3000, seed), "EURUSD", "1H")
+        result = classify_swing_strength(swings)
+        assert [s.swing_strength for s in result] == _reference(swings)
+        assert {INTERNAL, WEAK, STRONG} <= {s.swing_strength for s in result}
+
+    def test_accepts_records(self) -> None:
+        series = _random_series(500, 4)
+        records = detect_swings(series, "EURUSD", "1H", records=True)
+        models = detect_swings(series, "EURUSD", "1H")
+        assert classify_swing_strength(records) == classify_swing_strength(models)
+
+    def test_mixed_series_rejected(self) -> None:
+        swings = _swings([("HIGH", 1.1)]) + _swings([("HIGH", 1.2)], pair="GBPUSD")
+        with pytest.raises(ValueError, match="one pair and timeframe"):
+            classify_swing_strength(swings)
+
+    def test_empty(self) -> None:
+        assert classify_swing_strength([]) == []
+        assert len(classify_swing_strength_array(np.empty(0, dtype=SWING_DTYPE))) == 0
+
+
+class TestArray:
+    """classify_swing_strength_array."""
+
+    def test_breaking_swing_and_time(self) -> None:
+        series = _random_series(2000, 5)
+        array = detect_swings_array(series.open_time, series.high, series.low)
+        out = classify_swing_strength_array(array)
+        assert out.dtype == STRENGTH_DTYPE and len(out) == len(array)
+        models = classify_swing_strength(detect_swings(series, "EURUSD", "1H"))
+        assert out["strength"].tolist() == [s.swing_strength for s in models]
+        broken = out["broken_by"] >= 0
+        assert np.all(np.isnat(out["broken_time"][~broken]))
+        by = out["broken_by"][broken]
+        np.testing.assert_array_equal(out["broken_time"][broken], array["open_time"][by])
+        assert np.all(array["type"][by] == array["type"][broken])
+        assert np.all(by > np.flatnonzero(broken))
+
+
+class TestTracker:
+    """Incremental classification."""
+
+    def test_reclassifies_only_broken_swings(self) -> None:
+        tracker = SwingStrengthTracker()
+        a, b, c, d = _swings([("HIGH", 1.10), ("HIGH", 1.09), ("LOW", 1.0), ("HIGH", 1.11)])
+        assert tracker.update(a) == [a.model_copy(update={"swing_strength": STRONG})]
+        tracker.update(b)
+        tracker.update(c)
+        changed = tracker.update(d)
+        assert [(s.open_time, s.swing_strength) for s in changed] == [
+            (a.open_time, INTERNAL),
+            (b.open_time, WEAK),
+            (d.open_time, STRONG),
+        ]
+        assert [s.open_time for s in tracker.unbroken("EURUSD", "1H")] == [
+            c.open_time,
+            d.open_time,
+        ]
+
+    @pytest.mark.parametrize("seed", [6, 7])
+    def test_final_labels_match_batch(self, seed: int) -> None:
+        swings = detect_swings(_random_series(3000, seed), "EURUSD", "1H")
+        tracker = SwingStrengthTracker()
+        latest: dict[tuple[datetime, SwingType], SwingStrength | None] = {}
+        for swing in swings:
+            for changed in tracker.update(swing):
+                latest[changed.open_time, changed.type] = changed.swing_strength
+        expected = classify_swing_strength(swings)
+        assert [latest[s.open_time, s.type] for s in expected] == [
+            s.swing_strength for s in expected
+        ]
+
+    def test_series_are_isolated(self) -> None:
+        tracker = SwingStrengthTracker()
+        tracker.update(_swings([("HIGH", 1.1)])[0])
+        [only] = tracker.update(_swings([("HIGH", 1.2)], pair="GBPUSD")[0])
+        assert only.pair == "GBPUSD"
+        assert len(tracker.unbroken("EURUSD", "1H")) == 1
+
+    def test_checkpoint_restore(self) -> None:
+        swings = detect_swings(_random_series(1500, 8), "EURUSD", "1H")
+        head, tail = swings[: len(swings) // 2], swings[len(swings) // 2 :]
+        live = SwingStrengthTracker()
+        for swing in head:
+            live.update(swing)
+        restored = SwingStrengthTracker.restore(json.loads(json.dumps(live.checkpoint())))
+        assert restored.unbroken("EURUSD", "1H") == live.unbroken("EURUSD", "1H")
+        for swing in tail:
+            assert restored.update(swing) == live.update(swing)
+
+    def test_restore_rejects_unknown_version(self) -> None:
+        with pytest.raises(ValueError, match="version"):
+            SwingStrengthTracker.restore({"version": 99, "series": []})
@@ -0,0 +1,289 @@
+"""Unit tests for the batched trade monitor.
+
+Covers:
+  - StopHit / TargetHit / TradeExpired for LONG and SHORT, with result_r
+  - Stop-first resolution when one candle reaches both levels
+  - Entry-time gating, expiry across a data gap, per-pair isolation
+  - open / cancel bookkeeping, duplicate ids, OpenTrade level validation
+  - Parity with backtest_array on a random walk
+  - Event round-trip through decode_event, import order of events/execution
+"""
+
+import subprocess
+import sys
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from src.domain.execution import OpenTrade, TradeDirection, TradeMonitor
+from src.domain.research.backtest import backtest_array
+from src.domain.structure.models import Candle
+from src.events import StopHit, TargetHit, TradeExpired, decode_event, encode_event
+
+_T0 = datetime(2025, 2, 3, 0, 0)
+_HOUR = timedelta(hours=1)
+
+
+def _trade(
+    trade_id: str = "t1",
+    direction: TradeDirection = TradeDirection.LONG,
+    stop: float = 1.0990,
+    target: float = 1.1020,
+    entry_time: datetime = _T0,
+    pair: str = "EURUSD",
+    expires_at: datetime | None = None,
+) -> OpenTrade:
+    return OpenTrade(
+        trade_id=trade_id,
+        pair=pair,
+        direction=direction,
+        entry_time=entry_time,
+        entry_price=1.1000,
+        stop_loss=stop,
+        take_profit=target,
+        expires_at=expires_at,
+    )
+
+
+def _short(trade_id: str = "s1", **kwargs) -> OpenTrade:
+    return _trade(trade_id, TradeDirection.SHORT, stop=1.1010, target=1.0980, **kwargs)
+
+
+def _candle(
+    hour: int, high: float, low: float, close: float | None = None, pair: str = "EURUSD"
+) -> Candle:
+    close = (high + low) / 2 if close is None else close
+    return Candle(
+        pair=pair,
+        timeframe="1H",
+        open_time=_T0 + hour * _HOUR,
+        open=close,
+        high=high,
+        low=low,
+        close=close,
+    )
+
+
+class TestResolution:
+    """Stops, targets and stop-first ordering."""
+
+    def test_long_target(self) -> None:
+        monitor = TradeMonitor()
+        monitor.open(_trade())
+        assert monitor.on_candle(_candle(0, 1.1015, 1.0995)) == []
+        [event] = monitor.on_candle(_candle(1, 1.1021, 1.1005))
+        assert isinstance(event, TargetHit)
+        assert (event.trade_id, event.exit_price) == ("t1", 1.1020)
+        assert event.exit_time == _T0 + 2 * _HOUR
+        assert event.result_r == pytest.approx(2.0)
+        assert "t1" not in monitor and len(monitor) == 0
+
+    def test_long_stop_touch(self) -> None:
+        monitor = TradeMonitor()
+        monitor.open(_trade())
+        [event] = monitor.on_candle(_candle(0, 1.1005, 1.0990))
+        assert isinstance(event, StopHit)
+        assert (event.exit_price, event.result_r) == (1.0990, -1.0)
+
+    def test_short_stop_and_target(self) -> None:
+        monitor = TradeMonitor()
+        monitor.open_many([_short("s1"), _short("s2", entry_time=_T0 + _HOUR)])
+        [stop] = monitor.on_candle(_candle(0, 1.1010, 1.0995))
+        assert isinstance(stop, StopHit) and stop.trade_id == "s1"
+        [target] = monitor.on_candle(_candle(1, 1.1000, 1.0980))
+        assert isinstance(target, TargetHit) and target.trade_id == "s2"
+        assert target.direction is TradeDirection.SHORT
+        assert target.result_r == pytest.approx(2.0)
+
+    def test_both_levels_in_one_candle_is_a_stop(self) -> None:
+        monitor = TradeMonitor()
+        monitor.open_many([_trade("long"), _short("short")])
+        events = monitor.on_candle(_candle(0, 1.1030, 1.0970))
+        assert [(type(e), e.trade_id) for e in events] == [(StopHit, "long"), (StopHit, "short")]
+
+    def test_event_order(self) -> None:
+        monitor = TradeMonitor()
+        monitor.open_many(
+            [
+                _trade("b", target=1.1005),
+                _trade("a", stop=1.0999),
+                _trade("c", target=1.1030, expires_at=_T0 + _HOUR),
+            ]
+        )
+        events = monitor.on_candle(_candle(0, 1.1006, 1.0998, close=1.1002))
+        assert [(type(e), e.trade_id) for e in events] == [
+            (StopHit, "a"),
+            (TargetHit, "b"),
+            (TradeExpired, "c"),
+        ]
+
+    def test_pairs_are_isolated(self) -> None:
+        monitor = TradeMonitor()
+        monitor.open_many([_trade("eu"), _trade("gu", pair="GBPUSD")])
+        assert monitor.on_candle(_candle(0, 1.1030, 1.1000, pair="AUDUSD")) == []
+        [event] = monitor.on_candle(_candle(0, 1.1030, 1.1000, pair="GBPUSD"))
+        assert event.trade_id == "gu"
+        assert [t.trade_id for t in monitor.open_trades()] == ["eu"]
+
+
+class TestLifetime:
+    """Entry gating and expiry."""
+
+    def test_candles_before_entry_are_ignored(self) -> None:
+        monitor = TradeMonitor()
+        monitor.open(_trade(entry_time=_T0 + _HOUR))
+        assert monitor.on_candle(_candle(0, 1.1030, 1.0970)) == []
+        assert len(monitor) == 1
+
+    def test_default_expiry_at_last_live_close(self) -> None:
+        monitor = TradeMonitor(expiry_hours=3)
+        monitor.open(_trade())
+        for hour in range(2):
+            assert monitor.on_candle(_candle(hour, 1.1005, 1.0995)) == []
+        [event] = monitor.on_candle(_candle(2, 1.1005, 1.0995, close=1.1004))
+        assert isinstance(event, TradeExpired)
+        assert event.exit_time == _T0 + 3 * _HOUR
+        assert event.exit_price == 1.1004
+        assert event.result_r == pytest.approx(0.4)
+
+    def test_expiry_hours_default_from_config(self) -> None:
+        assert TradeMonitor().expiry == timedelta(hours=48)
+
+    def test_expiry_across_gap_uses_last_close(self) -> None:
+        monitor = TradeMonitor(expiry_hours=2)
+        monitor.open(_trade())
+        monitor.on_candle(_candle(0, 1.1005, 1.0995, close=1.0995))
+        # Candle 1 is missing; candle 5 opens after the expiry.
+        [event] = monitor.on_candle(_candle(5, 1.1030, 1.0970))
+        assert isinstance(event, TradeExpired)
+        assert (event.exit_time, event.exit_price) == (_T0 + _HOUR, 1.0995)
+        assert event.result_r == pytest.approx(-0.5)
+
+    def test_expiry_before_any_candle_marks_at_entry(self) -> None:
+        monitor = TradeMonitor(expiry_hours=1)
+        monitor.open(_trade())
+        [event] = monitor.on_candle(_candle(4, 1.1030, 1.0970))
+        assert isinstance(event, TradeExpired)
+        assert (event.exit_price, event.result_r) == (1.1000, 0.0)
+
+
+class TestBookkeeping:
+    """open / cancel and validation."""
+
+    def test_duplicate_id_rejected(self) -> None:
+        monitor = TradeMonitor()
+        monitor.open(_trade())
+        with pytest.raises(ValueError, match="already open"):
+            monitor.open(_short("t1"))
+
+    def test_cancel(self) -> None:
+        monitor = TradeMonitor()
+        monitor.open_many([_trade("a"), _trade("b")])
+        assert monitor.cancel("a")
+        monitor.on_candle(_candle(0, 1.1005, 1.0995))  # indexes built
+        assert monitor.cancel("b")
+        assert not monitor.cancel("b")
+        assert monitor.on_candle(_candle(1, 1.1030, 1.0970)) == []
+        monitor.open(_trade("a"))  # id is free again
+        assert len(monitor) == 1
+
+    def test_compaction_keeps_survivors(self) -> None:
+        monitor = TradeMonitor()
+        monitor.open_many(_trade(f"x{i}", stop=1.0990 + i * 1e-6) for i in range(200))
+        monitor.open(_trade("keep", stop=1.0900))
+        assert len(monitor.on_candle(_candle(0, 1.1005, 1.0985))) == 200
+        monitor.open(_trade("late", entry_time=_T0 + 2 * _HOUR))
+        [event] = monitor.on_candle(_candle(1, 1.1030, 1.0995))
+        assert event.trade_id == "keep"
+        assert [t.trade_id for t in monitor.open_trades("EURUSD")] == ["late"]
+
+    @pytest.mark.parametrize(
+        ("direction", "stop", "target"),
+        [
+            (TradeDirection.LONG, 1.1010, 1.1020),
+            (TradeDirection.LONG, 1.0990, 1.0995),
+            (TradeDirection.SHORT, 1.0990, 1.0980),
+        ],
+    )
+    def test_levels_must_straddle_entry(
+        self, direction: TradeDirection, stop: float, target: float
+    ) -> None:
+        with pytest.raises(ValueError, match="opposite sides"):
+            _trade(direction=direction, stop=stop, target=target)
+
+
+class TestBacktestParity:
+    """Same outcomes as the vectorised backtester."""
+
+    def test_random_walk(self) -> None:
+        rng = np.random.default_rng(11)
+        n, m = 400, 300
+        close = 1.1 + np.cumsum(rng.normal(0, 0.0006, n))
+        open_ = np.concatenate([[1.1], close[:-1]])
+        spread = np.abs(rng.normal(0, 0.0004, n))
+        high, low = np.maximum(open_, close) + spread, np.minimum(open_, close) - spread
+        times = np.datetime64(_T0, "us") + np.arange(n) * np.timedelta64(1, "h")
+
+        at = rng.integers(0, n - 60, m)
+        is_long = rng.random(m) < 0.5
+        entry = close[at]
+        risk = rng.uniform(0.0005, 0.003, m)
+        stop = np.where(is_long, entry - risk, entry + risk)
+        entry_time = times[at] + np.timedelta64(1, "h")
+        expected = backtest_array(
+            times, high, low, close, entry_time, is_long, entry, stop, target_r=(1.5,)
+        )
+
+        monitor = TradeMonitor()
+        sign = np.where(is_long, 1.0, -1.0)
+        monitor.open_many(
+            OpenTrade(
+                trade_id=str(i),
+                pair="EURUSD",
+                direction=TradeDirection.LONG if is_long[i] else TradeDirection.SHORT,
+                entry_time=entry_time[i].item(),
+                entry_price=entry[i],
+                stop_loss=stop[i],
+                take_profit=entry[i] + sign[i] * risk[i] * 1.5,
+            )
+            for i in range(m)
+        )
+        got: dict[int, tuple[str, float]] = {}
+        for i in range(n):
+            candle_events = monitor.check(
+                "EURUSD",
+                times[i].item(),
+                times[i].item() + _HOUR,
+                high[i],
+                low[i],
+                close[i],
+            )
+            for event in candle_events:
+                got[int(event.trade_id)] = (event.topic, event.result_r)
+
+        topics = {"LOSS": "trade.stop_hit", "WIN": "trade.target_hit", "EXPIRED": "trade.expired"}
+        resolved = expected[expected["outcome"] != ""]
+        assert len(resolved) > m // 2
+        assert set(got) == set(resolved["signal"].tolist())
+        for row in resolved:
+            topic, result_r = got[int(row["signal"])]
+            assert topic == topics[str(row["outcome"])]
+            assert result_r == pytest.approx(row["result_r"])
+        assert len(monitor) == m - len(resolved)
+
+
+class TestEvents:
+    """Transport encoding and import order."""
+
+    def test_round_trip(self) -> None:
+        monitor = TradeMonitor()
+        monitor.open(_short())
+        [event] = monitor.on_candle(_candle(0, 1.1000, 1.0975))
+        assert decode_event(event.topic, encode_event(event)) == event
+        assert event.topic == "trade.target_hit"
+
+    @pytest.mark.parametrize("first", ["src.events", "src.domain.execution"])
+    def test_import_order(self, first: str) -> None:
+        code = f"import {first}; import src.events, src.domain.execution"
+        subprocess.run([sys.executable, "-c", code], check=True)
@@ -0,0 +1,148 @@
+"""Unit tests for the trusted (validate-once) construction paths.
+
+Covers:
+  - Candle.trusted equivalence with validated models
+  - Guard on the pydantic internals Candle.trusted relies on
+  - Strict validation still applying to direct construction
+  - CandleSeries.from_rows batch validation and trusted row access
+  - SwingRecord and detect_swings(records=True)
+"""
+
+import json
+import pickle
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+from pydantic import BaseModel, ValidationError
+
+from src.domain.structure.models import (
+    PYDANTIC_INSTANCE_SLOTS,
+    Candle,
+    CandleSeries,
+    Swing,
+    SwingRecord,
+    SwingType,
+)
+from src.domain.structure.swing_detection import detect_swings
+
+FIXTURES_PATH = Path(__file__).parent.parent / "fixtures" / "candles.json"
+
+_T0 = datetime(2025, 1, 1, 0, 0, 0)
+_CANDLE = {
+    "pair": "EURUSD",
+    "timeframe": "1H",
+    "open_time": _T0,
+    "open": 1.1,
+    "high": 1.2,
+    "low": 1.0,
+    "close": 1.15,
+}
+
+
+def _fixture_rows() -> list[tuple[datetime, float, float, float, float]]:
+    data = json.loads(FIXTURES_PATH.read_text())
+    return [
+        (
+            datetime.fromisoformat(row["open_time"]),
+            row["open"],
+            row["high"],
+            row["low"],
+            row["close"],
+        )
+        for row in data["candles"]
+    ]
+
+
+class TestTrustedConstructors:
+    """Trusted models are indistinguishable from validated ones."""
+
+    def test_trusted_candle_equals_validated(self) -> None:
+        trusted = Candle.trusted(**_CANDLE)
+        validated = Candle(**_CANDLE)
+        assert trusted == validated
+        assert hash(trusted) == hash(validated)
+        assert trusted.model_dump() == validated.model_dump()
+        assert trusted.model_dump_json() == validated.model_dump_json()
+
+    def test_trusted_candle_is_frozen(self) -> None:
+        with pytest.raises(ValidationError):
+            Candle.trusted(**_CANDLE).high = 2.0  # type: ignore[misc]
+
+    def test_trusted_candle_state_matches_validated(self) -> None:
+        # Fails if pydantic changes the instance layout trusted() fills in.
+        assert BaseModel.__slots__ == PYDANTIC_INSTANCE_SLOTS
+        trusted = Candle.trusted(**_CANDLE)
+        validated = Candle(**_CANDLE)
+        assert trusted.__getstate__() == validated.__getstate__()
+        assert pickle.loads(pickle.dumps(trusted)) == validated
+        assert trusted.model_copy(update={"close": 1.16}) == validated.model_copy(
+            update={"close": 1.16}
+        )
+        assert trusted.model_fields_set == validated.model_fields_set
+
+    def test_direct_construction_still_validates(self) -> None:
+        with pytest.raises(ValidationError, match="high"):
+            Candle(**{**_CANDLE, "high": 0.9})
+
+
+class TestFromRows:
+    """Bulk construction validates the batch once."""
+
+    def test_rows_round_trip(self) -> None:
+        rows = _fixture_rows()
+        series = CandleSeries.from_rows("EURUSD", "1H", rows)
+        candles = series.to_candles()
+        assert len(candles) == len(rows)
+        assert candles[3] == Candle(
+            pair="EURUSD",
+            timeframe="1H",
+            open_time=rows[3][0],
+            open=rows[3][1],
+            high=rows[3][2],
+            low=rows[3][3],
+            close=rows[3][4],
+        )
+        assert series[-1] == candles[-1]
+
+    def test_invalid_row_rejected_once_for_batch(self) -> None:
+        rows = _fixture_rows()
+        t, o, _, lo, c = rows[7]
+        rows[7] = (t, o, lo - 0.001, lo, c)
+        with pytest.raises(ValueError, match="Invalid OHLC at index 7"):
+            CandleSeries.from_rows("EURUSD", "1H", rows)
+
+    def test_trusted_source_skips_validation(self) -> None:
+        rows = _fixture_rows()
+        rows[0], rows[1] = rows[1], rows[0]
+        series = CandleSeries.from_rows("EURUSD", "1H", rows, validate=False)
+        assert len(series) == len(rows)
+
+    def test_empty_rows(self) -> None:
+        assert len(CandleSeries.from_rows("EURUSD", "1H", [])) == 0
+
+
+class TestSwingRecords:
+    """detect_swings(records=True) returns lightweight tuples."""
+
+    def test_records_match_models(self) -> None:
+        series = CandleSeries.from_rows("EURUSD", "1H", _fixture_rows())
+        models = detect_swings(series, "EURUSD", "1H")
+        records = detect_swings(series, "EURUSD", "1H", records=True)
+        assert all(type(r) is SwingRecord for r in records)
+        assert [r.to_swing() for r in records] == models
+        assert all(type(s) is Swing for s in models)
+
+    def test_records_from_candle_list(self) -> None:
+        candles = CandleSeries.from_rows("EURUSD", "1H", _fixture_rows()).to_candles()
+        records = detect_swings(candles, "EURUSD", "1H", min_swing_pips=5.0, records=True)
+        models = detect_swings(candles, "EURUSD", "1H", min_swing_pips=5.0)
+        assert [tuple(r) for r in records] == [
+            (s.pair, s.timeframe, s.open_time, s.type, s.price) for s in models
+        ]
+
+    def test_record_is_immutable(self) -> None:
+        record = SwingRecord("EURUSD", "1H", _T0, SwingType.HIGH, 1.2)
+        with pytest.raises(AttributeError):
+            record.price = 1.3  # type: ignore[misc]
+        assert not hasattr(record, "__dict__")
@@ -0,0 +1,329 @@
+"""Unit tests for the TwelveData client and adapter.
+
+Covers:
+  - Token bucket bursts, refill waits and oversize requests
+  - Batched symbol requests sized to the credit bucket, query parameters
+  - Retries with backoff on 429/5xx and transport errors; no retry on 4xx
+  - Payload translation into CandleSeries (either order, errors, bad bars)
+  - Concurrent multi-pair, multi-timeframe fetch against a stub server
+  - Freshness watermarks advanced by each fetched series
+"""
+
+import asyncio
+import time
+from collections.abc import Callable
+from datetime import datetime
+from typing import Any
+
+import httpx
+import numpy as np
+import pytest
+
+from src.domain.market_data.ingestion import TwelveDataAdapter, to_series
+from src.domain.observability.metrics import get_metrics_registry
+from src.infrastructure.config import PairConfig, PairsConfig
+from src.infrastructure.twelve_data import (
+    TokenBucket,
+    TwelveDataClient,
+    TwelveDataError,
+    TwelveDataSettings,
+)
+
+_SETTINGS = TwelveDataSettings(
+    twelvedata_api_key="test-key",
+    twelvedata_base_url="https://stub.test",
+    twelvedata_credits_per_minute=6000,
+    twelvedata_max_retries=3,
+    twelvedata_backoff_base_s=0.001,
+    twelvedata_backoff_max_s=0.005,
+)
+
+_PAIRS = PairsConfig(
+    pairs={
+        pair: PairConfig(
+            pip_value=0.0001,
+            pip_digits=4,
+            typical_spread_pips=0.5,
+            twelvedata_symbol=f"{pair[:3]}/{pair[3:]}",
+            active=True,
+        )
+        for pair in ("EURUSD", "GBPUSD", "AUDUSD")
+    }
+)
+
+
+def _values(symbol: str, interval: str, n: int = 3) -> list[dict[str, str]]:
+    base = 1.0 + len(symbol) / 100 + len(interval) / 1000
+    return [
+        {
+            "datetime": f"2025-02-03 0{i}:00:00",
+            "open": f"{base + i / 1e4:.5f}",
+            "high": f"{base + i / 1e4 + 0.0005:.5f}",
+            "low": f"{base + i / 1e4 - 0.0005:.5f}",
+            "close": f"{base + (i + 1) / 1e4:.5f}",
+        }
+        for i in range(n)
+    ]
+
+
+class _Stub:
+    """Stand-in for the TwelveData time_series endpoint."""
+
+    def __init__(self, fail: Callable[[int], httpx.Response | None] | None = None) -> None:
+        self.requests: list[httpx.Request] = []
+        self.fail = fail
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        if self.fail and (response := self.fail(len(self.requests))) is not None:
+            return response
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        params = request.url.params
+        symbols, interval = params["symbol"].split(","), params["interval"]
+        payloads: dict[str, Any] = {
+            s: {"meta": {"symbol": s}, "values": _values(s, interval), "status": "ok"}
+            for s in symbols
+        }
+        if "BAD/SYM" in payloads:
+            payloads["BAD/SYM"] = {"code": 400, "message": "invalid symbol", "status": "error"}
+        body = payloads[symbols[0]] if len(symbols) == 1 else payloads
+        return httpx.Response(200, json=body)
+
+    @property
+    def batches(self) -> list[list[str]]:
+        return [r.url.params["symbol"].split(",") for r in self.requests]
+
+
+def _client(stub: _Stub, limiter: TokenBucket | None = None) -> TwelveDataClient:
+    return TwelveDataClient(_SETTINGS, limiter=limiter, transport=httpx.MockTransport(stub))
+
+
+@pytest.mark.asyncio
+class TestTokenBucket:
+    """Credit limiting."""
+
+    async def test_burst_then_wait(self) -> None:
+        bucket = TokenBucket(rate_per_s=50.0, capacity=2)
+        start = time.monotonic()
+        await bucket.acquire()
+        await bucket.acquire()
+        assert time.monotonic() - start < 0.02
+        await bucket.acquire(2)
+        assert time.monotonic() - start >= 0.035
+
+    async def test_refill_is_capped(self) -> None:
+        now = [0.0]
+        bucket = TokenBucket(rate_per_s=1.0, capacity=3, clock=lambda: now[0])
+        await bucket.acquire(3)
+        now[0] = 100.0
+        assert bucket.tokens == 3
+
+    async def test_oversize_request_rejected(self) -> None:
+        with pytest.raises(ValueError, match="Cannot acquire 9"):
+            await TokenBucket.per_minute(8).acquire(9)
+
+
+@pytest.mark.asyncio
+class TestClient:
+    """Batching and retries."""
+
+    async def test_batches_fit_the_bucket(self) -> None:
+        stub = _Stub()
+        symbols = [f"S{i}/USD" for i in range(7)]
+        async with _client(stub, limiter=TokenBucket(rate_per_s=1000.0, capacity=3)) as client:
+            assert client.batch_size == 3
+            payloads = await client.time_series(symbols, "5min", outputsize=10, start_date=None)
+        assert list(payloads) == symbols
+        assert stub.batches == [symbols[0:3], symbols[3:6], symbols[6:]]
+        params = stub.requests[0].url.params
+        assert params["apikey"] == "test-key"
+        assert (params["interval"], params["timezone"], params["order"]) == ("5min", "UTC", "ASC")
+        assert params["outputsize"] == "10"
+        assert "start_date" not in params
+
+    async def test_single_symbol_response_is_keyed(self) -> None:
+        async with _client(_Stub()) as client:
+            payloads = await client.time_series(["EUR/USD", "EUR/USD"], "1h")
+        assert list(payloads) == ["EUR/USD"]
+        assert payloads["EUR/USD"]["status"] == "ok"
+
+    @pytest.mark.parametrize(
+        "failure",
+        [
+            httpx.Response(429, json={"code": 429, "message": "out of credits", "status": "error"}),
+            httpx.Response(200, json={"code": 429, "message": "out of credits", "status": "error"}),
+            httpx.Response(503, text="unavailable"),
+        ],
+    )
+    async def test_retries_transient_errors(self, failure: httpx.Response) -> None:
+        stub = _Stub(lambda n: failure if n <= 2 else None)
+        async with _client(stub) as client:
+            payloads = await client.time_series(["EUR/USD"], "1h")
+        assert len(stub.requests) == 3
+        assert payloads["EUR/USD"]["status"] == "ok"
+
+    async def test_retries_transport_errors(self) -> None:
+        calls = 0
+        stub = _Stub()
+
+        async def flaky(request: httpx.Request) -> httpx.Response:
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                raise httpx.ConnectError("refused", request=request)
+            return await stub(request)
+
+        client = TwelveDataClient(_SETTINGS, transport=httpx.MockTransport(flaky))
+        async with client:
+            await client.time_series(["EUR/USD"], "1h")
+        assert calls == 2
+
+    async def test_gives_up_after_max_retries(self) -> None:
+        stub = _Stub(lambda n: httpx.Response(502, text="bad gateway"))
+        async with _client(stub) as client:
+            with pytest.raises(TwelveDataError) as info:
+                await client.time_series(["EUR/USD"], "1h")
+        assert info.value.code == 502
+        assert len(stub.requests) == 1 + _SETTINGS.twelvedata_max_retries
+
+    async def test_single_symbol_error_is_that_symbols_payload(self) -> None:
+        stub = _Stub()
+        async with _client(stub, limiter=TokenBucket(rate_per_s=1000.0, capacity=1)) as client:
+            payloads = await client.time_series(["EUR/USD", "BAD/SYM"], "1h")
+        assert stub.batches == [["EUR/USD"], ["BAD/SYM"]]
+        assert payloads["EUR/USD"]["status"] == "ok"
+        assert payloads["BAD/SYM"] == {"code": 400, "message": "invalid symbol", "status": "error"}
+
+    async def test_single_symbol_request_errors_still_raise(self) -> None:
+        body = {"code": 401, "message": "invalid api key", "status": "error"}
+        stub = _Stub(lambda n: httpx.Response(200, json=body))
+        async with _client(stub) as client:
+            with pytest.raises(TwelveDataError, match="invalid api key"):
+                await client.time_series(["EUR/USD"], "1h")
+
+    async def test_client_errors_are_not_retried(self) -> None:
+        body = {"code": 401, "message": "invalid api key", "status": "error"}
+        stub = _Stub(lambda n: httpx.Response(200, json=body))
+        async with _client(stub) as client:
+            with pytest.raises(TwelveDataError, match="invalid api key"):
+                await client.time_series(["EUR/USD", "GBP/USD"], "1h")
+        assert len(stub.requests) == 1
+
+
+class TestToSeries:
+    """Payload translation."""
+
+    def test_columns(self) -> None:
+        series = to_series("EURUSD", "1H", {"values": _values("EUR/USD", "1h"), "status": "ok"})
+        assert (series.pair, series.timeframe, len(series)) == ("EURUSD", "1H", 3)
+        assert series.open_time[1] == np.datetime64("2025-02-03T01:00")
+        assert series.open.dtype == np.float64
+        assert series.close[0] == pytest.approx(series.open[1])
+
+    def test_newest_first_is_reversed(self) -> None:
+        values = _values("EUR/USD", "1h")
+        series = to_series("EURUSD", "1H", {"values": values[::-1], "status": "ok"})
+        assert series.open_time[0] == np.datetime64("2025-02-03T00:00")
+        assert series.open_time.flags.c_contiguous
+
+    def test_daily_dates_and_empty(self) -> None:
+        bar = {"datetime": "2025-02-03", "open": "1", "high": "1.2", "low": "0.9", "close": "1.1"}
+        assert to_series("EURUSD", "D", {"values": [bar]}).open_time[0] == np.datetime64(
+            "2025-02-03T00:00"
+        )
+        assert len(to_series("EURUSD", "D", {"values": [], "status": "ok"})) == 0
+
+    def test_error_payload(self) -> None:
+        with pytest.raises(TwelveDataError, match="invalid symbol"):
+            to_series("EURUSD", "1H", {"code": 400, "message": "invalid symbol", "status": "error"})
+
+    def test_unusable_bars_are_dropped(self) -> None:
+        values = _values("EUR/USD", "1h", n=5)
+        values[3]["low"] = "0"
+        values.insert(2, dict(values[1]))
+        series = to_series("EURUSD", "1H", {"values": values, "status": "ok"})
+        assert len(series) == 4
+        series.validate()
+
+
+@pytest.mark.asyncio
+class TestAdapter:
+    """Concurrent fetch through the stub server."""
+
+    async def test_fetch_many(self) -> None:
+        stub = _Stub()
+        async with _client(stub) as client:
+            adapter = TwelveDataAdapter(client, pairs=_PAIRS)
+            series = await adapter.fetch(
+                ["EURUSD", "GBPUSD", "AUDUSD"],
+                ["5M", "1H", "D"],
+                start=datetime(2025, 2, 3),
+                outputsize=3,
+            )
+        assert len(stub.requests) == 3  # one batched request per timeframe
+        assert stub.max_in_flight == 3
+        assert {r.url.params["interval"] for r in stub.requests} == {"5min", "1h", "1day"}
+        assert stub.requests[0].url.params["start_date"] == "2025-02-03 00:00:00"
+        assert set(series) == {
+            (p, tf) for p in ("EURUSD", "GBPUSD", "AUDUSD") for tf in ("5M", "1H", "D")
+        }
+        assert series["GBPUSD", "1H"].pair == "GBPUSD"
+
+    async def test_symbol_errors_are_skipped(self) -> None:
+        pairs = PairsConfig(
+            pairs={
+                **_PAIRS.pairs,
+                "BADSYM": _PAIRS.pairs["EURUSD"].model_copy(
+                    update={"twelvedata_symbol": "BAD/SYM"}
+                ),
+            }
+        )
+        async with _client(_Stub()) as client:
+            series = await TwelveDataAdapter(client, pairs=pairs).fetch(
+                ["EURUSD", "BADSYM"], ["1H"]
+            )
+        assert set(series) == {("EURUSD", "1H")}
+
+    async def test_fetch_marks_freshness(self) -> None:
+        metrics = get_metrics_registry()
+        enabled, metrics.enabled = metrics.enabled, True
+        metrics.reset()
+        try:
+            async with _client(_Stub()) as client:
+                await TwelveDataAdapter(client, pairs=_PAIRS).fetch(["EURUSD"], ["5M", "1H"])
+            # Bars open at 00:00, 01:00 and 02:00; the last closes one bar later.
+            assert metrics.watermark("EURUSD", "5M") == datetime(2025, 2, 3, 2, 5)
+            assert metrics.watermark("EURUSD", "1H") == datetime(2025, 2, 3, 3)
+        finally:
+            metrics.enabled = enabled
+            metrics.reset()
+
+    async def test_symbol_errors_in_single_symbol_batches_are_skipped(self) -> None:
+        pairs = PairsConfig(
+            pairs={
+                **_PAIRS.pairs,
+                "BADSYM": _PAIRS.pairs["EURUSD"].model_copy(
+                    update={"twelvedata_symbol": "BAD/SYM"}
+                ),
+            }
+        )
+        limiter = TokenBucket(rate_per_s=1000.0, capacity=1)
+        async with _client(_Stub(), limiter=limiter) as client:
+            series = await TwelveDataAdapter(client, pairs=pairs).fetch(
+                ["EURUSD", "BADSYM"], ["1H", "D"]
+            )
+        assert set(series) == {("EURUSD", "1H"), ("EURUSD", "D")}
+
+    async def test_unknown_timeframe(self) -> None:
+        async with _client(_Stub()) as client:
+            with pytest.raises(ValueError, match="3H"):
+                await TwelveDataAdapter(client, pairs=_PAIRS).fetch(["EURUSD"], ["3H"])
+
+    async def test_symbol_mapping_from_config(self) -> None:
+        async with _client(_Stub()) as client:
+            assert TwelveDataAdapter(client).symbol("EURUSD") == "EUR/USD"
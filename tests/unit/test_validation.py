@@ -0,0 +1,229 @@
+"""Unit tests for the vectorised candle data-quality validator.
+
+Covers:
+  - Duplicate, out-of-order, invalid, outlier and off-session flags
+  - Session calendar: expected bars per slot, weekends, holidays, D and W
+  - Gaps reported only where the calendar expected bars
+  - keep_mask, counts and DataGapDetected events
+  - Input validation
+"""
+
+from datetime import date, datetime, time, timedelta
+
+import numpy as np
+import pytest
+
+from src.domain.market_data.validation import (
+    GAP_DTYPE,
+    QualityFlag,
+    SessionCalendar,
+    validate_candles,
+    validate_series,
+)
+from src.domain.structure.models import CandleSeries
+from src.events import DataGapDetected
+
+# Monday.
+_T0 = datetime(2025, 2, 3)
+
+_CALENDAR = SessionCalendar([(time(0, 0), time(8, 0)), (time(8, 0), time(16, 0))])
+
+
+def _columns(times: list[datetime] | np.ndarray) -> dict[str, np.ndarray]:
+    n = len(times)
+    close = 1.1 + np.arange(n) * 1e-5
+    return {
+        "open_time": np.asarray(times, dtype="datetime64[us]"),
+        "open": close - 1e-5,
+        "high": close + 2e-4,
+        "low": close - 2e-4,
+        "close": close,
+    }
+
+
+def _hourly(hours: list[int]) -> dict[str, np.ndarray]:
+    return _columns([_T0 + timedelta(hours=h) for h in hours])
+
+
+def _validate(columns: dict[str, np.ndarray], timeframe: str = "1H", **kwargs):
+    return validate_candles("EURUSD", timeframe, calendar=_CALENDAR, **columns, **kwargs)
+
+
+class TestRowFlags:
+    """Per-bar flags."""
+
+    def test_clean_batch(self) -> None:
+        report = _validate(_hourly(list(range(16))))
+        assert report.ok
+        assert report.rows == 16
+        assert report.index.dtype == np.int64 and len(report.index) == 0
+        assert report.gaps.dtype == GAP_DTYPE
+
+    def test_duplicates_and_out_of_order(self) -> None:
+        report = _validate(_hourly([0, 1, 2, 2, 1, 5, 3, 6]))
+        np.testing.assert_array_equal(report.flagged(QualityFlag.DUPLICATE), [3, 4])
+        np.testing.assert_array_equal(report.flagged(QualityFlag.OUT_OF_ORDER), [6])
+        keep = report.keep_mask()
+        np.testing.assert_array_equal(keep, [1, 1, 1, 0, 0, 1, 0, 1])
+
+    def test_invalid_prices(self) -> None:
+        columns = _hourly(list(range(5)))
+        columns["close"][1] = 0.0
+        columns["high"][2] = np.nan
+        columns["low"][3] = columns["close"][3] + 1e-4  # low above close
+        report = _validate(columns)
+        np.testing.assert_array_equal(report.flagged(QualityFlag.INVALID), [1, 2, 3])
+        assert report.counts()["INVALID"] == 3
+
+    def test_outlier_against_block_median(self) -> None:
+        columns = _hourly(list(range(16)))
+        columns["high"][5] += 0.01  # ~26x the typical range
+        columns["low"][9] -= 0.002  # ~6x
+        report = _validate(columns)
+        np.testing.assert_array_equal(report.flagged(QualityFlag.OUTLIER), [5])
+        strict = _validate(columns, outlier_factor=5.0)
+        np.testing.assert_array_equal(strict.flagged(QualityFlag.OUTLIER), [5, 9])
+        assert report.keep_mask().all()  # outliers are kept by default
+
+    def test_off_session(self) -> None:
+        saturday = _T0 + timedelta(days=5, hours=10)
+        report = _validate(_hourly([14, 15, 16, 23]))
+        np.testing.assert_array_equal(report.flagged(QualityFlag.OFF_SESSION), [2, 3])
+        weekend = _validate(_columns([saturday]))
+        assert weekend.flags.tolist() == [QualityFlag.OFF_SESSION]
+
+    def test_flags_combine(self) -> None:
+        columns = _hourly([0, 20, 20])
+        columns["open"][2] = -1.0
+        report = _validate(columns)
+        assert report.index.tolist() == [1, 2]
+        assert QualityFlag(int(report.flags[1])) == (
+            QualityFlag.DUPLICATE | QualityFlag.INVALID | QualityFlag.OFF_SESSION
+        )
+
+    def test_validate_series(self) -> None:
+        series = CandleSeries("EURUSD", "1H", **_hourly([0, 1, 2, 20]))
+        report = validate_series(series, calendar=_CALENDAR)
+        assert report.counts() == {
+            "DUPLICATE": 0,
+            "OUT_OF_ORDER": 0,
+            "INVALID": 0,
+            "OUTLIER": 0,
+            "OFF_SESSION": 1,
+            "gaps": 1,
+        }
+
+
+class TestCalendar:
+    """Expected bars."""
+
+    def test_expected_intraday_bars(self) -> None:
+        start = np.array([_T0, _T0, _T0 + timedelta(hours=15)], dtype="datetime64[us]")
+        end = np.array(
+            [_T0 + timedelta(hours=2), _T0 + timedelta(days=7), _T0 + timedelta(days=3)],
+            dtype="datetime64[us]",
+        )
+        # 16 session hours a day, five trading days a week.
+        np.testing.assert_array_equal(_CALENDAR.expected_bars(start, end, "1H"), [2, 80, 33])
+        np.testing.assert_array_equal(_CALENDAR.expected_bars(start, end, "4H"), [1, 20, 8])
+
+    def test_bar_overlapping_a_session_is_expected(self) -> None:
+        calendar = SessionCalendar([(time(13, 0), time(21, 0))])
+        times = np.array([_T0 + timedelta(hours=h) for h in (8, 12, 16, 20)], "datetime64[us]")
+        assert calendar.in_session(times, "4H").tolist() == [False, True, True, True]
+        assert calendar.in_session(times, "1H").tolist() == [False, False, True, True]
+
+    def test_window_wrapping_midnight(self) -> None:
+        calendar = SessionCalendar([(time(22, 0), time(2, 0))])
+        times = np.array([_T0 + timedelta(hours=h) for h in (1, 2, 21, 22)], "datetime64[us]")
+        assert calendar.in_session(times, "1H").tolist() == [True, False, False, True]
+
+    def test_holidays_and_daily_bars(self) -> None:
+        calendar = SessionCalendar(_CALENDAR.windows, holidays=[date(2025, 2, 5)])
+        days = np.array([_T0 + timedelta(days=d) for d in range(7)], "datetime64[us]")
+        assert calendar.in_session(days, "D").tolist() == [1, 1, 0, 1, 1, 0, 0]
+        start, end = days[:1], days[:1] + np.timedelta64(14, "D")
+        assert calendar.expected_bars(start, end, "D").tolist() == [9]
+
+    def test_weekly_bars(self) -> None:
+        weeks = np.array([_T0, _T0 + timedelta(days=2)], "datetime64[us]")
+        assert _CALENDAR.in_session(weeks, "W").tolist() == [True, False]
+        start = np.array([_T0 + timedelta(days=7)], "datetime64[us]")
+        end = np.array([_T0 + timedelta(days=28)], "datetime64[us]")
+        assert _CALENDAR.expected_bars(start, end, "W").tolist() == [3]
+
+    def test_from_config(self) -> None:
+        calendar = SessionCalendar.from_config()
+        night = np.array([_T0 + timedelta(hours=22)], "datetime64[us]")
+        assert not calendar.in_session(night, "5M")[0]
+
+    def test_no_windows(self) -> None:
+        with pytest.raises(ValueError, match="session window"):
+            SessionCalendar([])
+
+
+class TestGaps:
+    """Gaps against the calendar."""
+
+    def test_missing_session_bars(self) -> None:
+        report = _validate(_hourly([0, 1, 5, 6, 15]))
+        assert report.gaps.tolist() == [
+            (
+                1,
+                np.datetime64(_T0 + timedelta(hours=2)),
+                np.datetime64(_T0 + timedelta(hours=5)),
+                3,
+            ),
+            (
+                3,
+                np.datetime64(_T0 + timedelta(hours=7)),
+                np.datetime64(_T0 + timedelta(hours=15)),
+                8,
+            ),
+        ]
+
+    def test_overnight_and_weekend_are_not_gaps(self) -> None:
+        friday = [_T0 + timedelta(days=4, hours=h) for h in range(16)]
+        monday = [_T0 + timedelta(days=7, hours=h) for h in range(16)]
+        thursday = [_T0 + timedelta(days=3, hours=h) for h in range(16)]
+        assert _validate(_columns(thursday + friday + monday)).ok
+
+    def test_gap_across_the_weekend(self) -> None:
+        times = [_T0 + timedelta(days=4, hours=14), _T0 + timedelta(days=7, hours=2)]
+        [gap] = _validate(_columns(times)).gaps
+        assert gap["missing_bars"] == 1 + 2
+
+    def test_duplicates_do_not_hide_gaps(self) -> None:
+        report = _validate(_hourly([0, 3, 0, 1]))
+        assert report.gaps["missing_bars"].tolist() == [1]
+        assert report.gaps["index"].tolist() == [3]
+
+    def test_gap_events(self) -> None:
+        [event] = _validate(_hourly([0, 4])).gap_events()
+        assert isinstance(event, DataGapDetected)
+        assert event.topic == "data.gap_detected"
+        assert (event.pair, event.timeframe, event.missing_bars) == ("EURUSD", "1H", 3)
+        assert (event.start, event.end) == (_T0 + timedelta(hours=1), _T0 + timedelta(hours=4))
+
+    def test_daily_series(self) -> None:
+        days = [_T0 + timedelta(days=d) for d in (0, 1, 3, 7, 8)]
+        report = _validate(_columns(days), "D")
+        assert report.gaps["missing_bars"].tolist() == [1, 1]
+
+
+class TestInputs:
+    """Argument checks."""
+
+    def test_empty_batch(self) -> None:
+        report = _validate(_hourly([]))
+        assert report.ok and report.rows == 0
+
+    def test_length_mismatch(self) -> None:
+        columns = _hourly([0, 1])
+        columns["close"] = columns["close"][:1]
+        with pytest.raises(ValueError, match="same length"):
+            _validate(columns)
+
+    def test_timeframe_must_divide_the_day(self) -> None:
+        with pytest.raises(ValueError, match="7H"):
+            _validate(_hourly([0]), "7H")
@@ -0,0 +1,310 @@
+"""Unit tests for the parameter sweep and walk-forward runner.
+
+Covers:
+  - Rolling and anchored fold schedules, grid expansion
+  - FoldData swing candidates matching detect_swings_array per filter value
+  - swing_sweep_objective metrics and parameter checks
+  - Identical results in-process and on a process pool
+  - Checkpointing: resuming after a failure, refusing a foreign checkpoint
+  - Per-fold selection of the best in-sample point
+"""
+
+import json
+from collections.abc import Mapping
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pytest
+
+from src.domain.research.models import ValidationType
+from src.domain.research.walk_forward import (
+    CellResult,
+    FoldData,
+    parameter_grid,
+    run_sweep,
+    select_walk_forward,
+    swing_sweep_objective,
+    walk_forward_folds,
+)
+from src.domain.structure.models import CandleSeries
+from src.domain.structure.swing_detection import detect_swings_array
+
+_START = datetime(2025, 1, 6)
+
+
+def _series(days: int = 40, seed: int = 2) -> CandleSeries:
+    rng = np.random.default_rng(seed)
+    n = days * 24
+    close = 1.1 + np.cumsum(rng.normal(0, 0.0008, n))
+    open_ = np.concatenate([[1.1], close[:-1]])
+    spread = np.abs(rng.normal(0, 0.0005, n))
+    times = np.datetime64(_START, "us") + np.arange(n) * np.timedelta64(1, "h")
+    return CandleSeries(
+        "EURUSD",
+        "1H",
+        times,
+        open_,
+        np.maximum(open_, close) + spread,
+        np.minimum(open_, close) - spread,
+        close,
+    )
+
+
+# Calls and FoldData ids seen by _flaky_objective in this process, and grid
+# values that fail.
+_CALLS: list[tuple[int, Any]] = []
+_SEGMENT_IDS: list[int] = []
+_FAIL_ON: set[Any] = set()
+
+
+def _flaky_objective(data: FoldData, params: Mapping[str, Any]) -> dict[str, float]:
+    _CALLS.append((len(data.series), params["x"]))
+    _SEGMENT_IDS.append(id(data))
+    if params["x"] in _FAIL_ON:
+        raise RuntimeError("worker died")
+    return {"score": float(params["x"]), "candles": len(data.series)}
+
+
+class TestSchedule:
+    """Folds and grids."""
+
+    def test_rolling_folds(self) -> None:
+        folds = walk_forward_folds(
+            _START, _START + timedelta(days=40), train=timedelta(days=20), test=timedelta(days=7)
+        )
+        assert len(folds) == 2
+        assert folds[1].train_start == _START + timedelta(days=7)
+        assert folds[1].test_start == folds[1].train_end == _START + timedelta(days=27)
+        assert folds[1].test_end == _START + timedelta(days=34)
+
+    def test_anchored_folds_with_step(self) -> None:
+        folds = walk_forward_folds(
+            _START,
+            _START + timedelta(days=40),
+            train=timedelta(days=20),
+            test=timedelta(days=7),
+            step=timedelta(days=5),
+            anchored=True,
+        )
+        assert [f.index for f in folds] == [0, 1, 2]
+        assert all(f.train_start == _START for f in folds)
+        assert folds[2].test_start == _START + timedelta(days=30)
+
+    def test_non_positive_period_rejected(self) -> None:
+        with pytest.raises(ValueError, match="positive"):
+            walk_forward_folds(_START, _START, train=timedelta(0), test=timedelta(days=1))
+
+    def test_grid_order(self) -> None:
+        assert parameter_grid({"a": [1, 2], "b": ["x", "y"]}) == [
+            {"a": 1, "b": "x"},
+            {"a": 1, "b": "y"},
+            {"a": 2, "b": "x"},
+            {"a": 2, "b": "y"},
+        ]
+        assert parameter_grid({}) == [{}]
+        with pytest.raises(ValueError, match="'a' has no values"):
+            parameter_grid({"a": []})
+
+
+class TestFoldData:
+    """Cached swing candidates."""
+
+    @pytest.mark.parametrize("min_swing_pips", [None, 0.0, 5.0, 12.5])
+    def test_swings_match_detection(self, min_swing_pips: float | None) -> None:
+        series = _series()
+        data = FoldData.from_series(series, _START + timedelta(days=3), _START + timedelta(days=9))
+        segment = data.series
+        assert segment.open_time[0] == np.datetime64(_START + timedelta(days=3), "us")
+        assert len(segment) == 6 * 24
+        expected = detect_swings_array(
+            segment.open_time, segment.high, segment.low, "EURUSD", min_swing_pips
+        )
+        np.testing.assert_array_equal(data.swings(min_swing_pips), expected)
+        assert data.swings(min_swing_pips) is data.swings(min_swing_pips)
+
+    def test_short_segment(self) -> None:
+        data = FoldData(_series()[:2])
+        assert len(data.swings(5.0)) == 0
+        assert swing_sweep_objective(data, {})["swings"] == 0
+
+
+class TestObjective:
+    """swing_sweep_objective."""
+
+    def test_metrics(self) -> None:
+        data = FoldData(_series())
+        loose = swing_sweep_objective(data, {"min_swing_pips": 0.0})
+        strict = swing_sweep_objective(data, {"min_swing_pips": 15.0})
+        assert loose["swings"] > strict["swings"] > 0
+        for metrics in (loose, strict):
+            assert 0.0 <= metrics["sweep_rate"] <= 1.0
+            assert 0.0 <= metrics["reversal_rate"] <= 1.0
+
+    def test_wider_sweep_tolerance_sweeps_less(self) -> None:
+        data = FoldData(_series())
+        tight = swing_sweep_objective(data, {"sweep_tolerance_pips": 0.0})
+        wide = swing_sweep_objective(data, {"sweep_tolerance_pips": 30.0})
+        assert wide["sweep_rate"] < tight["sweep_rate"]
+
+    def test_unknown_parameter(self) -> None:
+        with pytest.raises(ValueError, match="min_swing_pip"):
+            swing_sweep_objective(FoldData(_series()), {"min_swing_pip": 5.0})
+
+
+def _folds() -> list:
+    return walk_forward_folds(
+        _START, _START + timedelta(days=40), train=timedelta(days=14), test=timedelta(days=7)
+    )
+
+
+class TestRunSweep:
+    """Cell evaluation, ordering and parallelism."""
+
+    def test_inline_and_pool_agree(self) -> None:
+        grid = {"min_swing_pips": [0.0, 8.0], "sweep_tolerance_pips": [1.0, 4.0]}
+        series = _series()
+        inline = run_sweep(series, _folds(), grid, max_workers=1)
+        pooled = run_sweep(series, _folds(), grid, max_workers=2)
+        assert inline == pooled
+        assert len(inline) == len(_folds()) * 2 * 4
+        first = inline[0]
+        assert (first.fold, first.validation_type) == (0, ValidationType.IN_SAMPLE)
+        assert first.params == {"min_swing_pips": 0.0, "sweep_tolerance_pips": 1.0}
+        assert inline[4].validation_type is ValidationType.WALK_FORWARD
+
+    def test_segments_are_reused_across_grid_points(self) -> None:
+        _CALLS.clear()
+        _SEGMENT_IDS.clear()
+        run_sweep(_series(), _folds()[:1], {"x": [1, 2, 3]}, _flaky_objective, max_workers=1)
+        assert _CALLS == [
+            (14 * 24, 1),
+            (14 * 24, 2),
+            (14 * 24, 3),
+            (7 * 24, 1),
+            (7 * 24, 2),
+            (7 * 24, 3),
+        ]
+        assert len(set(_SEGMENT_IDS[:3])) == len(set(_SEGMENT_IDS[3:])) == 1
+
+
+class TestCheckpoint:
+    """Resuming interrupted sweeps."""
+
+    def test_resume_after_failure(self, tmp_path: Path) -> None:
+        checkpoint = tmp_path / "sweep.jsonl"
+        series, folds, grid = _series(), _folds(), {"x": [1, 2, 3]}
+        _FAIL_ON.add(3)
+        try:
+            with pytest.raises(RuntimeError, match="worker died"):
+                run_sweep(
+                    series, folds, grid, _flaky_objective, checkpoint=checkpoint, max_workers=1
+                )
+        finally:
+            _FAIL_ON.clear()
+        assert len(checkpoint.read_text().splitlines()) == 1 + 2
+
+        _CALLS.clear()
+        results = run_sweep(
+            series, folds, grid, _flaky_objective, checkpoint=checkpoint, max_workers=1
+        )
+        assert len(_CALLS) == len(folds) * 2 * 3 - 2
+        assert results == run_sweep(series, folds, grid, _flaky_objective, max_workers=1)
+
+        _CALLS.clear()
+        run_sweep(series, folds, grid, _flaky_objective, checkpoint=checkpoint, max_workers=1)
+        assert _CALLS == []
+
+    def test_torn_last_line_is_recomputed(self, tmp_path: Path) -> None:
+        checkpoint = tmp_path / "sweep.jsonl"
+        series, folds, grid = _series(), _folds()[:1], {"x": [1, 2]}
+        run_sweep(series, folds, grid, _flaky_objective, checkpoint=checkpoint, max_workers=1)
+        lines = checkpoint.read_text().splitlines()
+        checkpoint.write_text("\n".join(lines[:-1]) + "\n" + lines[-1][:10])
+        _CALLS.clear()
+        run_sweep(series, folds, grid, _flaky_objective, checkpoint=checkpoint, max_workers=1)
+        assert len(_CALLS) == 1
+        # The fragment was cut, so the recomputed row is readable on the next resume.
+        resumed = checkpoint.read_text().splitlines()
+        assert len(resumed) == len(lines)
+        assert all(json.loads(line) for line in resumed)
+        _CALLS.clear()
+        run_sweep(series, folds, grid, _flaky_objective, checkpoint=checkpoint, max_workers=1)
+        assert _CALLS == []
+
+    def test_torn_header_starts_over(self, tmp_path: Path) -> None:
+        checkpoint = tmp_path / "sweep.jsonl"
+        checkpoint.write_text('{"swe')
+        series, folds, grid = _series(), _folds()[:1], {"x": [1, 2]}
+        run_sweep(series, folds, grid, _flaky_objective, checkpoint=checkpoint, max_workers=1)
+        assert "sweep" in json.loads(checkpoint.read_text().splitlines()[0])
+
+    def test_foreign_checkpoint_rejected(self, tmp_path: Path) -> None:
+        checkpoint = tmp_path / "sweep.jsonl"
+        run_sweep(
+            _series(),
+            _folds()[:1],
+            {"x": [1]},
+            _flaky_objective,
+            checkpoint=checkpoint,
+            max_workers=1,
+        )
+        with pytest.raises(ValueError, match="different sweep"):
+            run_sweep(
+                _series(),
+                _folds()[:1],
+                {"x": [2]},
+                _flaky_objective,
+                checkpoint=checkpoint,
+                max_workers=1,
+            )
+
+    def test_rows_are_json(self, tmp_path: Path) -> None:
+        checkpoint = tmp_path / "sweep.jsonl"
+        run_sweep(
+            _series(),
+            _folds()[:1],
+            {"x": [1]},
+            _flaky_objective,
+            checkpoint=checkpoint,
+            max_workers=1,
+        )
+        header, row, _ = (json.loads(line) for line in checkpoint.read_text().splitlines())
+        assert set(header) == {"sweep"}
+        assert row == {
+            "fold": 0,
+            "validation_type": "IN_SAMPLE",
+            "params": {"x": 1},
+            "metrics": {"score": 1.0, "candles": 14 * 24},
+        }
+
+
+class TestSelection:
+    """select_walk_forward."""
+
+    @staticmethod
+    def _cell(fold: int, vt: ValidationType, x: int, score: float) -> CellResult:
+        return CellResult(fold, vt, {"x": x}, {"score": score})
+
+    def test_best_in_sample_point_is_paired_with_its_test(self) -> None:
+        ins, wf = ValidationType.IN_SAMPLE, ValidationType.WALK_FORWARD
+        results = [
+            self._cell(0, ins, 1, 0.2),
+            self._cell(0, ins, 2, 0.9),
+            self._cell(0, wf, 1, 0.5),
+            self._cell(0, wf, 2, 0.1),
+            self._cell(1, ins, 1, 0.7),
+            self._cell(1, ins, 2, 0.7),
+            self._cell(1, wf, 1, 0.6),
+            self._cell(1, wf, 2, 0.3),
+        ]
+        [first, second] = select_walk_forward(results, "score")
+        assert (first.params, first.in_sample, first.walk_forward) == (
+            {"x": 2},
+            {"score": 0.9},
+            {"score": 0.1},
+        )
+        assert second.params == {"x": 1}  # tie -> earlier grid point
+        [low, _] = select_walk_forward(results, "score", maximize=False)
+        assert low.params == {"x": 1}